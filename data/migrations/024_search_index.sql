@@ -0,0 +1,180 @@
+-- 024_search_index.sql — FTS5 full-text search index
+--
+-- Replaces the search tool's LIKE '%q%' scans (a full table scan per table, and
+-- megabytes of transcripts.raw_text per query) with one FTS5 index per searchable
+-- table. Each index is an EXTERNAL-CONTENT table (content=<table>,
+-- content_rowid=id): the inverted index is stored, the text is not duplicated —
+-- snippet() and bm25() read the source row by id.
+--
+-- Triggers keep every index in step with its table on INSERT / UPDATE / DELETE
+-- (external-content tables must be told the OLD values to un-index them, hence
+-- the 'delete' command rows). UPDATE triggers fire only on the indexed columns,
+-- so is_read flips and status changes cost nothing.
+--
+-- Tokenizer: unicode61 + diacritic folding, with prefix indexes so the search
+-- tool's per-term prefix queries ("acm*") stay index lookups.
+--
+-- Idempotent: CREATE ... IF NOT EXISTS, and 'rebuild' repopulates each index
+-- from its content table (the backfill) no matter how often it runs.
+
+-- contacts
+CREATE VIRTUAL TABLE IF NOT EXISTS fts_contacts USING fts5(
+    name, company, email, notes,
+    content='contacts', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS fts_contacts_ai AFTER INSERT ON contacts BEGIN
+    INSERT INTO fts_contacts(rowid, name, company, email, notes) VALUES (NEW.id, NEW.name, NEW.company, NEW.email, NEW.notes);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_contacts_ad AFTER DELETE ON contacts BEGIN
+    INSERT INTO fts_contacts(fts_contacts, rowid, name, company, email, notes) VALUES ('delete', OLD.id, OLD.name, OLD.company, OLD.email, OLD.notes);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_contacts_au AFTER UPDATE OF name, company, email, notes ON contacts BEGIN
+    INSERT INTO fts_contacts(fts_contacts, rowid, name, company, email, notes) VALUES ('delete', OLD.id, OLD.name, OLD.company, OLD.email, OLD.notes);
+    INSERT INTO fts_contacts(rowid, name, company, email, notes) VALUES (NEW.id, NEW.name, NEW.company, NEW.email, NEW.notes);
+END;
+INSERT INTO fts_contacts(fts_contacts) VALUES ('rebuild');
+
+-- projects
+CREATE VIRTUAL TABLE IF NOT EXISTS fts_projects USING fts5(
+    name, description,
+    content='projects', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS fts_projects_ai AFTER INSERT ON projects BEGIN
+    INSERT INTO fts_projects(rowid, name, description) VALUES (NEW.id, NEW.name, NEW.description);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_projects_ad AFTER DELETE ON projects BEGIN
+    INSERT INTO fts_projects(fts_projects, rowid, name, description) VALUES ('delete', OLD.id, OLD.name, OLD.description);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_projects_au AFTER UPDATE OF name, description ON projects BEGIN
+    INSERT INTO fts_projects(fts_projects, rowid, name, description) VALUES ('delete', OLD.id, OLD.name, OLD.description);
+    INSERT INTO fts_projects(rowid, name, description) VALUES (NEW.id, NEW.name, NEW.description);
+END;
+INSERT INTO fts_projects(fts_projects) VALUES ('rebuild');
+
+-- tasks
+CREATE VIRTUAL TABLE IF NOT EXISTS fts_tasks USING fts5(
+    title, description,
+    content='tasks', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS fts_tasks_ai AFTER INSERT ON tasks BEGIN
+    INSERT INTO fts_tasks(rowid, title, description) VALUES (NEW.id, NEW.title, NEW.description);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_tasks_ad AFTER DELETE ON tasks BEGIN
+    INSERT INTO fts_tasks(fts_tasks, rowid, title, description) VALUES ('delete', OLD.id, OLD.title, OLD.description);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_tasks_au AFTER UPDATE OF title, description ON tasks BEGIN
+    INSERT INTO fts_tasks(fts_tasks, rowid, title, description) VALUES ('delete', OLD.id, OLD.title, OLD.description);
+    INSERT INTO fts_tasks(rowid, title, description) VALUES (NEW.id, NEW.title, NEW.description);
+END;
+INSERT INTO fts_tasks(fts_tasks) VALUES ('rebuild');
+
+-- contact_interactions
+CREATE VIRTUAL TABLE IF NOT EXISTS fts_interactions USING fts5(
+    subject, summary,
+    content='contact_interactions', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS fts_interactions_ai AFTER INSERT ON contact_interactions BEGIN
+    INSERT INTO fts_interactions(rowid, subject, summary) VALUES (NEW.id, NEW.subject, NEW.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_interactions_ad AFTER DELETE ON contact_interactions BEGIN
+    INSERT INTO fts_interactions(fts_interactions, rowid, subject, summary) VALUES ('delete', OLD.id, OLD.subject, OLD.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_interactions_au AFTER UPDATE OF subject, summary ON contact_interactions BEGIN
+    INSERT INTO fts_interactions(fts_interactions, rowid, subject, summary) VALUES ('delete', OLD.id, OLD.subject, OLD.summary);
+    INSERT INTO fts_interactions(rowid, subject, summary) VALUES (NEW.id, NEW.subject, NEW.summary);
+END;
+INSERT INTO fts_interactions(fts_interactions) VALUES ('rebuild');
+
+-- emails
+CREATE VIRTUAL TABLE IF NOT EXISTS fts_emails USING fts5(
+    subject, snippet, from_name,
+    content='emails', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS fts_emails_ai AFTER INSERT ON emails BEGIN
+    INSERT INTO fts_emails(rowid, subject, snippet, from_name) VALUES (NEW.id, NEW.subject, NEW.snippet, NEW.from_name);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_emails_ad AFTER DELETE ON emails BEGIN
+    INSERT INTO fts_emails(fts_emails, rowid, subject, snippet, from_name) VALUES ('delete', OLD.id, OLD.subject, OLD.snippet, OLD.from_name);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_emails_au AFTER UPDATE OF subject, snippet, from_name ON emails BEGIN
+    INSERT INTO fts_emails(fts_emails, rowid, subject, snippet, from_name) VALUES ('delete', OLD.id, OLD.subject, OLD.snippet, OLD.from_name);
+    INSERT INTO fts_emails(rowid, subject, snippet, from_name) VALUES (NEW.id, NEW.subject, NEW.snippet, NEW.from_name);
+END;
+INSERT INTO fts_emails(fts_emails) VALUES ('rebuild');
+
+-- transcripts
+CREATE VIRTUAL TABLE IF NOT EXISTS fts_transcripts USING fts5(
+    title, summary, raw_text,
+    content='transcripts', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS fts_transcripts_ai AFTER INSERT ON transcripts BEGIN
+    INSERT INTO fts_transcripts(rowid, title, summary, raw_text) VALUES (NEW.id, NEW.title, NEW.summary, NEW.raw_text);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_transcripts_ad AFTER DELETE ON transcripts BEGIN
+    INSERT INTO fts_transcripts(fts_transcripts, rowid, title, summary, raw_text) VALUES ('delete', OLD.id, OLD.title, OLD.summary, OLD.raw_text);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_transcripts_au AFTER UPDATE OF title, summary, raw_text ON transcripts BEGIN
+    INSERT INTO fts_transcripts(fts_transcripts, rowid, title, summary, raw_text) VALUES ('delete', OLD.id, OLD.title, OLD.summary, OLD.raw_text);
+    INSERT INTO fts_transcripts(rowid, title, summary, raw_text) VALUES (NEW.id, NEW.title, NEW.summary, NEW.raw_text);
+END;
+INSERT INTO fts_transcripts(fts_transcripts) VALUES ('rebuild');
+
+-- decisions
+CREATE VIRTUAL TABLE IF NOT EXISTS fts_decisions USING fts5(
+    title, context, decision,
+    content='decisions', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS fts_decisions_ai AFTER INSERT ON decisions BEGIN
+    INSERT INTO fts_decisions(rowid, title, context, decision) VALUES (NEW.id, NEW.title, NEW.context, NEW.decision);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_decisions_ad AFTER DELETE ON decisions BEGIN
+    INSERT INTO fts_decisions(fts_decisions, rowid, title, context, decision) VALUES ('delete', OLD.id, OLD.title, OLD.context, OLD.decision);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_decisions_au AFTER UPDATE OF title, context, decision ON decisions BEGIN
+    INSERT INTO fts_decisions(fts_decisions, rowid, title, context, decision) VALUES ('delete', OLD.id, OLD.title, OLD.context, OLD.decision);
+    INSERT INTO fts_decisions(rowid, title, context, decision) VALUES (NEW.id, NEW.title, NEW.context, NEW.decision);
+END;
+INSERT INTO fts_decisions(fts_decisions) VALUES ('rebuild');
+
+-- journal_entries
+CREATE VIRTUAL TABLE IF NOT EXISTS fts_journal USING fts5(
+    content,
+    content='journal_entries', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS fts_journal_ai AFTER INSERT ON journal_entries BEGIN
+    INSERT INTO fts_journal(rowid, content) VALUES (NEW.id, NEW.content);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_journal_ad AFTER DELETE ON journal_entries BEGIN
+    INSERT INTO fts_journal(fts_journal, rowid, content) VALUES ('delete', OLD.id, OLD.content);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_journal_au AFTER UPDATE OF content ON journal_entries BEGIN
+    INSERT INTO fts_journal(fts_journal, rowid, content) VALUES ('delete', OLD.id, OLD.content);
+    INSERT INTO fts_journal(rowid, content) VALUES (NEW.id, NEW.content);
+END;
+INSERT INTO fts_journal(fts_journal) VALUES ('rebuild');
+
+-- standalone_notes
+CREATE VIRTUAL TABLE IF NOT EXISTS fts_notes USING fts5(
+    title, content, tags,
+    content='standalone_notes', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS fts_notes_ai AFTER INSERT ON standalone_notes BEGIN
+    INSERT INTO fts_notes(rowid, title, content, tags) VALUES (NEW.id, NEW.title, NEW.content, NEW.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_notes_ad AFTER DELETE ON standalone_notes BEGIN
+    INSERT INTO fts_notes(fts_notes, rowid, title, content, tags) VALUES ('delete', OLD.id, OLD.title, OLD.content, OLD.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS fts_notes_au AFTER UPDATE OF title, content, tags ON standalone_notes BEGIN
+    INSERT INTO fts_notes(fts_notes, rowid, title, content, tags) VALUES ('delete', OLD.id, OLD.title, OLD.content, OLD.tags);
+    INSERT INTO fts_notes(rowid, title, content, tags) VALUES (NEW.id, NEW.title, NEW.content, NEW.tags);
+END;
+INSERT INTO fts_notes(fts_notes) VALUES ('rebuild');
@@ -0,0 +1,409 @@
+-- 025_contact_health.sql — materialized, change-driven contact health
+--
+-- v_contact_health (020) ran ~25 correlated subqueries per active contact on
+-- EVERY read — three copies of the last-activity UNION, five separate
+-- "latest relationship_scores row" lookups — and weekly_review,
+-- relationship_pulse, signals.py, render.py and the dashboards all scan it.
+--
+-- Now:
+--   * v_contact_health_live   — the 020 computation, verbatim. Only the refresher
+--                               reads it (and the shim, for rows it can't trust).
+--   * contact_health          — one materialized row per active contact.
+--   * contact_health_dirty    — contact ids whose inputs changed. Triggers on every
+--                               source table (emails, contact_interactions,
+--                               transcript_participants, transcripts, commitments,
+--                               follow_ups, calendar_events, projects, slack_messages,
+--                               relationship_scores, contacts) add ids here; a write
+--                               costs one INSERT OR IGNORE, not a recompute.
+--   * v_contact_health        — compatibility shim, same columns as before. Serves
+--                               materialized rows, but recomputes live for any dirty
+--                               contact, and for EVERY contact if the last sweep is
+--                               over an hour old or from a previous day. So raw
+--                               sqlite3 readers (plugin commands, agents) that never
+--                               run the refresher still get correct numbers.
+--                               days_silent is always computed at read time from
+--                               the stored last_activity.
+--
+-- software_of_you.contact_health drains the dirty set and runs the periodic sweep
+-- that re-derives the time-relative columns (30-day windows, overdue counts,
+-- next_meeting) and stamps soy_meta 'contact_health_swept_at'.
+--
+-- Idempotent: CREATE ... IF NOT EXISTS, DROP VIEW IF EXISTS + CREATE, and the
+-- closing full refresh rebuilds the table from the live view on every run.
+
+DROP VIEW IF EXISTS v_contact_health_live;
+CREATE VIEW IF NOT EXISTS v_contact_health_live AS
+SELECT
+  c.id,
+  c.name,
+  c.email,
+  c.company,
+  c.role,
+  c.status,
+
+  -- Email stats (last 30 days)
+  (SELECT COUNT(*) FROM emails WHERE contact_id = c.id
+    AND received_at > datetime('now', '-30 days')) AS emails_30d,
+  (SELECT COUNT(*) FROM emails WHERE contact_id = c.id
+    AND direction = 'inbound'
+    AND received_at > datetime('now', '-30 days')) AS emails_inbound_30d,
+  (SELECT COUNT(*) FROM emails WHERE contact_id = c.id
+    AND direction = 'outbound'
+    AND received_at > datetime('now', '-30 days')) AS emails_outbound_30d,
+  (SELECT COUNT(DISTINCT thread_id) FROM emails WHERE contact_id = c.id
+    AND received_at > datetime('now', '-30 days')) AS threads_30d,
+  (SELECT COUNT(*) FROM emails WHERE contact_id = c.id) AS emails_total,
+
+  -- Interaction stats
+  (SELECT COUNT(*) FROM contact_interactions WHERE contact_id = c.id
+    AND occurred_at > datetime('now', '-30 days')) AS interactions_30d,
+  (SELECT COUNT(*) FROM contact_interactions WHERE contact_id = c.id) AS interactions_total,
+
+  -- Last activity (most recent across interactions, emails, transcripts, AND SLACK)
+  (SELECT MAX(ts) FROM (
+    SELECT MAX(occurred_at) AS ts FROM contact_interactions WHERE contact_id = c.id
+    UNION ALL
+    SELECT MAX(received_at) FROM emails WHERE contact_id = c.id
+    UNION ALL
+    SELECT MAX(t.occurred_at) FROM transcripts t
+      JOIN transcript_participants tp ON tp.transcript_id = t.id
+      WHERE tp.contact_id = c.id
+    UNION ALL
+    SELECT MAX(received_at) FROM slack_messages WHERE contact_id = c.id
+  )) AS last_activity,
+
+  -- Days since last activity (NULL if no activity) — now includes Slack
+  CAST(julianday('now') - julianday(
+    (SELECT MAX(ts) FROM (
+      SELECT MAX(occurred_at) AS ts FROM contact_interactions WHERE contact_id = c.id
+      UNION ALL
+      SELECT MAX(received_at) FROM emails WHERE contact_id = c.id
+      UNION ALL
+      SELECT MAX(t.occurred_at) FROM transcripts t
+        JOIN transcript_participants tp ON tp.transcript_id = t.id
+        WHERE tp.contact_id = c.id
+      UNION ALL
+      SELECT MAX(received_at) FROM slack_messages WHERE contact_id = c.id
+    ))
+  ) + 0.5 AS INTEGER) AS days_silent,
+
+  -- Transcript/call stats
+  (SELECT COUNT(DISTINCT tp.transcript_id) FROM transcript_participants tp
+    WHERE tp.contact_id = c.id) AS transcripts_total,
+  (SELECT COUNT(DISTINCT tp.transcript_id) FROM transcript_participants tp
+    JOIN transcripts t ON t.id = tp.transcript_id
+    WHERE tp.contact_id = c.id
+    AND t.occurred_at > datetime('now', '-30 days')) AS transcripts_30d,
+
+  -- Slack stats (last 30 days)
+  (SELECT COUNT(*) FROM slack_messages WHERE contact_id = c.id
+    AND received_at > datetime('now', '-30 days')) AS slack_messages_30d,
+  (SELECT COUNT(*) FROM slack_messages WHERE contact_id = c.id) AS slack_messages_total,
+
+  -- Open commitments (you owe them)
+  (SELECT COUNT(*) FROM commitments com
+    WHERE com.status IN ('open', 'overdue')
+    AND com.is_user_commitment = 1
+    AND com.transcript_id IN (
+      SELECT transcript_id FROM transcript_participants WHERE contact_id = c.id
+    )) AS your_open_commitments,
+
+  -- Open commitments (they owe you)
+  (SELECT COUNT(*) FROM commitments com
+    WHERE com.status IN ('open', 'overdue')
+    AND com.is_user_commitment = 0
+    AND com.owner_contact_id = c.id) AS their_open_commitments,
+
+  -- Overdue commitments (either direction)
+  (SELECT COUNT(*) FROM commitments com
+    WHERE com.status IN ('open', 'overdue')
+    AND com.deadline_date < date('now')
+    AND (com.owner_contact_id = c.id
+      OR (com.is_user_commitment = 1 AND com.transcript_id IN (
+        SELECT transcript_id FROM transcript_participants WHERE contact_id = c.id
+      )))) AS overdue_commitments,
+
+  -- Pending follow-ups
+  (SELECT COUNT(*) FROM follow_ups WHERE contact_id = c.id
+    AND status = 'pending') AS pending_follow_ups,
+  (SELECT COUNT(*) FROM follow_ups WHERE contact_id = c.id
+    AND status = 'pending' AND due_date < date('now')) AS overdue_follow_ups,
+
+  -- Next upcoming event with this contact
+  (SELECT MIN(start_time) FROM calendar_events
+    WHERE contact_ids LIKE '%' || c.id || '%'
+    AND start_time > datetime('now')
+    AND status != 'cancelled') AS next_meeting,
+
+  -- Active projects where this contact is the client
+  (SELECT COUNT(*) FROM projects WHERE client_id = c.id
+    AND status IN ('active', 'planning')) AS active_projects,
+
+  -- Latest relationship score
+  (SELECT relationship_depth FROM relationship_scores
+    WHERE contact_id = c.id ORDER BY score_date DESC LIMIT 1) AS relationship_depth,
+  (SELECT trajectory FROM relationship_scores
+    WHERE contact_id = c.id ORDER BY score_date DESC LIMIT 1) AS trajectory,
+  (SELECT commitment_follow_through FROM relationship_scores
+    WHERE contact_id = c.id ORDER BY score_date DESC LIMIT 1) AS follow_through,
+  (SELECT talk_ratio_avg FROM relationship_scores
+    WHERE contact_id = c.id ORDER BY score_date DESC LIMIT 1) AS talk_ratio_avg,
+  (SELECT notes FROM relationship_scores
+    WHERE contact_id = c.id ORDER BY score_date DESC LIMIT 1) AS relationship_notes
+
+FROM contacts c
+WHERE c.status = 'active';
+
+CREATE TABLE IF NOT EXISTS contact_health (
+  id                       INTEGER PRIMARY KEY,
+  name                     TEXT,
+  email                    TEXT,
+  company                  TEXT,
+  role                     TEXT,
+  status                   TEXT,
+  emails_30d               INTEGER,
+  emails_inbound_30d       INTEGER,
+  emails_outbound_30d      INTEGER,
+  threads_30d              INTEGER,
+  emails_total             INTEGER,
+  interactions_30d         INTEGER,
+  interactions_total       INTEGER,
+  last_activity            TEXT,
+  days_silent              INTEGER,
+  transcripts_total        INTEGER,
+  transcripts_30d          INTEGER,
+  slack_messages_30d       INTEGER,
+  slack_messages_total     INTEGER,
+  your_open_commitments    INTEGER,
+  their_open_commitments   INTEGER,
+  overdue_commitments      INTEGER,
+  pending_follow_ups       INTEGER,
+  overdue_follow_ups       INTEGER,
+  next_meeting             TEXT,
+  active_projects          INTEGER,
+  relationship_depth       TEXT,
+  trajectory               TEXT,
+  follow_through           REAL,
+  talk_ratio_avg           REAL,
+  relationship_notes       TEXT
+);
+
+CREATE TABLE IF NOT EXISTS contact_health_dirty (
+  contact_id INTEGER PRIMARY KEY
+);
+
+DROP VIEW IF EXISTS v_contact_health;
+CREATE VIEW IF NOT EXISTS v_contact_health AS
+SELECT
+  h.id,
+  h.name,
+  h.email,
+  h.company,
+  h.role,
+  h.status,
+  h.emails_30d,
+  h.emails_inbound_30d,
+  h.emails_outbound_30d,
+  h.threads_30d,
+  h.emails_total,
+  h.interactions_30d,
+  h.interactions_total,
+  h.last_activity,
+  CAST(julianday('now') - julianday(h.last_activity) + 0.5 AS INTEGER) AS days_silent,
+  h.transcripts_total,
+  h.transcripts_30d,
+  h.slack_messages_30d,
+  h.slack_messages_total,
+  h.your_open_commitments,
+  h.their_open_commitments,
+  h.overdue_commitments,
+  h.pending_follow_ups,
+  h.overdue_follow_ups,
+  h.next_meeting,
+  h.active_projects,
+  h.relationship_depth,
+  h.trajectory,
+  h.follow_through,
+  h.talk_ratio_avg,
+  h.relationship_notes
+FROM contact_health h
+WHERE EXISTS (
+    SELECT 1 FROM soy_meta
+    WHERE key = 'contact_health_swept_at'
+      AND value > datetime('now', '-1 hour')
+      AND date(value) = date('now'))
+  AND h.id NOT IN (SELECT contact_id FROM contact_health_dirty)
+UNION ALL
+SELECT l.* FROM v_contact_health_live l
+WHERE NOT EXISTS (
+    SELECT 1 FROM soy_meta
+    WHERE key = 'contact_health_swept_at'
+      AND value > datetime('now', '-1 hour')
+      AND date(value) = date('now'))
+   OR l.id IN (SELECT contact_id FROM contact_health_dirty);
+
+-- Change triggers: mark affected contacts dirty.
+CREATE TRIGGER IF NOT EXISTS trg_ch_emails_ai AFTER INSERT ON emails BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_emails_ad AFTER DELETE ON emails BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_emails_au AFTER UPDATE OF contact_id, direction, received_at, thread_id ON emails BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL;
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_interactions_ai AFTER INSERT ON contact_interactions BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_interactions_ad AFTER DELETE ON contact_interactions BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_interactions_au AFTER UPDATE OF contact_id, occurred_at ON contact_interactions BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL;
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_slack_ai AFTER INSERT ON slack_messages BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_slack_ad AFTER DELETE ON slack_messages BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_slack_au AFTER UPDATE OF contact_id, received_at ON slack_messages BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL;
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_follow_ups_ai AFTER INSERT ON follow_ups BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_follow_ups_ad AFTER DELETE ON follow_ups BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_follow_ups_au AFTER UPDATE OF contact_id, status, due_date ON follow_ups BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL;
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_scores_ai AFTER INSERT ON relationship_scores BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_scores_ad AFTER DELETE ON relationship_scores BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_scores_au AFTER UPDATE OF contact_id, score_date, relationship_depth, trajectory, commitment_follow_through, talk_ratio_avg, notes ON relationship_scores BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL;
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_participants_ai AFTER INSERT ON transcript_participants BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_participants_ad AFTER DELETE ON transcript_participants BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_participants_au AFTER UPDATE OF contact_id, transcript_id ON transcript_participants BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL;
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_projects_ai AFTER INSERT ON projects BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.client_id WHERE NEW.client_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_projects_ad AFTER DELETE ON projects BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.client_id WHERE OLD.client_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_projects_au AFTER UPDATE OF client_id, status ON projects BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.client_id WHERE OLD.client_id IS NOT NULL;
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.client_id WHERE NEW.client_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_commitments_ai AFTER INSERT ON commitments BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.owner_contact_id WHERE NEW.owner_contact_id IS NOT NULL;
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id)
+    SELECT contact_id FROM transcript_participants
+    WHERE transcript_id = NEW.transcript_id AND contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_commitments_ad AFTER DELETE ON commitments BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.owner_contact_id WHERE OLD.owner_contact_id IS NOT NULL;
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id)
+    SELECT contact_id FROM transcript_participants
+    WHERE transcript_id = OLD.transcript_id AND contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_commitments_au AFTER UPDATE OF status, is_user_commitment, owner_contact_id, transcript_id, deadline_date ON commitments BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT OLD.owner_contact_id WHERE OLD.owner_contact_id IS NOT NULL;
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.owner_contact_id WHERE NEW.owner_contact_id IS NOT NULL;
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id)
+    SELECT contact_id FROM transcript_participants
+    WHERE transcript_id = OLD.transcript_id AND contact_id IS NOT NULL;
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id)
+    SELECT contact_id FROM transcript_participants
+    WHERE transcript_id = NEW.transcript_id AND contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_transcripts_au AFTER UPDATE OF occurred_at ON transcripts BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id)
+    SELECT contact_id FROM transcript_participants
+    WHERE transcript_id = NEW.id AND contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_transcripts_bd BEFORE DELETE ON transcripts BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id)
+    SELECT contact_id FROM transcript_participants
+    WHERE transcript_id = OLD.id AND contact_id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_events_ai AFTER INSERT ON calendar_events BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id)
+    SELECT id FROM contacts WHERE NEW.contact_ids LIKE '%' || id || '%';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_events_ad AFTER DELETE ON calendar_events BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id)
+    SELECT id FROM contacts WHERE OLD.contact_ids LIKE '%' || id || '%';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_events_au AFTER UPDATE OF contact_ids, start_time, status ON calendar_events BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id)
+    SELECT id FROM contacts WHERE OLD.contact_ids LIKE '%' || id || '%';
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id)
+    SELECT id FROM contacts WHERE NEW.contact_ids LIKE '%' || id || '%';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_contacts_ai AFTER INSERT ON contacts BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.id WHERE NEW.id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_contacts_au AFTER UPDATE OF name, email, company, role, status ON contacts BEGIN
+  INSERT OR IGNORE INTO contact_health_dirty (contact_id) SELECT NEW.id WHERE NEW.id IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_contacts_ad AFTER DELETE ON contacts BEGIN
+  DELETE FROM contact_health WHERE id = OLD.id;
+  DELETE FROM contact_health_dirty WHERE contact_id = OLD.id;
+END;
+
+-- Initial fill (also the full sweep software_of_you.contact_health runs).
+DELETE FROM contact_health;
+INSERT INTO contact_health SELECT * FROM v_contact_health_live;
+DELETE FROM contact_health_dirty;
+INSERT OR REPLACE INTO soy_meta (key, value, updated_at)
+VALUES ('contact_health_swept_at', datetime('now'), datetime('now'));
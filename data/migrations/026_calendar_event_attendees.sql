@@ -0,0 +1,289 @@
+-- 026_calendar_event_attendees.sql — normalized event attendees
+--
+-- Calendar attendees lived only in two JSON columns on calendar_events
+-- (attendees, contact_ids), and every per-contact lookup — next_meeting in
+-- v_contact_health, calendar_tool's "with contact", the profile and entity
+-- pages, the contact_health dirty triggers — matched them with
+-- contact_ids LIKE '%' || id || '%'. That scans every event for every contact,
+-- and contact 1 also matches 11, 21 and 100.
+--
+-- Now:
+--   * calendar_event_attendees — one row per (event, attendee): the attendee's
+--                                email and response_status, the matched
+--                                contact_id, and a copy of the event's
+--                                start_time so (contact_id, start_time) is a
+--                                single index range scan.
+--   * Triggers on calendar_events keep it in step with the JSON columns, so
+--     every writer (google_sync, the /calendar command's raw SQL, demo seeds)
+--     populates it without knowing it exists. contact_ids stays the
+--     compatibility column for readers that still parse it.
+--   * v_contact_health_live.next_meeting and the contact_health dirty triggers
+--     (025) switch from LIKE to the junction table.
+--
+-- Attendee sources, per event:
+--   attendees   — [{"email", "name", "status"}, ...] as written by google_sync
+--                 (bare email strings are accepted too); contact_id is the
+--                 contact whose email matches, the rule sync has always used.
+--   contact_ids — JSON array ("[1, 2]") or comma-separated ("1,2") ids; adds
+--                 rows for contacts linked without a usable attendee email.
+--
+-- Idempotent: CREATE ... IF NOT EXISTS, DROP ... IF EXISTS + CREATE, and the
+-- backfill is INSERT OR IGNORE against the table's UNIQUE constraints.
+
+CREATE TABLE IF NOT EXISTS calendar_event_attendees (
+  id              INTEGER PRIMARY KEY,
+  event_id        INTEGER NOT NULL REFERENCES calendar_events(id) ON DELETE CASCADE,
+  contact_id      INTEGER REFERENCES contacts(id) ON DELETE SET NULL,
+  email           TEXT,
+  response_status TEXT,
+  start_time      TEXT,
+  UNIQUE (event_id, email),
+  UNIQUE (event_id, contact_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_event_attendees_contact_start
+  ON calendar_event_attendees(contact_id, start_time);
+CREATE INDEX IF NOT EXISTS idx_event_attendees_event
+  ON calendar_event_attendees(event_id);
+
+-- Attendee matching (here and in google_sync) looks contacts up by email.
+CREATE INDEX IF NOT EXISTS idx_contacts_email ON contacts(email);
+
+-- What each event's JSON columns say its attendees are. The triggers and the
+-- backfill read these filtered to one event / all events respectively.
+DROP VIEW IF EXISTS v_calendar_attendees_from_json;
+CREATE VIEW IF NOT EXISTS v_calendar_attendees_from_json AS
+SELECT event_id,
+  (SELECT c.id FROM contacts c WHERE c.email = a.email LIMIT 1) AS contact_id,
+  email, response_status, start_time
+FROM (
+  SELECT
+    ce.id AS event_id,
+    CASE j.type WHEN 'object' THEN json_extract(j.value, '$.email')
+                WHEN 'text' THEN j.value END AS email,
+    CASE j.type WHEN 'object' THEN json_extract(j.value, '$.status') END AS response_status,
+    ce.start_time
+  FROM calendar_events ce,
+    json_each(CASE WHEN json_valid(ce.attendees) THEN ce.attendees ELSE '[]' END) j
+) a
+WHERE email LIKE '%@%';
+
+DROP VIEW IF EXISTS v_calendar_attendees_from_ids;
+CREATE VIEW IF NOT EXISTS v_calendar_attendees_from_ids AS
+SELECT
+  ce.id AS event_id,
+  c.id AS contact_id,
+  NULL AS email,
+  NULL AS response_status,
+  ce.start_time
+FROM calendar_events ce,
+  json_each(CASE WHEN json_valid(ce.contact_ids) THEN ce.contact_ids
+                 WHEN json_valid('[' || ce.contact_ids || ']') THEN '[' || ce.contact_ids || ']'
+                 ELSE '[]' END) j
+JOIN contacts c ON c.id = CAST(j.value AS INTEGER);
+
+-- Trigger bodies use ON CONFLICT DO NOTHING rather than INSERT OR IGNORE:
+-- google_sync writes events with an UPSERT, and inside triggers fired by its
+-- DO UPDATE, SQLite applies the outer statement's ABORT policy over a
+-- trigger's OR IGNORE. An upsert-clause on the inner INSERT is honoured.
+CREATE TRIGGER IF NOT EXISTS trg_cea_events_ai AFTER INSERT ON calendar_events BEGIN
+  INSERT INTO calendar_event_attendees (event_id, contact_id, email, response_status, start_time)
+    SELECT * FROM v_calendar_attendees_from_json WHERE event_id = NEW.id
+    ON CONFLICT DO NOTHING;
+  INSERT INTO calendar_event_attendees (event_id, contact_id, email, response_status, start_time)
+    SELECT * FROM v_calendar_attendees_from_ids WHERE event_id = NEW.id
+    ON CONFLICT DO NOTHING;
+END;
+
+-- Re-syncs rewrite both JSON columns on every event; only rebuild when they
+-- actually changed, so an unchanged event doesn't churn its attendee rows
+-- (and mark every attendee's contact_health dirty).
+CREATE TRIGGER IF NOT EXISTS trg_cea_events_au AFTER UPDATE OF attendees, contact_ids ON calendar_events
+WHEN OLD.attendees IS NOT NEW.attendees OR OLD.contact_ids IS NOT NEW.contact_ids BEGIN
+  DELETE FROM calendar_event_attendees WHERE event_id = NEW.id;
+  INSERT INTO calendar_event_attendees (event_id, contact_id, email, response_status, start_time)
+    SELECT * FROM v_calendar_attendees_from_json WHERE event_id = NEW.id
+    ON CONFLICT DO NOTHING;
+  INSERT INTO calendar_event_attendees (event_id, contact_id, email, response_status, start_time)
+    SELECT * FROM v_calendar_attendees_from_ids WHERE event_id = NEW.id
+    ON CONFLICT DO NOTHING;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_cea_events_start_au AFTER UPDATE OF start_time ON calendar_events
+WHEN OLD.start_time IS NOT NEW.start_time BEGIN
+  UPDATE calendar_event_attendees SET start_time = NEW.start_time WHERE event_id = NEW.id;
+END;
+
+-- ON DELETE CASCADE covers connections with foreign_keys on; this covers the rest.
+CREATE TRIGGER IF NOT EXISTS trg_cea_events_ad AFTER DELETE ON calendar_events BEGIN
+  DELETE FROM calendar_event_attendees WHERE event_id = OLD.id;
+END;
+
+-- Backfill events synced before this migration.
+INSERT OR IGNORE INTO calendar_event_attendees (event_id, contact_id, email, response_status, start_time)
+  SELECT * FROM v_calendar_attendees_from_json;
+INSERT OR IGNORE INTO calendar_event_attendees (event_id, contact_id, email, response_status, start_time)
+  SELECT * FROM v_calendar_attendees_from_ids;
+
+-- contact_health (025): next_meeting via the junction table instead of LIKE.
+DROP VIEW IF EXISTS v_contact_health_live;
+CREATE VIEW IF NOT EXISTS v_contact_health_live AS
+SELECT
+  c.id,
+  c.name,
+  c.email,
+  c.company,
+  c.role,
+  c.status,
+
+  -- Email stats (last 30 days)
+  (SELECT COUNT(*) FROM emails WHERE contact_id = c.id
+    AND received_at > datetime('now', '-30 days')) AS emails_30d,
+  (SELECT COUNT(*) FROM emails WHERE contact_id = c.id
+    AND direction = 'inbound'
+    AND received_at > datetime('now', '-30 days')) AS emails_inbound_30d,
+  (SELECT COUNT(*) FROM emails WHERE contact_id = c.id
+    AND direction = 'outbound'
+    AND received_at > datetime('now', '-30 days')) AS emails_outbound_30d,
+  (SELECT COUNT(DISTINCT thread_id) FROM emails WHERE contact_id = c.id
+    AND received_at > datetime('now', '-30 days')) AS threads_30d,
+  (SELECT COUNT(*) FROM emails WHERE contact_id = c.id) AS emails_total,
+
+  -- Interaction stats
+  (SELECT COUNT(*) FROM contact_interactions WHERE contact_id = c.id
+    AND occurred_at > datetime('now', '-30 days')) AS interactions_30d,
+  (SELECT COUNT(*) FROM contact_interactions WHERE contact_id = c.id) AS interactions_total,
+
+  -- Last activity (most recent across interactions, emails, transcripts, AND SLACK)
+  (SELECT MAX(ts) FROM (
+    SELECT MAX(occurred_at) AS ts FROM contact_interactions WHERE contact_id = c.id
+    UNION ALL
+    SELECT MAX(received_at) FROM emails WHERE contact_id = c.id
+    UNION ALL
+    SELECT MAX(t.occurred_at) FROM transcripts t
+      JOIN transcript_participants tp ON tp.transcript_id = t.id
+      WHERE tp.contact_id = c.id
+    UNION ALL
+    SELECT MAX(received_at) FROM slack_messages WHERE contact_id = c.id
+  )) AS last_activity,
+
+  -- Days since last activity (NULL if no activity) — now includes Slack
+  CAST(julianday('now') - julianday(
+    (SELECT MAX(ts) FROM (
+      SELECT MAX(occurred_at) AS ts FROM contact_interactions WHERE contact_id = c.id
+      UNION ALL
+      SELECT MAX(received_at) FROM emails WHERE contact_id = c.id
+      UNION ALL
+      SELECT MAX(t.occurred_at) FROM transcripts t
+        JOIN transcript_participants tp ON tp.transcript_id = t.id
+        WHERE tp.contact_id = c.id
+      UNION ALL
+      SELECT MAX(received_at) FROM slack_messages WHERE contact_id = c.id
+    ))
+  ) + 0.5 AS INTEGER) AS days_silent,
+
+  -- Transcript/call stats
+  (SELECT COUNT(DISTINCT tp.transcript_id) FROM transcript_participants tp
+    WHERE tp.contact_id = c.id) AS transcripts_total,
+  (SELECT COUNT(DISTINCT tp.transcript_id) FROM transcript_participants tp
+    JOIN transcripts t ON t.id = tp.transcript_id
+    WHERE tp.contact_id = c.id
+    AND t.occurred_at > datetime('now', '-30 days')) AS transcripts_30d,
+
+  -- Slack stats (last 30 days)
+  (SELECT COUNT(*) FROM slack_messages WHERE contact_id = c.id
+    AND received_at > datetime('now', '-30 days')) AS slack_messages_30d,
+  (SELECT COUNT(*) FROM slack_messages WHERE contact_id = c.id) AS slack_messages_total,
+
+  -- Open commitments (you owe them)
+  (SELECT COUNT(*) FROM commitments com
+    WHERE com.status IN ('open', 'overdue')
+    AND com.is_user_commitment = 1
+    AND com.transcript_id IN (
+      SELECT transcript_id FROM transcript_participants WHERE contact_id = c.id
+    )) AS your_open_commitments,
+
+  -- Open commitments (they owe you)
+  (SELECT COUNT(*) FROM commitments com
+    WHERE com.status IN ('open', 'overdue')
+    AND com.is_user_commitment = 0
+    AND com.owner_contact_id = c.id) AS their_open_commitments,
+
+  -- Overdue commitments (either direction)
+  (SELECT COUNT(*) FROM commitments com
+    WHERE com.status IN ('open', 'overdue')
+    AND com.deadline_date < date('now')
+    AND (com.owner_contact_id = c.id
+      OR (com.is_user_commitment = 1 AND com.transcript_id IN (
+        SELECT transcript_id FROM transcript_participants WHERE contact_id = c.id
+      )))) AS overdue_commitments,
+
+  -- Pending follow-ups
+  (SELECT COUNT(*) FROM follow_ups WHERE contact_id = c.id
+    AND status = 'pending') AS pending_follow_ups,
+  (SELECT COUNT(*) FROM follow_ups WHERE contact_id = c.id
+    AND status = 'pending' AND due_date < date('now')) AS overdue_follow_ups,
+
+  -- Next upcoming event with this contact
+  (SELECT MIN(a.start_time) FROM calendar_event_attendees a
+    JOIN calendar_events ce ON ce.id = a.event_id
+    WHERE a.contact_id = c.id
+    AND a.start_time > datetime('now')
+    AND ce.status != 'cancelled') AS next_meeting,
+
+  -- Active projects where this contact is the client
+  (SELECT COUNT(*) FROM projects WHERE client_id = c.id
+    AND status IN ('active', 'planning')) AS active_projects,
+
+  -- Latest relationship score
+  (SELECT relationship_depth FROM relationship_scores
+    WHERE contact_id = c.id ORDER BY score_date DESC LIMIT 1) AS relationship_depth,
+  (SELECT trajectory FROM relationship_scores
+    WHERE contact_id = c.id ORDER BY score_date DESC LIMIT 1) AS trajectory,
+  (SELECT commitment_follow_through FROM relationship_scores
+    WHERE contact_id = c.id ORDER BY score_date DESC LIMIT 1) AS follow_through,
+  (SELECT talk_ratio_avg FROM relationship_scores
+    WHERE contact_id = c.id ORDER BY score_date DESC LIMIT 1) AS talk_ratio_avg,
+  (SELECT notes FROM relationship_scores
+    WHERE contact_id = c.id ORDER BY score_date DESC LIMIT 1) AS relationship_notes
+
+FROM contacts c
+WHERE c.status = 'active';
+
+-- contact_health dirty tracking: attendee rows replace the LIKE triggers.
+-- Event inserts, deletes and start_time changes reach these through the
+-- trg_cea_* triggers above; only a status change needs its own.
+DROP TRIGGER IF EXISTS trg_ch_events_ai;
+DROP TRIGGER IF EXISTS trg_ch_events_ad;
+DROP TRIGGER IF EXISTS trg_ch_events_au;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_attendees_ai AFTER INSERT ON calendar_event_attendees BEGIN
+  INSERT INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL
+    ON CONFLICT DO NOTHING;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_attendees_ad AFTER DELETE ON calendar_event_attendees BEGIN
+  INSERT INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL
+    ON CONFLICT DO NOTHING;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_attendees_au AFTER UPDATE OF contact_id, start_time ON calendar_event_attendees BEGIN
+  INSERT INTO contact_health_dirty (contact_id) SELECT OLD.contact_id WHERE OLD.contact_id IS NOT NULL
+    ON CONFLICT DO NOTHING;
+  INSERT INTO contact_health_dirty (contact_id) SELECT NEW.contact_id WHERE NEW.contact_id IS NOT NULL
+    ON CONFLICT DO NOTHING;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ch_events_status_au AFTER UPDATE OF status ON calendar_events BEGIN
+  INSERT INTO contact_health_dirty (contact_id)
+    SELECT contact_id FROM calendar_event_attendees
+    WHERE event_id = NEW.id AND contact_id IS NOT NULL
+    ON CONFLICT DO NOTHING;
+END;
+
+-- Re-fill so stored next_meeting values come from the new definition.
+DELETE FROM contact_health;
+INSERT INTO contact_health SELECT * FROM v_contact_health_live;
+DELETE FROM contact_health_dirty;
+INSERT OR REPLACE INTO soy_meta (key, value, updated_at)
+VALUES ('contact_health_swept_at', datetime('now'), datetime('now'));
@@ -0,0 +1,22 @@
+-- 027_slack_channel_high_water.sql — per-channel Slack high-water mark
+--
+-- slack_sync used to re-read a fixed days=7 window of every monitored channel
+-- on every run. latest_synced_ts records the newest message ts sync has seen
+-- in the channel, so the next run asks conversations.history only for
+-- messages after it (oldest=latest_synced_ts) and API volume follows the
+-- number of new messages. NULL means "never synced": the first run falls back
+-- to the days window.
+--
+-- ALTER stays FIRST: a re-run outside the ledger hits "duplicate column" and
+-- the runner skips the rest of the file.
+
+ALTER TABLE slack_channels ADD COLUMN latest_synced_ts TEXT;
+
+-- Seed from what's already stored so existing installs don't re-read their
+-- window. slack_message_id is '<channel_id>_<ts>'; Slack ts values are
+-- fixed-width ('1700000000.000100'), so MAX on the text is MAX on time.
+UPDATE slack_channels SET latest_synced_ts = (
+    SELECT MAX(substr(m.slack_message_id, length(m.channel_id) + 2))
+    FROM slack_messages m
+    WHERE m.channel_id = slack_channels.slack_channel_id
+);
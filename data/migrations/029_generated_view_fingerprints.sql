@@ -0,0 +1,19 @@
+-- 029_generated_view_fingerprints.sql — incremental page rendering
+--
+-- scripts/render.py used to rebuild every page on every run. Each
+-- generated_views row now records what its file was built from:
+--   input_fingerprint — sha256 of the page's inputs (the contact's own row
+--                       versions for an entity page, module-level table
+--                       signatures for the dashboard / module views, plus the
+--                       template hash and today's date). A page whose
+--                       fingerprint hasn't moved isn't rebuilt.
+--   content_hash      — sha256 of the rendered HTML (minus the "generated at"
+--                       stamp); a rebuild that produces the same bytes skips
+--                       the file write.
+-- NULL means "unknown": the next render rebuilds the page.
+--
+-- ALTERs only: a re-run outside the ledger hits "duplicate column" on the
+-- first and the runner skips the rest of the file.
+
+ALTER TABLE generated_views ADD COLUMN input_fingerprint TEXT;
+ALTER TABLE generated_views ADD COLUMN content_hash TEXT;
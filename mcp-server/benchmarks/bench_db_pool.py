@@ -0,0 +1,99 @@
+"""Microbenchmark: connect-per-call vs the per-thread connection pool.
+
+Times the real tool entry points that fan out into many ``db.execute`` calls
+— ``get_overview`` (through FastMCP's ``call_tool``) and the dashboard render
+(``views._render_dashboard``) — once with pooling disabled (the old
+connect/pragma/close per query) and once with it on.
+
+Runs against a throwaway seeded database under a temp ``XDG_DATA_HOME``;
+your real data is never touched.
+
+Usage:
+    python benchmarks/bench_db_pool.py [--iterations=N]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ["XDG_DATA_HOME"] = tempfile.mkdtemp(prefix="soy-bench-")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from software_of_you import db  # noqa: E402
+from software_of_you.server import create_server  # noqa: E402
+from software_of_you.tools import views  # noqa: E402
+
+
+def _seed() -> None:
+    db.init_db()
+    statements = []
+    for i in range(200):
+        statements.append((
+            "INSERT INTO contacts (name, email, company, type, status) "
+            "VALUES (?, ?, 'Acme', 'individual', 'active')",
+            (f"Contact {i}", f"c{i}@example.com"),
+        ))
+    for i in range(500):
+        statements.append((
+            "INSERT INTO emails (gmail_id, thread_id, subject, from_address, "
+            "direction, contact_id, received_at) VALUES (?, ?, ?, ?, 'inbound', ?, "
+            "datetime('now', ?))",
+            (f"m{i}", f"t{i % 120}", f"Subject {i}", f"c{i % 200}@example.com",
+             i % 200 + 1, f"-{i % 30} days"),
+        ))
+    # Mark services fresh so the tools never try to reach Google mid-benchmark.
+    for key in ("gmail_last_synced", "calendar_last_synced"):
+        statements.append((
+            "INSERT OR REPLACE INTO soy_meta (key, value, updated_at) "
+            "VALUES (?, datetime('now', 'localtime'), datetime('now'))",
+            (key,),
+        ))
+    db.execute_many(statements)
+
+
+def _time(label: str, fn, iterations: int) -> float:
+    fn()  # warm up templates / page cache
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    per_call = (time.perf_counter() - start) / iterations * 1000
+    print(f"  {label:<24} {per_call:8.2f} ms/call")
+    return per_call
+
+
+def main(argv: list[str]) -> int:
+    iterations = 50
+    for arg in argv:
+        if arg.startswith("--iterations="):
+            iterations = int(arg.split("=", 1)[1])
+
+    _seed()
+    server = create_server()
+    targets = {
+        "get_overview": lambda: asyncio.run(server.call_tool("get_overview", {})),
+        "dashboard render": lambda: views._render_dashboard(open_after=False),
+    }
+
+    pool_size = db.POOL_SIZE or 8
+    results = {}
+    for mode, size in (("connect-per-call", 0), ("pooled", pool_size)):
+        db.configure_pool(size)
+        print(f"{mode} (pool size {size}):")
+        results[mode] = {
+            name: _time(name, fn, iterations) for name, fn in targets.items()
+        }
+
+    print("speedup:")
+    for name in targets:
+        before = results["connect-per-call"][name]
+        after = results["pooled"][name]
+        print(f"  {name:<24} {before / after:8.2f}x")
+    db.close_pool()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
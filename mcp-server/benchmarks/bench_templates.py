@@ -0,0 +1,131 @@
+"""Benchmark: cold and warm view-render latency with the template caches.
+
+Cold is the first dashboard + entity page a fresh process renders (what the
+MCP server pays after a restart, or each ``render.py --jobs`` worker),
+measured in a subprocess for each template-cache state:
+
+  * no disk cache (``SOY_TEMPLATE_CACHE=0``) — parse and compile everything;
+  * bytecode cache — compiled code unpickled from ``template-cache/bytecode``;
+  * precompiled — modules from ``software-of-you compile-templates``.
+
+Warm is the steady state inside one process: the shared environment versus
+building a new ``jinja2.Environment`` per render, as the views used to.
+
+Runs against a throwaway seeded database under a temp ``XDG_DATA_HOME``;
+your real data is never touched.
+
+Usage:
+    python benchmarks/bench_templates.py [--iterations=N]
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+if "XDG_DATA_HOME" not in os.environ or "--child" not in sys.argv:
+    os.environ["XDG_DATA_HOME"] = tempfile.mkdtemp(prefix="soy-bench-")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import jinja2  # noqa: E402
+
+from software_of_you import db, templating  # noqa: E402
+from software_of_you.tools import views  # noqa: E402
+
+
+def _seed() -> None:
+    db.init_db()
+    statements = []
+    for i in range(50):
+        statements.append((
+            "INSERT INTO contacts (name, email, company, type, status) "
+            "VALUES (?, ?, 'Acme', 'individual', 'active')",
+            (f"Contact {i}", f"c{i}@example.com"),
+        ))
+    for i in range(200):
+        statements.append((
+            "INSERT INTO emails (gmail_id, thread_id, subject, from_address, "
+            "direction, contact_id, received_at) VALUES (?, ?, ?, ?, 'inbound', ?, "
+            "datetime('now', ?))",
+            (f"m{i}", f"t{i % 40}", f"Subject {i}", f"c{i % 50}@example.com",
+             i % 50 + 1, f"-{i % 30} days"),
+        ))
+    db.execute_many(statements)
+
+
+def _render() -> None:
+    views._render_dashboard(open_after=False)
+    views._render_entity_page(1, "", open_after=False)
+
+
+def _child() -> int:
+    """Time this fresh process's first render; print the ms as JSON."""
+    start = time.perf_counter()
+    _render()
+    print(json.dumps({"ms": (time.perf_counter() - start) * 1000}))
+    return 0
+
+
+def _cold(label: str, extra_env: dict, runs: int = 5) -> float:
+    env = {**os.environ, **extra_env}
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, __file__, "--child"], env=env,
+            capture_output=True, text=True, check=True,
+        ).stdout
+        samples.append(json.loads(out.splitlines()[-1])["ms"])
+    best = min(samples)
+    print(f"  {label:<28} {best:8.2f} ms (best of {runs})")
+    return best
+
+
+def _warm(label: str, iterations: int) -> float:
+    _render()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        _render()
+    per_call = (time.perf_counter() - start) / iterations * 1000
+    print(f"  {label:<28} {per_call:8.2f} ms/call")
+    return per_call
+
+
+def main(argv: list[str]) -> int:
+    if "--child" in argv:
+        return _child()
+    iterations = 50
+    for arg in argv:
+        if arg.startswith("--iterations="):
+            iterations = int(arg.split("=", 1)[1])
+
+    _seed()
+    cache = db.DATA_DIR / "template-cache"
+    shutil.rmtree(cache, ignore_errors=True)
+
+    print("cold (first render in a new process):")
+    _cold("no disk cache", {"SOY_TEMPLATE_CACHE": "0"})
+    _render()  # fill the bytecode cache
+    _cold("bytecode cache", {})
+    templating.precompile()
+    _cold("precompiled", {})
+
+    print("warm (same process):")
+    shared = _warm("shared env", iterations)
+    real_get_env = templating.get_env
+    templating.get_env = lambda: jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(templating.TEMPLATES_DIR)),
+        autoescape=jinja2.select_autoescape(["html"]),
+    )
+    fresh = _warm("new env per render (old)", iterations)
+    templating.get_env = real_get_env
+    print(f"  speedup {fresh / shared:8.2f}x")
+    db.close_pool()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
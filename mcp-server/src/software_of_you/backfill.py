@@ -0,0 +1,410 @@
+"""Resumable historical backfill for Gmail, Calendar and Slack.
+
+Regular syncs only look back a week, which is plenty for keeping up but
+leaves relationship history for long-standing contacts nearly empty. A
+backfill walks each source's full history a page at a time:
+
+  * Gmail — messages.list over the whole mailbox (spam and trash excluded),
+    newest first, following ``nextPageToken``;
+  * Calendar — events.list from ``CALENDAR_SINCE`` up to the moment the
+    backfill first started (later events are the regular sync's job);
+  * Slack — conversations.history per monitored channel, walking backwards
+    with ``latest`` set to the oldest message stored so far.
+
+Each of those, per Google account or Slack channel, is a *stream*. After
+every page the stream's checkpoint (page token / oldest ts, item count, done
+flag) is written to soy_meta in the same transaction as the page's rows, so
+an interrupted backfill resumes exactly where it stopped and never skips a
+page it didn't store. Finished streams are skipped on the next run;
+``reset()`` clears every checkpoint to start over.
+
+Requests go through ``fetcher``, so they share the per-host limits with
+interactive syncs, and the runner pauses ``PAUSE_SECS`` between pages to
+leave most of each API's quota to them. ``start()`` runs the backfill on a
+background thread, so the MCP server keeps answering tools while it runs;
+the CLI calls ``run()`` in the foreground.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timezone
+from typing import Callable
+
+from software_of_you import fetcher, google_sync, slack_sync
+from software_of_you.contact_index import ContactIndex
+from software_of_you.db import execute, execute_batches, execute_write
+
+SOURCES = ("gmail", "calendar", "slack")
+
+PAUSE_SECS = float(os.environ.get("SOY_BACKFILL_PAUSE", "0.25"))
+GMAIL_PAGE_SIZE = 100  # two metadata batches per page
+CALENDAR_PAGE_SIZE = 250
+CALENDAR_SINCE = "2000-01-01T00:00:00Z"
+
+_CHECKPOINT_PREFIX = "backfill:"
+_CHECKPOINT_SQL = "INSERT OR REPLACE INTO soy_meta (key, value, updated_at) VALUES (?, ?, datetime('now'))"
+
+
+# ── Checkpoints ──────────────────────────────────────────────────────
+
+
+def _load_checkpoint(key: str) -> dict:
+    rows = execute("SELECT value FROM soy_meta WHERE key = ?", (key,))
+    if rows and rows[0]["value"]:
+        try:
+            return json.loads(rows[0]["value"])
+        except ValueError:
+            pass
+    return {}
+
+
+def saved_checkpoints() -> list[dict]:
+    """Every stream's persisted progress, including streams of past runs."""
+    rows = execute(
+        "SELECT key, value, updated_at FROM soy_meta WHERE key LIKE ? ORDER BY key",
+        (_CHECKPOINT_PREFIX + "%",),
+    )
+    out = []
+    for r in rows:
+        try:
+            checkpoint = json.loads(r["value"])
+        except (TypeError, ValueError):
+            continue
+        out.append({
+            "stream": r["key"][len(_CHECKPOINT_PREFIX):],
+            "items": checkpoint.get("items", 0),
+            "done": checkpoint.get("done", False),
+            "updated_at": r["updated_at"],
+        })
+    return out
+
+
+def reset(sources: tuple[str, ...] | list[str] = SOURCES) -> int:
+    """Forget the checkpoints of ``sources`` so the next backfill starts over."""
+    return sum(
+        execute_write("DELETE FROM soy_meta WHERE key LIKE ?", (f"{_CHECKPOINT_PREFIX}{source}:%",))
+        for source in sources
+    )
+
+
+# ── Streams ──────────────────────────────────────────────────────────
+
+
+class _Stream:
+    """One paginated history walk with a soy_meta checkpoint.
+
+    ``fetch_page(checkpoint)`` fetches and parses the next page and returns
+    ``(items, batches, next_checkpoint, done)``: how many items the page held,
+    the ``execute_batches`` writes that store them, and the checkpoint to
+    commit alongside those writes.
+    """
+
+    def __init__(self, source: str, scope: str, fetch_page: Callable, total: int | None = None):
+        self.source = source
+        self.scope = scope
+        self.key = f"{_CHECKPOINT_PREFIX}{source}:{scope}"
+        self.fetch_page = fetch_page
+        self.total = total
+        self.checkpoint = _load_checkpoint(self.key)
+        self.items_this_run = 0
+        self.pages_this_run = 0
+        self.active_secs = 0.0
+        self.error: str | None = None
+
+    @property
+    def done(self) -> bool:
+        return bool(self.checkpoint.get("done"))
+
+    def step(self) -> None:
+        """Fetch, store and checkpoint one page."""
+        started = time.monotonic()
+        items, batches, next_checkpoint, done = self.fetch_page(self.checkpoint)
+        checkpoint = {
+            **next_checkpoint,
+            "items": self.checkpoint.get("items", 0) + items,
+            "pages": self.checkpoint.get("pages", 0) + 1,
+            "done": done,
+        }
+        execute_batches([*batches, (_CHECKPOINT_SQL, [(self.key, json.dumps(checkpoint))])])
+        self.checkpoint = checkpoint
+        self.items_this_run += items
+        self.pages_this_run += 1
+        self.active_secs += time.monotonic() - started
+
+    def progress(self) -> dict:
+        items = self.checkpoint.get("items", 0)
+        rate = self.items_this_run / self.active_secs if self.active_secs else 0.0
+        eta = None
+        if self.done:
+            eta = 0
+        elif self.total and rate:
+            eta = round(max(self.total - items, 0) / rate)
+        out = {
+            "source": self.source,
+            "scope": self.scope,
+            "items": items,
+            "pages": self.checkpoint.get("pages", 0),
+            "done": self.done,
+            "items_per_sec": round(rate, 1),
+            "eta_secs": eta,
+        }
+        if self.total is not None:
+            out["total"] = self.total
+        if self.error:
+            out["error"] = self.error
+        return out
+
+
+def _gmail_stream(token: str, account_email: str | None) -> _Stream:
+    account_id = google_sync._lookup_account_id(account_email)
+    user_email = account_email or google_sync._get_user_email(token)
+    contacts = ContactIndex()
+    state = {"token": token}
+    try:
+        profile, state["token"] = google_sync._get_with_refresh(
+            f"{google_sync.GMAIL_API}/profile", token, account_email,
+        )
+        total = profile.get("messagesTotal")
+    except Exception:
+        total = None
+
+    def fetch_page(checkpoint: dict):
+        url = f"{google_sync.GMAIL_API}/messages?maxResults={GMAIL_PAGE_SIZE}"
+        if checkpoint.get("page_token"):
+            url += f"&pageToken={urllib.parse.quote(checkpoint['page_token'])}"
+        data, state["token"] = google_sync._get_with_refresh(url, state["token"], account_email)
+        ids = list(dict.fromkeys(m["id"] for m in data.get("messages", [])))
+        known = google_sync._known_gmail_ids(ids)
+        fetched, failed, state["token"] = google_sync._gmail_fetch_metadata(
+            [m for m in ids if m not in known], state["token"], account_email,
+        )
+        if failed:
+            # Leave the checkpoint on this page so a resume retries it. A
+            # message deleted since the listing (404) isn't a failure.
+            raise RuntimeError(f"{failed} messages could not be fetched")
+        # messages.list includes drafts; skip them as sync_gmail does.
+        rows = [
+            google_sync._gmail_email_row(msg_id, msg, user_email, account_id, contacts)
+            for msg_id, msg in fetched.items()
+            if not google_sync._GMAIL_SKIP_LABELS & set(msg.get("labelIds", []))
+        ]
+        next_token = data.get("nextPageToken")
+        return len(ids), [(google_sync._EMAIL_INSERT_SQL, rows)], {"page_token": next_token}, not next_token
+
+    return _Stream("gmail", account_email or "default", fetch_page, total)
+
+
+def _calendar_stream(token: str, account_email: str | None, calendar_id: str = "primary") -> _Stream:
+    account_id = google_sync._lookup_account_id(account_email)
+    contacts = ContactIndex()
+    state = {"token": token}
+
+    def fetch_page(checkpoint: dict):
+        # Pin the upper bound on the first page so every later page (and
+        # every resume) walks the same listing its page tokens belong to.
+        time_max = checkpoint.get("time_max") or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        url = (
+            f"{google_sync.CALENDAR_API}/calendars/{urllib.parse.quote(calendar_id)}/events"
+            f"?singleEvents=true&maxResults={CALENDAR_PAGE_SIZE}"
+            f"&timeMin={urllib.parse.quote(CALENDAR_SINCE)}&timeMax={urllib.parse.quote(time_max)}"
+        )
+        if checkpoint.get("page_token"):
+            url += f"&pageToken={urllib.parse.quote(checkpoint['page_token'])}"
+        data, state["token"] = google_sync._get_with_refresh(
+            fetcher.with_fields(url, google_sync.CALENDAR_EVENT_FIELDS),
+            state["token"], account_email,
+        )
+        events = [ev for ev in data.get("items", []) if ev.get("id")]
+        rows = [
+            google_sync._calendar_event_row(ev, account_id, calendar_id, contacts)
+            for ev in events if ev.get("status") != "cancelled"
+        ]
+        next_token = data.get("nextPageToken")
+        return (
+            len(events),
+            [(google_sync._CALENDAR_UPSERT_SQL, rows)],
+            {"page_token": next_token, "time_max": time_max},
+            not next_token,
+        )
+
+    scope = google_sync._meta_key(calendar_id, account_email)
+    return _Stream("calendar", scope, fetch_page)
+
+
+def _slack_stream(token: str, channel_id: str, channel_name: str, user_cache: dict) -> _Stream:
+    contacts = ContactIndex()
+
+    def fetch_page(checkpoint: dict):
+        params = {"channel": channel_id, "limit": str(slack_sync.SLACK_PAGE_SIZE)}
+        if checkpoint.get("latest"):
+            params["latest"] = checkpoint["latest"]
+        history = slack_sync._api_get("conversations.history", token, params)
+        messages = [m for m in history.get("messages", []) if m.get("ts")]
+        rows = [
+            row for row in (
+                slack_sync._message_row(m, channel_id, channel_name, user_cache, contacts) for m in messages
+            ) if row
+        ]
+        # Newest first: the next page is everything older than this one.
+        latest = min((m["ts"] for m in messages), key=float, default=checkpoint.get("latest"))
+        done = not (history.get("has_more") and messages)
+        return len(messages), [(slack_sync._MESSAGE_INSERT_SQL, rows)], {"latest": latest}, done
+
+    return _Stream("slack", channel_id, fetch_page)
+
+
+def _open_streams(sources: list[str]) -> tuple[list[_Stream], list[dict]]:
+    """Build a stream per source × account (or channel). Returns ``(streams, errors)``."""
+    streams: list[_Stream] = []
+    errors: list[dict] = []
+    google = [s for s in ("gmail", "calendar") if s in sources]
+    if google:
+        google_sync.migrate_legacy_token()
+        accounts = [a["email"] for a in google_sync.list_accounts() if a["status"] == "active"] or [None]
+        for email in accounts:
+            token = google_sync.get_valid_token(email=email)
+            if not token:
+                errors.append({"source": "google", "scope": email or "default", "error": "Not authenticated with Google."})
+                continue
+            for source in google:
+                try:
+                    opener = _gmail_stream if source == "gmail" else _calendar_stream
+                    streams.append(opener(token, email))
+                except Exception as e:
+                    errors.append({"source": source, "scope": email or "default", "error": str(e)})
+
+    if "slack" in sources:
+        token = slack_sync.get_bot_token()
+        if not token:
+            errors.append({"source": "slack", "error": "Not connected to Slack."})
+        else:
+            channels = execute("SELECT slack_channel_id, name FROM slack_channels WHERE is_monitored = 1")
+            user_cache = slack_sync._load_users(token) if channels else {}
+            streams.extend(
+                _slack_stream(token, ch["slack_channel_id"], ch["name"], user_cache) for ch in channels
+            )
+    return streams, errors
+
+
+# ── Runner ───────────────────────────────────────────────────────────
+
+
+class Backfill:
+    """One backfill run over ``sources``; streams are walked one after another."""
+
+    def __init__(self, sources: tuple[str, ...] | list[str] = SOURCES):
+        self.sources = list(sources)
+        self.state = "starting"
+        self.streams: list[_Stream] = []
+        self.errors: list[dict] = []
+        self.started = time.monotonic()
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.finished: float | None = None
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run(self, on_page: Callable[["Backfill"], None] | None = None) -> dict:
+        try:
+            self.streams, self.errors = _open_streams(self.sources)
+            self.state = "running"
+            for stream in self.streams:
+                while not stream.done and not self._stop.is_set():
+                    try:
+                        stream.step()
+                    except Exception as e:
+                        stream.error = str(e)
+                        print(f"Backfill {stream.key} stopped: {e}", file=sys.stderr)
+                        break
+                    if on_page:
+                        on_page(self)
+                    self._stop.wait(PAUSE_SECS)
+                if self._stop.is_set():
+                    break
+            self.state = "stopped" if self._stop.is_set() else "finished"
+        except Exception as e:
+            self.errors.append({"error": str(e)})
+            self.state = "failed"
+        self.finished = time.monotonic()
+        return self.status()
+
+    def status(self) -> dict:
+        elapsed = (self.finished or time.monotonic()) - self.started
+        items = sum(s.items_this_run for s in self.streams)
+        streams = [s.progress() for s in self.streams]
+        etas = [s["eta_secs"] for s in streams if not s["done"] and "error" not in s]
+        out = {
+            "state": self.state,
+            "sources": self.sources,
+            "started_at": self.started_at,
+            "elapsed_secs": round(elapsed, 1),
+            "items": items,
+            "items_per_sec": round(items / elapsed, 1) if elapsed else 0.0,
+            # Streams run one after another, so the run's ETA is their sum —
+            # unknown while any unfinished stream can't estimate its own.
+            "eta_secs": sum(etas) if None not in etas else None,
+            "streams": streams,
+        }
+        if self.errors:
+            out["errors"] = self.errors
+        return out
+
+
+_current: Backfill | None = None
+_current_lock = threading.Lock()
+
+
+def _check_sources(sources) -> list[str]:
+    sources = list(sources or SOURCES)
+    unknown = [s for s in sources if s not in SOURCES]
+    if unknown:
+        raise ValueError(f"Unknown source: {', '.join(unknown)}. Use: {', '.join(SOURCES)}")
+    return sources
+
+
+def run(sources=None, on_page: Callable[[Backfill], None] | None = None) -> dict:
+    """Backfill ``sources`` in the foreground; returns the final status."""
+    try:
+        sources = _check_sources(sources)
+    except ValueError as e:
+        return {"error": str(e)}
+    return Backfill(sources).run(on_page)
+
+
+def start(sources=None) -> dict:
+    """Start a backfill on a background thread (one at a time per process)."""
+    global _current
+    try:
+        sources = _check_sources(sources)
+    except ValueError as e:
+        return {"error": str(e)}
+    with _current_lock:
+        if _current and _current.finished is None:
+            return {**_current.status(), "message": "A backfill is already running."}
+        _current = Backfill(sources)
+        threading.Thread(target=_current.run, name="soy-backfill", daemon=True).start()
+        return _current.status()
+
+
+def stop() -> dict:
+    """Ask the running backfill to stop after its current page."""
+    with _current_lock:
+        backfill = _current
+    if not backfill or backfill.finished is not None:
+        return {"state": "idle", "message": "No backfill is running."}
+    backfill.stop()
+    return {**backfill.status(), "message": "Stopping after the current page; progress is saved."}
+
+
+def status() -> dict:
+    """Progress of this process's latest backfill, plus every saved checkpoint."""
+    with _current_lock:
+        backfill = _current
+    out = backfill.status() if backfill else {"state": "idle"}
+    out["checkpoints"] = saved_checkpoints()
+    return out
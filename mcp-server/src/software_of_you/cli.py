@@ -1,4 +1,4 @@
-"""CLI for Software of You: setup, serve, status, migrate, uninstall.
+"""CLI for Software of You: setup, serve, status, migrate, backfill, daemon, compile-templates, uninstall.
 
 Usage:
     software-of-you setup [--key=KEY]  # Activate license + configure Claude Desktop
@@ -6,6 +6,9 @@ Usage:
     software-of-you serve              # Start MCP server (called by Claude Desktop)
     software-of-you status             # Show system status
     software-of-you migrate            # Run database migrations only
+    software-of-you backfill [SOURCE]  # Import full Gmail/Calendar/Slack history (resumable)
+    software-of-you daemon             # Keep every service synced on its own schedule
+    software-of-you compile-templates  # Precompile view templates (optional, speeds up renders)
     software-of-you uninstall          # Remove MCP config + deactivate license
 """
 
@@ -287,12 +290,105 @@ def cmd_migrate() -> int:
     return 0
 
 
+def cmd_backfill() -> int:
+    """Walk full Gmail/Calendar/Slack history in the foreground, resumably.
+
+    Progress is checkpointed after every page; Ctrl-C stops cleanly and the
+    next run picks up where this one left off. ``--restart`` forgets the
+    checkpoints first.
+    """
+    from software_of_you import backfill
+
+    args = [a for a in sys.argv[2:] if not a.startswith("--")]
+    sources = args or list(backfill.SOURCES)
+    init_db()
+    if "--restart" in sys.argv[2:]:
+        backfill.reset(sources)
+
+    def report(run) -> None:
+        status = run.status()
+        eta = status["eta_secs"]
+        eta_label = f"{eta // 60}m{eta % 60:02d}s" if eta is not None else "unknown"
+        print(
+            f"\r  {status['items']} items  {status['items_per_sec']}/s  ETA {eta_label}   ",
+            end="", flush=True,
+        )
+
+    print(f"Backfilling {', '.join(sources)} (Ctrl-C to pause; rerun to resume)")
+    try:
+        result = backfill.run(sources, on_page=report)
+    except KeyboardInterrupt:
+        print("\nPaused. Progress is saved; run the same command to resume.")
+        return 130
+    print()
+    if "error" in result:
+        print(result["error"])
+        return 1
+    for stream in result["streams"]:
+        state = "done" if stream["done"] else stream.get("error", "incomplete")
+        print(f"  {stream['source']:<9} {stream['scope']:<32} {stream['items']:>7} items  {state}")
+    for error in result.get("errors", []):
+        print(f"  {error.get('source', 'backfill')}: {error['error']}")
+    return 0 if result["state"] == "finished" else 1
+
+
+def cmd_daemon() -> int:
+    """Run the sync daemon in the foreground until Ctrl-C / SIGTERM.
+
+    For machines where the MCP server isn't always running (launchd keeps
+    this alive). While another process's daemon — say, one embedded in a
+    running MCP server — owns the database, this one waits on standby and
+    takes over when that heartbeat goes stale.
+    """
+    import signal
+    import time
+
+    from software_of_you import sync_daemon
+
+    init_db()
+    try:
+        if sync_daemon.other_daemon_alive():
+            print(f"Standing by: pid {sync_daemon.status()['pid']} is already syncing.", flush=True)
+            while sync_daemon.other_daemon_alive():
+                time.sleep(sync_daemon.HEARTBEAT_SECS)
+    except KeyboardInterrupt:
+        return 0
+
+    daemon = sync_daemon.SyncDaemon()
+    intervals = ", ".join(f"{s.name} every {s.interval / 60:g}m" for s in daemon.services)
+    print(f"Sync daemon started: {intervals} (Ctrl-C to stop)", flush=True)
+    # launchd stops agents with SIGTERM: finish the current tick, then exit.
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+    try:
+        daemon.run_forever()
+    except KeyboardInterrupt:
+        daemon.save_state(stopped=True)
+        print("\nStopped.")
+    return 0
+
+
+def cmd_compile_templates() -> int:
+    """Precompile the view templates into modules the renderers load directly.
+
+    Optional: without it templates compile on first use and land in the
+    bytecode cache. Rerun after editing templates (stale builds are ignored).
+    """
+    from software_of_you import templating
+
+    result = templating.precompile()
+    print(f"Compiled {result['templates']} templates to {result['path']}")
+    return 0
+
+
 COMMANDS = {
     "setup": cmd_setup,
     "serve": cmd_serve,
     "status": cmd_status,
     "uninstall": cmd_uninstall,
     "migrate": cmd_migrate,
+    "backfill": cmd_backfill,
+    "daemon": cmd_daemon,
+    "compile-templates": cmd_compile_templates,
 }
 
 
@@ -305,6 +401,9 @@ def main() -> int:
         print("  serve              Start MCP server (used by Claude Desktop)")
         print("  status             Show system status")
         print("  migrate            Run database migrations only")
+        print("  backfill [SOURCE]  Import full history (gmail, calendar, slack); --restart to start over")
+        print("  daemon             Keep Gmail, Calendar, transcripts and Slack synced in the background")
+        print("  compile-templates  Precompile view templates for faster renders")
         print("  uninstall          Remove from Claude Desktop + deactivate license")
         return 0
 
@@ -0,0 +1,75 @@
+"""Refresher for the materialized ``contact_health`` table (migration 025).
+
+Triggers on every source table record which contacts changed in
+``contact_health_dirty``; this module folds those changes into the table and
+runs the periodic sweep that re-derives the time-relative columns (30-day
+windows, overdue counts, next_meeting). The ``v_contact_health`` shim stays
+correct without it — dirty or stale rows fall back to the live computation —
+so this is purely about keeping reads on the fast, materialized path.
+
+Call ``ensure_fresh()`` before reading ``v_contact_health`` (and outside any
+``db.snapshot()`` block — it writes). It costs one small read when there is
+nothing to do.
+"""
+
+import sys
+
+from software_of_you.db import execute, execute_many
+
+# The shim trusts materialized rows for an hour after a sweep (and only on the
+# same UTC day); sweep at half that so readers never fall off the fast path.
+SWEEP_INTERVAL_SECS = 30 * 60
+
+_FILL = "INSERT INTO contact_health SELECT * FROM v_contact_health_live"
+_STAMP = (
+    "INSERT OR REPLACE INTO soy_meta (key, value, updated_at) "
+    "VALUES ('contact_health_swept_at', datetime('now'), datetime('now'))"
+)
+
+
+def refresh_dirty() -> int:
+    """Recompute only the contacts whose inputs changed. Returns how many."""
+    n = execute("SELECT COUNT(*) AS n FROM contact_health_dirty")[0]["n"]
+    if not n:
+        return 0
+    execute_many([
+        ("DELETE FROM contact_health WHERE id IN (SELECT contact_id FROM contact_health_dirty)", ()),
+        (_FILL + " WHERE id IN (SELECT contact_id FROM contact_health_dirty)", ()),
+        ("DELETE FROM contact_health_dirty", ()),
+    ])
+    return n
+
+
+def sweep() -> int:
+    """Rebuild every row (time windows move even when no data changes)."""
+    execute_many([
+        ("DELETE FROM contact_health", ()),
+        (_FILL, ()),
+        ("DELETE FROM contact_health_dirty", ()),
+        (_STAMP, ()),
+    ])
+    return execute("SELECT COUNT(*) AS n FROM contact_health")[0]["n"]
+
+
+def ensure_fresh() -> dict:
+    """Sweep if the last sweep is due, otherwise drain the dirty set.
+
+    Returns ``{"swept": bool, "refreshed": int}``. Never raises: a failure
+    leaves the shim serving live rows, which is slower but still correct.
+    """
+    try:
+        row = execute(
+            """SELECT
+                 (SELECT value FROM soy_meta WHERE key = 'contact_health_swept_at') AS swept_at,
+                 (SELECT value FROM soy_meta WHERE key = 'contact_health_swept_at')
+                   > datetime('now', ?) AS recent,
+                 date((SELECT value FROM soy_meta WHERE key = 'contact_health_swept_at'))
+                   = date('now') AS same_day""",
+            (f"-{SWEEP_INTERVAL_SECS} seconds",),
+        )[0]
+        if not (row["swept_at"] and row["recent"] and row["same_day"]):
+            return {"swept": True, "refreshed": sweep()}
+        return {"swept": False, "refreshed": refresh_dirty()}
+    except Exception as e:
+        print(f"contact_health refresh failed: {e}", file=sys.stderr)
+        return {"swept": False, "refreshed": 0}
@@ -0,0 +1,48 @@
+"""In-memory contact lookup for the sync write paths.
+
+Syncs used to resolve every sender and attendee with its own query — a
+``SELECT id FROM contacts WHERE email = ?`` per message, plus a
+``name LIKE %…%`` per Slack sender. A ``ContactIndex`` loads the contacts
+table once per sync run and answers those lookups from dicts instead, with
+the same semantics:
+
+  * ``by_email`` is an exact match, like ``WHERE email = ?`` (the lowest id
+    wins when two contacts share an address);
+  * ``by_name`` is ``resolve_contact_by_name``'s case-insensitive substring
+    match, returning an id only when exactly one contact matches.
+
+Contacts are few (hundreds to low thousands) and a run lasts seconds, so a
+snapshot taken at the start of the run is fresh enough.
+"""
+
+from software_of_you.db import execute
+
+
+class ContactIndex:
+    def __init__(self):
+        rows = execute("SELECT id, name, email FROM contacts ORDER BY id")
+        self._by_email: dict[str, int] = {}
+        self._names: list[tuple[str, int]] = []
+        for r in rows:
+            if r["email"]:
+                self._by_email.setdefault(r["email"], r["id"])
+            if r["name"]:
+                self._names.append((r["name"].lower(), r["id"]))
+        self._name_cache: dict[str, int | None] = {}
+
+    def by_email(self, email: str | None) -> int | None:
+        return self._by_email.get(email) if email else None
+
+    def by_name(self, name: str | None) -> int | None:
+        """Unique fuzzy name match, else None (no match or ambiguous)."""
+        if not name:
+            return None
+        if name not in self._name_cache:
+            needle = name.lower()
+            ids = [cid for cname, cid in self._names if needle in cname]
+            self._name_cache[name] = ids[0] if len(ids) == 1 else None
+        return self._name_cache[name]
+
+    def match(self, name: str | None, email: str | None) -> int | None:
+        """Email first, then the fuzzy name fallback (Slack's resolution order)."""
+        return self.by_email(email) or self.by_name(name)
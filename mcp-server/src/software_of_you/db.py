@@ -5,13 +5,21 @@ the Claude Code plugin. Migrations are bundled in this package and are
 idempotent (safe to re-run every startup).
 """
 
+import atexit
 import hashlib
 import os
+import queue
+import random
 import shutil
 import sqlite3
 import sys
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 DATA_HOME = os.environ.get(
     "XDG_DATA_HOME",
@@ -25,6 +33,21 @@ MIGRATIONS_DIR = Path(__file__).parent / "migrations"
 
 MAX_BACKUPS = 5
 
+# Pooled connections (see ``_acquire``). SOY_DB_POOL_SIZE caps how many
+# per-thread connections stay open at once; 0 restores connect-per-call.
+POOL_SIZE = int(os.environ.get("SOY_DB_POOL_SIZE", "8"))
+# A pooled connection idle longer than this is probed with ``SELECT 1``
+# before reuse and replaced if the probe fails.
+POOL_HEALTH_CHECK_SECS = 30.0
+
+# Cross-process contention (pipeline.py, signals.py, render.py, the session
+# hook all write the same file): SQLite's own busy handler waits up to
+# BUSY_TIMEOUT_SECS for the lock, then writes retry BEGIN/COMMIT with jittered
+# exponential backoff before surfacing "database is locked".
+BUSY_TIMEOUT_SECS = 5.0
+BUSY_RETRIES = 4
+BUSY_BACKOFF_SECS = 0.05
+
 
 def ensure_dirs() -> None:
     """Create data directories if they don't exist."""
@@ -33,10 +56,18 @@ def ensure_dirs() -> None:
     VIEWS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def get_connection(readonly: bool = False) -> sqlite3.Connection:
-    """Get a database connection with WAL mode and row factory."""
+def get_connection(
+    readonly: bool = False, check_same_thread: bool = True
+) -> sqlite3.Connection:
+    """Get a database connection with WAL mode and row factory.
+
+    This is a fresh, caller-owned connection. The ``execute*`` helpers below
+    draw from the per-thread pool instead.
+    """
     ensure_dirs()
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = sqlite3.connect(
+        str(DB_PATH), timeout=BUSY_TIMEOUT_SECS, check_same_thread=check_same_thread
+    )
     conn.row_factory = sqlite3.Row
     if not readonly:
         conn.execute("PRAGMA journal_mode=WAL")
@@ -44,6 +75,348 @@ def get_connection(readonly: bool = False) -> sqlite3.Connection:
     return conn
 
 
+# ── Connection pool ──────────────────────────────────────────────────
+
+# Each thread keeps ONE connection in ``_pool_local.slot`` and reuses it for
+# every execute* call, so the WAL/foreign_keys pragmas and the open() syscall
+# are paid once per thread instead of once per query. ``_pool_conns`` maps
+# every live pooled connection to its owning thread so ``close_pool`` (and the
+# reaper for exited threads) can close them from anywhere — hence
+# ``check_same_thread=False`` on pooled connections; each one is still only
+# ever *used* by its owner.
+_pool_local = threading.local()
+_pool_lock = threading.Lock()
+_pool_conns: dict[sqlite3.Connection, threading.Thread] = {}
+_pool_generation = 0
+
+
+class _Slot:
+    __slots__ = ("conn", "path", "generation", "last_used")
+
+    def __init__(self, conn: sqlite3.Connection, path: str, generation: int):
+        self.conn = conn
+        self.path = path
+        self.generation = generation
+        self.last_used = time.monotonic()
+
+
+def configure_pool(size: int) -> None:
+    """Set the maximum number of pooled connections (0 disables pooling).
+
+    Existing pooled connections are closed so the new limit applies at once.
+    """
+    global POOL_SIZE
+    close_pool()
+    POOL_SIZE = max(0, int(size))
+
+
+def close_pool() -> None:
+    """Close every pooled connection. Safe to call repeatedly.
+
+    Called on FastMCP shutdown, at interpreter exit, and before a backup
+    restore overwrites DB_PATH. Stops the writer thread first so its
+    connection is closed too (it restarts on the next write). Bumping the generation makes every thread
+    discard its (now closed) slot on its next call and open a fresh one.
+    """
+    global _pool_generation
+    _writer.shutdown()
+    with _pool_lock:
+        _pool_generation += 1
+        conns = list(_pool_conns)
+        _pool_conns.clear()
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    _pool_local.slot = None
+
+
+def pool_stats() -> dict:
+    """Return a snapshot of pool occupancy, for status output and tests."""
+    with _pool_lock:
+        return {
+            "size": POOL_SIZE,
+            "open": len(_pool_conns),
+            "generation": _pool_generation,
+        }
+
+
+def _healthy(slot: _Slot) -> bool:
+    """Probe a pooled connection that has sat idle past the check interval."""
+    if time.monotonic() - slot.last_used < POOL_HEALTH_CHECK_SECS:
+        return True
+    try:
+        slot.conn.execute("SELECT 1").fetchone()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def _discard(conn: sqlite3.Connection) -> None:
+    with _pool_lock:
+        _pool_conns.pop(conn, None)
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+def _reap_dead_threads() -> None:
+    """Close connections whose owning thread has exited. Caller holds the lock."""
+    for conn, owner in list(_pool_conns.items()):
+        if not owner.is_alive():
+            del _pool_conns[conn]
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+
+def _acquire() -> tuple[sqlite3.Connection, bool]:
+    """Return ``(conn, pooled)`` for the calling thread.
+
+    Reuses the thread's pooled connection when it still points at the current
+    DB_PATH (tests and restores repoint/replace the file), belongs to the
+    current pool generation, and passes the idle health check. When the pool
+    is full or disabled, falls back to a one-shot connection that
+    ``_release`` closes — the pre-pool behaviour, never an error.
+    """
+    path = str(DB_PATH)
+    slot = getattr(_pool_local, "slot", None)
+    if slot is not None:
+        if (
+            slot.path == path
+            and slot.generation == _pool_generation
+            and _healthy(slot)
+        ):
+            slot.last_used = time.monotonic()
+            return slot.conn, True
+        _discard(slot.conn)
+        _pool_local.slot = None
+
+    if POOL_SIZE <= 0:
+        return get_connection(), False
+
+    with _pool_lock:
+        if len(_pool_conns) >= POOL_SIZE:
+            _reap_dead_threads()
+        if len(_pool_conns) < POOL_SIZE:
+            conn = get_connection(check_same_thread=False)
+            _pool_conns[conn] = threading.current_thread()
+            _pool_local.slot = _Slot(conn, path, _pool_generation)
+            return conn, True
+
+    return get_connection(), False
+
+
+def _release(conn: sqlite3.Connection, pooled: bool) -> None:
+    """Return a connection after use: close one-shots, reset pooled ones.
+
+    A pooled connection must never carry an open transaction into the next
+    call, so anything left uncommitted by a failed statement is rolled back.
+    """
+    if not pooled:
+        conn.close()
+        return
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+    except sqlite3.Error:
+        slot = getattr(_pool_local, "slot", None)
+        if slot is not None and slot.conn is conn:
+            _pool_local.slot = None
+        _discard(conn)
+
+
+atexit.register(close_pool)
+
+
+# ── Write coordinator ────────────────────────────────────────────────
+
+# All execute_write / execute_many / execute_lenient / insert_with_log calls
+# in this process funnel through ONE writer thread. Each call becomes a job
+# (a function of the writer's connection) run inside its own SAVEPOINT, and
+# every job that queued up while the previous batch was committing shares the
+# next BEGIN IMMEDIATE … COMMIT — one fsync for a whole sync burst instead of
+# one per row. A job that raises only rolls back its own savepoint; the rest
+# of the batch still commits. Callers block on a Future, so a write has
+# committed (and is visible to their pooled reader) by the time it returns.
+#
+# SOY_DB_WRITER=0 runs writes directly on the caller's pooled connection.
+WRITER_ENABLED = os.environ.get("SOY_DB_WRITER", "1") != "0"
+# How long the writer keeps collecting jobs once it sees contention (jobs
+# already queued behind the first). An uncontended write never waits.
+GROUP_COMMIT_WINDOW_SECS = float(os.environ.get("SOY_DB_GROUP_COMMIT_MS", "2")) / 1000
+GROUP_COMMIT_MAX_JOBS = 256
+
+
+def _is_busy(exc: BaseException) -> bool:
+    msg = str(exc).lower()
+    return "database is locked" in msg or "database is busy" in msg
+
+
+def _retry_busy(fn, stats: dict | None = None):
+    """Call ``fn`` retrying SQLITE_BUSY/LOCKED with jittered exponential backoff."""
+    delay = BUSY_BACKOFF_SECS
+    for attempt in range(BUSY_RETRIES + 1):
+        try:
+            return fn()
+        except sqlite3.OperationalError as e:
+            if not _is_busy(e) or attempt == BUSY_RETRIES:
+                raise
+            if stats is not None:
+                stats["busy_retries"] += 1
+            time.sleep(delay * (1 + random.random()))
+            delay *= 2
+
+
+class _WriteCoordinator:
+    """Single writer thread that group-commits queued write jobs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._queue: queue.Queue | None = None
+        self.stats = {"batches": 0, "jobs": 0, "failed_jobs": 0, "busy_retries": 0}
+
+    def submit(self, fn):
+        """Queue ``fn(conn)`` for the writer and block until it commits."""
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._queue,),
+                    name="soy-db-writer", daemon=True,
+                )
+                self._thread.start()
+            self._queue.put((str(DB_PATH), fn, future))
+        return future.result()
+
+    def shutdown(self) -> None:
+        """Drain outstanding jobs, close the writer connection, stop the thread."""
+        with self._lock:
+            thread, q = self._thread, self._queue
+            self._thread = self._queue = None
+        if thread is None:
+            return
+        q.put(None)
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self, q: queue.Queue) -> None:
+        conn: sqlite3.Connection | None = None
+        conn_path = None
+        pending: list = []  # an item read past the end of the last batch
+        while True:
+            item = pending.pop() if pending else q.get()
+            if item is None:
+                break
+            batch = [item]
+            contended = not q.empty()
+            deadline = time.monotonic() + GROUP_COMMIT_WINDOW_SECS
+            while len(batch) < GROUP_COMMIT_MAX_JOBS:
+                try:
+                    if contended:
+                        nxt = q.get(timeout=max(0.0, deadline - time.monotonic()))
+                    else:
+                        nxt = q.get_nowait()
+                except queue.Empty:
+                    break
+                # A stop sentinel or a job for a different DB_PATH ends the batch.
+                if nxt is None or nxt[0] != item[0]:
+                    pending.append(nxt)
+                    break
+                batch.append(nxt)
+
+            try:
+                if conn is None or conn_path != item[0]:
+                    if conn is not None:
+                        conn.close()
+                    conn = None
+                    conn = get_connection(check_same_thread=False)
+                    conn.isolation_level = None  # explicit BEGIN/COMMIT below
+                    conn_path = item[0]
+                self._commit(conn, batch)
+            except Exception as e:
+                # Unexpected failure (open error, a broken connection): fail
+                # every unresolved caller rather than leave them blocked.
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except sqlite3.Error:
+                        pass
+                conn = None
+        if conn is not None:
+            conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, batch: list) -> None:
+        _retry_busy(lambda: conn.execute("BEGIN IMMEDIATE"), self.stats)
+        outcomes = []
+        try:
+            for _, fn, _ in batch:
+                conn.execute("SAVEPOINT job")
+                try:
+                    result = fn(conn)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO SAVEPOINT job")
+                    conn.execute("RELEASE SAVEPOINT job")
+                    outcomes.append((None, e))
+                else:
+                    conn.execute("RELEASE SAVEPOINT job")
+                    outcomes.append((result, None))
+            _retry_busy(lambda: conn.execute("COMMIT"), self.stats)
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+        self.stats["batches"] += 1
+        self.stats["jobs"] += len(batch)
+        for (_, _, future), (result, error) in zip(batch, outcomes):
+            if error is not None:
+                self.stats["failed_jobs"] += 1
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+_writer = _WriteCoordinator()
+
+
+def _write(fn):
+    """Run write job ``fn(conn)`` in a transaction and return its result.
+
+    Goes through the group-commit writer when enabled; otherwise runs on the
+    caller's pooled connection (all-or-nothing, rolled back on error).
+    """
+    if WRITER_ENABLED:
+        return _writer.submit(fn)
+    if getattr(_pool_local, "snapshot", None) is not None:
+        # The pooled connection is holding this thread's read snapshot.
+        conn, pooled = get_connection(), False
+    else:
+        conn, pooled = _acquire()
+    try:
+        result = fn(conn)
+        _retry_busy(conn.commit)
+        return result
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        _release(conn, pooled)
+
+
+def writer_stats() -> dict:
+    """Return group-commit counters (batches, jobs, failed_jobs, busy_retries)."""
+    return dict(_writer.stats)
+
+
 def backup_db() -> Path | None:
     """Create a rolling, crash-consistent backup of the database.
 
@@ -225,6 +598,9 @@ def _restore_latest_backup() -> bool:
         return False
     latest = backups[-1]
 
+    # Pooled connections are ours to close: none may survive over the copy.
+    close_pool()
+
     # Remove stale WAL sidecars from the now-closed connection. If left in place,
     # SQLite would replay them into the freshly-restored .db on next open,
     # re-clobbering exactly the rows we just recovered.
@@ -256,24 +632,82 @@ def init_db() -> None:
     conn.close()
 
 
+class Snapshot:
+    """One read transaction over one connection; see ``snapshot``."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def execute(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        """Run a read query against the snapshot and return rows."""
+        return self._conn.execute(sql, params).fetchall()
+
+    def batch(self, queries: dict[str, str | tuple[str, tuple]]) -> dict[str, list[sqlite3.Row]]:
+        """Run a named set of queries and return ``{name: rows}``.
+
+        Each value is either bare SQL or an ``(sql, params)`` pair.
+        """
+        results = {}
+        for name, query in queries.items():
+            sql, params = (query, ()) if isinstance(query, str) else query
+            results[name] = self.execute(sql, params)
+        return results
+
+
+@contextmanager
+def snapshot() -> Iterator[Snapshot]:
+    """Hold one read transaction open for a block of queries.
+
+    In WAL mode a read transaction sees a single committed state of the
+    database, so every count and list read through the snapshot agrees even
+    while a sync commits underneath — and the whole block pays for one
+    connection checkout instead of one per query. Plain ``execute()`` calls
+    made on this thread inside the block (e.g. from shared helpers) join the
+    snapshot too. Nested ``snapshot()`` blocks reuse the outer one.
+
+    Writes are NOT part of the snapshot: they commit through the writer and
+    are not visible to reads inside the block.
+    """
+    active = getattr(_pool_local, "snapshot", None)
+    if active is not None:
+        yield active
+        return
+
+    conn, pooled = _acquire()
+    try:
+        conn.execute("BEGIN")
+        snap = Snapshot(conn)
+        _pool_local.snapshot = snap
+        try:
+            yield snap
+        finally:
+            _pool_local.snapshot = None
+            conn.rollback()  # read-only: ending the transaction is all we need
+    finally:
+        _release(conn, pooled)
+
+
+def query_batch(queries: dict[str, str | tuple[str, tuple]]) -> dict[str, list[sqlite3.Row]]:
+    """Run a named set of read queries in one snapshot; returns ``{name: rows}``."""
+    with snapshot() as snap:
+        return snap.batch(queries)
+
+
 def execute(sql: str, params: tuple = ()) -> list[sqlite3.Row]:
     """Execute a read query and return rows."""
-    conn = get_connection(readonly=True)
+    snap = getattr(_pool_local, "snapshot", None)
+    if snap is not None:
+        return snap.execute(sql, params)
+    conn, pooled = _acquire()
     try:
         return conn.execute(sql, params).fetchall()
     finally:
-        conn.close()
+        _release(conn, pooled)
 
 
 def execute_write(sql: str, params: tuple = ()) -> int:
     """Execute a write query and return lastrowid."""
-    conn = get_connection()
-    try:
-        cursor = conn.execute(sql, params)
-        conn.commit()
-        return cursor.lastrowid
-    finally:
-        conn.close()
+    return _write(lambda conn: conn.execute(sql, params).lastrowid)
 
 
 def execute_many(statements: list[tuple[str, tuple]]) -> int:
@@ -281,19 +715,31 @@ def execute_many(statements: list[tuple[str, tuple]]) -> int:
 
     Returns the lastrowid of the final statement.
     """
-    conn = get_connection()
-    try:
+    def job(conn: sqlite3.Connection) -> int:
         last_id = 0
         for sql, params in statements:
             cursor = conn.execute(sql, params)
             last_id = cursor.lastrowid
-        conn.commit()
         return last_id
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
+
+    return _write(job)
+
+
+def execute_batches(batches: list[tuple[str, list[tuple]]]) -> int:
+    """Like ``execute_many``, but each entry is ``(sql, [params, ...])``.
+
+    Every batch runs through ``executemany`` — one prepared statement for all
+    of its rows — and all batches commit in a single transaction. Empty
+    batches are skipped. Returns the total number of rows changed.
+    """
+    def job(conn: sqlite3.Connection) -> int:
+        changed = 0
+        for sql, rows in batches:
+            if rows:
+                changed += max(conn.executemany(sql, rows).rowcount, 0)
+        return changed
+
+    return _write(job)
 
 
 def execute_lenient(statements: list[tuple[str, tuple]]) -> int:
@@ -307,9 +753,8 @@ def execute_lenient(statements: list[tuple[str, tuple]]) -> int:
     doesn't discard the whole analysis; the caller surfaces the skip count
     instead of silently failing.
     """
-    conn = get_connection()
-    skipped = 0
-    try:
+    def job(conn: sqlite3.Connection) -> int:
+        skipped = 0
         for sql, params in statements:
             try:
                 conn.execute("SAVEPOINT row")
@@ -319,10 +764,9 @@ def execute_lenient(statements: list[tuple[str, tuple]]) -> int:
                 conn.execute("ROLLBACK TO SAVEPOINT row")
                 conn.execute("RELEASE SAVEPOINT row")
                 skipped += 1
-        conn.commit()
         return skipped
-    finally:
-        conn.close()
+
+    return _write(job)
 
 
 def insert_with_log(
@@ -343,18 +787,12 @@ def insert_with_log(
     ``last_insert_rowid()`` in the log still resolves to the entity just
     inserted (its FK was always correct; only the Python return value was not).
     """
-    conn = get_connection()
-    try:
-        cursor = conn.execute(entity_sql, entity_params)
-        entity_id = cursor.lastrowid
+    def job(conn: sqlite3.Connection) -> int:
+        entity_id = conn.execute(entity_sql, entity_params).lastrowid
         conn.execute(log_sql, log_params)
-        conn.commit()
         return entity_id
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
+
+    return _write(job)
 
 
 def dict_from_row(row: sqlite3.Row) -> dict:
@@ -0,0 +1,198 @@
+"""Batch loader for the data behind contact entity pages.
+
+An entity page used to query each of its sections per contact — tags, notes,
+emails, upcoming events, projects (then tasks per project), follow-ups,
+transcripts, the latest relationship score, standalone notes and company
+teammates — so a full render cost about fifteen round-trips per contact.
+``EntityPageData`` fetches each of those datasets for every contact being
+rendered in one query per table and groups the rows by contact in memory;
+page builders then read their sections from the groups. Per-contact
+``LIMIT``s become ``ROW_NUMBER() OVER (PARTITION BY contact …)`` so every
+page still gets the same rows, in the same order, it would have queried:
+
+  * notes: the 5 newest; upcoming events: the next 5; transcripts: the 10
+    most recent the contact took part in; relationship score: the latest;
+  * standalone notes keep ``linked_contacts LIKE '%<id>%'`` semantics (a
+    note is linked to every id that appears as a digit substring), pinned
+    first, at most 5;
+  * company team: the other active contacts sharing the contact's company.
+
+Only sections for installed modules are loaded (their tables may not exist
+otherwise), matching what the builders render. Contact ids are bound as one
+JSON array (``json_each``), so a batch of any size is a single parameter.
+"""
+
+import json
+import re
+
+from software_of_you.db import execute, rows_to_dicts
+
+_IDS = "SELECT value FROM json_each(?)"
+
+# Sections keyed by the template context name, each ``(module, sql)``: the
+# query returns the contact id as ``_cid`` plus the page's columns, already
+# ordered (and per-contact limited) the way the page shows them. ``None``
+# means the section is always loaded.
+_SECTION_QUERIES = {
+    "tags": (None, f"""
+        SELECT et.entity_id AS _cid, t.name, t.color
+        FROM tags t JOIN entity_tags et ON et.tag_id = t.id
+        WHERE et.entity_type = 'contact' AND et.entity_id IN ({_IDS})"""),
+    "notes": (None, f"""
+        SELECT _cid, content, created_at FROM (
+          SELECT entity_id AS _cid, content, created_at,
+                 ROW_NUMBER() OVER (PARTITION BY entity_id ORDER BY created_at DESC) AS _rn
+          FROM notes WHERE entity_type = 'contact' AND entity_id IN ({_IDS})
+        ) WHERE _rn <= 5 ORDER BY _cid, _rn"""),
+    "emails": ("gmail", f"""
+        SELECT contact_id AS _cid, * FROM emails
+        WHERE contact_id IN ({_IDS}) ORDER BY received_at ASC"""),
+    "upcoming_events": ("calendar", f"""
+        SELECT * FROM (
+          SELECT a.contact_id AS _cid,
+                 ROW_NUMBER() OVER (PARTITION BY a.contact_id ORDER BY a.start_time ASC) AS _rn,
+                 ce.*
+          FROM calendar_event_attendees a
+          JOIN calendar_events ce ON ce.id = a.event_id
+          WHERE a.contact_id IN ({_IDS}) AND a.start_time > datetime('now') AND ce.status != 'cancelled'
+        ) WHERE _rn <= 5 ORDER BY _cid, _rn"""),
+    "projects": ("project-tracker", f"""
+        SELECT client_id AS _cid, * FROM projects WHERE client_id IN ({_IDS})"""),
+    "follow_ups": ("crm", f"""
+        SELECT contact_id AS _cid, * FROM follow_ups
+        WHERE contact_id IN ({_IDS}) AND status = 'pending' ORDER BY due_date ASC"""),
+    "transcripts": ("conversation-intelligence", f"""
+        SELECT _cid, id, title, summary, call_intelligence, occurred_at FROM (
+          SELECT tp.contact_id AS _cid, t.id, t.title, t.summary, t.call_intelligence, t.occurred_at,
+                 ROW_NUMBER() OVER (PARTITION BY tp.contact_id ORDER BY t.occurred_at DESC) AS _rn
+          FROM transcripts t
+          JOIN (SELECT DISTINCT transcript_id, contact_id FROM transcript_participants
+                WHERE contact_id IN ({_IDS})) tp ON tp.transcript_id = t.id
+        ) WHERE _rn <= 10 ORDER BY _cid, _rn"""),
+    "relationship_score": ("conversation-intelligence", f"""
+        SELECT * FROM (
+          SELECT contact_id AS _cid, *,
+                 ROW_NUMBER() OVER (PARTITION BY contact_id ORDER BY score_date DESC) AS _rn
+          FROM relationship_scores WHERE contact_id IN ({_IDS})
+        ) WHERE _rn = 1"""),
+}
+
+_TASKS_SQL = f"""
+    SELECT project_id AS _pid, title, status FROM tasks
+    WHERE project_id IN (SELECT id FROM projects WHERE client_id IN ({_IDS}))
+    ORDER BY sort_order"""
+
+_STANDALONE_NOTES_SQL = """
+    SELECT id, title, substr(content, 1, 150) as preview, tags, pinned, linked_contacts
+    FROM standalone_notes
+    WHERE linked_contacts IS NOT NULL AND linked_contacts != ''
+    ORDER BY pinned DESC"""
+
+_TEAM_SQL = f"""
+    SELECT id AS _cid, company, name, role FROM contacts
+    WHERE status = 'active' AND company IN (
+      SELECT company FROM contacts
+      WHERE id IN ({_IDS}) AND company IS NOT NULL AND company != '')"""
+
+
+def digit_runs(text: str) -> set[str]:
+    """Every digit substring of ``text`` — the ids ``LIKE '%<id>%'`` would match."""
+    out = set()
+    for run in re.findall(r"\d+", text or ""):
+        out.update(run[i:j] for i in range(len(run)) for j in range(i + 1, len(run) + 1) if run[i] != "0")
+    return out
+
+
+def _group(rows, key: str = "_cid") -> dict:
+    """``{row[key]: [row without the bookkeeping columns]}``, keeping row order."""
+    groups: dict = {}
+    for row in rows_to_dicts(rows):
+        owner = row.pop(key)
+        row.pop("_rn", None)
+        groups.setdefault(owner, []).append(row)
+    return groups
+
+
+class EntityPageData:
+    """Every entity-page section for ``contact_ids``, one query per table.
+
+    ``narratives=True`` also loads ``entity_narratives`` (the plugin's stored
+    narratives, which ``scripts/render.py`` renders).
+    """
+
+    def __init__(self, contact_ids, modules, narratives: bool = False):
+        ids = json.dumps(sorted({int(cid) for cid in contact_ids}))
+        self.modules = list(modules)
+        self._contacts = {
+            row["id"]: row
+            for row in rows_to_dicts(execute(f"SELECT * FROM contacts WHERE id IN ({_IDS})", (ids,)))
+        }
+
+        self._sections: dict[str, dict] = {}
+        for name, (module, sql) in _SECTION_QUERIES.items():
+            if module is None or module in self.modules:
+                self._sections[name] = _group(execute(sql, (ids,)))
+
+        if "projects" in self._sections:
+            tasks = _group(execute(_TASKS_SQL, (ids,)), key="_pid")
+            for projects in self._sections["projects"].values():
+                for p in projects:
+                    p["tasks"] = tasks.get(p["id"], [])
+
+        if "notes" in self.modules:
+            wanted = {str(cid) for cid in self._contacts}
+            linked: dict[int, list] = {}
+            for note in rows_to_dicts(execute(_STANDALONE_NOTES_SQL)):
+                matches = digit_runs(note.pop("linked_contacts")) & wanted
+                for cid in matches:
+                    notes = linked.setdefault(int(cid), [])
+                    if len(notes) < 5:
+                        notes.append(dict(note))
+            self._sections["standalone_notes"] = linked
+
+        self._teams: dict[str, list] = {}
+        for row in rows_to_dicts(execute(_TEAM_SQL, (ids,))):
+            self._teams.setdefault(row["company"], []).append(row)
+
+        self._narratives = {}
+        if narratives:
+            self._narratives = {
+                row["contact_id"]: row
+                for row in rows_to_dicts(execute(
+                    f"SELECT * FROM entity_narratives WHERE contact_id IN ({_IDS})", (ids,)
+                ))
+            }
+
+    def contact(self, contact_id: int) -> dict | None:
+        """The contact's row, or None if it isn't in this batch."""
+        row = self._contacts.get(contact_id)
+        return dict(row) if row else None
+
+    def sections(self, contact_id: int) -> dict:
+        """Fresh copies of the contact's raw sections, keyed by template name.
+
+        Lists for every section except ``relationship_score`` (a row or None);
+        ``company_team`` only when the contact has a company. Builders format
+        the rows in place, so each call hands out its own copies.
+        """
+        out = {}
+        for name, groups in self._sections.items():
+            rows = [dict(r) for r in groups.get(contact_id, [])]
+            if name == "projects":
+                for p in rows:
+                    p["tasks"] = [dict(t) for t in p["tasks"]]
+            out[name] = rows
+        if "relationship_score" in out:
+            out["relationship_score"] = out["relationship_score"][0] if out["relationship_score"] else None
+
+        company = (self._contacts.get(contact_id) or {}).get("company")
+        if company:
+            out["company_team"] = [
+                {"name": r["name"], "role": r["role"]}
+                for r in self._teams.get(company, []) if r["_cid"] != contact_id
+            ]
+        return out
+
+    def narrative(self, contact_id: int) -> dict | None:
+        """The contact's ``entity_narratives`` row (``narratives=True`` only)."""
+        return self._narratives.get(contact_id)
@@ -0,0 +1,459 @@
+"""Shared HTTP fetch engine for the Google and Slack sync modules.
+
+Every outbound API call goes through ``request()`` (or ``get_json()``), which
+applies, per host:
+
+  * a concurrency cap — at most N requests in flight to that host;
+  * a token-bucket rate limit sized to the API's quota, so fanning out never
+    trips Google's per-user quotas or Slack's tier limits;
+  * retries for 429 / 5xx / connection errors, honouring ``Retry-After`` and
+    otherwise backing off exponentially with jitter; a 429's ``Retry-After``
+    pauses every request on that host (or per-method key), not just the one
+    that was throttled;
+  * timing metrics (``stats()``), aggregated per host and for recent requests.
+
+``fetch_all()`` runs a function over many items on a shared thread pool, so a
+sync's wall-clock cost becomes roughly n × RTT / concurrency instead of
+n × RTT, while the per-host caps above still bound what actually hits the wire.
+
+Requests go out over pooled keep-alive ``http.client`` connections — one idle
+stack per host — so only the first request to a host pays the TCP + TLS
+handshake. Responses are requested gzipped, and ``with_fields()`` adds a
+Google ``fields=`` partial-response mask so only the parts a sync reads come
+back. When a proxy is configured for the scheme, requests fall back to
+``urllib.request`` so the proxy is honoured.
+
+Non-2xx responses that aren't retried (or run out of retries) raise
+``urllib.error.HTTPError``, exactly as ``urllib.request.urlopen`` did, so
+callers' existing 401/403/404 handling is unchanged; connection failures raise
+``urllib.error.URLError``.
+"""
+
+import email.utils
+import gzip
+import http.client
+import io
+import json
+import os
+import random
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable
+
+TIMEOUT_SECS = 15
+# Worker threads shared by every fetch_all() call. Per-host caps below still
+# apply, so this only bounds total fan-out across hosts.
+MAX_WORKERS = int(os.environ.get("SOY_FETCH_WORKERS", "8"))
+MAX_RETRIES = int(os.environ.get("SOY_FETCH_RETRIES", "4"))
+BACKOFF_BASE_SECS = 0.5
+BACKOFF_MAX_SECS = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Limits keyed by host, or host + path prefix for per-method quotas; the
+# longest matching key wins. (concurrency, requests per second, burst).
+#   Gmail:    250 quota units/user/s; messages.get costs 5 → 50/s.
+#   Calendar: 600 requests/user/min.
+#   Docs:     300 read requests/user/min.
+#   Slack:    Tier 2 (20/min) for the list methods, Tier 3 (50/min) for
+#             history/replies and as the default. Tiers are per method, so
+#             history and replies each get their own bucket.
+HOST_LIMITS: dict[str, tuple[int, float, float]] = {
+    "gmail.googleapis.com": (8, 40.0, 50),
+    "www.googleapis.com": (4, 8.0, 10),
+    "docs.googleapis.com": (4, 4.0, 5),
+    "oauth2.googleapis.com": (2, 5.0, 5),
+    "slack.com": (4, 50 / 60, 10),
+    "slack.com/api/conversations.history": (4, 50 / 60, 10),
+    "slack.com/api/conversations.replies": (4, 50 / 60, 10),
+    "slack.com/api/conversations.list": (2, 20 / 60, 3),
+    "slack.com/api/users.list": (2, 20 / 60, 3),
+}
+DEFAULT_LIMITS = (4, 10.0, 10)
+
+# Idle keep-alive connections kept per host, and how long one may sit idle
+# before it's dropped rather than reused (Google and Slack close idle
+# connections after a few minutes; a dead one costs a failed send).
+POOL_MAX_IDLE = int(os.environ.get("SOY_FETCH_POOL_IDLE", "8"))
+POOL_IDLE_SECS = 60.0
+USER_AGENT = "software-of-you (gzip)"
+
+
+class TokenBucket:
+    """Blocking token bucket: ``rate`` tokens per second, up to ``burst``."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cost: float = 1.0) -> float:
+        """Take ``cost`` tokens, sleeping until they're available.
+
+        ``cost`` is capped at ``burst`` so an oversized request (a big Gmail
+        batch) waits for a full bucket rather than forever. Returns the time
+        spent waiting.
+        """
+        cost = min(cost, self.burst)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= cost:
+                    self._tokens -= cost
+                    return waited
+                delay = (cost - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class _Host:
+    def __init__(self, limits: tuple[int, float, float]):
+        concurrency, rate, burst = limits
+        self.slots = threading.BoundedSemaphore(concurrency)
+        self.bucket = TokenBucket(rate, burst)
+        self.lock = threading.Lock()
+        # A 429's Retry-After applies to the whole key (a Slack method tier,
+        # a Google per-user quota), not just the request that drew it: every
+        # request on the key holds off until then instead of drawing its own.
+        self.paused_until = 0.0
+        self.stats = {"requests": 0, "retries": 0, "throttled": 0, "errors": 0,
+                      "total_secs": 0.0, "max_secs": 0.0, "wait_secs": 0.0}
+
+
+_hosts: dict[str, _Host] = {}
+_hosts_lock = threading.Lock()
+_recent: deque = deque(maxlen=200)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_worker = threading.local()
+
+
+def _limits_key(url: str) -> str:
+    split = urllib.parse.urlsplit(url)
+    target = split.netloc + split.path
+    matches = [k for k in HOST_LIMITS if target == k or target.startswith(k + "/")]
+    return max(matches, key=len) if matches else split.netloc
+
+
+def _host(key: str) -> _Host:
+    with _hosts_lock:
+        host = _hosts.get(key)
+        if host is None:
+            host = _hosts[key] = _Host(HOST_LIMITS.get(key, DEFAULT_LIMITS))
+        return host
+
+
+def configure(key: str, concurrency: int, rate: float, burst: float | None = None) -> None:
+    """Override the limits for a host (or host + path prefix) key."""
+    HOST_LIMITS[key] = (concurrency, rate, burst if burst is not None else max(1.0, rate))
+    with _hosts_lock:
+        _hosts.pop(key, None)
+
+
+def _retry_after(exc: urllib.error.HTTPError) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds or HTTP-date), if any."""
+    value = exc.headers.get("Retry-After") if exc.headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff(attempt: int) -> float:
+    return min(BACKOFF_MAX_SECS, BACKOFF_BASE_SECS * (2 ** attempt)) * random.uniform(0.5, 1.0)
+
+
+def request(
+    url: str,
+    *,
+    method: str = "GET",
+    headers: dict | None = None,
+    data: bytes | None = None,
+    timeout: float = TIMEOUT_SECS,
+    cost: float = 1.0,
+    retries: int | None = None,
+) -> tuple[int, dict, bytes]:
+    """Send one request under the host's limits, retrying transient failures.
+
+    Returns ``(status, headers, body)``. Raises ``urllib.error.HTTPError`` for
+    a non-2xx status that isn't retryable or is still failing after
+    ``retries`` retries (default ``MAX_RETRIES``; pass 0 for a request that
+    must not be repeated, like sending mail), and ``urllib.error.URLError``
+    for a connection failure that outlasts them.
+    """
+    retries = MAX_RETRIES if retries is None else retries
+    key = _limits_key(url)
+    host = _host(key)
+    attempt = 0
+    while True:
+        waited = _wait_out_pause(host) + host.bucket.acquire(cost)
+        started = time.monotonic()
+        status = 0
+        delay = None
+        try:
+            with host.slots:
+                status, resp_headers, body = _send(method, url, headers or {}, data, timeout)
+            return status, resp_headers, body
+        except urllib.error.HTTPError as e:
+            status = e.code
+            if status not in RETRY_STATUSES or attempt >= retries:
+                raise
+            delay = _retry_after(e)
+            if delay is not None and delay > BACKOFF_MAX_SECS:
+                raise  # told to come back later than a sync should wait
+            if status == 429 and delay:
+                with host.lock:
+                    host.paused_until = max(host.paused_until, time.monotonic() + delay)
+        except (urllib.error.URLError, TimeoutError, ConnectionError):
+            if attempt >= retries:
+                raise
+        finally:
+            elapsed = time.monotonic() - started
+            with host.lock:
+                s = host.stats
+                s["requests"] += 1
+                s["wait_secs"] += waited
+                s["total_secs"] += elapsed
+                s["max_secs"] = max(s["max_secs"], elapsed)
+                s["throttled"] += status == 429
+                s["errors"] += not 200 <= status < 300
+            _recent.append({"host": key, "method": method, "status": status,
+                            "secs": round(elapsed, 4), "attempt": attempt})
+
+        with host.lock:
+            host.stats["retries"] += 1
+        time.sleep(delay if delay is not None else _backoff(attempt))
+        attempt += 1
+
+
+def _wait_out_pause(host: _Host) -> float:
+    """Sleep until ``host``'s Retry-After pause (if any) has passed; returns the wait."""
+    waited = 0.0
+    while True:
+        with host.lock:
+            delay = host.paused_until - time.monotonic()
+        if delay <= 0:
+            return waited
+        time.sleep(delay)
+        waited += delay
+
+
+def get_json(url: str, headers: dict | None = None, timeout: float = TIMEOUT_SECS) -> dict:
+    """GET ``url`` through ``request()`` and parse the JSON body."""
+    _, _, body = request(url, headers=headers, timeout=timeout)
+    return json.loads(body.decode())
+
+
+def post_form(url: str, fields: dict, headers: dict | None = None, timeout: float = TIMEOUT_SECS) -> dict:
+    """POST ``fields`` form-encoded (as the OAuth endpoints expect) and parse the JSON reply."""
+    _, _, body = request(
+        url,
+        method="POST",
+        data=urllib.parse.urlencode(fields).encode(),
+        headers={"Content-Type": "application/x-www-form-urlencoded", **(headers or {})},
+        timeout=timeout,
+    )
+    return json.loads(body.decode()) if body.strip() else {}
+
+
+def with_fields(url: str, fields: str) -> str:
+    """Add a Google ``fields=`` partial-response mask to ``url``."""
+    sep = "&" if urllib.parse.urlsplit(url).query else "?"
+    return f"{url}{sep}fields={urllib.parse.quote(fields, safe='(),/*')}"
+
+
+# ── Connection pool ──────────────────────────────────────────────────────
+
+
+_idle: dict[tuple[str, str], list[tuple[http.client.HTTPConnection, float]]] = {}
+_idle_lock = threading.Lock()
+_ssl_context: ssl.SSLContext | None = None
+
+
+def _checkout(scheme: str, netloc: str, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+    """An idle connection to the host if one is fresh enough, else a new one.
+
+    Returns ``(conn, reused)``.
+    """
+    global _ssl_context
+    stale = []
+    conn = None
+    with _idle_lock:
+        stack = _idle.get((scheme, netloc), [])
+        now = time.monotonic()
+        while stack:
+            candidate, since = stack.pop()
+            if now - since < POOL_IDLE_SECS:
+                conn = candidate
+                break
+            stale.append(candidate)
+    for old in stale:
+        old.close()
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+    if scheme == "https":
+        if _ssl_context is None:
+            _ssl_context = ssl.create_default_context()
+        return http.client.HTTPSConnection(netloc, timeout=timeout, context=_ssl_context), False
+    return http.client.HTTPConnection(netloc, timeout=timeout), False
+
+
+def _checkin(scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+    with _idle_lock:
+        stack = _idle.setdefault((scheme, netloc), [])
+        if len(stack) < POOL_MAX_IDLE:
+            stack.append((conn, time.monotonic()))
+            return
+    conn.close()
+
+
+def close_connections() -> None:
+    """Close every pooled idle connection."""
+    with _idle_lock:
+        conns = [conn for stack in _idle.values() for conn, _ in stack]
+        _idle.clear()
+    for conn in conns:
+        conn.close()
+
+
+# Methods a stale keep-alive connection may silently resend (RFC 9110 9.2.2).
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def _send(method: str, url: str, headers: dict, data: bytes | None, timeout: float) -> tuple[int, dict, bytes]:
+    """One HTTP exchange, no retries. Raises HTTPError for non-2xx, URLError for I/O failures."""
+    split = urllib.parse.urlsplit(url)
+    headers = {"Accept-Encoding": "gzip", "User-Agent": USER_AGENT, **headers}
+    proxies = urllib.request.getproxies()
+    if split.scheme in proxies and not urllib.request.proxy_bypass(split.hostname or ""):
+        return _send_via_urllib(method, url, headers, data, timeout)
+
+    path = (split.path or "/") + (f"?{split.query}" if split.query else "")
+    while True:
+        conn, reused = _checkout(split.scheme, split.netloc, timeout)
+        sent = False
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            sent = True
+            resp = conn.getresponse()
+            body = resp.read()
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+            conn.close()
+            # The server had probably dropped this idle connection. Resend only
+            # if it can't have acted on the request: the send itself failed, or
+            # sending it twice is harmless. A POST that was fully written is
+            # left to the caller's own retry policy.
+            if reused and (not sent or method.upper() in _IDEMPOTENT_METHODS):
+                continue
+            raise urllib.error.URLError(e) from e
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise urllib.error.URLError(e) from e
+        if resp.will_close:
+            conn.close()
+        else:
+            _checkin(split.scheme, split.netloc, conn)
+        break
+
+    if (resp.getheader("Content-Encoding") or "").lower() == "gzip":
+        body = gzip.decompress(body)
+    if not 200 <= resp.status < 300:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.msg, io.BytesIO(body))
+    return resp.status, dict(resp.getheaders()), body
+
+
+def _send_via_urllib(method: str, url: str, headers: dict, data: bytes | None, timeout: float) -> tuple[int, dict, bytes]:
+    req = urllib.request.Request(url, data=data, method=method, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            status, resp_headers, body = resp.status, dict(resp.headers.items()), resp.read()
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        if (e.headers.get("Content-Encoding") or "").lower() == "gzip":
+            body = gzip.decompress(body)
+        raise urllib.error.HTTPError(url, e.code, e.reason, e.headers, io.BytesIO(body)) from None
+    if (resp_headers.get("Content-Encoding") or "").lower() == "gzip":
+        body = gzip.decompress(body)
+    return status, resp_headers, body
+
+
+def fetch_all(fn: Callable, items: Iterable) -> list:
+    """Run ``fn(item)`` for every item on the shared fetch pool.
+
+    Returns results in input order; an item whose call raised gets the
+    exception object in its slot instead. Calls made from inside a pool worker
+    run inline, so nested fan-out can't deadlock the pool.
+    """
+    items = list(items)
+    if len(items) <= 1 or getattr(_worker, "active", False) or MAX_WORKERS <= 1:
+        return [_capture(fn, item) for item in items]
+    futures = [_pool().submit(_in_worker, fn, item) for item in items]
+    return [f.result() for f in futures]
+
+
+def _capture(fn: Callable, item):
+    try:
+        return fn(item)
+    except Exception as e:
+        return e
+
+
+def _in_worker(fn: Callable, item):
+    _worker.active = True
+    try:
+        return _capture(fn, item)
+    finally:
+        _worker.active = False
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="soy-fetch")
+        return _executor
+
+
+def stats() -> dict:
+    """Per-host request metrics, pooled idle connections, and recent timings."""
+    with _hosts_lock:
+        hosts = dict(_hosts)
+    hosts = {key: _snapshot(h) for key, h in hosts.items()}
+    for s in hosts.values():
+        s["avg_secs"] = round(s["total_secs"] / s["requests"], 4) if s["requests"] else 0.0
+    with _idle_lock:
+        idle = {netloc: len(stack) for (_, netloc), stack in _idle.items()}
+    return {"hosts": hosts, "idle_connections": idle, "recent": list(_recent)}
+
+
+def _snapshot(host: _Host) -> dict:
+    with host.lock:
+        return dict(host.stats)
+
+
+def reset_stats() -> None:
+    """Forget per-host state (limits are re-read from HOST_LIMITS) and timings."""
+    with _hosts_lock:
+        _hosts.clear()
+    _recent.clear()
+
@@ -18,10 +18,10 @@ import sys
 import time
 import urllib.error
 import urllib.parse
-import urllib.request
 import webbrowser
 from http.server import BaseHTTPRequestHandler, HTTPServer
 
+from software_of_you import fetcher
 from software_of_you.db import DATA_DIR, execute, execute_write, execute_many
 
 TOKENS_DIR = DATA_DIR / "tokens"
@@ -82,13 +82,12 @@ def derive_label(email: str) -> str:
 def _get_user_email(access_token: str):
     """Fetch email and name from Google userinfo API."""
     try:
-        req = urllib.request.Request(
-            "https://www.googleapis.com/oauth2/v2/userinfo",
+        info = fetcher.get_json(
+            "https://www.googleapis.com/oauth2/v2/userinfo?fields=email,name",
             headers={"Authorization": f"Bearer {access_token}"},
+            timeout=5,
         )
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            info = json.loads(resp.read().decode())
-            return info.get("email"), info.get("name")
+        return info.get("email"), info.get("name")
     except urllib.error.URLError:
         return None, None
 
@@ -134,17 +133,15 @@ def refresh_access_token(token_data: dict, email: str | None = None) -> dict | N
     if not refresh_token:
         return None
 
-    params = urllib.parse.urlencode({
+    params = {
         "client_id": DEFAULT_CREDENTIALS["client_id"],
         "client_secret": DEFAULT_CREDENTIALS["client_secret"],
         "refresh_token": refresh_token,
         "grant_type": "refresh_token",
-    }).encode()
+    }
 
     try:
-        req = urllib.request.Request(TOKEN_ENDPOINT, data=params)
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            new_data = json.loads(resp.read().decode())
+        new_data = fetcher.post_form(TOKEN_ENDPOINT, params, timeout=10)
         new_data["refresh_token"] = refresh_token
         save_token(new_data, email=email)
         return new_data
@@ -392,18 +389,15 @@ def run_auth_flow(scopes=None) -> dict:
         raise RuntimeError(f"Authorization failed: {_OAuthHandler.error}")
 
     # Exchange code for tokens
-    token_params = urllib.parse.urlencode({
+    token_params = {
         "client_id": DEFAULT_CREDENTIALS["client_id"],
         "client_secret": DEFAULT_CREDENTIALS["client_secret"],
         "code": _OAuthHandler.auth_code,
         "grant_type": "authorization_code",
         "redirect_uri": redirect_uri,
         "code_verifier": code_verifier,
-    }).encode()
-
-    req = urllib.request.Request(TOKEN_ENDPOINT, data=token_params)
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        token_data = json.loads(resp.read().decode())
+    }
+    token_data = fetcher.post_form(TOKEN_ENDPOINT, token_params, timeout=10)
 
     # Auto-detect email and save per-account
     token_data["saved_at"] = int(time.time())
@@ -437,12 +431,9 @@ def revoke_token(email: str | None = None) -> None:
         return
 
     token = token_data.get("access_token", token_data.get("refresh_token"))
-    params = urllib.parse.urlencode({"token": token}).encode()
-
     try:
-        req = urllib.request.Request(REVOKE_ENDPOINT, data=params)
-        urllib.request.urlopen(req, timeout=10)
-    except urllib.error.URLError:
+        fetcher.post_form(REVOKE_ENDPOINT, {"token": token}, timeout=10)
+    except (urllib.error.URLError, ValueError):
         pass
 
     if email:
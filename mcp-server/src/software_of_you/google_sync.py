@@ -10,12 +10,16 @@ import base64
 import json
 import re
 import sys
+import threading
+import time
 import urllib.error
 import urllib.parse
-import urllib.request
-from datetime import datetime, timedelta
+import uuid
+from datetime import datetime, timedelta, timezone
 
-from software_of_you.db import execute, execute_many, execute_write
+from software_of_you import fetcher, scheduler
+from software_of_you.contact_index import ContactIndex
+from software_of_you.db import execute, execute_batches, execute_many, execute_write
 from software_of_you.google_auth import (
     get_valid_token,
     list_accounts,
@@ -25,18 +29,108 @@ from software_of_you.google_auth import (
 )
 
 GMAIL_API = "https://gmail.googleapis.com/gmail/v1/users/me"
+GMAIL_BATCH_URL = "https://gmail.googleapis.com/batch/gmail/v1"
+# Gmail accepts up to 100 calls per batch but rate-limits large ones; Google
+# recommends 50.
+GMAIL_BATCH_SIZE = 50
 CALENDAR_API = "https://www.googleapis.com/calendar/v3"
 DOCS_API = "https://docs.googleapis.com/v1/documents"
 
+# Partial-response masks (``fields=``): ask Google for only what we store.
+GMAIL_METADATA_FIELDS = "id,threadId,labelIds,snippet,internalDate,payload/headers"
+GMAIL_BODY_FIELDS = "payload"
+CALENDAR_EVENT_FIELDS = (
+    "items(id,summary,description,location,start,end,status,"
+    "attendees(email,displayName,responseStatus)),nextPageToken,nextSyncToken"
+)
+DOC_FIELDS = "title,body(content(paragraph(elements(textRun(content)))))"
+
 GEMINI_SENDER = "gemini-notes@google.com"
 DOC_LINK_RE = re.compile(r"https://docs\.google\.com/document/d/([a-zA-Z0-9_-]+)")
 
 
 def _api_get(url: str, token: str) -> dict:
-    """Make an authenticated GET request to a Google API."""
-    req = urllib.request.Request(url, headers={"Authorization": f"Bearer {token}"})
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        return json.loads(resp.read().decode())
+    """Make an authenticated GET request to a Google API.
+
+    Goes through the shared fetch engine: per-host concurrency and quota
+    limits, and retries with backoff on 429/5xx.
+    """
+    return fetcher.get_json(url, headers={"Authorization": f"Bearer {token}"})
+
+
+def _api_batch_get(urls: list[str], token: str) -> list[tuple[int, dict]]:
+    """GET several Google API URLs in one multipart ``batch/gmail/v1`` request.
+
+    Returns one ``(status, body)`` per URL, in order. A part missing from the
+    response comes back as ``(0, {})``. Raises like ``_api_get`` if the batch
+    request itself fails (network error, 401 on the outer request, ...).
+    """
+    boundary = f"batch_{uuid.uuid4().hex}"
+    parts = []
+    for i, url in enumerate(urls):
+        split = urllib.parse.urlsplit(url)
+        path = split.path + (f"?{split.query}" if split.query else "")
+        parts.append(
+            f"--{boundary}\r\n"
+            f"Content-Type: application/http\r\n"
+            f"Content-ID: <item{i}>\r\n\r\n"
+            f"GET {path}\r\n\r\n"
+        )
+    body = ("".join(parts) + f"--{boundary}--\r\n").encode()
+    # Each part counts against the Gmail quota, so the batch costs len(urls).
+    _, headers, raw = fetcher.request(
+        GMAIL_BATCH_URL,
+        method="POST",
+        data=body,
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": f"multipart/mixed; boundary={boundary}",
+        },
+        timeout=30,
+        cost=len(urls),
+    )
+    content_type = next((v for k, v in headers.items() if k.lower() == "content-type"), "")
+    return _parse_batch_response(raw, content_type, len(urls))
+
+
+def _parse_batch_response(raw: bytes, content_type: str, count: int) -> list[tuple[int, dict]]:
+    """Split a multipart/mixed batch response into per-part (status, JSON body).
+
+    Parts are matched to requests by their ``Content-ID: <response-itemN>``
+    header, falling back to position when a part has none.
+    """
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    results: list[tuple[int, dict]] = [(0, {})] * count
+    if not match:
+        return results
+    delimiter = b"--" + match.group(1).encode()
+    position = 0
+    for chunk in raw.replace(b"\r\n", b"\n").split(delimiter)[1:]:
+        if chunk.startswith(b"--"):
+            break
+        part_headers, _, http = chunk.strip(b"\n").partition(b"\n\n")
+        index = position
+        position += 1
+        for line in part_headers.decode(errors="replace").splitlines():
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-id":
+                found = re.search(r"(\d+)", value)
+                if found:
+                    index = int(found.group(1))
+        status_line, _, rest = http.partition(b"\n")
+        # Skip the part's response headers (there may be none).
+        _, _, payload = (b"\n" + rest).partition(b"\n\n")
+        try:
+            status = int(status_line.split()[1])
+        except (IndexError, ValueError):
+            status = 0
+        try:
+            data = json.loads(payload.decode()) if payload.strip() else {}
+        except ValueError:
+            data = {}
+        if 0 <= index < count:
+            results[index] = (status, data)
+    return results
 
 
 def _is_auth_error(exc: Exception) -> bool:
@@ -44,6 +138,10 @@ def _is_auth_error(exc: Exception) -> bool:
     return isinstance(exc, urllib.error.HTTPError) and exc.code == 401
 
 
+_refresh_locks: dict[str | None, threading.Lock] = {}
+_refresh_locks_lock = threading.Lock()
+
+
 def _refresh_token(account_email: str | None) -> str | None:
     """Refresh the OAuth access token once, returning the new access token.
 
@@ -51,11 +149,16 @@ def _refresh_token(account_email: str | None) -> str | None:
     exchange the refresh_token, persist). Returns None if no refreshable
     token is available.
     """
-    token_data = load_token(email=account_email)
-    if not token_data:
-        return None
-    new_data = refresh_access_token(token_data, email=account_email)
-    return new_data.get("access_token") if new_data else None
+    # Parallel jobs for one account may all hit the 401 together; refresh one
+    # at a time so they don't race on the account's token file.
+    with _refresh_locks_lock:
+        lock = _refresh_locks.setdefault(account_email, threading.Lock())
+    with lock:
+        token_data = load_token(email=account_email)
+        if not token_data:
+            return None
+        new_data = refresh_access_token(token_data, email=account_email)
+        return new_data.get("access_token") if new_data else None
 
 
 def _should_mark_synced(failed: int) -> bool:
@@ -71,7 +174,7 @@ def _should_mark_synced(failed: int) -> bool:
 def _get_user_email(token: str) -> str | None:
     """Get the authenticated user's email address."""
     try:
-        info = _api_get("https://www.googleapis.com/oauth2/v2/userinfo", token)
+        info = _api_get("https://www.googleapis.com/oauth2/v2/userinfo?fields=email", token)
         return info.get("email")
     except Exception:
         return None
@@ -90,13 +193,281 @@ def _lookup_account_id(account_email: str | None) -> int | None:
         return None
 
 
+# Gmail sync keeps a per-account ``historyId`` checkpoint in soy_meta. With a
+# checkpoint, a run asks history.list for what changed since then (new
+# messages, read/star label changes) — cost scales with new mail. Without one,
+# or once Google has expired it (history is kept for about a week), it falls
+# back to a paginated full scan of the last 7 days and takes a fresh
+# checkpoint from the mailbox profile read *before* the scan, so anything that
+# arrives mid-scan is replayed by the next incremental run rather than missed.
+GMAIL_FULL_SCAN_MAX_PAGES = 10  # × 50 messages
+GMAIL_HISTORY_PAGE_SIZE = 500
+# messages.list leaves spam and trash out by default; history.list doesn't.
+# Drafts are in both, and each autosave is a new message id.
+_GMAIL_SKIP_LABELS = {"SPAM", "TRASH", "DRAFT"}
+
+
+class _HistoryExpired(Exception):
+    """history.list returned 404: the checkpoint is older than Gmail keeps."""
+
+
+def _get_with_refresh(url: str, token: str, account_email: str | None) -> tuple[dict, str]:
+    """GET ``url``; on a 401, refresh the token once and retry once.
+
+    Returns ``(data, token)`` — the token may be the refreshed one, which the
+    caller should keep using. Re-raises if the retry fails or no refresh is
+    available.
+    """
+    try:
+        return _api_get(url, token), token
+    except Exception as e:
+        if not _is_auth_error(e):
+            raise
+        new_token = _refresh_token(account_email)
+        if not new_token:
+            raise
+        return _api_get(url, new_token), new_token
+
+
+def _get_all_with_refresh(
+    urls: list[str], token: str, account_email: str | None,
+) -> tuple[list, str]:
+    """GET every URL concurrently with ``_get_with_refresh`` semantics.
+
+    Returns ``(results, token)`` with results in URL order; a failed GET leaves
+    its exception in its slot. Items rejected with 401 share one token refresh
+    and are retried once together.
+    """
+    results = fetcher.fetch_all(lambda u: _api_get(u, token), urls)
+    stale = [i for i, r in enumerate(results) if _is_auth_error(r)]
+    if stale:
+        new_token = _refresh_token(account_email)
+        if new_token:
+            token = new_token
+            retried = fetcher.fetch_all(lambda u: _api_get(u, token), [urls[i] for i in stale])
+            for i, outcome in zip(stale, retried):
+                results[i] = outcome
+    return results, token
+
+
+def _batch_fetch(urls: list[str], token: str) -> list[tuple[int, dict]]:
+    """``_api_batch_get`` over any number of URLs, chunks sent concurrently.
+
+    A chunk whose batch request fails outright reports every part as 401 (auth
+    rejected) or 0 (anything else), so callers handle it like per-part errors.
+    """
+    chunks = [urls[i:i + GMAIL_BATCH_SIZE] for i in range(0, len(urls), GMAIL_BATCH_SIZE)]
+    results: list[tuple[int, dict]] = []
+    for chunk, outcome in zip(chunks, fetcher.fetch_all(lambda c: _api_batch_get(c, token), chunks)):
+        if isinstance(outcome, Exception):
+            if not _is_auth_error(outcome):
+                print(f"Gmail batch fetch failed: {outcome}", file=sys.stderr)
+            outcome = [(401 if _is_auth_error(outcome) else 0, {})] * len(chunk)
+        results.extend(outcome)
+    return results
+
+
+def _gmail_fetch_metadata(
+    msg_ids: list[str], token: str, account_email: str | None,
+) -> tuple[dict[str, dict], int, str]:
+    """Fetch message metadata for ``msg_ids`` in concurrent multipart batches.
+
+    Per-item 401 semantics match ``_get_with_refresh``: if any part (or whole
+    batch) is rejected with 401, the token is refreshed once and just those
+    items are retried once. Returns ``(messages_by_id, failed, token)``; a
+    message counts as failed if its part still didn't come back 200, except
+    for a 404: the message is gone (deleted since history listed it, like a
+    draft autosave), and retrying it would only stall the checkpoint.
+    """
+    urls = [
+        fetcher.with_fields(
+            f"{GMAIL_API}/messages/{msg_id}?format=metadata"
+            f"&metadataHeaders=From&metadataHeaders=To&metadataHeaders=Subject",
+            GMAIL_METADATA_FIELDS,
+        )
+        for msg_id in msg_ids
+    ]
+    results = _batch_fetch(urls, token)
+
+    retry = [i for i, (status, _) in enumerate(results) if status == 401]
+    if retry:
+        new_token = _refresh_token(account_email)
+        if new_token:
+            token = new_token
+            for i, result in zip(retry, _batch_fetch([urls[i] for i in retry], token)):
+                results[i] = result
+
+    messages = {
+        msg_id: data for msg_id, (status, data) in zip(msg_ids, results) if status == 200
+    }
+    failed = sum(status not in (200, 404) for status, _ in results)
+    return messages, failed, token
+
+
+def _meta_key(name: str, account_email: str | None) -> str:
+    return f"{name}:{account_email}" if account_email else name
+
+
+def _gmail_checkpoint(account_email: str | None) -> str | None:
+    rows = execute(
+        "SELECT value FROM soy_meta WHERE key = ?",
+        (_meta_key("gmail_history_id", account_email),),
+    )
+    return rows[0]["value"] if rows and rows[0]["value"] else None
+
+
+def _gmail_history_delta(
+    start_history_id: str, token: str, account_email: str | None,
+) -> tuple[list[str], dict[str, list[str]], str | None, str]:
+    """Page through history.list since ``start_history_id``.
+
+    Returns ``(added_ids, labels_by_id, history_id, token)``: new message ids in
+    arrival order, the latest label set for every message whose labels changed,
+    and the mailbox historyId to checkpoint. Raises ``_HistoryExpired`` when
+    Gmail no longer has history that far back.
+    """
+    added: list[str] = []
+    labels: dict[str, list[str]] = {}
+    history_id = None
+    page_token = None
+    while True:
+        url = (
+            f"{GMAIL_API}/history?startHistoryId={urllib.parse.quote(start_history_id)}"
+            f"&historyTypes=messageAdded&historyTypes=labelAdded&historyTypes=labelRemoved"
+            f"&maxResults={GMAIL_HISTORY_PAGE_SIZE}"
+        )
+        if page_token:
+            url += f"&pageToken={urllib.parse.quote(page_token)}"
+        try:
+            data, token = _get_with_refresh(url, token, account_email)
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                raise _HistoryExpired() from e
+            raise
+
+        for record in data.get("history", []):
+            for item in record.get("messagesAdded", []):
+                msg = item.get("message", {})
+                if msg.get("id") and not _GMAIL_SKIP_LABELS & set(msg.get("labelIds", [])):
+                    added.append(msg["id"])
+            for kind in ("labelsAdded", "labelsRemoved"):
+                for item in record.get(kind, []):
+                    msg = item.get("message", {})
+                    if not msg.get("id"):
+                        continue
+                    if "labelIds" in msg:
+                        # The message's full label set as of this record.
+                        labels[msg["id"]] = list(msg["labelIds"])
+                    else:
+                        current = set(labels.get(msg["id"], ()))
+                        change = set(item.get("labelIds", []))
+                        current = current | change if kind == "labelsAdded" else current - change
+                        labels[msg["id"]] = sorted(current)
+
+        history_id = data.get("historyId", history_id)
+        page_token = data.get("nextPageToken")
+        if not page_token:
+            return list(dict.fromkeys(added)), labels, history_id, token
+
+
+def _gmail_full_scan(token: str, account_email: str | None) -> tuple[list[str], str]:
+    """List the last 7 days of message ids, following nextPageToken.
+
+    Returns ``(ids, token)``. Capped at ``GMAIL_FULL_SCAN_MAX_PAGES`` pages.
+    """
+    ids: list[str] = []
+    page_token = None
+    for _ in range(GMAIL_FULL_SCAN_MAX_PAGES):
+        url = f"{GMAIL_API}/messages?maxResults=50&q=newer_than:7d"
+        if page_token:
+            url += f"&pageToken={urllib.parse.quote(page_token)}"
+        data, token = _get_with_refresh(url, token, account_email)
+        ids.extend(m["id"] for m in data.get("messages", []))
+        page_token = data.get("nextPageToken")
+        if not page_token:
+            break
+    return list(dict.fromkeys(ids)), token
+
+
+def _known_gmail_ids(gmail_ids: list[str]) -> set[str]:
+    """Which of ``gmail_ids`` are already in the emails table."""
+    known: set[str] = set()
+    for i in range(0, len(gmail_ids), 500):
+        chunk = gmail_ids[i:i + 500]
+        rows = execute(
+            f"SELECT gmail_id FROM emails WHERE gmail_id IN ({','.join('?' * len(chunk))})",
+            tuple(chunk),
+        )
+        known.update(r["gmail_id"] for r in rows)
+    return known
+
+
+def _label_columns(label_ids: list[str]) -> tuple[str, int, int]:
+    """(labels, is_read, is_starred) column values for a Gmail label list."""
+    return (
+        ",".join(label_ids),
+        0 if "UNREAD" in label_ids else 1,
+        1 if "STARRED" in label_ids else 0,
+    )
+
+
+_EMAIL_INSERT_SQL = """INSERT OR IGNORE INTO emails
+       (gmail_id, thread_id, contact_id, direction, from_address, to_addresses,
+        subject, snippet, labels, is_read, is_starred, received_at, from_name, account_id)
+       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _gmail_email_row(
+    msg_id: str, msg: dict, user_email: str | None, account_id: int | None, contacts: ContactIndex,
+) -> tuple:
+    """``_EMAIL_INSERT_SQL`` parameters for one message's metadata."""
+    headers = {h["name"].lower(): h["value"] for h in msg.get("payload", {}).get("headers", [])}
+    from_addr = headers.get("from", "")
+    to_addr = headers.get("to", "")
+    subject = headers.get("subject", "(no subject)")
+
+    # Parse from name/address
+    from_name = from_addr
+    from_email = from_addr
+    if "<" in from_addr:
+        parts = from_addr.split("<")
+        from_name = parts[0].strip().strip('"')
+        from_email = parts[1].rstrip(">").strip()
+
+    # Determine direction
+    direction = "outbound" if user_email and from_email.lower() == user_email.lower() else "inbound"
+
+    # Try to match contact
+    contact_match_email = from_email if direction == "inbound" else to_addr
+    # Extract email from "Name <email>" format
+    if "<" in contact_match_email:
+        contact_match_email = contact_match_email.split("<")[1].rstrip(">").strip()
+
+    contact_id = contacts.by_email(contact_match_email)
+
+    snippet = msg.get("snippet", "")
+    thread_id = msg.get("threadId", "")
+    labels, is_read, is_starred = _label_columns(msg.get("labelIds", []))
+
+    # Parse date
+    internal_date = msg.get("internalDate", "0")
+    received_at = datetime.fromtimestamp(int(internal_date) / 1000).isoformat()
+
+    return (
+        msg_id, thread_id, contact_id, direction, from_email, to_addr,
+        subject, snippet, labels, is_read, is_starred,
+        received_at, from_name, account_id,
+    )
+
+
 def sync_gmail(token: str | None = None, account_email: str | None = None) -> dict:
-    """Sync recent emails from Gmail.
+    """Sync emails from Gmail — incrementally via history.list when possible.
 
     Args:
         token: OAuth access token (fetched automatically if not provided)
         account_email: Email of the Google account being synced.
-            Used for direction detection (avoids extra API call) and account_id linkage.
+            Used for direction detection (avoids extra API call), account_id
+            linkage, and to key the account's historyId checkpoint.
     """
     token = token or get_valid_token(email=account_email)
     if not token:
@@ -107,99 +478,68 @@ def sync_gmail(token: str | None = None, account_email: str | None = None) -> di
     account_id = _lookup_account_id(account_email)
     synced = 0
     failed = 0
+    updated = 0
+    mode = "incremental"
+    message_ids: list[str] = []
 
     try:
-        # Fetch recent message list
-        url = f"{GMAIL_API}/messages?maxResults=50&q=newer_than:7d"
-        data = _api_get(url, token)
-        messages = data.get("messages", [])
-
-        statements = []
-        for msg_ref in messages:
-            msg_id = msg_ref["id"]
-
-            # Check if already synced (dedup by gmail_id)
-            existing = execute("SELECT id FROM emails WHERE gmail_id = ?", (msg_id,))
-            if existing:
-                continue
+        checkpoint = _gmail_checkpoint(account_email)
+        label_changes: dict[str, list[str]] = {}
+        history_id = None
+        if checkpoint:
+            try:
+                message_ids, label_changes, history_id, token = _gmail_history_delta(
+                    checkpoint, token, account_email,
+                )
+            except _HistoryExpired:
+                checkpoint = None
 
-            # Fetch full message. On a per-message 401 (token expired mid-sync),
-            # refresh the token once and retry this item once. Any item we still
-            # can't fetch counts as a failure so the timestamp is not advanced.
-            msg_url = f"{GMAIL_API}/messages/{msg_id}?format=metadata&metadataHeaders=From&metadataHeaders=To&metadataHeaders=Subject"
+        if not checkpoint:
+            mode = "full"
+            # Read the checkpoint before listing (see the note above). Without
+            # one, the sync still works — the next run just scans again.
             try:
-                msg = _api_get(msg_url, token)
-            except Exception as e:
-                if _is_auth_error(e):
-                    new_token = _refresh_token(account_email)
-                    if new_token:
-                        token = new_token
-                        try:
-                            msg = _api_get(msg_url, token)
-                        except Exception:
-                            failed += 1
-                            continue
-                    else:
-                        failed += 1
-                        continue
-                else:
-                    failed += 1
-                    continue
+                profile, token = _get_with_refresh(f"{GMAIL_API}/profile", token, account_email)
+                history_id = profile.get("historyId")
+            except Exception:
+                history_id = None
+            message_ids, token = _gmail_full_scan(token, account_email)
+
+        known = _known_gmail_ids(list(dict.fromkeys([*message_ids, *label_changes])))
+
+        # Fetch new messages in multipart batches. On a per-message 401 (token
+        # expired mid-sync), the token is refreshed once and that item retried
+        # once. Any item we still can't fetch (other than a 404: deleted)
+        # counts as a failure so neither the timestamp nor the checkpoint is
+        # advanced.
+        fetched, failed, token = _gmail_fetch_metadata(
+            [m for m in message_ids if m not in known], token, account_email,
+        )
 
-            headers = {h["name"].lower(): h["value"] for h in msg.get("payload", {}).get("headers", [])}
-            from_addr = headers.get("from", "")
-            to_addr = headers.get("to", "")
-            subject = headers.get("subject", "(no subject)")
-
-            # Parse from name/address
-            from_name = from_addr
-            from_email = from_addr
-            if "<" in from_addr:
-                parts = from_addr.split("<")
-                from_name = parts[0].strip().strip('"')
-                from_email = parts[1].rstrip(">").strip()
-
-            # Determine direction
-            direction = "outbound" if user_email and from_email.lower() == user_email.lower() else "inbound"
-
-            # Try to match contact
-            contact_match_email = from_email if direction == "inbound" else to_addr
-            # Extract email from "Name <email>" format
-            if "<" in contact_match_email:
-                contact_match_email = contact_match_email.split("<")[1].rstrip(">").strip()
-
-            contact_rows = execute(
-                "SELECT id FROM contacts WHERE email = ?",
-                (contact_match_email,),
-            )
-            contact_id = contact_rows[0]["id"] if contact_rows else None
-
-            snippet = msg.get("snippet", "")
-            thread_id = msg.get("threadId", "")
-            labels = ",".join(msg.get("labelIds", []))
-            is_read = "UNREAD" not in msg.get("labelIds", [])
-            is_starred = "STARRED" in msg.get("labelIds", [])
-
-            # Parse date
-            internal_date = msg.get("internalDate", "0")
-            received_at = datetime.fromtimestamp(int(internal_date) / 1000).isoformat()
-
-            statements.append((
-                """INSERT OR IGNORE INTO emails
-                   (gmail_id, thread_id, contact_id, direction, from_address, to_addresses,
-                    subject, snippet, labels, is_read, is_starred, received_at, from_name, account_id)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (msg_id, thread_id, contact_id, direction, from_email, to_addr,
-                 subject, snippet, labels, 1 if is_read else 0, 1 if is_starred else 0,
-                 received_at, from_name, account_id),
-            ))
-            synced += 1
-
-        if statements:
-            execute_many(statements)
-
-        # Only advance the freshness timestamp on a fully-clean sync. If any
-        # messages were dropped, leave the timestamp so auto-sync retries.
+        contacts = ContactIndex()
+        email_rows = [
+            _gmail_email_row(msg_id, msg, user_email, account_id, contacts)
+            for msg_id, msg in fetched.items()
+            if not _GMAIL_SKIP_LABELS & set(msg.get("labelIds", []))
+        ]
+        synced = len(email_rows)
+
+        # Read/star changes on mail we already have. New messages were just
+        # fetched with their current labels, so only stored ones need this.
+        label_rows = [
+            (*_label_columns(label_ids), msg_id)
+            for msg_id, label_ids in label_changes.items() if msg_id in known
+        ]
+        updated = len(label_rows)
+
+        execute_batches([
+            (_EMAIL_INSERT_SQL, email_rows),
+            ("UPDATE emails SET labels = ?, is_read = ?, is_starred = ? WHERE gmail_id = ?", label_rows),
+        ])
+
+        # Only advance the freshness timestamp — and the history checkpoint —
+        # on a fully-clean sync. If any messages were dropped, leave both so
+        # the next run retries them instead of stepping past them.
         if _should_mark_synced(failed):
             ts_statements = [
                 ("INSERT OR REPLACE INTO soy_meta (key, value, updated_at) VALUES ('gmail_last_synced', datetime('now'), datetime('now'))", ()),
@@ -209,12 +549,19 @@ def sync_gmail(token: str | None = None, account_email: str | None = None) -> di
                     "INSERT OR REPLACE INTO soy_meta (key, value, updated_at) VALUES (?, datetime('now'), datetime('now'))",
                     (f"gmail_last_synced:{account_email}",),
                 ))
+            if history_id:
+                ts_statements.append((
+                    "INSERT OR REPLACE INTO soy_meta (key, value, updated_at) VALUES (?, ?, datetime('now'))",
+                    (_meta_key("gmail_history_id", account_email), str(history_id)),
+                ))
             execute_many(ts_statements)
 
         return {
             "synced": synced,
+            "updated": updated,
             "failed": failed,
-            "total_checked": len(messages),
+            "total_checked": len(message_ids),
+            "mode": mode,
             "account": account_email,
         }
 
@@ -223,87 +570,208 @@ def sync_gmail(token: str | None = None, account_email: str | None = None) -> di
         return {"error": str(e), "synced": synced, "failed": failed}
 
 
-def sync_calendar(token: str | None = None, account_email: str | None = None) -> dict:
-    """Sync calendar events (next 14 days + last 7 days).
+# Calendar sync keeps a per-account, per-calendar ``syncToken`` in soy_meta.
+# With one, events.list returns only the events that changed since — deleted
+# events and cancelled recurring instances included, as status "cancelled" —
+# so a run touches only what changed. The first run, or any run after Google
+# answers 410 Gone for an expired token, is a full listing of the window from
+# CALENDAR_LOOKBACK_DAYS ago to CALENDAR_HORIZON_DAYS ahead, paged to the end
+# (Google only hands out the syncToken on the last page). Changes arrive
+# through the token wherever the event is, but an unchanged event past the
+# horizon never would as it drifts into view, so once less than half the
+# horizon is left the next run lists the window again. A full listing also
+# prunes the stored events of that calendar and window it no longer contains
+# (deleted while we had no valid token).
+CALENDAR_LOOKBACK_DAYS = 7
+CALENDAR_HORIZON_DAYS = 365
+CALENDAR_PAGE_SIZE = 250
+
+
+class _SyncTokenExpired(Exception):
+    """events.list returned 410 Gone: the syncToken is no longer valid."""
+
+
+def _calendar_list(
+    calendar_id: str, token: str, account_email: str | None,
+    sync_token: str | None, time_min: str, time_max: str,
+) -> tuple[list[dict], str | None, str]:
+    """Page through events.list — incrementally with ``sync_token``, else the
+    full ``time_min``..``time_max`` window.
+
+    Returns ``(events, next_sync_token, token)``. Raises ``_SyncTokenExpired``
+    on 410.
+    """
+    base = (
+        f"{CALENDAR_API}/calendars/{urllib.parse.quote(calendar_id)}/events"
+        f"?singleEvents=true&maxResults={CALENDAR_PAGE_SIZE}"
+    )
+    if sync_token:
+        base += f"&syncToken={urllib.parse.quote(sync_token)}"
+    else:
+        base += f"&timeMin={urllib.parse.quote(time_min)}&timeMax={urllib.parse.quote(time_max)}"
+    events: list[dict] = []
+    page_token = None
+    while True:
+        url = base + (f"&pageToken={urllib.parse.quote(page_token)}" if page_token else "")
+        try:
+            data, token = _get_with_refresh(
+                fetcher.with_fields(url, CALENDAR_EVENT_FIELDS), token, account_email,
+            )
+        except urllib.error.HTTPError as e:
+            if e.code == 410:
+                raise _SyncTokenExpired() from e
+            raise
+        events.extend(data.get("items", []))
+        page_token = data.get("nextPageToken")
+        if not page_token:
+            return events, data.get("nextSyncToken"), token
+
+
+# Deleted/cancelled events are removed, except rows a transcript still points
+# at: those are kept but marked cancelled (every calendar consumer already
+# filters those out). 026's triggers clear attendee rows either way. Both
+# statements take ``(google_event_id,)``.
+_CALENDAR_CANCEL_SQL = (
+    "UPDATE calendar_events SET status = 'cancelled', synced_at = datetime('now') "
+    "WHERE google_event_id = ? AND status != 'cancelled'"
+)
+_CALENDAR_DELETE_SQL = """DELETE FROM calendar_events WHERE google_event_id = ?
+     AND id NOT IN (SELECT source_calendar_event_id FROM transcripts
+                    WHERE source_calendar_event_id IS NOT NULL)"""
+
+# Triggers from migration 026 rebuild an event's calendar_event_attendees
+# rows from attendees/contact_ids when either changes — the junction table
+# every per-contact lookup uses.
+_CALENDAR_UPSERT_SQL = """INSERT INTO calendar_events
+       (google_event_id, title, description, location, start_time, end_time,
+        all_day, status, attendees, contact_ids, account_id, calendar_id)
+       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+       ON CONFLICT(google_event_id) DO UPDATE SET
+         title=excluded.title, description=excluded.description,
+         location=excluded.location, start_time=excluded.start_time,
+         end_time=excluded.end_time, status=excluded.status,
+         attendees=excluded.attendees, contact_ids=excluded.contact_ids,
+         account_id=COALESCE(excluded.account_id, calendar_events.account_id),
+         calendar_id=excluded.calendar_id, synced_at=datetime('now')"""
+
+
+def _calendar_event_row(
+    event: dict, account_id: int | None, calendar_id: str, contacts: ContactIndex,
+) -> tuple:
+    """``_CALENDAR_UPSERT_SQL`` parameters for one events.list item."""
+    title = event.get("summary", "(no title)")
+    description = event.get("description", "")
+    location = event.get("location", "")
+
+    start = event.get("start", {})
+    end = event.get("end", {})
+    start_time = start.get("dateTime", start.get("date", ""))
+    end_time = end.get("dateTime", end.get("date", ""))
+    all_day = "date" in start and "dateTime" not in start
+
+    status = event.get("status", "confirmed")
+    attendees_raw = event.get("attendees", [])
+    attendees = json.dumps([
+        {"email": a.get("email", ""), "name": a.get("displayName", ""), "status": a.get("responseStatus", "")}
+        for a in attendees_raw
+    ]) if attendees_raw else None
+
+    contact_ids = [cid for cid in (contacts.by_email(a.get("email")) for a in attendees_raw) if cid]
+    contact_ids_str = json.dumps(contact_ids) if contact_ids else None
+
+    return (event["id"], title, description or None, location or None,
+            start_time, end_time, 1 if all_day else 0, status,
+            attendees, contact_ids_str, account_id, calendar_id)
+
+
+def sync_calendar(
+    token: str | None = None, account_email: str | None = None, calendar_id: str = "primary",
+) -> dict:
+    """Sync calendar events incrementally from the account's syncToken.
+
+    Without a stored token (after a 410, or once the listed window's horizon
+    is half used up) this is a full listing of the window; see the comment
+    above for details.
 
     Args:
         token: OAuth access token (fetched automatically if not provided)
         account_email: Email of the Google account being synced.
+        calendar_id: Calendar to sync; tokens are kept per calendar.
     """
     token = token or get_valid_token(email=account_email)
     if not token:
         return {"error": "Not authenticated with Google."}
 
     account_id = _lookup_account_id(account_email)
+    token_key = _meta_key(f"calendar_sync_token:{calendar_id}", account_email)
+    horizon_key = _meta_key(f"calendar_sync_horizon:{calendar_id}", account_email)
     synced = 0
+    deleted = 0
     failed = 0
-    now = datetime.now()
-    time_min = (now - timedelta(days=7)).isoformat() + "Z"
-    time_max = (now + timedelta(days=14)).isoformat() + "Z"
+    now = datetime.now(timezone.utc)
+    time_min = (now - timedelta(days=CALENDAR_LOOKBACK_DAYS)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    time_max = (now + timedelta(days=CALENDAR_HORIZON_DAYS)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    relist_before = (now + timedelta(days=CALENDAR_HORIZON_DAYS / 2)).strftime("%Y-%m-%dT%H:%M:%SZ")
 
     try:
-        url = (
-            f"{CALENDAR_API}/calendars/primary/events"
-            f"?timeMin={urllib.parse.quote(time_min)}"
-            f"&timeMax={urllib.parse.quote(time_max)}"
-            f"&singleEvents=true&orderBy=startTime&maxResults=100"
+        rows = execute(
+            "SELECT key, value FROM soy_meta WHERE key IN (?, ?)", (token_key, horizon_key),
         )
-        data = _api_get(url, token)
-        events = data.get("items", [])
-
-        statements = []
-        for event in events:
-            event_id = event.get("id", "")
-            if not event_id:
-                continue
+        meta = {r["key"]: r["value"] for r in rows}
+        sync_token = meta.get(token_key) or None
+        if (meta.get(horizon_key) or "") < relist_before:
+            sync_token = None  # the listed window is running out
+        mode = "incremental" if sync_token else "full"
+        try:
+            events, next_sync_token, token = _calendar_list(
+                calendar_id, token, account_email, sync_token, time_min, time_max,
+            )
+        except _SyncTokenExpired:
+            mode = "full"
+            events, next_sync_token, token = _calendar_list(
+                calendar_id, token, account_email, None, time_min, time_max,
+            )
 
-            title = event.get("summary", "(no title)")
-            description = event.get("description", "")
-            location = event.get("location", "")
-
-            start = event.get("start", {})
-            end = event.get("end", {})
-            start_time = start.get("dateTime", start.get("date", ""))
-            end_time = end.get("dateTime", end.get("date", ""))
-            all_day = "date" in start and "dateTime" not in start
-
-            status = event.get("status", "confirmed")
-            attendees_raw = event.get("attendees", [])
-            attendees = json.dumps([
-                {"email": a.get("email", ""), "name": a.get("displayName", ""), "status": a.get("responseStatus", "")}
-                for a in attendees_raw
-            ]) if attendees_raw else None
-
-            # Match attendees to contacts
-            contact_ids = []
-            for a in attendees_raw:
-                email = a.get("email", "")
-                if email:
-                    rows = execute("SELECT id FROM contacts WHERE email = ?", (email,))
-                    if rows:
-                        contact_ids.append(rows[0]["id"])
-            contact_ids_str = json.dumps(contact_ids) if contact_ids else None
-
-            statements.append((
-                """INSERT INTO calendar_events
-                   (google_event_id, title, description, location, start_time, end_time,
-                    all_day, status, attendees, contact_ids, account_id)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                   ON CONFLICT(google_event_id) DO UPDATE SET
-                     title=excluded.title, description=excluded.description,
-                     location=excluded.location, start_time=excluded.start_time,
-                     end_time=excluded.end_time, status=excluded.status,
-                     attendees=excluded.attendees, contact_ids=excluded.contact_ids,
-                     account_id=COALESCE(excluded.account_id, calendar_events.account_id),
-                     synced_at=datetime('now')""",
-                (event_id, title, description or None, location or None,
-                 start_time, end_time, 1 if all_day else 0, status,
-                 attendees, contact_ids_str, account_id),
-            ))
-            synced += 1
-
-        if statements:
-            execute_many(statements)
+        # Google lists each changed event once, but keep only the last
+        # occurrence of an id anyway so upserts and removals can't collide.
+        latest = {ev["id"]: ev for ev in events if ev.get("id")}
+        contacts = ContactIndex()
+        upserts = []
+        removed = []
+        for event_id, event in latest.items():
+            if event.get("status") == "cancelled":
+                removed.append((event_id,))
+            else:
+                upserts.append(_calendar_event_row(event, account_id, calendar_id, contacts))
+        synced = len(upserts)
+
+        if mode == "full":
+            stored = execute(
+                """SELECT google_event_id FROM calendar_events
+                   WHERE account_id IS ? AND COALESCE(calendar_id, 'primary') = ?
+                     AND julianday(start_time) >= julianday(?)
+                     AND julianday(start_time) < julianday(?)
+                     AND status != 'cancelled'""",
+                (account_id, calendar_id, time_min, time_max),
+            )
+            removed.extend((r["google_event_id"],) for r in stored if r["google_event_id"] not in latest)
+        deleted = len(removed)
+
+        # The new syncToken commits with the writes it covers, so a crash
+        # can't leave a token pointing past events we never stored.
+        execute_batches([
+            (_CALENDAR_UPSERT_SQL, upserts),
+            (_CALENDAR_CANCEL_SQL, removed),
+            (_CALENDAR_DELETE_SQL, removed),
+            (
+                "INSERT OR REPLACE INTO soy_meta (key, value, updated_at) VALUES (?, ?, datetime('now'))",
+                [(token_key, next_sync_token)] if next_sync_token else [],
+            ),
+            (
+                "INSERT OR REPLACE INTO soy_meta (key, value, updated_at) VALUES (?, ?, datetime('now'))",
+                [(horizon_key, time_max)] if mode == "full" and next_sync_token else [],
+            ),
+        ])
 
         # Only advance the freshness timestamp on a fully-clean sync.
         if _should_mark_synced(failed):
@@ -319,8 +787,10 @@ def sync_calendar(token: str | None = None, account_email: str | None = None) ->
 
         return {
             "synced": synced,
+            "deleted": deleted,
             "failed": failed,
             "total_events": len(events),
+            "mode": mode,
             "account": account_email,
         }
 
@@ -399,14 +869,24 @@ def sync_transcripts(token: str | None = None, account_email: str | None = None)
     transient_failed = 0
 
     try:
-        # Find Gemini emails not yet in transcript_sources
+        # Find Gemini emails not yet in transcript_sources. With an account,
+        # only its own mailbox's: its token can't fetch another account's
+        # messages, and concurrent per-account runs mustn't import the same
+        # email twice. Emails stored before multi-account support (or by the
+        # legacy single-token sync) have no account_id; they came from the
+        # first account's mailbox, so the primary account scans them.
+        account_filter, params = "", [GEMINI_SENDER]
+        if account_email:
+            account_filter = """AND (e.account_id IS ? OR (e.account_id IS NULL AND EXISTS (
+                                 SELECT 1 FROM google_accounts WHERE email = ? AND is_primary = 1)))"""
+            params += [_lookup_account_id(account_email), account_email]
         gemini_emails = execute(
-            """SELECT e.id, e.gmail_id, e.subject, e.received_at
+            f"""SELECT e.id, e.gmail_id, e.subject, e.received_at
                FROM emails e
-               WHERE e.from_address = ?
+               WHERE e.from_address = ? {account_filter}
                  AND e.id NOT IN (SELECT email_id FROM transcript_sources WHERE email_id IS NOT NULL)
                ORDER BY e.received_at DESC""",
-            (GEMINI_SENDER,),
+            tuple(params),
         )
 
         if not gemini_emails:
@@ -416,50 +896,49 @@ def sync_transcripts(token: str | None = None, account_email: str | None = None)
             )])
             return {"imported": 0, "errors": []}
 
-        for email in gemini_emails:
-            email_id = email["id"]
-            gmail_id = email["gmail_id"]
-            subject = email["subject"] or ""
+        # Fetch every email body, then every linked Doc, concurrently; the
+        # database writes below stay serial. A 401 (token expired mid-sync)
+        # refreshes the token once and retries the affected items once.
+        msgs, token = _get_all_with_refresh(
+            [fetcher.with_fields(f"{GMAIL_API}/messages/{e['gmail_id']}?format=full", GMAIL_BODY_FIELDS)
+             for e in gemini_emails],
+            token, account_email,
+        )
+        pending = []  # (email, doc_id)
+        for email, msg in zip(gemini_emails, msgs):
+            if isinstance(msg, Exception):
+                transient_failed += 1
+                errors.append({"email_id": email["id"], "error": str(msg)})
+                continue
+            html_body = _extract_body_parts(msg.get("payload", {}), "text/html")
+            plain_body = _extract_body_parts(msg.get("payload", {}), "text/plain")
+            body_text = html_body or plain_body or ""
 
-            try:
-                # Fetch full email body. On a per-message 401 (token expired
-                # mid-sync), refresh the token once and retry this item once.
-                full_url = f"{GMAIL_API}/messages/{gmail_id}?format=full"
-                try:
-                    msg = _api_get(full_url, token)
-                except Exception as e:
-                    if _is_auth_error(e):
-                        new_token = _refresh_token(account_email)
-                        if not new_token:
-                            raise
-                        token = new_token
-                        msg = _api_get(full_url, token)
-                    else:
-                        raise
+            doc_match = DOC_LINK_RE.search(body_text)
+            if not doc_match:
+                errors.append({"email_id": email["id"], "error": "No Doc link"})
+                continue
 
-                html_body = _extract_body_parts(msg.get("payload", {}), "text/html")
-                plain_body = _extract_body_parts(msg.get("payload", {}), "text/plain")
-                body_text = html_body or plain_body or ""
+            pending.append((email, doc_match.group(1)))
 
-                doc_match = DOC_LINK_RE.search(body_text)
-                if not doc_match:
-                    errors.append({"email_id": email_id, "error": "No Doc link"})
-                    continue
-
-                doc_id = doc_match.group(1)
-                doc_url = f"https://docs.google.com/document/d/{doc_id}"
+        docs, token = _get_all_with_refresh(
+            [fetcher.with_fields(f"{DOCS_API}/{doc_id}", DOC_FIELDS) for _, doc_id in pending],
+            token, account_email,
+        )
+        for (email, doc_id), doc in zip(pending, docs):
+            email_id = email["id"]
+            subject = email["subject"] or ""
+            doc_url = f"https://docs.google.com/document/d/{doc_id}"
 
-                # Fetch Google Doc
-                try:
-                    doc = _api_get(f"{DOCS_API}/{doc_id}", token)
-                except urllib.error.HTTPError as e:
-                    if e.code == 403:
-                        return {
-                            "needs_reauth": True,
-                            "error": "Google Docs scope not authorized.",
-                            "imported": imported,
-                        }
-                    raise
+            try:
+                if isinstance(doc, urllib.error.HTTPError) and doc.code == 403:
+                    return {
+                        "needs_reauth": True,
+                        "error": "Google Docs scope not authorized.",
+                        "imported": imported,
+                    }
+                if isinstance(doc, Exception):
+                    raise doc
 
                 raw_text = _extract_doc_text(doc)
                 if not raw_text:
@@ -534,58 +1013,103 @@ def sync_transcripts(token: str | None = None, account_email: str | None = None)
         return {"error": str(e), "imported": imported, "failed": transient_failed}
 
 
-def sync_all_accounts() -> dict:
-    """Sync Gmail, Calendar, and Transcripts for all connected Google accounts.
+SYNC_SERVICES = ("gmail", "calendar", "transcripts")
+_SERVICE_FNS = {"gmail": sync_gmail, "calendar": sync_calendar, "transcripts": sync_transcripts}
+# Transcripts read what gmail and calendar write (the Gemini notification
+# emails, the events to match), so they run in a second phase, after both.
+_SYNC_PHASES = (("gmail", "calendar"), ("transcripts",))
+
+
+def _run_phased(jobs_for) -> dict:
+    """Run ``jobs_for(services)``'s ``((key, service), fn)`` jobs phase by
+    phase; returns ``{(key, service): result}``."""
+    results = {}
+    for phase in _SYNC_PHASES:
+        jobs = list(jobs_for(phase))
+        if jobs:
+            results.update(scheduler.run_jobs(jobs))
+    return results
+
+
+def sync_all_accounts(services: tuple[str, ...] | list[str] = SYNC_SERVICES) -> dict:
+    """Sync the given services for all connected Google accounts, in parallel.
+
+    Every account × service pair is one ``scheduler`` job. Gmail and
+    calendar jobs run together, then the transcripts jobs (``_SYNC_PHASES``),
+    so a sync takes about as long as its slowest job in each phase. Each
+    account's token is resolved once, up front and concurrently, and only
+    that account's jobs use it; a mid-sync 401 refreshes it under a per-account lock (``_refresh_token``).
 
     Falls back to legacy single-token behavior if no accounts are registered.
+    The result keeps the per-account / per-service shape:
+    ``{"status", "accounts_synced", "results": {account: {service: result}}}``.
     """
+    unknown = [name for name in services if name not in _SERVICE_FNS]
+    if unknown:
+        return {"error": f"Unknown service: {', '.join(unknown)}"}
+
     # Auto-migrate legacy token if present
     migrate_legacy_token()
 
     accounts = list_accounts()
     results = {}
+    started = time.monotonic()
 
     if accounts:
-        active_accounts = [a for a in accounts if a["status"] == "active"]
-        for acct in active_accounts:
-            acct_email = acct["email"]
-            token = get_valid_token(email=acct_email)
+        emails = [a["email"] for a in accounts if a["status"] == "active"]
+        tokens = scheduler.run_jobs(
+            (email, lambda email=email: {"token": get_valid_token(email=email)}) for email in emails
+        )
+        ready = {}
+        for email in emails:
+            token = tokens[email].get("token")
             if not token:
-                results[acct_email] = {"error": "Could not get valid token"}
+                results[email] = {"error": "Could not get valid token"}
                 continue
+            results[email] = {}
+            ready[email] = token
+
+        def jobs_for(phase):
+            return (
+                ((email, name), lambda fn=_SERVICE_FNS[name], email=email, token=token:
+                    fn(token=token, account_email=email))
+                for email, token in ready.items()
+                for name in services if name in phase
+            )
 
-            acct_results = {}
-            for name, fn in [("gmail", sync_gmail), ("calendar", sync_calendar), ("transcripts", sync_transcripts)]:
-                try:
-                    acct_results[name] = fn(token=token, account_email=acct_email)
-                except Exception as e:
-                    acct_results[name] = {"error": str(e)}
+        for (email, name), result in _run_phased(jobs_for).items():
+            results[email][name] = result
 
-            # Update last_synced_at on the account
+        # Update last_synced_at on the accounts that synced
+        synced = [email for email in emails if "error" not in results[email]]
+        if synced:
             try:
-                execute_write(
+                execute_many([(
                     "UPDATE google_accounts SET last_synced_at = datetime('now') WHERE email = ?",
-                    (acct_email,),
-                )
+                    (email,),
+                ) for email in synced])
             except Exception:
                 pass
-
-            results[acct_email] = acct_results
+        # Preserve the caller-visible account order.
+        results = {email: results[email] for email in emails}
     else:
         # Fall back to legacy single-token behavior
         token = get_valid_token()
         if not token:
             return {"status": "skipped", "reason": "Google not connected"}
 
-        legacy_results = {}
-        for name, fn in [("gmail", sync_gmail), ("calendar", sync_calendar), ("transcripts", sync_transcripts)]:
-            try:
-                legacy_results[name] = fn(token)
-            except Exception as e:
-                legacy_results[name] = {"error": str(e)}
-        results["legacy"] = legacy_results
-
-    return {"status": "ok", "accounts_synced": len(results), "results": results}
+        legacy = _run_phased(lambda phase: (
+            (("legacy", name), lambda fn=_SERVICE_FNS[name]: fn(token))
+            for name in services if name in phase
+        ))
+        results["legacy"] = {name: legacy[("legacy", name)] for name in services}
+
+    return {
+        "status": "ok",
+        "accounts_synced": len(results),
+        "results": results,
+        "elapsed_secs": round(time.monotonic() - started, 3),
+    }
 
 
 def sync_service(service: str, account_email: str | None = None) -> dict:
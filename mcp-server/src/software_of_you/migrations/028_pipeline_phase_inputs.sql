@@ -0,0 +1,17 @@
+-- 028_pipeline_phase_inputs.sql — incremental pipeline bookkeeping
+--
+-- scripts/pipeline.py runs its phases as a DAG and skips a phase whose inputs
+-- haven't changed since its last successful run. Each phase row records:
+--   input_fingerprint — sha256 of the phase's declared inputs (table
+--                       signatures, file fingerprints, ...) when it ran or was
+--                       skipped; the next run compares against it.
+--   skip_reason       — why a 'skipped' phase didn't run (unchanged inputs,
+--                       fresh sync, nothing to analyze, flag not given).
+--
+-- ALTERs only: a re-run outside the ledger hits "duplicate column" on the
+-- first and the runner skips the rest of the file.
+
+ALTER TABLE pipeline_phases ADD COLUMN input_fingerprint TEXT;
+ALTER TABLE pipeline_phases ADD COLUMN skip_reason TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_pipeline_phases_phase ON pipeline_phases(phase, id);
@@ -0,0 +1,99 @@
+"""Bounded-parallel job runner with a per-job deadline.
+
+``sync_all_accounts`` uses it to run every account × service sync at once, so
+a full sync takes about as long as its slowest job instead of the sum of all
+of them. Network calls inside the jobs still go through ``fetcher``'s per-host
+limits, so running more jobs never pushes past an API's quota.
+
+A job that overruns its deadline is reported as timed out and abandoned: its
+thread is a daemon and keeps running to completion in the background (its
+late result is discarded), and a fresh worker takes its place so the jobs
+still queued aren't held up behind it. Callers that mustn't start the same
+work twice track when the job itself returns (see ``sync_daemon``).
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Hashable, Iterable
+
+MAX_PARALLEL = int(os.environ.get("SOY_SYNC_PARALLEL", "6"))
+JOB_DEADLINE_SECS = float(os.environ.get("SOY_SYNC_JOB_DEADLINE", "120"))
+
+
+class _Job:
+    def __init__(self, key: Hashable, fn: Callable[[], dict]):
+        self.key = key
+        self.fn = fn
+        self.started: float | None = None
+
+
+def run_jobs(
+    jobs: Iterable[tuple[Hashable, Callable[[], dict]]],
+    max_parallel: int | None = None,
+    deadline_secs: float | None = None,
+) -> dict:
+    """Run ``(key, fn)`` jobs, at most ``max_parallel`` at a time.
+
+    Returns ``{key: result}`` with one entry per job. A job that raises gets
+    ``{"error": str(exc)}``; one still running ``deadline_secs`` after it
+    started gets ``{"error": "Timed out after Ns", "timed_out": True}``.
+    Each result dict also carries ``elapsed_secs``.
+    """
+    max_parallel = max(1, max_parallel or MAX_PARALLEL)
+    deadline_secs = deadline_secs or JOB_DEADLINE_SECS
+    pending = deque(_Job(key, fn) for key, fn in jobs)
+    total = len(pending)
+    running: list[_Job] = []
+    results: dict = {}
+    cond = threading.Condition()
+
+    def worker():
+        while True:
+            with cond:
+                if not pending:
+                    return
+                job = pending.popleft()
+                job.started = time.monotonic()
+                running.append(job)
+                cond.notify_all()
+            try:
+                result = job.fn()
+            except Exception as e:
+                result = {"error": str(e)}
+            with cond:
+                abandoned = job not in running
+                if not abandoned:
+                    running.remove(job)
+                    if isinstance(result, dict):
+                        result = {**result, "elapsed_secs": round(time.monotonic() - job.started, 3)}
+                    results[job.key] = result
+                    cond.notify_all()
+            if abandoned:
+                return  # a replacement worker already took this one's place
+
+    def spawn():
+        threading.Thread(target=worker, name="soy-sync", daemon=True).start()
+
+    for _ in range(min(max_parallel, total)):
+        spawn()
+
+    with cond:
+        while len(results) < total:
+            now = time.monotonic()
+            for job in list(running):
+                if now - job.started >= deadline_secs:
+                    running.remove(job)
+                    results[job.key] = {
+                        "error": f"Timed out after {deadline_secs:g}s",
+                        "timed_out": True,
+                        "elapsed_secs": round(now - job.started, 3),
+                    }
+                    if pending:
+                        spawn()
+            if len(results) >= total:
+                break
+            waits = [job.started + deadline_secs - now for job in running]
+            cond.wait(timeout=max(0.0, min(waits)) if waits else None)
+    return results
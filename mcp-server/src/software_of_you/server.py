@@ -4,8 +4,13 @@ Defines the server instance, behavioral instructions, and registers
 all tools. This is the entry point that Claude Desktop connects to.
 """
 
+from contextlib import asynccontextmanager
+
 from mcp.server.fastmcp import FastMCP
 
+from software_of_you import sync_daemon
+from software_of_you.db import close_pool
+
 SERVER_INSTRUCTIONS = """You are the AI interface for Software of You — a personal data platform. All data is local SQLite. Users talk naturally; you call tools and present results conversationally.
 
 ## Core Behavior
@@ -69,11 +74,23 @@ Never list tools. Frame as conversation. One next step at a time.
 """
 
 
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Run the background sync daemon while serving; close pooled DB connections on shutdown."""
+    sync_daemon.start()
+    try:
+        yield {}
+    finally:
+        sync_daemon.stop()
+        close_pool()
+
+
 def create_server() -> FastMCP:
     """Create and configure the MCP server with all tools."""
     server = FastMCP(
         "Software of You",
         instructions=SERVER_INSTRUCTIONS,
+        lifespan=_lifespan,
     )
 
     # Register data tools
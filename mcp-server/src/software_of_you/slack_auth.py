@@ -14,10 +14,10 @@ import sys
 import time
 import urllib.error
 import urllib.parse
-import urllib.request
 import webbrowser
 from http.server import BaseHTTPRequestHandler, HTTPServer
 
+from software_of_you import fetcher
 from software_of_you.db import DATA_DIR
 
 TOKEN_PATH = DATA_DIR / "slack_token.json"
@@ -166,16 +166,13 @@ def run_auth_flow() -> dict:
         raise RuntimeError(f"Slack authorization failed: {_OAuthHandler.error}")
 
     # Exchange code for token
-    token_params = urllib.parse.urlencode({
+    token_params = {
         "client_id": creds["client_id"],
         "client_secret": creds["client_secret"],
         "code": _OAuthHandler.auth_code,
         "redirect_uri": redirect_uri,
-    }).encode()
-
-    req = urllib.request.Request(SLACK_TOKEN_ENDPOINT, data=token_params)
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        data = json.loads(resp.read().decode())
+    }
+    data = fetcher.post_form(SLACK_TOKEN_ENDPOINT, token_params, timeout=10)
 
     if not data.get("ok"):
         error_msg = data.get("error", "unknown error")
@@ -213,13 +210,12 @@ def revoke_token() -> bool:
     access_token = token_data.get("access_token")
     if access_token:
         try:
-            req = urllib.request.Request(
-                SLACK_REVOKE_ENDPOINT,
+            fetcher.post_form(
+                SLACK_REVOKE_ENDPOINT, {},
                 headers={"Authorization": f"Bearer {access_token}"},
-                data=b"",
+                timeout=10,
             )
-            urllib.request.urlopen(req, timeout=10)
-        except urllib.error.URLError:
+        except (urllib.error.URLError, ValueError):
             pass
 
     if TOKEN_PATH.exists():
@@ -6,18 +6,27 @@ Syncs channels and messages into the shared SQLite database.
 Pattern mirrors google_sync.py.
 """
 
-import json
+import os
 import sys
 import urllib.error
 import urllib.parse
-import urllib.request
 from datetime import datetime, timedelta
 
-from software_of_you.db import execute, execute_many, execute_write, rows_to_dicts
+from software_of_you import fetcher
+from software_of_you.contact_index import ContactIndex
+from software_of_you.db import execute, execute_batches, execute_many, rows_to_dicts
 from software_of_you.slack_auth import get_bot_token
-from software_of_you.tools._resolve import resolve_contact_by_name
 
 SLACK_API = "https://slack.com/api"
+# Slack recommends no more than 200 items per page for cursor-paginated methods.
+SLACK_PAGE_SIZE = 200
+# Stored threads with a message this recent are polled for new replies.
+THREAD_ACTIVE_DAYS = 14
+# How many of those stored threads one run re-polls. conversations.replies
+# allows ~50 calls a minute, so the rest wait their turn: each run picks up
+# where the last one's rotation stopped.
+THREAD_POLL_MAX = int(os.environ.get("SOY_SLACK_THREAD_POLLS", "40"))
+_THREAD_CURSOR_KEY = "slack_thread_poll_cursor"
 
 
 def _should_mark_synced(failed: int) -> bool:
@@ -45,11 +54,9 @@ def _api_get(method: str, token: str, params: dict | None = None) -> dict:
     if params:
         url += "?" + urllib.parse.urlencode(params)
 
-    req = urllib.request.Request(
-        url, headers={"Authorization": f"Bearer {token}"}
-    )
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        data = json.loads(resp.read().decode())
+    # Through the shared fetch engine: Slack's per-method tier limits, and
+    # retries honouring Retry-After on 429.
+    data = fetcher.get_json(url, headers={"Authorization": f"Bearer {token}"})
 
     if not data.get("ok"):
         error = data.get("error", "unknown")
@@ -58,30 +65,102 @@ def _api_get(method: str, token: str, params: dict | None = None) -> dict:
     return data
 
 
-def _match_contact(sender_name: str | None, sender_email: str | None) -> int | None:
-    """Try to match a Slack user to an existing contact.
-
-    Resolution order:
-    1. Exact email match
-    2. Fuzzy name match (LIKE %name%)
+def _paginate(method: str, token: str, params: dict, key: str) -> list[dict]:
+    """Every ``key`` item of a cursor-paginated method, following next_cursor.
 
-    Returns contact_id or None.
+    Raises if any page fails, so callers never act on a partial listing.
     """
-    if sender_email:
+    items: list[dict] = []
+    cursor = None
+    while True:
+        page_params = {**params, "limit": str(SLACK_PAGE_SIZE)}
+        if cursor:
+            page_params["cursor"] = cursor
+        data = _api_get(method, token, page_params)
+        items.extend(data.get(key, []))
+        cursor = (data.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            return items
+
+
+def _known_message_ids(message_ids: list[str]) -> set[str]:
+    """Which composite ``slack_message_id``s are already stored (one IN query per 500)."""
+    known: set[str] = set()
+    for i in range(0, len(message_ids), 500):
+        chunk = message_ids[i:i + 500]
         rows = execute(
-            "SELECT id FROM contacts WHERE email = ?", (sender_email,)
+            f"SELECT slack_message_id FROM slack_messages WHERE slack_message_id IN ({','.join('?' * len(chunk))})",
+            tuple(chunk),
         )
-        if rows:
-            return rows[0]["id"]
+        known.update(r["slack_message_id"] for r in rows)
+    return known
+
 
-    # Fuzzy name fallback. On an ambiguous multi-match the helper returns an
-    # ambiguous result rather than a unique id; here we intentionally leave the
-    # message unlinked (preserving prior behavior) rather than guess.
-    match = resolve_contact_by_name(sender_name or "")
-    if match and "id" in match:
-        return match["id"]
+def _load_users(token: str) -> dict[str, dict]:
+    """Slack user id → ``{"name", "email", "is_bot"}``, for sender matching.
 
-    return None
+    A failed users.list leaves the cache empty: messages still sync, just
+    without sender names or contact links.
+    """
+    user_cache = {}
+    try:
+        for member in _paginate("users.list", token, {}, "members"):
+            uid = member.get("id", "")
+            profile = member.get("profile", {})
+            user_cache[uid] = {
+                "name": profile.get("real_name") or member.get("name", ""),
+                "email": profile.get("email"),
+                "is_bot": member.get("is_bot", False),
+            }
+    except Exception as e:
+        print(f"Failed to fetch Slack users: {e}", file=sys.stderr)
+    return user_cache
+
+
+_MESSAGE_INSERT_SQL = """INSERT OR IGNORE INTO slack_messages
+       (slack_message_id, channel_id, channel_name, sender_id,
+        sender_name, content, thread_ts, is_thread_parent,
+        contact_id, received_at)
+       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _message_row(
+    msg: dict, channel_id: str, channel_name: str, user_cache: dict, contacts: ContactIndex,
+) -> tuple | None:
+    """``_MESSAGE_INSERT_SQL`` parameters for one message, or None to skip it."""
+    # Skip bot messages, system messages, and subtypes
+    if msg.get("subtype") or msg.get("bot_id"):
+        return None
+
+    sender_id = msg.get("user", "")
+    msg_ts = msg.get("ts", "")
+    if not msg_ts:
+        return None
+
+    # Look up sender info
+    user_info = user_cache.get(sender_id, {})
+    if user_info.get("is_bot"):
+        return None
+
+    sender_name = user_info.get("name", "")
+    sender_email = user_info.get("email")
+    # Email first, then a unique fuzzy name match. An ambiguous
+    # name leaves the message unlinked rather than guessing.
+    contact_id = contacts.match(sender_name, sender_email)
+
+    content = msg.get("text", "")
+    thread_ts = msg.get("thread_ts")
+    is_thread_parent = 1 if msg.get("reply_count", 0) > 0 else 0
+
+    # Convert Slack timestamp to ISO datetime
+    received_at = datetime.fromtimestamp(float(msg_ts)).isoformat()
+
+    # Composite ID: channel_id + message timestamp
+    return (
+        f"{channel_id}_{msg_ts}", channel_id, channel_name, sender_id,
+        sender_name, content, thread_ts, is_thread_parent,
+        contact_id, received_at,
+    )
 
 
 def sync_channels(token: str | None = None) -> dict:
@@ -103,12 +182,9 @@ def sync_channels(token: str | None = None) -> dict:
     synced = 0
 
     try:
-        data = _api_get("conversations.list", token, {
+        channels = _paginate("conversations.list", token, {
             "types": "public_channel,private_channel,im,mpim",
-            "limit": "200",
-        })
-
-        channels = data.get("channels", [])
+        }, "channels")
         statements = []
 
         for ch in channels:
@@ -136,15 +212,58 @@ def sync_channels(token: str | None = None) -> dict:
         return {"error": str(e), "synced": synced}
 
 
-def sync_messages(token: str | None = None, days: int = 7) -> dict:
-    """Sync recent Slack messages from monitored channels.
+def _active_threads(since: str) -> dict[tuple[str, str], str]:
+    """Stored threads with a message since ``since``: ``{(channel, thread_ts): newest ts}``.
+
+    A reply doesn't resurface its parent in conversations.history, so threads
+    already stored are polled for new replies for as long as they stay active.
+    """
+    rows = execute(
+        """SELECT channel_id, thread_ts,
+                  MAX(substr(slack_message_id, length(channel_id) + 2)) AS latest_ts
+           FROM slack_messages
+           WHERE thread_ts IS NOT NULL AND received_at >= ?
+           GROUP BY channel_id, thread_ts""",
+        (since,),
+    )
+    return {(r["channel_id"], r["thread_ts"]): r["latest_ts"] for r in rows}
 
-    Fetches message history for each monitored channel, matches senders
-    to contacts, and inserts into slack_messages table.
+
+def _rotate_threads(keys, limit: int) -> list[tuple[str, str]]:
+    """Up to ``limit`` of ``keys``, starting after the last run's cursor.
+
+    Keys are ordered by channel and thread ts; the walk wraps around, so every
+    active thread is polled once every ``len(keys) / limit`` runs however many
+    there are.
+    """
+    order = sorted(keys, key=lambda k: (k[0], float(k[1])))
+    rows = execute("SELECT value FROM soy_meta WHERE key = ?", (_THREAD_CURSOR_KEY,))
+    if rows and rows[0]["value"]:
+        channel, _, ts = rows[0]["value"].partition(":")
+        cursor = (channel, float(ts))
+        split = next((i for i, k in enumerate(order) if (k[0], float(k[1])) > cursor), len(order))
+        order = order[split:] + order[:split]
+    return order[:max(limit, 0)]
+
+
+def sync_messages(token: str | None = None, days: int = 7) -> dict:
+    """Sync new Slack messages and thread replies from monitored channels.
+
+    Every monitored channel's history since its ``latest_synced_ts``
+    high-water mark (all pages) is fetched concurrently, then thread replies —
+    for every new parent with replies, plus up to ``THREAD_POLL_MAX`` stored
+    threads with activity in the last ``THREAD_ACTIVE_DAYS``, taken in
+    rotation — again concurrently. Both
+    fan-outs go through ``fetcher``, so its per-method tier limits bound what
+    reaches Slack, and sync time follows the slowest channel rather than the
+    sum of them. Each channel's messages, replies and mark then commit
+    together; a channel with any failed fetch writes nothing and is retried
+    next run.
 
     Args:
         token: Bot access token (fetched automatically if not provided)
-        days: Number of days of history to fetch (default 7)
+        days: How far back to read a channel that has never been synced
+            (default 7)
 
     Returns:
         Result dict with sync counts
@@ -154,104 +273,125 @@ def sync_messages(token: str | None = None, days: int = 7) -> dict:
         return {"error": "Not connected to Slack."}
 
     synced = 0
+    replies = 0
     failed = 0
     errors = []
 
     try:
         # Get monitored channels
         channels = execute(
-            "SELECT slack_channel_id, name FROM slack_channels WHERE is_monitored = 1"
+            "SELECT slack_channel_id, name, latest_synced_ts FROM slack_channels WHERE is_monitored = 1"
         )
 
         if not channels:
             return {"synced": 0, "message": "No monitored channels. Run sync_channels first."}
 
         # Build user cache for contact matching
-        user_cache = {}
-        try:
-            user_data = _api_get("users.list", token, {"limit": "200"})
-            for member in user_data.get("members", []):
-                uid = member.get("id", "")
-                profile = member.get("profile", {})
-                user_cache[uid] = {
-                    "name": profile.get("real_name") or member.get("name", ""),
-                    "email": profile.get("email"),
-                    "is_bot": member.get("is_bot", False),
-                }
-        except Exception as e:
-            print(f"Failed to fetch Slack users: {e}", file=sys.stderr)
-
-        # Calculate oldest timestamp
-        oldest = (datetime.now() - timedelta(days=days)).timestamp()
+        user_cache = _load_users(token)
+        contacts = ContactIndex()
+
+        # Where a never-synced channel starts
+        window_start = str((datetime.now() - timedelta(days=days)).timestamp())
+
+        # oldest is exclusive, so the message at the mark isn't re-read.
+        histories = fetcher.fetch_all(
+            lambda ch: _paginate("conversations.history", token, {
+                "channel": ch["slack_channel_id"],
+                "oldest": ch["latest_synced_ts"] or window_start,
+            }, "messages"),
+            channels,
+        )
 
-        for ch in channels:
+        # Threads to poll, with the newest reply already stored (None: all).
+        # New parents in the history just read are always polled; a reply
+        # doesn't resurface an older parent, so stored threads take turns.
+        monitored = {ch["slack_channel_id"] for ch, h in zip(channels, histories) if not isinstance(h, Exception)}
+        stored = {
+            key: latest
+            for key, latest in _active_threads(
+                (datetime.now() - timedelta(days=THREAD_ACTIVE_DAYS)).isoformat()
+            ).items()
+            if key[0] in monitored
+        }
+        threads = {}
+        for ch, history in zip(channels, histories):
+            if isinstance(history, Exception):
+                continue
+            for msg in history:
+                key = (ch["slack_channel_id"], msg.get("ts"))
+                if msg.get("reply_count", 0) > 0 and key[1]:
+                    threads[key] = stored.pop(key, None)
+        polled = _rotate_threads(stored, THREAD_POLL_MAX)
+        threads.update((key, stored[key]) for key in polled)
+        thread_keys = list(threads)
+
+        def fetch_replies(key):
+            params = {"channel": key[0], "ts": key[1]}
+            if threads[key]:
+                params["oldest"] = threads[key]
+            return _paginate("conversations.replies", token, params, "messages")
+
+        replies_by_channel: dict[str, list] = {}
+        for key, outcome in zip(thread_keys, fetcher.fetch_all(fetch_replies, thread_keys)):
+            replies_by_channel.setdefault(key[0], []).append(outcome)
+
+        committed = set()
+        for ch, history in zip(channels, histories):
             channel_id = ch["slack_channel_id"]
             channel_name = ch["name"]
 
             try:
-                history = _api_get("conversations.history", token, {
-                    "channel": channel_id,
-                    "oldest": str(oldest),
-                    "limit": "100",
-                })
-
-                messages = history.get("messages", [])
-                statements = []
-
-                for msg in messages:
-                    # Skip bot messages, system messages, and subtypes
-                    if msg.get("subtype") or msg.get("bot_id"):
-                        continue
-
-                    sender_id = msg.get("user", "")
-                    msg_ts = msg.get("ts", "")
-                    if not msg_ts:
-                        continue
-
-                    # Composite ID: channel_id + message timestamp
-                    composite_id = f"{channel_id}_{msg_ts}"
-
-                    # Look up sender info
-                    user_info = user_cache.get(sender_id, {})
-                    if user_info.get("is_bot"):
-                        continue
-
-                    sender_name = user_info.get("name", "")
-                    sender_email = user_info.get("email")
-                    contact_id = _match_contact(sender_name, sender_email)
-
-                    content = msg.get("text", "")
-                    thread_ts = msg.get("thread_ts")
-                    is_thread_parent = 1 if msg.get("reply_count", 0) > 0 else 0
-
-                    # Convert Slack timestamp to ISO datetime
-                    received_at = datetime.fromtimestamp(float(msg_ts)).isoformat()
-
-                    statements.append((
-                        """INSERT OR IGNORE INTO slack_messages
-                           (slack_message_id, channel_id, channel_name, sender_id,
-                            sender_name, content, thread_ts, is_thread_parent,
-                            contact_id, received_at)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                        (composite_id, channel_id, channel_name, sender_id,
-                         sender_name, content, thread_ts, is_thread_parent,
-                         contact_id, received_at),
-                    ))
-                    synced += 1
-
-                if statements:
-                    execute_many(statements)
-
-                # Update channel last_synced_at
-                execute_write(
-                    "UPDATE slack_channels SET last_synced_at = datetime('now') WHERE slack_channel_id = ?",
-                    (channel_id,),
+                thread_messages = []
+                for outcome in replies_by_channel.get(channel_id, []):
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    thread_messages.extend(outcome)
+                if isinstance(history, Exception):
+                    raise history
+
+                # conversations.replies repeats the parent; keep one of each ts.
+                messages = list({m["ts"]: m for m in [*history, *thread_messages] if m.get("ts")}.values())
+                known = _known_message_ids([f"{channel_id}_{m['ts']}" for m in messages])
+                rows = [
+                    row for row in (
+                        _message_row(msg, channel_id, channel_name, user_cache, contacts)
+                        for msg in messages
+                        if f"{channel_id}_{msg['ts']}" not in known
+                    ) if row
+                ]
+                synced += len(rows)
+                # A reply is a row whose thread_ts (row[6]) isn't its own ts.
+                replies += sum(1 for row in rows if row[6] not in (None, row[0][len(channel_id) + 1:]))
+                # The mark tracks channel history only (bot and system messages
+                # count too: they're still "seen"); replies are found by thread.
+                high_water = max(
+                    (m["ts"] for m in history if m.get("ts")), key=float, default=ch["latest_synced_ts"],
                 )
 
+                # New messages, replies and the channel's marks in one commit.
+                execute_batches([
+                    (_MESSAGE_INSERT_SQL, rows),
+                    (
+                        """UPDATE slack_channels SET last_synced_at = datetime('now'), latest_synced_ts = ?
+                           WHERE slack_channel_id = ?""",
+                        [(high_water, channel_id)],
+                    ),
+                ])
+                committed.add(channel_id)
+
             except Exception as e:
                 failed += 1
                 errors.append({"channel": channel_name, "error": str(e)})
 
+        # The rotation moves on only past threads whose channel committed, so
+        # a failed channel's threads come round again with its retry.
+        done = next((i for i, key in enumerate(polled) if key[0] not in committed), len(polled))
+        if done:
+            execute_many([(
+                "INSERT OR REPLACE INTO soy_meta (key, value, updated_at) VALUES (?, ?, datetime('now'))",
+                (_THREAD_CURSOR_KEY, f"{polled[done - 1][0]}:{polled[done - 1][1]}"),
+            )])
+
         # Only advance the freshness timestamp on a fully-clean sync. If any
         # channel was dropped, leave the timestamp so auto-sync retries instead
         # of waiting out the freshness window.
@@ -261,7 +401,13 @@ def sync_messages(token: str | None = None, days: int = 7) -> dict:
                 (),
             )])
 
-        result = {"synced": synced, "failed": failed, "channels_checked": len(channels)}
+        result = {
+            "synced": synced,
+            "replies": replies,
+            "failed": failed,
+            "channels_checked": len(channels),
+            "threads_checked": len(thread_keys),
+        }
         if errors:
             result["errors"] = errors
         return result
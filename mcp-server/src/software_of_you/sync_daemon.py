@@ -0,0 +1,458 @@
+"""Background sync daemon: each service on its own schedule.
+
+Tools used to check soy_meta and run a blocking Gmail / Calendar / Slack sync
+inside the user's tool call whenever data was older than its threshold, so a
+tool's latency depended on Google and Slack. The daemon moves that off the
+request path: it syncs every service on its own interval and tools only read
+the local database.
+
+  * Each service runs every ``interval`` seconds, ± ``JITTER_FRACTION`` so
+    services (and several installs behind one proxy) don't fire in lockstep.
+  * A failed run backs off exponentially from ``BACKOFF_BASE_SECS`` up to
+    ``BACKOFF_MAX_SECS`` instead of retrying every tick; the first clean run
+    returns it to its interval. A service that isn't connected is "skipped",
+    not failed, and simply checked again next interval.
+  * The first run after start-up is due ``interval`` after the service's last
+    clean sync (from soy_meta), so restarting doesn't resync fresh data.
+  * Due services run together through ``scheduler.run_jobs``, under its
+    per-job deadline. A run that overruns it is recorded as failed but keeps
+    going in the background; the service isn't started again until it ends,
+    so two runs never race on its checkpoints.
+
+Schedules are wall-clock, so after a laptop sleeps the overdue services run as
+soon as the daemon wakes — or sooner, when a tool ``nudge()``s it.
+
+Tools are stale-while-revalidate: they answer from local data straight away,
+and ``nudge()`` returns a ``freshness`` stamp for their ``_context``. With no
+daemon syncing this database at all (``SOY_SYNC_DAEMON=0``, scripts), a nudge
+starts a background refresh of the stale services itself. Refreshes are
+single-flight per service — concurrent tool calls share the one in flight —
+and a service isn't retried within ``BACKOFF_BASE_SECS`` of its last attempt.
+
+Runs embedded in the MCP server (a daemon thread started from the server's
+lifespan; ``SOY_SYNC_DAEMON=0`` turns that off) or standalone via
+``software-of-you daemon``. Only one daemon syncs a database at a time: each
+writes a heartbeat with its state to soy_meta (``sync_daemon``), and a second
+one defers while that heartbeat is fresh. ``status()`` reads the same row, so
+``system_status`` reports next-run / last-run state whichever process owns it.
+"""
+
+import json
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from software_of_you import scheduler
+from software_of_you.db import execute, execute_write
+
+ENABLED = os.environ.get("SOY_SYNC_DAEMON", "1") != "0"
+# Whether a nudge with no daemon running refreshes stale services itself.
+REFRESH_ON_READ = os.environ.get("SOY_SYNC_ON_READ", "1") != "0"
+
+# Seconds between clean runs, per service.
+INTERVALS = {
+    "gmail": float(os.environ.get("SOY_SYNC_INTERVAL_GMAIL", "900")),
+    "calendar": float(os.environ.get("SOY_SYNC_INTERVAL_CALENDAR", "900")),
+    "transcripts": float(os.environ.get("SOY_SYNC_INTERVAL_TRANSCRIPTS", "3600")),
+    "slack": float(os.environ.get("SOY_SYNC_INTERVAL_SLACK", "900")),
+}
+# soy_meta key each service stamps after a clean sync.
+LAST_SYNCED_KEYS = {
+    "gmail": "gmail_last_synced",
+    "calendar": "calendar_last_synced",
+    "transcripts": "transcripts_last_scanned",
+    "slack": "slack_last_synced",
+}
+JITTER_FRACTION = 0.1
+BACKOFF_BASE_SECS = 60.0
+BACKOFF_MAX_SECS = 3600.0
+HEARTBEAT_SECS = 30.0
+# A heartbeat older than this means its daemon is gone.
+HEARTBEAT_STALE_SECS = 3 * HEARTBEAT_SECS
+# First runs of never-synced services are spread out by this much.
+STARTUP_STAGGER_SECS = 2.0
+
+_STATE_KEY = "sync_daemon"
+
+
+def _google(service: str) -> Callable[[], dict]:
+    def run():
+        from software_of_you.google_sync import sync_all_accounts
+        return sync_all_accounts([service])
+    return run
+
+
+def _slack() -> dict:
+    from software_of_you.slack_sync import sync_slack
+    return sync_slack()
+
+
+def default_jobs() -> dict[str, Callable[[], dict]]:
+    return {
+        "gmail": _google("gmail"),
+        "calendar": _google("calendar"),
+        "transcripts": _google("transcripts"),
+        "slack": _slack,
+    }
+
+
+def _iso(ts: float | None) -> str | None:
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _errors(result, path: str = "") -> list[str]:
+    """Every ``error`` value anywhere in a (nested) sync result."""
+    if not isinstance(result, dict):
+        return []
+    found = [f"{path}{result['error']}"] if result.get("error") else []
+    for key, value in result.items():
+        if isinstance(value, dict):
+            found.extend(_errors(value, f"{path}{key}: "))
+    return found
+
+
+def _outcome(result: dict) -> tuple[str, str | None]:
+    """``("ok" | "skipped" | "error", error)`` for one service run."""
+    if result.get("status") == "skipped" or str(result.get("error", "")).startswith("Not connected"):
+        return "skipped", result.get("reason") or result.get("error")
+    errors = _errors(result)
+    if errors:
+        return "error", "; ".join(errors)[:500]
+    return "ok", None
+
+
+def _last_synced(services: list[str]) -> dict[str, float]:
+    """``{service: epoch}`` of each one's last clean sync (soy_meta stamps are UTC)."""
+    keys = {LAST_SYNCED_KEYS[s]: s for s in services if s in LAST_SYNCED_KEYS}
+    if not keys:
+        return {}
+    rows = execute(
+        f"""SELECT key, (julianday(value) - 2440587.5) * 86400.0 AS epoch FROM soy_meta
+            WHERE key IN ({",".join("?" * len(keys))})""",
+        tuple(keys),
+    )
+    return {keys[r["key"]]: r["epoch"] for r in rows if r["epoch"] is not None}
+
+
+class _Service:
+    def __init__(self, name: str, run: Callable[[], dict], interval: float):
+        self.name = name
+        self.run = run
+        self.interval = interval
+        self.next_run = 0.0
+        self.last_run: float | None = None
+        self.last_status: str | None = None
+        self.last_error: str | None = None
+        self.last_duration: float | None = None
+        self.failures = 0
+        # Set from the moment a tick picks the service until its run returns,
+        # even when the scheduler has abandoned it past its deadline.
+        self.running = False
+
+    def tracked(self) -> Callable[[], dict]:
+        """``run``, clearing ``running`` only once it has actually returned."""
+        def run():
+            try:
+                return self.run()
+            finally:
+                self.running = False
+        return run
+
+    def jittered(self, secs: float) -> float:
+        return secs * random.uniform(1 - JITTER_FRACTION, 1 + JITTER_FRACTION)
+
+    def record(self, status: str, error: str | None, duration: float | None, now: float) -> None:
+        self.last_run = now
+        self.last_status = status
+        self.last_error = error
+        self.last_duration = duration
+        if status == "error":
+            self.failures += 1
+            delay = min(BACKOFF_MAX_SECS, BACKOFF_BASE_SECS * 2 ** (self.failures - 1))
+        else:
+            self.failures = 0
+            delay = self.interval
+        self.next_run = now + self.jittered(delay)
+
+    def state(self) -> dict:
+        return {
+            "interval_secs": self.interval,
+            "next_run_at": _iso(self.next_run),
+            "last_run_at": _iso(self.last_run),
+            "last_status": self.last_status,
+            "last_error": self.last_error,
+            "last_duration_secs": self.last_duration,
+            "consecutive_failures": self.failures,
+        }
+
+
+class SyncDaemon:
+    """Runs due services each tick; ``start()`` ticks on a background thread."""
+
+    def __init__(self, jobs: dict[str, Callable[[], dict]] | None = None,
+                 intervals: dict[str, float] | None = None):
+        jobs = jobs if jobs is not None else default_jobs()
+        intervals = {**INTERVALS, **(intervals or {})}
+        self.services = [_Service(name, run, intervals[name]) for name, run in jobs.items()]
+        self.started_at = time.time()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        now = time.time()
+        last_synced = _last_synced([s.name for s in self.services])
+        for i, service in enumerate(self.services):
+            last = last_synced.get(service.name)
+            service.next_run = (last + service.interval) if last else now + i * STARTUP_STAGGER_SECS
+
+    # ── Scheduling ───────────────────────────────────────────────────
+
+    def tick(self, now: float | None = None) -> dict:
+        """Run every due service (concurrently) and reschedule it. Returns ``{name: result}``.
+
+        A service whose last run is still going (timed out, abandoned by the
+        scheduler) isn't due until that run ends.
+        """
+        now = time.time() if now is None else now
+        due = [s for s in self.services if s.next_run <= now and not s.running]
+        for service in due:
+            service.running = True
+        try:
+            results = scheduler.run_jobs((s.name, s.tracked()) for s in due) if due else {}
+        except Exception:
+            for service in due:
+                service.running = False
+            raise
+        finished = time.time()
+        for service in due:
+            result = results.get(service.name) or {"error": "no result"}
+            status, error = _outcome(result)
+            service.record(status, error, result.get("elapsed_secs"), finished)
+        self.save_state()
+        return results
+
+    def nudge(self) -> None:
+        """Wake the loop so it re-checks the schedule now."""
+        self._wake.set()
+
+    def next_wait(self) -> float:
+        soonest = min((s.next_run for s in self.services), default=time.time() + HEARTBEAT_SECS)
+        return max(0.0, min(HEARTBEAT_SECS, soonest - time.time()))
+
+    # ── Lifecycle ────────────────────────────────────────────────────
+
+    def run_forever(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"Sync daemon tick failed: {e}", file=sys.stderr)
+            self._wake.wait(self.next_wait())
+            self._wake.clear()
+        self.save_state(stopped=True)
+
+    def start(self) -> "SyncDaemon":
+        self._thread = threading.Thread(target=self.run_forever, name="soy-sync-daemon", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    # ── State ────────────────────────────────────────────────────────
+
+    def state(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "started_at": _iso(self.started_at),
+            "heartbeat": time.time(),
+            "services": {s.name: s.state() for s in self.services},
+        }
+
+    def save_state(self, stopped: bool = False) -> None:
+        state = self.state()
+        if stopped:
+            state["stopped"] = True
+        try:
+            execute_write(
+                "INSERT OR REPLACE INTO soy_meta (key, value, updated_at) VALUES (?, ?, datetime('now'))",
+                (_STATE_KEY, json.dumps(state)),
+            )
+        except Exception as e:
+            print(f"Sync daemon could not save state: {e}", file=sys.stderr)
+
+
+# ── Module-level daemon ──────────────────────────────────────────────
+
+_daemon: SyncDaemon | None = None
+_daemon_lock = threading.Lock()
+
+
+def _saved_state() -> dict | None:
+    try:
+        rows = execute("SELECT value FROM soy_meta WHERE key = ?", (_STATE_KEY,))
+        return json.loads(rows[0]["value"]) if rows and rows[0]["value"] else None
+    except Exception:
+        return None
+
+
+def other_daemon_alive() -> bool:
+    """Whether another process's daemon has a fresh heartbeat."""
+    state = _saved_state()
+    if not state or state.get("stopped") or state.get("pid") == os.getpid():
+        return False
+    return time.time() - state.get("heartbeat", 0) < HEARTBEAT_STALE_SECS
+
+
+def start() -> SyncDaemon | None:
+    """Start this process's daemon thread, unless disabled or another daemon owns the DB."""
+    global _daemon
+    with _daemon_lock:
+        if _daemon is not None:
+            return _daemon
+        if not ENABLED or other_daemon_alive():
+            return None
+        _daemon = SyncDaemon().start()
+        return _daemon
+
+
+def stop() -> None:
+    global _daemon
+    with _daemon_lock:
+        daemon, _daemon = _daemon, None
+    if daemon:
+        daemon.stop()
+
+
+# ── Stale-while-revalidate ───────────────────────────────────────────
+
+_inflight: dict[str, threading.Thread] = {}
+_last_attempt: dict[str, float] = {}
+_inflight_lock = threading.Lock()
+
+
+def _refresh(services: list[str]) -> None:
+    """Start one background sync for whichever ``services`` aren't already syncing."""
+    now = time.time()
+    with _inflight_lock:
+        todo = [
+            s for s in services
+            if s not in _inflight and now - _last_attempt.get(s, 0.0) >= BACKOFF_BASE_SECS
+        ]
+        if not todo:
+            return
+        jobs = default_jobs()
+        thread = threading.Thread(
+            target=_run_refresh, args=([(s, jobs[s]) for s in todo],),
+            name="soy-sync-refresh", daemon=True,
+        )
+        for service in todo:
+            _inflight[service] = thread
+            _last_attempt[service] = now
+    thread.start()
+
+
+def _until_done(name: str, fn: Callable[[], dict]) -> Callable[[], dict]:
+    """``fn``, leaving ``name`` in flight until it returns — past its deadline too."""
+    def run():
+        try:
+            return fn()
+        finally:
+            with _inflight_lock:
+                _inflight.pop(name, None)
+    return run
+
+
+def _run_refresh(jobs: list[tuple[str, Callable[[], dict]]]) -> None:
+    try:
+        results = scheduler.run_jobs((name, _until_done(name, fn)) for name, fn in jobs)
+        for name, result in results.items():
+            status, error = _outcome(result)
+            if status == "error":
+                print(f"Background {name} sync failed: {error}", file=sys.stderr)
+    except Exception as e:
+        print(f"Background sync failed: {e}", file=sys.stderr)
+        with _inflight_lock:
+            for name, _ in jobs:
+                _inflight.pop(name, None)
+
+
+def refreshing(service: str) -> bool:
+    """Whether a sync of ``service`` is running in this process right now."""
+    daemon = _daemon
+    if daemon is not None and any(s.running for s in daemon.services if s.name == service):
+        return True
+    return service in _inflight
+
+
+def freshness(services: list[str]) -> dict:
+    """``{service: {last_synced_at, age_secs, stale, refreshing}}`` from soy_meta."""
+    last_synced = _last_synced(services)
+    now = time.time()
+    result = {}
+    for service in services:
+        last = last_synced.get(service)
+        age = max(0, int(now - last)) if last is not None else None
+        result[service] = {
+            "last_synced_at": _iso(last),
+            "age_secs": age,
+            "stale": age is None or age >= INTERVALS[service],
+            "refreshing": refreshing(service),
+        }
+    return result
+
+
+def nudge(services: list[str]) -> dict:
+    """Non-blocking hint from a tool that it's about to read ``services``' data.
+
+    Wakes this process's daemon so anything overdue (say, after the machine
+    slept) starts now rather than at its next timer. With no daemon syncing
+    this database, starts a single-flight background refresh of whichever
+    are stale instead. Never syncs in the caller's thread. Returns the
+    ``freshness`` stamp the tool should put in its ``_context``.
+    """
+    current = freshness([s for s in services if s in INTERVALS])
+    daemon = _daemon
+    if daemon is not None:
+        daemon.nudge()
+        return current
+    stale = [s for s, f in current.items() if f["stale"] and not f["refreshing"]]
+    if stale and REFRESH_ON_READ and not other_daemon_alive():
+        _refresh(stale)
+        for service in stale:
+            current[service]["refreshing"] = refreshing(service)
+    return current
+
+
+def stamp(result: dict, *freshness_stamps: dict | None) -> dict:
+    """Put the merged ``freshness`` stamps into ``result["_context"]``."""
+    merged = {}
+    for f in freshness_stamps:
+        merged.update(f or {})
+    if merged and isinstance(result, dict):
+        result.setdefault("_context", {})["freshness"] = merged
+    return result
+
+
+def status() -> dict:
+    """The owning daemon's schedule state (from soy_meta), plus whether it's alive."""
+    state = _saved_state()
+    if not state:
+        return {"running": False, "message": "The sync daemon has not run yet."}
+    alive = not state.get("stopped") and time.time() - state.get("heartbeat", 0) < HEARTBEAT_STALE_SECS
+    return {
+        "running": alive,
+        "pid": state.get("pid"),
+        "embedded": state.get("pid") == os.getpid(),
+        "started_at": state.get("started_at"),
+        "heartbeat_at": _iso(state.get("heartbeat")),
+        "services": state.get("services", {}),
+    }
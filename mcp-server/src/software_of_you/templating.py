@@ -0,0 +1,140 @@
+"""Process-wide Jinja environment for the generated views.
+
+``tools/views.py`` and ``scripts/render.py`` used to build a fresh
+``jinja2.Environment`` per page, so every render re-parsed and re-compiled
+``base.html``, ``nav.html``, the page template and its components. They now
+share the environment ``get_env`` returns, and compiled templates persist
+across processes in two layers under ``DATA_DIR/template-cache/``:
+
+  * ``bytecode/<hash>/`` — a ``FileSystemBytecodeCache``: a process that
+    loads a template already compiled by an earlier one (the MCP server after
+    a restart, each ``render.py --jobs`` worker) unpickles its code object
+    instead of parsing the source;
+  * ``compiled/<hash>/`` — templates precompiled into importable Python
+    modules by the optional build step ``precompile()``
+    (``software-of-you compile-templates``). When present they're loaded
+    ahead of the sources, skipping even the bytecode cache's file reads.
+
+``<hash>`` is the hash of every template's path and contents, so editing a
+template moves both caches to a fresh directory instead of serving stale
+code. ``get_env`` notices edits by stat-ing the templates on each call (no
+reads) and rebuilds the environment when anything moved.
+``SOY_TEMPLATE_CACHE=0`` turns both on-disk layers off.
+"""
+
+import compileall
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+
+import jinja2
+
+from software_of_you import db
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+DISK_CACHE = os.environ.get("SOY_TEMPLATE_CACHE", "1") != "0"
+
+_env_lock = threading.Lock()
+_current: tuple[tuple, jinja2.Environment] | None = None
+
+
+def _template_files() -> list[Path]:
+    return sorted(TEMPLATES_DIR.rglob("*.html"))
+
+
+def template_hash() -> str:
+    """Hash of every template's relative path and contents."""
+    digest = hashlib.sha256()
+    for path in _template_files():
+        digest.update(str(path.relative_to(TEMPLATES_DIR)).encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _stat_signature() -> tuple:
+    """Cheap change detector: each template's path, size and mtime."""
+    out = []
+    for path in _template_files():
+        st = path.stat()
+        out.append((str(path), st.st_size, st.st_mtime_ns))
+    return tuple(out)
+
+
+def _cache_dir(kind: str, digest: str) -> Path:
+    return db.DATA_DIR / "template-cache" / kind / digest[:16]
+
+
+def _new_env(loader: jinja2.BaseLoader, bytecode_cache=None) -> jinja2.Environment:
+    return jinja2.Environment(
+        loader=loader,
+        autoescape=jinja2.select_autoescape(["html"]),
+        bytecode_cache=bytecode_cache,
+    )
+
+
+def _build_env() -> jinja2.Environment:
+    source = jinja2.FileSystemLoader(str(TEMPLATES_DIR))
+    if not DISK_CACHE:
+        return _new_env(source)
+    digest = template_hash()
+    loader: jinja2.BaseLoader = source
+    compiled = _cache_dir("compiled", digest)
+    if compiled.is_dir():
+        loader = jinja2.ChoiceLoader([jinja2.ModuleLoader(str(compiled)), source])
+    bytecode = _cache_dir("bytecode", digest)
+    try:
+        bytecode.mkdir(parents=True, exist_ok=True)
+        cache = jinja2.FileSystemBytecodeCache(str(bytecode))
+    except OSError:
+        cache = None  # read-only data dir: compile in memory only
+    return _new_env(loader, cache)
+
+
+def get_env() -> jinja2.Environment:
+    """The shared environment (autoescape on for ``.html``), rebuilt only when
+    the templates or the data dir change."""
+    global _current
+    key = (str(db.DATA_DIR), _stat_signature())
+    current = _current
+    if current is not None and current[0] == key:
+        return current[1]
+    with _env_lock:
+        if _current is None or _current[0] != key:
+            _current = (key, _build_env())
+        return _current[1]
+
+
+def precompile() -> dict:
+    """Compile every template into importable modules for ``get_env`` to load.
+
+    Writes ``compiled/<hash>/`` — modules plus their ``.pyc`` — atomically
+    (build in a temp dir, then rename) and prunes the compiled and bytecode
+    directories of older template versions. Returns ``{"path", "templates",
+    "hash"}``.
+    """
+    global _current
+    digest = template_hash()
+    target = _cache_dir("compiled", digest)
+    staging = target.with_name(target.name + ".tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.parent.mkdir(parents=True, exist_ok=True)
+    _new_env(jinja2.FileSystemLoader(str(TEMPLATES_DIR))).compile_templates(
+        str(staging), zip=None, ignore_errors=False,
+    )
+    # Byte-compile the modules too: importing them must not mean compiling
+    # Python source in every new process (or never caching it, under
+    # PYTHONDONTWRITEBYTECODE).
+    compileall.compile_dir(str(staging), quiet=1)
+    shutil.rmtree(target, ignore_errors=True)
+    staging.rename(target)
+
+    for kind in ("compiled", "bytecode"):
+        for stale in (db.DATA_DIR / "template-cache" / kind).glob("*"):
+            if stale.name != target.name:
+                shutil.rmtree(stale, ignore_errors=True)
+    with _env_lock:
+        _current = None
+    return {"path": str(target), "templates": len(list(target.glob("*.py"))), "hash": digest[:16]}
@@ -1,6 +1,7 @@
 """Shared contact resolution helper.
 
-A single fuzzy-name resolver used by interactions, projects, and slack sync.
+A single fuzzy-name resolver used by interactions and projects (Slack sync
+applies the same rule in bulk through ``contact_index.ContactIndex``).
 Previously each call site duplicated a ``SELECT ... WHERE name LIKE ?`` and
 silently returned ``None`` on multiple matches — quietly dropping or
 mis-attributing the link. This helper surfaces the ambiguity so callers that
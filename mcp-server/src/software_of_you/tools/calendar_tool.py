@@ -4,6 +4,7 @@ import json
 
 from mcp.server.fastmcp import FastMCP
 
+from software_of_you import sync_daemon
 from software_of_you.db import execute, rows_to_dicts
 
 
@@ -25,39 +26,32 @@ def register(server: FastMCP) -> None:
           with     — Events with a specific contact (contact_id or contact_name)
           free     — Free time slots today (gaps between events)
 
-        Auto-syncs calendar if data is stale (>15 min). Events are linked
-        to contacts via attendee email matching.
+        Answers from the local copy at once (``_context.freshness`` says how
+        old it is) and refreshes it in the background when stale. Events are
+        linked to contacts via attendee email matching.
         """
-        _auto_sync()
+        freshness = _auto_sync()
 
         if action == "today":
-            return _day("date('now')")
+            result = _day("date('now')")
         elif action == "tomorrow":
-            return _day("date('now', '+1 day')")
+            result = _day("date('now', '+1 day')")
         elif action == "week":
-            return _week()
+            result = _week()
         elif action == "schedule":
-            return _schedule(date_str)
+            result = _schedule(date_str)
         elif action == "with":
-            return _with_contact(contact_id, contact_name)
+            result = _with_contact(contact_id, contact_name)
         elif action == "free":
-            return _free()
+            result = _free()
         else:
-            return {"error": f"Unknown action: {action}. Use: today, tomorrow, week, schedule, with, free"}
+            result = {"error": f"Unknown action: {action}. Use: today, tomorrow, week, schedule, with, free"}
+        return sync_daemon.stamp(result, freshness)
 
 
-def _auto_sync():
-    try:
-        rows = execute("SELECT value FROM soy_meta WHERE key = 'calendar_last_synced'")
-        if rows:
-            from datetime import datetime
-            last = datetime.fromisoformat(rows[0]["value"])
-            if (datetime.now() - last).total_seconds() < 900:
-                return
-        from software_of_you.google_sync import sync_calendar
-        sync_calendar()
-    except Exception:
-        pass
+def _auto_sync() -> dict:
+    """Nudge the sync daemon about calendar data; never syncs inline."""
+    return sync_daemon.nudge(["calendar"])
 
 
 def _enrich_events(events):
@@ -153,8 +147,11 @@ def _with_contact(contact_id, contact_name):
         return {"error": "contact_id or contact_name required."}
 
     rows = execute(
-        "SELECT * FROM calendar_events WHERE contact_ids LIKE ? AND status != 'cancelled' ORDER BY start_time DESC LIMIT 20",
-        (f"%{contact_id}%",),
+        """SELECT ce.* FROM calendar_event_attendees a
+           JOIN calendar_events ce ON ce.id = a.event_id
+           WHERE a.contact_id = ? AND ce.status != 'cancelled'
+           ORDER BY a.start_time DESC LIMIT 20""",
+        (contact_id,),
     )
     events = _enrich_events(rows_to_dicts(rows))
 
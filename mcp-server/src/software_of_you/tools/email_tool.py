@@ -2,6 +2,7 @@
 
 from mcp.server.fastmcp import FastMCP
 
+from software_of_you import sync_daemon
 from software_of_you.db import execute, rows_to_dicts
 
 
@@ -24,37 +25,30 @@ def register(server: FastMCP) -> None:
           from     — Emails from a specific contact (contact_id or contact_name required)
           thread   — Get all emails in a thread (thread_id required)
 
-        Auto-syncs Gmail if data is stale (>15 min). Emails are read-only —
-        this tool doesn't send emails, it reads what's been synced.
+        Answers from the local copy at once (``_context.freshness`` says how
+        old it is) and refreshes it in the background when stale. Emails are
+        read-only — this tool doesn't send emails, it reads what's been synced.
         """
-        _auto_sync()
+        freshness = _auto_sync()
 
         if action == "inbox":
-            return _inbox(limit)
+            result = _inbox(limit)
         elif action == "unread":
-            return _unread(limit)
+            result = _unread(limit)
         elif action == "search":
-            return _search(query, limit)
+            result = _search(query, limit)
         elif action == "from":
-            return _from_contact(contact_id, contact_name, limit)
+            result = _from_contact(contact_id, contact_name, limit)
         elif action == "thread":
-            return _thread(thread_id)
+            result = _thread(thread_id)
         else:
-            return {"error": f"Unknown action: {action}. Use: inbox, unread, search, from, thread"}
-
-
-def _auto_sync():
-    try:
-        rows = execute("SELECT value FROM soy_meta WHERE key = 'gmail_last_synced'")
-        if rows:
-            from datetime import datetime
-            last = datetime.fromisoformat(rows[0]["value"])
-            if (datetime.now() - last).total_seconds() < 900:
-                return
-        from software_of_you.google_sync import sync_gmail
-        sync_gmail()
-    except Exception:
-        pass
+            result = {"error": f"Unknown action: {action}. Use: inbox, unread, search, from, thread"}
+        return sync_daemon.stamp(result, freshness)
+
+
+def _auto_sync() -> dict:
+    """Nudge the sync daemon about Gmail data; never syncs inline."""
+    return sync_daemon.nudge(["gmail"])
 
 
 def _inbox(limit):
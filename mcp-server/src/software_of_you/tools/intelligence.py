@@ -5,53 +5,50 @@ with cross-references. They are the "second brain" layer — the reason
 a CEO uses this instead of just searching her email.
 """
 
+import functools
 import json
 from mcp.server.fastmcp import FastMCP
 
-from software_of_you.db import execute, rows_to_dicts
-
-
-def _auto_sync_all() -> None:
-    """Check freshness and sync stale services. Logs failures to stderr."""
-    try:
-        from software_of_you.google_sync import sync_service
-        from datetime import datetime
-
-        for key, service, threshold in [
-            ("gmail_last_synced", "gmail", 900),
-            ("calendar_last_synced", "calendar", 900),
-            ("transcripts_last_scanned", "transcripts", 3600),
-        ]:
-            rows = execute("SELECT value FROM soy_meta WHERE key = ?", (key,))
-            if rows:
-                last = datetime.fromisoformat(rows[0]["value"])
-                if (datetime.now() - last).total_seconds() < threshold:
-                    continue
-            sync_service(service)
-    except Exception as e:
-        import sys
-        print(f"Auto-sync failed: {e}", file=sys.stderr)
-
-
-def _auto_sync_slack() -> None:
-    """Check Slack freshness and sync if stale. Logs failures to stderr."""
-    try:
-        from datetime import datetime
-        rows = execute("SELECT value FROM soy_meta WHERE key = 'slack_last_synced'", ())
-        if rows:
-            last = datetime.fromisoformat(rows[0]["value"])
-            if (datetime.now() - last).total_seconds() < 900:
-                return
-        from software_of_you.slack_sync import sync_slack
-        sync_slack()
-    except Exception as e:
-        import sys
-        print(f"Slack auto-sync failed: {e}", file=sys.stderr)
+from software_of_you import sync_daemon
+from software_of_you.contact_health import ensure_fresh as ensure_health_fresh
+from software_of_you.db import execute, rows_to_dicts, snapshot
+
+
+def _auto_sync_all() -> dict:
+    """Nudge the sync daemon about Google data; never syncs inline.
+
+    Tools read only local data. The daemon (or, without one, a background
+    refresh) keeps Gmail, Calendar and transcripts fresh; this just wakes it
+    in case something is stale. Returns the freshness stamp.
+    """
+    return sync_daemon.nudge(["gmail", "calendar", "transcripts"])
+
+
+def _auto_sync_slack() -> dict:
+    """Nudge the sync daemon about Slack data; never syncs inline."""
+    return sync_daemon.nudge(["slack"])
+
+
+def _with_freshness(slack: bool = False):
+    """Answer straight from local data and stamp ``_context.freshness``.
+
+    The nudges return at once, so the tool's latency is its SQLite reads; the
+    stamp tells the caller how old that data is and whether a refresh is
+    already under way.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def tool(*args, **kwargs):
+            stamps = [_auto_sync_all(), _auto_sync_slack() if slack else None]
+            return sync_daemon.stamp(fn(*args, **kwargs), *stamps)
+        return tool
+    return decorate
 
 
 def register(server: FastMCP) -> None:
 
     @server.tool()
+    @_with_freshness()
     def meeting_prep(
         event_id: int = 0,
         hours_ahead: int = 4,
@@ -67,7 +64,7 @@ def register(server: FastMCP) -> None:
             hours_ahead: Look-ahead window in hours when event_id is 0
             contact_name: Find next event with this attendee
         """
-        _auto_sync_all()
+        ensure_health_fresh()
 
         # Find the event
         if event_id:
@@ -182,6 +179,7 @@ def register(server: FastMCP) -> None:
         }
 
     @server.tool()
+    @_with_freshness(slack=True)
     def nudges(
         tier: str = "all",
         limit: int = 20,
@@ -192,8 +190,7 @@ def register(server: FastMCP) -> None:
             tier: Filter by urgency: urgent, soon, awareness, or all
             limit: Max items to return
         """
-        _auto_sync_all()
-        _auto_sync_slack()
+        ensure_health_fresh()
 
         # Summary counts
         summary_rows = execute("SELECT * FROM v_nudge_summary")
@@ -231,6 +228,7 @@ def register(server: FastMCP) -> None:
         }
 
     @server.tool()
+    @_with_freshness()
     def commitments_view(
         status: str = "open",
         contact_id: int = 0,
@@ -241,8 +239,6 @@ def register(server: FastMCP) -> None:
             status: Filter: open, overdue, completed, all
             contact_id: Filter by person (0 = all people)
         """
-        _auto_sync_all()  # Commitments come from transcripts
-
         if contact_id:
             rows = execute(
                 "SELECT * FROM v_commitment_status WHERE owner_contact_id = ? ORDER BY days_overdue DESC",
@@ -280,6 +276,7 @@ def register(server: FastMCP) -> None:
         }
 
     @server.tool()
+    @_with_freshness(slack=True)
     def relationship_pulse(
         contact_id: int = 0,
         threshold_days: int = 14,
@@ -290,8 +287,7 @@ def register(server: FastMCP) -> None:
             contact_id: Specific contact for deep dive (0 = show all, ranked by staleness)
             threshold_days: Days silent to flag as cooling
         """
-        _auto_sync_all()
-        _auto_sync_slack()
+        ensure_health_fresh()
 
         if contact_id:
             rows = execute("SELECT * FROM v_contact_health WHERE id = ?", (contact_id,))
@@ -339,6 +335,7 @@ def register(server: FastMCP) -> None:
             }
 
     @server.tool()
+    @_with_freshness(slack=True)
     def weekly_review(
         week_offset: int = 0,
     ) -> dict:
@@ -347,8 +344,7 @@ def register(server: FastMCP) -> None:
         Args:
             week_offset: 0 = current week (Mon-Sun), -1 = last week
         """
-        _auto_sync_all()
-        _auto_sync_slack()
+        ensure_health_fresh()
 
         # Calculate ISO week boundaries
         from datetime import datetime, timedelta
@@ -363,36 +359,72 @@ def register(server: FastMCP) -> None:
 
         data = {"week_start": monday_str, "week_end": sunday_str}
 
-        # Meetings held
-        meetings = execute(
-            """SELECT id, title, start_time, end_time, attendees, contact_ids
-               FROM calendar_events
-               WHERE date(start_time) BETWEEN ? AND ? AND status != 'cancelled'
-               ORDER BY start_time ASC""",
-            (monday_str, sunday_str),
-        )
+        week = (monday_str, sunday_str)
+        week_ts = (monday_str, sunday_str + " 23:59:59")
+        next_week = (next_monday_str, next_sunday_str)
+
+        # One read transaction for the whole review, so "made" vs "completed"
+        # and the meeting counts can't straddle a sync that lands mid-call.
+        with snapshot() as snap:
+            r = snap.batch({
+                # Meetings held
+                "meetings": (
+                    """SELECT id, title, start_time, end_time, attendees, contact_ids
+                       FROM calendar_events
+                       WHERE date(start_time) BETWEEN ? AND ? AND status != 'cancelled'
+                       ORDER BY start_time ASC""",
+                    week,
+                ),
+                # Commitments made this week — count from the base table by
+                # created_at, independent of status. The v_commitment_status
+                # view filters to status IN ('open','overdue'), which would drop
+                # a commitment that was made AND completed in the same week,
+                # undercounting "made".
+                "new_commits": (
+                    """SELECT c.id, c.description, c.status, c.created_at, co.name as owner_name
+                       FROM commitments c
+                       LEFT JOIN contacts co ON c.owner_contact_id = co.id
+                       WHERE c.created_at BETWEEN ? AND ?""",
+                    week_ts,
+                ),
+                # Completed this week (query commitments table directly — view
+                # doesn't expose completed_at)
+                "completed_commits": (
+                    """SELECT c.id, c.description, c.completed_at, co.name as owner_name
+                       FROM commitments c
+                       LEFT JOIN contacts co ON c.owner_contact_id = co.id
+                       WHERE c.status = 'completed'
+                         AND c.completed_at BETWEEN ? AND ?""",
+                    week_ts,
+                ),
+                "health": "SELECT * FROM v_contact_health WHERE last_activity IS NOT NULL",
+                # Next week preview
+                "next_meetings": (
+                    """SELECT title, start_time, attendees FROM calendar_events
+                       WHERE date(start_time) BETWEEN ? AND ? AND status != 'cancelled'
+                       ORDER BY start_time ASC""",
+                    next_week,
+                ),
+                "upcoming_commits": (
+                    """SELECT * FROM v_commitment_status
+                       WHERE status IN ('open', 'overdue')
+                         AND deadline_date BETWEEN ? AND ?""",
+                    next_week,
+                ),
+            })
+            try:
+                decisions = snap.execute(
+                    "SELECT title, context, status, decided_at FROM decisions WHERE decided_at BETWEEN ? AND ?",
+                    week_ts,
+                )
+            except Exception:
+                decisions = []
+
+        meetings = r["meetings"]
         data["meetings"] = {"items": rows_to_dicts(meetings), "count": len(meetings)}
 
-        # Commitments made this week — count from the base table by created_at,
-        # independent of status. The v_commitment_status view filters to
-        # status IN ('open','overdue'), which would drop a commitment that was
-        # made AND completed in the same week, undercounting "made".
-        new_commits = execute(
-            """SELECT c.id, c.description, c.status, c.created_at, co.name as owner_name
-               FROM commitments c
-               LEFT JOIN contacts co ON c.owner_contact_id = co.id
-               WHERE c.created_at BETWEEN ? AND ?""",
-            (monday_str, sunday_str + " 23:59:59"),
-        )
-        # Completed this week (query commitments table directly — view doesn't expose completed_at)
-        completed_commits = execute(
-            """SELECT c.id, c.description, c.completed_at, co.name as owner_name
-               FROM commitments c
-               LEFT JOIN contacts co ON c.owner_contact_id = co.id
-               WHERE c.status = 'completed'
-                 AND c.completed_at BETWEEN ? AND ?""",
-            (monday_str, sunday_str + " 23:59:59"),
-        )
+        new_commits = r["new_commits"]
+        completed_commits = r["completed_commits"]
         data["commitments"] = {
             "made": len(new_commits) if new_commits else 0,
             "completed": len(completed_commits) if completed_commits else 0,
@@ -400,7 +432,7 @@ def register(server: FastMCP) -> None:
         }
 
         # Relationships warming/cooling
-        health_rows = execute("SELECT * FROM v_contact_health WHERE last_activity IS NOT NULL")
+        health_rows = r["health"]
         contacts = rows_to_dicts(health_rows) if health_rows else []
         warming = [c for c in contacts if c.get("last_activity", "") >= monday_str]
         cooling = [c for c in contacts
@@ -412,28 +444,10 @@ def register(server: FastMCP) -> None:
         }
 
         # Decisions
-        try:
-            decisions = execute(
-                "SELECT title, context, status, decided_at FROM decisions WHERE decided_at BETWEEN ? AND ?",
-                (monday_str, sunday_str + " 23:59:59"),
-            )
-            data["decisions"] = rows_to_dicts(decisions) if decisions else []
-        except Exception:
-            data["decisions"] = []
-
-        # Next week preview
-        next_meetings = execute(
-            """SELECT title, start_time, attendees FROM calendar_events
-               WHERE date(start_time) BETWEEN ? AND ? AND status != 'cancelled'
-               ORDER BY start_time ASC""",
-            (next_monday_str, next_sunday_str),
-        )
-        upcoming_commits = execute(
-            """SELECT * FROM v_commitment_status
-               WHERE status IN ('open', 'overdue')
-                 AND deadline_date BETWEEN ? AND ?""",
-            (next_monday_str, next_sunday_str),
-        )
+        data["decisions"] = rows_to_dicts(decisions) if decisions else []
+
+        next_meetings = r["next_meetings"]
+        upcoming_commits = r["upcoming_commits"]
         data["next_week"] = {
             "meetings": rows_to_dicts(next_meetings) if next_meetings else [],
             "pending_commitments": rows_to_dicts(upcoming_commits) if upcoming_commits else [],
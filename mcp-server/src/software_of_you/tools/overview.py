@@ -2,7 +2,8 @@
 
 from mcp.server.fastmcp import FastMCP
 
-from software_of_you.db import execute, rows_to_dicts, get_installed_modules
+from software_of_you import sync_daemon
+from software_of_you.db import execute, query_batch, rows_to_dicts, get_installed_modules
 
 
 def register(server: FastMCP) -> None:
@@ -15,105 +16,125 @@ def register(server: FastMCP) -> None:
         follow-ups, recent activity, upcoming events, unread emails,
         and open commitments — depending on what modules are installed.
 
-        Auto-syncs Gmail and Calendar if stale (>15 min).
+        Answers from local data at once; ``_context.freshness`` says how old
+        the Gmail and Calendar data is and whether a refresh is under way.
         """
         modules = get_installed_modules()
-        data = {"modules": modules}
 
-        # Contact stats (always)
-        data["contacts"] = {
-            "total": execute("SELECT COUNT(*) as n FROM contacts")[0]["n"],
-            "active": execute("SELECT COUNT(*) as n FROM contacts WHERE status = 'active'")[0]["n"],
-            "recent": rows_to_dicts(execute(
-                "SELECT id, name, company, role, updated_at FROM contacts WHERE status = 'active' ORDER BY updated_at DESC LIMIT 5"
-            )),
-        }
+        freshness = _auto_sync([svc for svc in ("calendar", "gmail") if svc in modules])
 
-        # Projects
+        # Every count and list comes from ONE read transaction, so the numbers
+        # agree with each other even if a sync commits mid-call.
+        queries = {
+            "contacts_total": "SELECT COUNT(*) as n FROM contacts",
+            "contacts_active": "SELECT COUNT(*) as n FROM contacts WHERE status = 'active'",
+            "contacts_recent": "SELECT id, name, company, role, updated_at FROM contacts WHERE status = 'active' ORDER BY updated_at DESC LIMIT 5",
+            "activity": """SELECT al.*, CASE al.entity_type
+                   WHEN 'contact' THEN (SELECT name FROM contacts WHERE id = al.entity_id)
+                   WHEN 'project' THEN (SELECT name FROM projects WHERE id = al.entity_id)
+                   ELSE al.entity_type || ' #' || al.entity_id
+                 END as entity_name
+               FROM activity_log al ORDER BY al.created_at DESC LIMIT 15""",
+        }
         if "project-tracker" in modules:
-            data["projects"] = {
-                "by_status": rows_to_dicts(execute("SELECT status, COUNT(*) as count FROM projects GROUP BY status")),
-                "active": rows_to_dicts(execute(
-                    """SELECT p.id, p.name, p.status, p.priority, p.target_date, c.name as client_name
+            queries.update({
+                "projects_by_status": "SELECT status, COUNT(*) as count FROM projects GROUP BY status",
+                "projects_active": """SELECT p.id, p.name, p.status, p.priority, p.target_date, c.name as client_name
                        FROM projects p LEFT JOIN contacts c ON p.client_id = c.id
-                       WHERE p.status IN ('active', 'planning') ORDER BY p.priority DESC LIMIT 8"""
-                )),
-                "overdue_tasks": rows_to_dicts(execute(
-                    """SELECT t.title, t.due_date, p.name as project_name FROM tasks t
+                       WHERE p.status IN ('active', 'planning') ORDER BY p.priority DESC LIMIT 8""",
+                "overdue_tasks": """SELECT t.title, t.due_date, p.name as project_name FROM tasks t
                        JOIN projects p ON p.id = t.project_id
                        WHERE t.due_date < date('now') AND t.status NOT IN ('done')
-                       ORDER BY t.due_date ASC LIMIT 5"""
-                )),
-                "task_stats": rows_to_dicts(execute("SELECT status, COUNT(*) as count FROM tasks GROUP BY status")),
-            }
-
-        # Follow-ups (CRM)
+                       ORDER BY t.due_date ASC LIMIT 5""",
+                "task_stats": "SELECT status, COUNT(*) as count FROM tasks GROUP BY status",
+            })
         if "crm" in modules:
-            data["follow_ups"] = rows_to_dicts(execute(
-                """SELECT f.id, f.due_date, f.reason, f.status, c.name as contact_name, c.id as contact_id
+            queries["follow_ups"] = """SELECT f.id, f.due_date, f.reason, f.status, c.name as contact_name, c.id as contact_id
                    FROM follow_ups f JOIN contacts c ON c.id = f.contact_id
                    WHERE f.status = 'pending' ORDER BY f.due_date ASC LIMIT 8"""
-            ))
-
-        # Calendar events
         if "calendar" in modules:
-            _auto_sync("calendar")
-            data["calendar"] = {
-                "today": rows_to_dicts(execute(
-                    """SELECT id, title, start_time, end_time, location, attendees, contact_ids
+            queries.update({
+                "calendar_today": """SELECT id, title, start_time, end_time, location, attendees, contact_ids
                        FROM calendar_events
                        WHERE date(start_time) = date('now') AND status != 'cancelled'
-                       ORDER BY start_time ASC"""
-                )),
-                "tomorrow": rows_to_dicts(execute(
-                    """SELECT id, title, start_time, end_time, location
+                       ORDER BY start_time ASC""",
+                "calendar_tomorrow": """SELECT id, title, start_time, end_time, location
                        FROM calendar_events
                        WHERE date(start_time) = date('now', '+1 day') AND status != 'cancelled'
-                       ORDER BY start_time ASC"""
-                )),
-                "week_count": execute(
-                    """SELECT COUNT(*) as n FROM calendar_events
+                       ORDER BY start_time ASC""",
+                "calendar_week_count": """SELECT COUNT(*) as n FROM calendar_events
                        WHERE start_time BETWEEN datetime('now') AND datetime('now', '+7 days')
-                       AND status != 'cancelled'"""
-                )[0]["n"],
-            }
-
-        # Email stats
+                       AND status != 'cancelled'""",
+            })
         if "gmail" in modules:
-            _auto_sync("gmail")
-            data["email"] = {
-                "unread": execute("SELECT COUNT(*) as n FROM emails WHERE is_read = 0")[0]["n"],
-                "starred": execute("SELECT COUNT(*) as n FROM emails WHERE is_starred = 1 AND is_read = 0")[0]["n"],
-                "needs_response": rows_to_dicts(execute(
-                    """SELECT e.thread_id, e.subject, e.from_name, e.received_at, c.name as contact_name
+            queries.update({
+                "email_unread": "SELECT COUNT(*) as n FROM emails WHERE is_read = 0",
+                "email_starred": "SELECT COUNT(*) as n FROM emails WHERE is_starred = 1 AND is_read = 0",
+                "email_needs_response": """SELECT e.thread_id, e.subject, e.from_name, e.received_at, c.name as contact_name
                        FROM emails e LEFT JOIN contacts c ON e.contact_id = c.id
                        WHERE e.direction = 'inbound'
                          AND e.thread_id NOT IN (
                            SELECT thread_id FROM emails
                            WHERE direction = 'outbound' AND received_at > e.received_at)
                          AND e.received_at > datetime('now', '-7 days')
-                       GROUP BY e.thread_id ORDER BY e.received_at DESC LIMIT 5"""
-                )),
+                       GROUP BY e.thread_id ORDER BY e.received_at DESC LIMIT 5""",
+            })
+        if "conversation-intelligence" in modules:
+            queries.update({
+                "commitments_open": "SELECT COUNT(*) as n FROM commitments WHERE status IN ('open', 'overdue')",
+                "commitments_overdue": "SELECT COUNT(*) as n FROM commitments WHERE status = 'overdue' OR (status = 'open' AND deadline_date < date('now'))",
+            })
+
+        r = query_batch(queries)
+        data = {"modules": modules}
+
+        # Contact stats (always)
+        data["contacts"] = {
+            "total": r["contacts_total"][0]["n"],
+            "active": r["contacts_active"][0]["n"],
+            "recent": rows_to_dicts(r["contacts_recent"]),
+        }
+
+        # Projects
+        if "project-tracker" in modules:
+            data["projects"] = {
+                "by_status": rows_to_dicts(r["projects_by_status"]),
+                "active": rows_to_dicts(r["projects_active"]),
+                "overdue_tasks": rows_to_dicts(r["overdue_tasks"]),
+                "task_stats": rows_to_dicts(r["task_stats"]),
+            }
+
+        # Follow-ups (CRM)
+        if "crm" in modules:
+            data["follow_ups"] = rows_to_dicts(r["follow_ups"])
+
+        # Calendar events
+        if "calendar" in modules:
+            data["calendar"] = {
+                "today": rows_to_dicts(r["calendar_today"]),
+                "tomorrow": rows_to_dicts(r["calendar_tomorrow"]),
+                "week_count": r["calendar_week_count"][0]["n"],
+            }
+
+        # Email stats
+        if "gmail" in modules:
+            data["email"] = {
+                "unread": r["email_unread"][0]["n"],
+                "starred": r["email_starred"][0]["n"],
+                "needs_response": rows_to_dicts(r["email_needs_response"]),
             }
 
         # Open commitments
         if "conversation-intelligence" in modules:
             data["commitments"] = {
-                "open": execute("SELECT COUNT(*) as n FROM commitments WHERE status IN ('open', 'overdue')")[0]["n"],
-                "overdue": execute("SELECT COUNT(*) as n FROM commitments WHERE status = 'overdue' OR (status = 'open' AND deadline_date < date('now'))")[0]["n"],
+                "open": r["commitments_open"][0]["n"],
+                "overdue": r["commitments_overdue"][0]["n"],
             }
 
         # Recent activity (always)
-        data["activity"] = rows_to_dicts(execute(
-            """SELECT al.*, CASE al.entity_type
-                   WHEN 'contact' THEN (SELECT name FROM contacts WHERE id = al.entity_id)
-                   WHEN 'project' THEN (SELECT name FROM projects WHERE id = al.entity_id)
-                   ELSE al.entity_type || ' #' || al.entity_id
-                 END as entity_name
-               FROM activity_log al ORDER BY al.created_at DESC LIMIT 15"""
-        ))
+        data["activity"] = rows_to_dicts(r["activity"])
 
-        return {
+        return sync_daemon.stamp({
             "result": data,
             "_context": {
                 "presentation": "Present as a conversational dashboard summary. Lead with what needs attention (overdue items, unread emails, upcoming meetings). Use natural language, not data dumps.",
@@ -123,23 +144,9 @@ def register(server: FastMCP) -> None:
                     "Offer to generate an HTML dashboard view",
                 ],
             },
-        }
+        }, freshness)
 
 
-def _auto_sync(service: str) -> None:
-    """Check freshness and sync if stale. Silently fails."""
-    try:
-        key = f"{service}_last_synced"
-        rows = execute("SELECT value FROM soy_meta WHERE key = ?", (key,))
-        if rows:
-            from datetime import datetime
-            last = datetime.fromisoformat(rows[0]["value"])
-            diff = (datetime.now() - last).total_seconds()
-            if diff < 900:  # 15 minutes
-                return
-
-        # Sync
-        from software_of_you.google_sync import sync_service
-        sync_service(service)
-    except Exception:
-        pass  # Silently use cached data
+def _auto_sync(services: list[str]) -> dict:
+    """Nudge the sync daemon about ``services``; the overview never syncs inline."""
+    return sync_daemon.nudge(services)
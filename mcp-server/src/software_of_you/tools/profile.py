@@ -110,8 +110,11 @@ def register(server: FastMCP) -> None:
         # Calendar events
         if "calendar" in modules:
             profile["events"] = rows_to_dicts(execute(
-                "SELECT * FROM calendar_events WHERE contact_ids LIKE ? ORDER BY start_time DESC LIMIT 30",
-                (f"%{cid}%",),
+                """SELECT ce.* FROM calendar_event_attendees a
+                   JOIN calendar_events ce ON ce.id = a.event_id
+                   WHERE a.contact_id = ?
+                   ORDER BY a.start_time DESC LIMIT 30""",
+                (cid,),
             ))
 
         # Projects
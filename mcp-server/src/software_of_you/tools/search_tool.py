@@ -1,8 +1,96 @@
-"""Cross-module search tool."""
+"""Cross-module search tool.
+
+Backed by the FTS5 indexes from migration 024 (one external-content index per
+searchable table, kept in sync by triggers). Every group is a bm25-ranked
+index lookup instead of a ``LIKE '%q%'`` table scan, and each hit carries a
+``highlight`` snippet with the matched terms wrapped in ``**``.
+"""
+
+import re
 
 from mcp.server.fastmcp import FastMCP
 
-from software_of_you.db import execute, rows_to_dicts, get_installed_modules
+from software_of_you.db import query_batch, rows_to_dicts, get_installed_modules
+
+RESULT_LIMIT = 10
+
+# (result key, ``module`` filter value, required installed module or None,
+#  SELECT over the FTS index joined back to its table). Each SELECT gets the
+# MATCH expression as its only parameter. bm25 weights follow the index's
+# column order and favour titles/names over bodies.
+_SEARCHES = [
+    ("contacts", "contacts", None,
+     """SELECT c.id, c.name, c.company, c.role, c.email, 'contact' as result_type,
+               snippet(fts_contacts, -1, '**', '**', '…', 12) as highlight,
+               bm25(fts_contacts, 10.0, 5.0, 5.0, 1.0) as rank
+        FROM fts_contacts JOIN contacts c ON c.id = fts_contacts.rowid
+        WHERE fts_contacts MATCH ?"""),
+    ("projects", "projects", "project-tracker",
+     """SELECT p.id, p.name, p.status, cl.name as client_name, 'project' as result_type,
+               snippet(fts_projects, -1, '**', '**', '…', 12) as highlight,
+               bm25(fts_projects, 10.0, 1.0) as rank
+        FROM fts_projects JOIN projects p ON p.id = fts_projects.rowid
+        LEFT JOIN contacts cl ON p.client_id = cl.id
+        WHERE fts_projects MATCH ?"""),
+    ("tasks", "projects", "project-tracker",
+     """SELECT t.id, t.title, t.status, p.name as project_name, 'task' as result_type,
+               snippet(fts_tasks, -1, '**', '**', '…', 12) as highlight,
+               bm25(fts_tasks, 10.0, 1.0) as rank
+        FROM fts_tasks JOIN tasks t ON t.id = fts_tasks.rowid
+        JOIN projects p ON p.id = t.project_id
+        WHERE fts_tasks MATCH ?"""),
+    ("interactions", "interactions", "crm",
+     """SELECT ci.id, ci.subject, ci.type, c.name as contact_name, ci.occurred_at,
+               'interaction' as result_type,
+               snippet(fts_interactions, -1, '**', '**', '…', 12) as highlight,
+               bm25(fts_interactions, 5.0, 1.0) as rank
+        FROM fts_interactions JOIN contact_interactions ci ON ci.id = fts_interactions.rowid
+        JOIN contacts c ON c.id = ci.contact_id
+        WHERE fts_interactions MATCH ?"""),
+    ("emails", "emails", "gmail",
+     """SELECT e.id, e.subject, e.from_name, e.snippet, e.received_at, 'email' as result_type,
+               snippet(fts_emails, -1, '**', '**', '…', 12) as highlight,
+               bm25(fts_emails, 5.0, 1.0, 3.0) as rank
+        FROM fts_emails JOIN emails e ON e.id = fts_emails.rowid
+        WHERE fts_emails MATCH ?"""),
+    ("transcripts", "transcripts", "conversation-intelligence",
+     """SELECT t.id, t.title, t.summary, t.occurred_at, 'transcript' as result_type,
+               snippet(fts_transcripts, -1, '**', '**', '…', 16) as highlight,
+               bm25(fts_transcripts, 10.0, 3.0, 1.0) as rank
+        FROM fts_transcripts JOIN transcripts t ON t.id = fts_transcripts.rowid
+        WHERE fts_transcripts MATCH ?"""),
+    ("decisions", "decisions", "decision-log",
+     """SELECT d.id, d.title, d.status, d.decided_at, 'decision' as result_type,
+               snippet(fts_decisions, -1, '**', '**', '…', 12) as highlight,
+               bm25(fts_decisions, 10.0, 1.0, 3.0) as rank
+        FROM fts_decisions JOIN decisions d ON d.id = fts_decisions.rowid
+        WHERE fts_decisions MATCH ?"""),
+    ("journal", "journal", "journal",
+     """SELECT j.id, j.entry_date, j.mood, substr(j.content, 1, 150) as preview,
+               'journal' as result_type,
+               snippet(fts_journal, -1, '**', '**', '…', 12) as highlight,
+               bm25(fts_journal) as rank
+        FROM fts_journal JOIN journal_entries j ON j.id = fts_journal.rowid
+        WHERE fts_journal MATCH ?"""),
+    ("notes", "notes", "notes",
+     """SELECT n.id, n.title, substr(n.content, 1, 150) as preview, n.tags,
+               'note' as result_type,
+               snippet(fts_notes, -1, '**', '**', '…', 12) as highlight,
+               bm25(fts_notes, 10.0, 1.0, 3.0) as rank
+        FROM fts_notes JOIN standalone_notes n ON n.id = fts_notes.rowid
+        WHERE fts_notes MATCH ?"""),
+]
+
+
+def _match_expression(query: str) -> str:
+    """Turn free text into an FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term (``"acme"*``), ANDed together.
+    Quoting means user punctuation can never be parsed as FTS5 syntax; the
+    prefix keeps "partial word" searches working the way LIKE did for the
+    common case (``acm`` finds Acme, ``sarah`` finds sarah@acme.com).
+    """
+    return " ".join(f'"{term}"*' for term in re.findall(r"\w+", query))
 
 
 def register(server: FastMCP) -> None:
@@ -11,7 +99,8 @@ def register(server: FastMCP) -> None:
         """Search across all modules for a keyword or phrase.
 
         Searches contacts, projects, interactions, emails, transcripts,
-        decisions, journal entries, and notes. Returns results grouped by type.
+        decisions, journal entries, and notes. Returns results grouped by type,
+        best match first, each with a highlighted snippet of where it matched.
 
         Args:
             query: The search term
@@ -20,109 +109,22 @@ def register(server: FastMCP) -> None:
         if not query:
             return {"error": "A search query is required."}
 
-        pattern = f"%{query}%"
+        match = _match_expression(query)
+        if not match:
+            return {"error": f"No searchable terms in {query!r} — use letters or numbers."}
+
         modules = get_installed_modules()
+        queries = {
+            key: (f"{sql}\n        ORDER BY rank LIMIT {RESULT_LIMIT}", (match,))
+            for key, filter_name, required, sql in _SEARCHES
+            if (not module or module == filter_name)
+            and (required is None or required in modules)
+        }
         results = {}
-
-        # Always search contacts
-        if not module or module == "contacts":
-            rows = execute(
-                """SELECT id, name, company, role, email, 'contact' as result_type
-                   FROM contacts WHERE name LIKE ? OR company LIKE ? OR email LIKE ? OR notes LIKE ?
-                   LIMIT 10""",
-                (pattern, pattern, pattern, pattern),
-            )
-            if rows:
-                results["contacts"] = rows_to_dicts(rows)
-
-        # Projects
-        if (not module or module == "projects") and "project-tracker" in modules:
-            rows = execute(
-                """SELECT p.id, p.name, p.status, c.name as client_name, 'project' as result_type
-                   FROM projects p LEFT JOIN contacts c ON p.client_id = c.id
-                   WHERE p.name LIKE ? OR p.description LIKE ?
-                   LIMIT 10""",
-                (pattern, pattern),
-            )
-            if rows:
-                results["projects"] = rows_to_dicts(rows)
-
-            rows = execute(
-                """SELECT t.id, t.title, t.status, p.name as project_name, 'task' as result_type
-                   FROM tasks t JOIN projects p ON p.id = t.project_id
-                   WHERE t.title LIKE ? OR t.description LIKE ?
-                   LIMIT 10""",
-                (pattern, pattern),
-            )
-            if rows:
-                results["tasks"] = rows_to_dicts(rows)
-
-        # Interactions
-        if (not module or module == "interactions") and "crm" in modules:
-            rows = execute(
-                """SELECT ci.id, ci.subject, ci.type, c.name as contact_name, ci.occurred_at, 'interaction' as result_type
-                   FROM contact_interactions ci JOIN contacts c ON c.id = ci.contact_id
-                   WHERE ci.subject LIKE ? OR ci.summary LIKE ?
-                   ORDER BY ci.occurred_at DESC LIMIT 10""",
-                (pattern, pattern),
-            )
-            if rows:
-                results["interactions"] = rows_to_dicts(rows)
-
-        # Emails
-        if (not module or module == "emails") and "gmail" in modules:
-            rows = execute(
-                """SELECT id, subject, from_name, snippet, received_at, 'email' as result_type
-                   FROM emails WHERE subject LIKE ? OR snippet LIKE ? OR from_name LIKE ?
-                   ORDER BY received_at DESC LIMIT 10""",
-                (pattern, pattern, pattern),
-            )
-            if rows:
-                results["emails"] = rows_to_dicts(rows)
-
-        # Transcripts
-        if (not module or module == "transcripts") and "conversation-intelligence" in modules:
-            rows = execute(
-                """SELECT id, title, summary, occurred_at, 'transcript' as result_type
-                   FROM transcripts WHERE title LIKE ? OR raw_text LIKE ? OR summary LIKE ?
-                   ORDER BY occurred_at DESC LIMIT 10""",
-                (pattern, pattern, pattern),
-            )
-            if rows:
-                results["transcripts"] = rows_to_dicts(rows)
-
-        # Decisions
-        if (not module or module == "decisions") and "decision-log" in modules:
-            rows = execute(
-                """SELECT id, title, status, decided_at, 'decision' as result_type
-                   FROM decisions WHERE title LIKE ? OR context LIKE ? OR decision LIKE ?
-                   ORDER BY decided_at DESC LIMIT 10""",
-                (pattern, pattern, pattern),
-            )
-            if rows:
-                results["decisions"] = rows_to_dicts(rows)
-
-        # Journal
-        if (not module or module == "journal") and "journal" in modules:
-            rows = execute(
-                """SELECT id, entry_date, mood, substr(content, 1, 150) as preview, 'journal' as result_type
-                   FROM journal_entries WHERE content LIKE ?
-                   ORDER BY entry_date DESC LIMIT 10""",
-                (pattern,),
-            )
-            if rows:
-                results["journal"] = rows_to_dicts(rows)
-
-        # Notes
-        if (not module or module == "notes") and "notes" in modules:
-            rows = execute(
-                """SELECT id, title, substr(content, 1, 150) as preview, tags, 'note' as result_type
-                   FROM standalone_notes WHERE title LIKE ? OR content LIKE ? OR tags LIKE ?
-                   ORDER BY updated_at DESC LIMIT 10""",
-                (pattern, pattern, pattern),
-            )
+        for key, rows in query_batch(queries).items():
             if rows:
-                results["notes"] = rows_to_dicts(rows)
+                # rank only orders the rows; it isn't part of the result.
+                results[key] = [{k: v for k, v in r.items() if k != "rank"} for r in rows_to_dicts(rows)]
 
         total = sum(len(v) for v in results.values())
         return {
@@ -130,6 +132,6 @@ def register(server: FastMCP) -> None:
             "total_matches": total,
             "query": query,
             "_context": {
-                "presentation": "Group results by type. Show the most relevant matches first. Link to entity details where possible.",
+                "presentation": "Group results by type. Show the most relevant matches first. Link to entity details where possible. `highlight` shows where the query matched (terms wrapped in **).",
             },
         }
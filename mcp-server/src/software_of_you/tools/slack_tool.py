@@ -2,6 +2,7 @@
 
 from mcp.server.fastmcp import FastMCP
 
+from software_of_you import sync_daemon
 from software_of_you.db import execute, rows_to_dicts
 
 
@@ -23,21 +24,23 @@ def register(server: FastMCP) -> None:
           thread   — Get all messages in a thread (thread_ts required)
           channels — List all synced Slack channels
 
-        Auto-syncs Slack if data is stale (>15 min). Messages are read-only —
-        this tool reads what's been synced from Slack.
+        Answers from the local copy at once (``_context.freshness`` says how
+        old it is) and refreshes it in the background when stale. Messages
+        are read-only — this tool reads what's been synced from Slack.
         """
-        _auto_sync()
+        freshness = _auto_sync()
 
         if action == "search":
-            return _search(query, days)
+            result = _search(query, days)
         elif action == "recent":
-            return _recent(channel, contact_id, days)
+            result = _recent(channel, contact_id, days)
         elif action == "thread":
-            return _thread(thread_ts)
+            result = _thread(thread_ts)
         elif action == "channels":
-            return _channels()
+            result = _channels()
         else:
-            return {"error": f"Unknown action: {action}. Use: search, recent, thread, channels"}
+            result = {"error": f"Unknown action: {action}. Use: search, recent, thread, channels"}
+        return sync_daemon.stamp(result, freshness)
 
     @server.tool()
     def slack_setup() -> dict:
@@ -104,19 +107,9 @@ def register(server: FastMCP) -> None:
             }
 
 
-def _auto_sync():
-    """Auto-sync Slack messages if data is stale (>15 min)."""
-    try:
-        rows = execute("SELECT value FROM soy_meta WHERE key = 'slack_last_synced'")
-        if rows:
-            from datetime import datetime
-            last = datetime.fromisoformat(rows[0]["value"])
-            if (datetime.now() - last).total_seconds() < 900:
-                return
-        from software_of_you.slack_sync import sync_messages
-        sync_messages()
-    except Exception:
-        pass
+def _auto_sync() -> dict:
+    """Nudge the sync daemon about Slack data; never syncs inline."""
+    return sync_daemon.nudge(["slack"])
 
 
 def _search(query, days):
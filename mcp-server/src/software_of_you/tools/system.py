@@ -2,6 +2,7 @@
 
 from mcp.server.fastmcp import FastMCP
 
+from software_of_you import backfill, sync_daemon
 from software_of_you.db import (
     execute, DB_PATH, DATA_DIR, BACKUP_DIR,
     backup_db, get_installed_modules,
@@ -10,14 +11,20 @@ from software_of_you.db import (
 
 def register(server: FastMCP) -> None:
     @server.tool()
-    def system_status(action: str = "status") -> dict:
+    def system_status(action: str = "status", sources: str = "") -> dict:
         """System management for Software of You.
 
         Actions:
-          status        — Show data stats, installed modules, Google connection
+          status        — Show data stats, installed modules, Google connection,
+                          and the sync daemon's last/next run per service
           setup_google  — Start Google OAuth flow (opens browser for authorization)
           revoke_google — Disconnect Google account
           backup        — Create a database backup now
+          backfill      — Import full Gmail/Calendar/Slack history in the background
+                          (sources: comma-separated subset, default all; resumes
+                          from saved checkpoints)
+          backfill_status — Backfill progress: items, items/s, ETA per source
+          backfill_stop — Pause the backfill after its current page
 
         The Google connection enables email sync and calendar integration.
         Users say "connect my Google account" to trigger setup_google.
@@ -30,8 +37,15 @@ def register(server: FastMCP) -> None:
             return _revoke_google()
         elif action == "backup":
             return _backup()
+        elif action == "backfill":
+            return backfill.start([name.strip() for name in sources.split(",") if name.strip()])
+        elif action == "backfill_status":
+            return backfill.status()
+        elif action == "backfill_stop":
+            return backfill.stop()
         else:
-            return {"error": f"Unknown action: {action}. Use: status, setup_google, revoke_google, backup"}
+            return {"error": f"Unknown action: {action}. Use: status, setup_google, revoke_google, backup, "
+                             "backfill, backfill_status, backfill_stop"}
 
 
 def _get_customer_name() -> str:
@@ -153,6 +167,7 @@ def _status():
             "modules": modules,
             "stats": stats,
             "google_connected": google_connected,
+            "sync_daemon": sync_daemon.status(),
         },
         "_context": {
             **onboarding,
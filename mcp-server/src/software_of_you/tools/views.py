@@ -17,11 +17,12 @@ import jinja2
 from mcp.server.fastmcp import FastMCP
 
 from software_of_you.db import (
-    execute, execute_many, rows_to_dicts,
+    execute, execute_many, rows_to_dicts, snapshot,
     get_installed_modules, VIEWS_DIR,
 )
-
-TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+from software_of_you import templating, view_assets
+from software_of_you.contact_health import ensure_fresh as ensure_health_fresh
+from software_of_you.entity_data import EntityPageData
 
 
 def _safe_slug(name: str, fallback: str = "view") -> str:
@@ -36,9 +37,11 @@ def _safe_slug(name: str, fallback: str = "view") -> str:
 
 
 def _get_env() -> jinja2.Environment:
-    """Get Jinja2 environment with template directory.
+    """Get the shared Jinja2 environment (``templating.get_env``).
 
-    Autoescaping is ON for HTML templates so that DB- and external-derived
+    It's built once per process (and its compiled templates cached on disk),
+    not per view. Autoescaping is ON — ``select_autoescape(["html"])`` — for
+    HTML templates so that DB- and external-derived
     values (contact names, email from_name, calendar event titles, transcript
     text, etc.) are rendered as inert escaped text and can never execute
     injected script. The ONE intentional raw-HTML channel is
@@ -57,10 +60,7 @@ def _get_env() -> jinja2.Environment:
     that substring MUST be escaped (``markupsafe.escape`` / ``html.escape``)
     before concatenation.
     """
-    return jinja2.Environment(
-        loader=jinja2.FileSystemLoader(str(TEMPLATES_DIR)),
-        autoescape=jinja2.select_autoescape(["html"]),
-    )
+    return templating.get_env()
 
 
 def _relative_time(iso_str: str) -> str:
@@ -181,6 +181,7 @@ def _get_nav_context(active_page: str = "dashboard", active_section: str = "",
         "project_pages": project_pages,
         "tip_text": tip_text or "Use /help-soy to see all available commands.",
         "generated_at": datetime.now().strftime("%B %d, %Y at %-I:%M %p"),
+        "assets": view_assets.publish(VIEWS_DIR),
     }
 
 
@@ -242,155 +243,160 @@ def _render_dashboard(open_after: bool) -> dict:
     template = env.get_template("pages/dashboard.html")
     modules = get_installed_modules()
     today = date.today()
+    # Before the snapshot: the refresh writes.
+    ensure_health_fresh()
+
+    # One read transaction for every query below (nav context included), so
+    # the stats, lists, and badges all describe the same database state.
+    with snapshot() as snap:
+        # Gather all dashboard data
+        ctx = _get_nav_context("dashboard")
+
+        # Stats
+        stats = {"contacts": snap.execute("SELECT COUNT(*) as n FROM contacts")[0]["n"]}
+        if "project-tracker" in modules:
+            stats["projects"] = snap.execute("SELECT COUNT(*) as n FROM projects WHERE status IN ('active','planning')")[0]["n"]
+        if "gmail" in modules:
+            stats["unread"] = snap.execute("SELECT COUNT(*) as n FROM emails WHERE is_read = 0")[0]["n"]
+        if "calendar" in modules:
+            stats["today_events"] = snap.execute("SELECT COUNT(*) as n FROM calendar_events WHERE date(start_time) = date('now') AND status != 'cancelled'")[0]["n"]
+
+        ctx["stats"] = stats
+        ctx["today_formatted"] = today.strftime("%A, %B %d, %Y")
+
+        # Urgent count for nudges
+        urgent = 0
+        try:
+            row = snap.execute("""SELECT
+                (SELECT COUNT(*) FROM follow_ups WHERE status = 'pending' AND due_date < date('now'))
+                + (SELECT COUNT(*) FROM commitments WHERE status IN ('open','overdue') AND deadline_date < date('now'))
+                + (SELECT COUNT(*) FROM tasks t JOIN projects p ON p.id = t.project_id WHERE t.status NOT IN ('done') AND t.due_date < date('now'))
+                as urgent_count""")
+            urgent = row[0]["urgent_count"] if row else 0
+        except Exception:
+            pass
+        ctx["urgent_count"] = urgent
 
-    # Gather all dashboard data
-    ctx = _get_nav_context("dashboard")
-
-    # Stats
-    stats = {"contacts": execute("SELECT COUNT(*) as n FROM contacts")[0]["n"]}
-    if "project-tracker" in modules:
-        stats["projects"] = execute("SELECT COUNT(*) as n FROM projects WHERE status IN ('active','planning')")[0]["n"]
-    if "gmail" in modules:
-        stats["unread"] = execute("SELECT COUNT(*) as n FROM emails WHERE is_read = 0")[0]["n"]
-    if "calendar" in modules:
-        stats["today_events"] = execute("SELECT COUNT(*) as n FROM calendar_events WHERE date(start_time) = date('now') AND status != 'cancelled'")[0]["n"]
-
-    ctx["stats"] = stats
-    ctx["today_formatted"] = today.strftime("%A, %B %d, %Y")
-
-    # Urgent count for nudges
-    urgent = 0
-    try:
-        row = execute("""SELECT
-            (SELECT COUNT(*) FROM follow_ups WHERE status = 'pending' AND due_date < date('now'))
-            + (SELECT COUNT(*) FROM commitments WHERE status IN ('open','overdue') AND deadline_date < date('now'))
-            + (SELECT COUNT(*) FROM tasks t JOIN projects p ON p.id = t.project_id WHERE t.status NOT IN ('done') AND t.due_date < date('now'))
-            as urgent_count""")
-        urgent = row[0]["urgent_count"] if row else 0
-    except Exception:
-        pass
-    ctx["urgent_count"] = urgent
+        # Calendar
+        if "calendar" in modules:
+            now = datetime.now()
+            today_events_raw = rows_to_dicts(snap.execute(
+                "SELECT * FROM calendar_events WHERE date(start_time) = date('now') AND status != 'cancelled' ORDER BY start_time ASC"
+            ))
+            for e in today_events_raw:
+                e["start_formatted"] = _format_time(e["start_time"])
+                try:
+                    start = datetime.fromisoformat(e["start_time"])
+                    end = datetime.fromisoformat(e["end_time"])
+                    mins = int((end - start).total_seconds() / 60)
+                    e["duration"] = f"{mins}m" if mins < 60 else f"{mins // 60}h{mins % 60:02d}m"
+                    e["is_past"] = end < now
+                    e["is_next"] = not e["is_past"] and start > now
+                except (ValueError, TypeError):
+                    e["duration"] = ""
+                    e["is_past"] = False
+                    e["is_next"] = False
+                e["context_line"] = e.get("location", "")
+
+            # Mark only the first non-past event as "next"
+            found_next = False
+            for e in today_events_raw:
+                if e["is_next"] and not found_next:
+                    found_next = True
+                elif e["is_next"]:
+                    e["is_next"] = False
+
+            ctx["today_events"] = today_events_raw
+
+            tomorrow_raw = rows_to_dicts(snap.execute(
+                "SELECT * FROM calendar_events WHERE date(start_time) = date('now', '+1 day') AND status != 'cancelled' ORDER BY start_time ASC"
+            ))
+            for e in tomorrow_raw:
+                e["start_formatted"] = _format_time(e["start_time"])
+            ctx["tomorrow_events"] = tomorrow_raw
+
+        # Email
+        if "gmail" in modules:
+            ctx["unread_count"] = stats.get("unread", 0)
+
+            needs_resp = rows_to_dicts(snap.execute(
+                """SELECT e.thread_id, e.subject, e.from_name, e.received_at, c.name as contact_name
+                   FROM emails e LEFT JOIN contacts c ON e.contact_id = c.id
+                   WHERE e.direction = 'inbound'
+                     AND e.thread_id NOT IN (SELECT thread_id FROM emails WHERE direction = 'outbound' AND received_at > e.received_at)
+                     AND e.received_at > datetime('now', '-7 days')
+                   GROUP BY e.thread_id ORDER BY e.received_at DESC LIMIT 5"""
+            ))
+            for t in needs_resp:
+                t["received_at_relative"] = _relative_time(t["received_at"])
+            ctx["needs_response"] = needs_resp
+
+            recent = rows_to_dicts(snap.execute(
+                """SELECT e.thread_id, e.subject, e.snippet, e.from_name, e.direction,
+                          e.received_at, e.is_read, e.is_starred, c.name as contact_name
+                   FROM emails e LEFT JOIN contacts c ON e.contact_id = c.id
+                   WHERE e.id IN (SELECT MAX(id) FROM emails GROUP BY thread_id)
+                   ORDER BY e.received_at DESC LIMIT 8"""
+            ))
+            for t in recent:
+                t["received_at_relative"] = _relative_time(t["received_at"])
+            ctx["recent_threads"] = recent
+
+        # Projects
+        if "project-tracker" in modules:
+            ctx["active_projects"] = rows_to_dicts(snap.execute(
+                """SELECT p.id, p.name, p.status, p.priority, c.name as client_name
+                   FROM projects p LEFT JOIN contacts c ON p.client_id = c.id
+                   WHERE p.status IN ('active', 'planning') ORDER BY p.priority DESC LIMIT 8"""
+            ))
+            task_rows = snap.execute("SELECT status, COUNT(*) as count FROM tasks GROUP BY status")
+            ctx["task_stats"] = {r["status"]: r["count"] for r in task_rows}
+            ctx["overdue_tasks"] = rows_to_dicts(snap.execute(
+                """SELECT t.title, t.due_date, p.name as project_name FROM tasks t
+                   JOIN projects p ON p.id = t.project_id
+                   WHERE t.due_date < date('now') AND t.status NOT IN ('done') LIMIT 5"""
+            ))
 
-    # Calendar
-    if "calendar" in modules:
-        now = datetime.now()
-        today_events_raw = rows_to_dicts(execute(
-            "SELECT * FROM calendar_events WHERE date(start_time) = date('now') AND status != 'cancelled' ORDER BY start_time ASC"
-        ))
-        for e in today_events_raw:
-            e["start_formatted"] = _format_time(e["start_time"])
-            try:
-                start = datetime.fromisoformat(e["start_time"])
-                end = datetime.fromisoformat(e["end_time"])
-                mins = int((end - start).total_seconds() / 60)
-                e["duration"] = f"{mins}m" if mins < 60 else f"{mins // 60}h{mins % 60:02d}m"
-                e["is_past"] = end < now
-                e["is_next"] = not e["is_past"] and start > now
-            except (ValueError, TypeError):
-                e["duration"] = ""
-                e["is_past"] = False
-                e["is_next"] = False
-            e["context_line"] = e.get("location", "")
-
-        # Mark only the first non-past event as "next"
-        found_next = False
-        for e in today_events_raw:
-            if e["is_next"] and not found_next:
-                found_next = True
-            elif e["is_next"]:
-                e["is_next"] = False
-
-        ctx["today_events"] = today_events_raw
-
-        tomorrow_raw = rows_to_dicts(execute(
-            "SELECT * FROM calendar_events WHERE date(start_time) = date('now', '+1 day') AND status != 'cancelled' ORDER BY start_time ASC"
-        ))
-        for e in tomorrow_raw:
-            e["start_formatted"] = _format_time(e["start_time"])
-        ctx["tomorrow_events"] = tomorrow_raw
-
-    # Email
-    if "gmail" in modules:
-        ctx["unread_count"] = stats.get("unread", 0)
-
-        needs_resp = rows_to_dicts(execute(
-            """SELECT e.thread_id, e.subject, e.from_name, e.received_at, c.name as contact_name
-               FROM emails e LEFT JOIN contacts c ON e.contact_id = c.id
-               WHERE e.direction = 'inbound'
-                 AND e.thread_id NOT IN (SELECT thread_id FROM emails WHERE direction = 'outbound' AND received_at > e.received_at)
-                 AND e.received_at > datetime('now', '-7 days')
-               GROUP BY e.thread_id ORDER BY e.received_at DESC LIMIT 5"""
-        ))
-        for t in needs_resp:
-            t["received_at_relative"] = _relative_time(t["received_at"])
-        ctx["needs_response"] = needs_resp
-
-        recent = rows_to_dicts(execute(
-            """SELECT e.thread_id, e.subject, e.snippet, e.from_name, e.direction,
-                      e.received_at, e.is_read, e.is_starred, c.name as contact_name
-               FROM emails e LEFT JOIN contacts c ON e.contact_id = c.id
-               WHERE e.id IN (SELECT MAX(id) FROM emails GROUP BY thread_id)
-               ORDER BY e.received_at DESC LIMIT 8"""
-        ))
-        for t in recent:
-            t["received_at_relative"] = _relative_time(t["received_at"])
-        ctx["recent_threads"] = recent
-
-    # Projects
-    if "project-tracker" in modules:
-        ctx["active_projects"] = rows_to_dicts(execute(
-            """SELECT p.id, p.name, p.status, p.priority, c.name as client_name
-               FROM projects p LEFT JOIN contacts c ON p.client_id = c.id
-               WHERE p.status IN ('active', 'planning') ORDER BY p.priority DESC LIMIT 8"""
+        # Contacts
+        contacts_raw = rows_to_dicts(snap.execute(
+            "SELECT id, name, company, role, email, updated_at FROM contacts WHERE status = 'active' ORDER BY updated_at DESC LIMIT 8"
         ))
-        task_rows = execute("SELECT status, COUNT(*) as count FROM tasks GROUP BY status")
-        ctx["task_stats"] = {r["status"]: r["count"] for r in task_rows}
-        ctx["overdue_tasks"] = rows_to_dicts(execute(
-            """SELECT t.title, t.due_date, p.name as project_name FROM tasks t
-               JOIN projects p ON p.id = t.project_id
-               WHERE t.due_date < date('now') AND t.status NOT IN ('done') LIMIT 5"""
-        ))
-
-    # Contacts
-    contacts_raw = rows_to_dicts(execute(
-        "SELECT id, name, company, role, email, updated_at FROM contacts WHERE status = 'active' ORDER BY updated_at DESC LIMIT 8"
-    ))
-    # Check for entity pages
-    for c in contacts_raw:
-        pages = execute("SELECT filename FROM generated_views WHERE entity_type = 'contact' AND entity_id = ?", (c["id"],))
-        c["entity_page"] = pages[0]["filename"] if pages else None
-    ctx["recent_contacts"] = contacts_raw
-
-    # Follow-ups
-    if "crm" in modules:
-        fus = rows_to_dicts(execute(
-            """SELECT f.*, c.name as contact_name FROM follow_ups f
-               JOIN contacts c ON c.id = f.contact_id
-               WHERE f.status = 'pending' ORDER BY f.due_date ASC LIMIT 8"""
+        # Check for entity pages
+        for c in contacts_raw:
+            pages = snap.execute("SELECT filename FROM generated_views WHERE entity_type = 'contact' AND entity_id = ?", (c["id"],))
+            c["entity_page"] = pages[0]["filename"] if pages else None
+        ctx["recent_contacts"] = contacts_raw
+
+        # Follow-ups
+        if "crm" in modules:
+            fus = rows_to_dicts(snap.execute(
+                """SELECT f.*, c.name as contact_name FROM follow_ups f
+                   JOIN contacts c ON c.id = f.contact_id
+                   WHERE f.status = 'pending' ORDER BY f.due_date ASC LIMIT 8"""
+            ))
+            today_str = today.isoformat()
+            for fu in fus:
+                fu["overdue"] = fu["due_date"] < today_str
+                fu["due_today"] = fu["due_date"] == today_str
+                fu["due_date_relative"] = _relative_time(fu["due_date"] + "T12:00:00")
+            ctx["follow_ups"] = fus
+
+        # Activity
+        activity_raw = rows_to_dicts(snap.execute(
+            """SELECT al.*, CASE al.entity_type
+                   WHEN 'contact' THEN (SELECT name FROM contacts WHERE id = al.entity_id)
+                   WHEN 'project' THEN (SELECT name FROM projects WHERE id = al.entity_id)
+                   ELSE al.entity_type || ' #' || al.entity_id
+                 END as entity_name
+               FROM activity_log al ORDER BY al.created_at DESC LIMIT 15"""
         ))
-        today_str = today.isoformat()
-        for fu in fus:
-            fu["overdue"] = fu["due_date"] < today_str
-            fu["due_today"] = fu["due_date"] == today_str
-            fu["due_date_relative"] = _relative_time(fu["due_date"] + "T12:00:00")
-        ctx["follow_ups"] = fus
-
-    # Activity
-    activity_raw = rows_to_dicts(execute(
-        """SELECT al.*, CASE al.entity_type
-               WHEN 'contact' THEN (SELECT name FROM contacts WHERE id = al.entity_id)
-               WHEN 'project' THEN (SELECT name FROM projects WHERE id = al.entity_id)
-               ELSE al.entity_type || ' #' || al.entity_id
-             END as entity_name
-           FROM activity_log al ORDER BY al.created_at DESC LIMIT 15"""
-    ))
-    icon_map = {"created": "plus", "updated": "edit-3", "interaction_logged": "message-circle",
-                "follow_up_created": "clock", "follow_up_completed": "check-circle",
-                "imported": "upload", "task_added": "plus-square", "task_updated": "check-square"}
-    for a in activity_raw:
-        a["icon"] = icon_map.get(a["action"], "activity")
-        a["created_at_relative"] = _relative_time(a["created_at"])
-    ctx["activity"] = activity_raw
+        icon_map = {"created": "plus", "updated": "edit-3", "interaction_logged": "message-circle",
+                    "follow_up_created": "clock", "follow_up_completed": "check-circle",
+                    "imported": "upload", "task_added": "plus-square", "task_updated": "check-square"}
+        for a in activity_raw:
+            a["icon"] = icon_map.get(a["action"], "activity")
+            a["created_at_relative"] = _relative_time(a["created_at"])
+        ctx["activity"] = activity_raw
 
     # Google connected?
     from software_of_you.db import DATA_DIR
@@ -422,13 +428,11 @@ def _render_entity_page(contact_id: int, narrative_sections_json: str, open_afte
     if not contact_id:
         return {"error": "contact_id is required for entity_page."}
 
-    rows = execute("SELECT * FROM contacts WHERE id = ?", (contact_id,))
-    if not rows:
+    data = EntityPageData([contact_id], get_installed_modules())
+    contact = data.contact(contact_id)
+    if contact is None:
         return {"error": f"No contact with id {contact_id}."}
 
-    contact = rows_to_dicts(rows)[0]
-    modules = get_installed_modules()
-
     # Build slug (whitelist — a contact name must never inject path chars)
     slug = _safe_slug(contact["name"], "contact")
 
@@ -437,76 +441,29 @@ def _render_entity_page(contact_id: int, narrative_sections_json: str, open_afte
                             tip_text="Use /follow-up to set a reminder for this person.")
     ctx["contact"] = contact
 
-    # Tags
-    ctx["tags"] = rows_to_dicts(execute(
-        "SELECT t.name, t.color FROM tags t JOIN entity_tags et ON et.tag_id = t.id WHERE et.entity_type = 'contact' AND et.entity_id = ?",
-        (contact_id,),
-    ))
-
-    # Notes
-    ctx["notes"] = rows_to_dicts(execute(
-        "SELECT content, created_at FROM notes WHERE entity_type = 'contact' AND entity_id = ? ORDER BY created_at DESC LIMIT 5",
-        (contact_id,),
-    ))
+    # Tags, notes, emails, events, projects, follow-ups, transcripts, score,
+    # standalone notes and company team — one query per table
+    ctx.update(data.sections(contact_id))
 
     # Emails
-    if "gmail" in modules:
-        emails_raw = rows_to_dicts(execute(
-            "SELECT * FROM emails WHERE contact_id = ? ORDER BY received_at ASC", (contact_id,),
-        ))
-        for e in emails_raw:
-            e["received_at_formatted"] = _relative_time(e["received_at"])
-        ctx["emails"] = emails_raw
+    for e in ctx.get("emails", []):
+        e["received_at_formatted"] = _relative_time(e["received_at"])
 
     # Events
-    if "calendar" in modules:
-        events_raw = rows_to_dicts(execute(
-            "SELECT * FROM calendar_events WHERE contact_ids LIKE ? AND status != 'cancelled' AND start_time > datetime('now') ORDER BY start_time ASC LIMIT 5",
-            (f"%{contact_id}%",),
-        ))
-        for e in events_raw:
-            e["start_formatted"] = _format_time(e["start_time"]) + " · " + _relative_time(e["start_time"])
-        ctx["upcoming_events"] = events_raw
-
-    # Projects
-    if "project-tracker" in modules:
-        projects = rows_to_dicts(execute(
-            "SELECT * FROM projects WHERE client_id = ?", (contact_id,),
-        ))
-        for p in projects:
-            p["tasks"] = rows_to_dicts(execute(
-                "SELECT title, status FROM tasks WHERE project_id = ? ORDER BY sort_order", (p["id"],),
-            ))
-        ctx["projects"] = projects
+    for e in ctx.get("upcoming_events", []):
+        e["start_formatted"] = _format_time(e["start_time"]) + " · " + _relative_time(e["start_time"])
 
     # Follow-ups
-    if "crm" in modules:
-        fus = rows_to_dicts(execute(
-            "SELECT * FROM follow_ups WHERE contact_id = ? AND status = 'pending' ORDER BY due_date ASC",
-            (contact_id,),
-        ))
-        today_str = date.today().isoformat()
-        for fu in fus:
-            fu["overdue"] = fu["due_date"] < today_str
-        ctx["follow_ups"] = fus
-
-    # Transcripts and call intelligence
-    if "conversation-intelligence" in modules:
-        transcripts = rows_to_dicts(execute(
-            """SELECT t.id, t.title, t.summary, t.call_intelligence, t.occurred_at
-               FROM transcripts t
-               JOIN transcript_participants tp ON tp.transcript_id = t.id
-               WHERE tp.contact_id = ?
-               GROUP BY t.id ORDER BY t.occurred_at DESC LIMIT 10""",
-            (contact_id,),
-        ))
-        ctx["transcripts"] = transcripts
+    today_str = date.today().isoformat()
+    for fu in ctx.get("follow_ups", []):
+        fu["overdue"] = fu["due_date"] < today_str
 
-        # Aggregate call intelligence
+    # Aggregate call intelligence
+    if "transcripts" in ctx:
         ci_agg = {"pain_points": [], "tech_stack": [], "key_concerns": []}
         seen_pp = set()
         seen_ts = set()
-        for t in transcripts:
+        for t in ctx["transcripts"]:
             if t.get("call_intelligence"):
                 try:
                     ci = json.loads(t["call_intelligence"]) if isinstance(t["call_intelligence"], str) else t["call_intelligence"]
@@ -526,34 +483,13 @@ def _render_entity_page(contact_id: int, narrative_sections_json: str, open_afte
         if any(ci_agg.values()):
             ctx["call_intelligence"] = ci_agg
 
-        # Relationship score
-        rs = rows_to_dicts(execute(
-            "SELECT * FROM relationship_scores WHERE contact_id = ? ORDER BY score_date DESC LIMIT 1",
-            (contact_id,),
-        ))
-        ctx["relationship_score"] = rs[0] if rs else None
-
     # Standalone notes
-    if "notes" in modules:
-        sn = rows_to_dicts(execute(
-            "SELECT id, title, substr(content, 1, 150) as preview, tags, pinned FROM standalone_notes WHERE linked_contacts LIKE ? ORDER BY pinned DESC LIMIT 5",
-            (f"%{contact_id}%",),
-        ))
-        for n in sn:
-            if n.get("tags"):
-                try:
-                    n["tags"] = json.loads(n["tags"]) if isinstance(n["tags"], str) else n["tags"]
-                except (json.JSONDecodeError, TypeError):
-                    n["tags"] = []
-        ctx["standalone_notes"] = sn
-
-    # Company team
-    if contact.get("company"):
-        team = rows_to_dicts(execute(
-            "SELECT name, role FROM contacts WHERE company = ? AND id != ? AND status = 'active'",
-            (contact["company"], contact_id),
-        ))
-        ctx["company_team"] = team
+    for n in ctx.get("standalone_notes", []):
+        if n.get("tags"):
+            try:
+                n["tags"] = json.loads(n["tags"]) if isinstance(n["tags"], str) else n["tags"]
+            except (json.JSONDecodeError, TypeError):
+                n["tags"] = []
 
     # Narrative sections
     ctx["narrative_sections"] = {}
@@ -612,6 +548,8 @@ def _render_module_view(sections_data_json: str, open_after: bool) -> dict:
     ctx["page_subtitle"] = data.get("page_subtitle", "")
     ctx["header_stats"] = data.get("header_stats", [])
     ctx["sections"] = data.get("sections", [])
+    # Model-authored sections can use classes and icons no template does.
+    ctx["assets"] = view_assets.publish(VIEWS_DIR, extra=[json.dumps(data)])
 
     env = _get_env()
     template = env.get_template("pages/module_view.html")
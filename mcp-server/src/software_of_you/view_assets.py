@@ -0,0 +1,486 @@
+"""Self-contained CSS and icons for the generated views.
+
+Pages used to load Tailwind's in-browser JIT from ``cdn.tailwindcss.com``,
+``lucide@latest`` from unpkg and Inter from Google Fonts: hundreds of KB per
+open, a compile before first paint, and nothing at all offline. Instead the
+renderers now write two files next to the pages, in ``<views dir>/assets/``,
+and every page links them:
+
+  * ``app-<hash>.css`` — the Tailwind utilities the pages actually use,
+    compiled here (``compile_css``) after a preflight reset. Candidates are
+    scanned from the templates and the Python that builds page HTML, like
+    Tailwind's own content scan, plus a safelist for the colour classes the
+    templates assemble at render time (``bg-{{ color }}-50``);
+  * ``icons-<hash>.js`` — the Lucide icons the pages reference, from the
+    subset vendored in ``static/lucide-icons.json``, with a tiny
+    ``lucide.createIcons()`` that inlines them (an external SVG sprite
+    ``<use>`` is blocked for ``file://`` pages, a script isn't).
+
+Names carry a hash of their contents, so browsers can cache them for good
+and a page never picks up a stale bundle. Fonts use Inter when it's
+installed locally and the system UI font otherwise.
+
+The compiler covers the utility families the views use (layout, flex/grid,
+spacing, sizing, typography, colours with ``/alpha``, borders, radii,
+shadows, rings, opacity, transitions) and the ``sm/md/lg/xl``, ``hover``,
+``focus``, ``group-hover``, ``first``/``last`` variants; anything else is
+ignored, as Tailwind ignores tokens that aren't utilities. Model-authored
+``module_view`` sections are scanned too (``publish(extra=…)``), so their
+classes and icons get a bundle of their own when they need one.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).parent
+ICONS_FILE = PACKAGE_DIR / "static" / "lucide-icons.json"
+
+# Files whose text is scanned for class and icon names on every build.
+CONTENT_SOURCES = [PACKAGE_DIR / "templates", PACKAGE_DIR / "tools" / "views.py"]
+
+
+# ── Theme ───────────────────────────────────────────────────────────
+
+_SHADES = ("50", "100", "200", "300", "400", "500", "600", "700", "800", "900")
+PALETTE = {hue: dict(zip(_SHADES, hexes.split())) for hue, hexes in {
+    "slate": "#f8fafc #f1f5f9 #e2e8f0 #cbd5e1 #94a3b8 #64748b #475569 #334155 #1e293b #0f172a",
+    "gray": "#f9fafb #f3f4f6 #e5e7eb #d1d5db #9ca3af #6b7280 #4b5563 #374151 #1f2937 #111827",
+    "zinc": "#fafafa #f4f4f5 #e4e4e7 #d4d4d8 #a1a1aa #71717a #52525b #3f3f46 #27272a #18181b",
+    "neutral": "#fafafa #f5f5f5 #e5e5e5 #d4d4d4 #a3a3a3 #737373 #525252 #404040 #262626 #171717",
+    "stone": "#fafaf9 #f5f5f4 #e7e5e4 #d6d3d1 #a8a29e #78716c #57534e #44403c #292524 #1c1917",
+    "red": "#fef2f2 #fee2e2 #fecaca #fca5a5 #f87171 #ef4444 #dc2626 #b91c1c #991b1b #7f1d1d",
+    "orange": "#fff7ed #ffedd5 #fed7aa #fdba74 #fb923c #f97316 #ea580c #c2410c #9a3412 #7c2d12",
+    "amber": "#fffbeb #fef3c7 #fde68a #fcd34d #fbbf24 #f59e0b #d97706 #b45309 #92400e #78350f",
+    "yellow": "#fefce8 #fef9c3 #fef08a #fde047 #facc15 #eab308 #ca8a04 #a16207 #854d0e #713f12",
+    "lime": "#f7fee7 #ecfccb #d9f99d #bef264 #a3e635 #84cc16 #65a30d #4d7c0f #3f6212 #365314",
+    "green": "#f0fdf4 #dcfce7 #bbf7d0 #86efac #4ade80 #22c55e #16a34a #15803d #166534 #14532d",
+    "emerald": "#ecfdf5 #d1fae5 #a7f3d0 #6ee7b7 #34d399 #10b981 #059669 #047857 #065f46 #064e3b",
+    "teal": "#f0fdfa #ccfbf1 #99f6e4 #5eead4 #2dd4bf #14b8a6 #0d9488 #0f766e #115e59 #134e4a",
+    "cyan": "#ecfeff #cffafe #a5f3fc #67e8f9 #22d3ee #06b6d4 #0891b2 #0e7490 #155e75 #164e63",
+    "sky": "#f0f9ff #e0f2fe #bae6fd #7dd3fc #38bdf8 #0ea5e9 #0284c7 #0369a1 #075985 #0c4a6e",
+    "blue": "#eff6ff #dbeafe #bfdbfe #93c5fd #60a5fa #3b82f6 #2563eb #1d4ed8 #1e40af #1e3a8a",
+    "indigo": "#eef2ff #e0e7ff #c7d2fe #a5b4fc #818cf8 #6366f1 #4f46e5 #4338ca #3730a3 #312e81",
+    "violet": "#f5f3ff #ede9fe #ddd6fe #c4b5fd #a78bfa #8b5cf6 #7c3aed #6d28d9 #5b21b6 #4c1d95",
+    "purple": "#faf5ff #f3e8ff #e9d5ff #d8b4fe #c084fc #a855f7 #9333ea #7e22ce #6b21a8 #581c87",
+    "fuchsia": "#fdf4ff #fae8ff #f5d0fe #f0abfc #e879f9 #d946ef #c026d3 #a21caf #86198f #701a75",
+    "pink": "#fdf2f8 #fce7f3 #fbcfe8 #f9a8d4 #f472b6 #ec4899 #db2777 #be185d #9d174d #831843",
+    "rose": "#fff1f2 #ffe4e6 #fecdd3 #fda4af #fb7185 #f43f5e #e11d48 #be123c #9f1239 #881337",
+}.items()}
+_NAMED_COLORS = {"white": "#ffffff", "black": "#000000", "transparent": "transparent", "current": "currentColor"}
+
+# The templates build these at render time (``bg-{{ c }}-50``,
+# ``text-{{ 'right' if loop.last else 'left' }}``), so no scan can see them.
+SAFELIST = [f"{prefix}-{hue}-{shade}" for hue in PALETTE
+            for prefix, shade in (("bg", "50"), ("bg", "100"), ("text", "600"), ("text", "700"))]
+SAFELIST += ["text-left", "text-right"]
+
+FONT_SANS = ('Inter, ui-sans-serif, system-ui, -apple-system, "Segoe UI", Roboto, '
+             '"Helvetica Neue", Arial, sans-serif')
+FONT_MONO = 'ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", monospace'
+
+_SCREENS = {"sm": 640, "md": 768, "lg": 1024, "xl": 1280}
+_PSEUDO = {"hover": ":hover", "focus": ":focus", "active": ":active", "focus-within": ":focus-within",
+           "disabled": ":disabled", "first": ":first-child", "last": ":last-child",
+           "odd": ":nth-child(odd)", "even": ":nth-child(even)"}
+_FONT_SIZES = {"xs": ("0.75rem", "1rem"), "sm": ("0.875rem", "1.25rem"), "base": ("1rem", "1.5rem"),
+               "lg": ("1.125rem", "1.75rem"), "xl": ("1.25rem", "1.75rem"), "2xl": ("1.5rem", "2rem"),
+               "3xl": ("1.875rem", "2.25rem"), "4xl": ("2.25rem", "2.5rem")}
+_MAX_WIDTHS = {"xs": "20rem", "sm": "24rem", "md": "28rem", "lg": "32rem", "xl": "36rem", "2xl": "42rem",
+               "3xl": "48rem", "4xl": "56rem", "5xl": "64rem", "6xl": "72rem", "7xl": "80rem",
+               "full": "100%", "none": "none", "prose": "65ch"}
+_TRANSITION = "transition-timing-function:cubic-bezier(0.4, 0, 0.2, 1);transition-duration:150ms"
+
+PREFLIGHT = f"""*,::before,::after{{box-sizing:border-box;border-width:0;border-style:solid;border-color:#e5e7eb}}
+html{{line-height:1.5;-webkit-text-size-adjust:100%;tab-size:4;font-family:{FONT_SANS}}}
+body{{margin:0;line-height:inherit}}
+hr{{height:0;color:inherit;border-top-width:1px}}
+h1,h2,h3,h4,h5,h6{{font-size:inherit;font-weight:inherit}}
+a{{color:inherit;text-decoration:inherit}}
+b,strong{{font-weight:bolder}}
+code,kbd,samp,pre{{font-family:{FONT_MONO};font-size:1em}}
+small{{font-size:80%}}
+table{{text-indent:0;border-color:inherit;border-collapse:collapse}}
+button,input,optgroup,select,textarea{{font-family:inherit;font-size:100%;font-weight:inherit;line-height:inherit;color:inherit;margin:0;padding:0}}
+button,select{{text-transform:none}}
+button,[type='button'],[type='reset'],[type='submit']{{-webkit-appearance:button;background-color:transparent;background-image:none}}
+blockquote,dl,dd,h1,h2,h3,h4,h5,h6,hr,figure,p,pre{{margin:0}}
+fieldset{{margin:0;padding:0}}
+ol,ul,menu{{list-style:none;margin:0;padding:0}}
+textarea{{resize:vertical}}
+input::placeholder,textarea::placeholder{{opacity:1;color:#9ca3af}}
+button,[role="button"]{{cursor:pointer}}
+img,svg,video,canvas,audio,iframe,embed,object{{display:block;vertical-align:middle}}
+img,video{{max-width:100%;height:auto}}
+[hidden]{{display:none}}
+"""
+
+
+# ── Utility compiler ────────────────────────────────────────────────
+
+# Fixed utilities, in the order their rules are emitted (later wins, as in
+# Tailwind: ``hidden`` after ``flex``, ``p-*`` before ``px-*``, …).
+_STATIC = {
+    "sr-only": "position:absolute;width:1px;height:1px;padding:0;margin:-1px;overflow:hidden;clip:rect(0, 0, 0, 0);white-space:nowrap;border-width:0",
+    "static": "position:static", "fixed": "position:fixed", "absolute": "position:absolute",
+    "relative": "position:relative", "sticky": "position:sticky",
+    "inset-0": "inset:0px",
+    "block": "display:block", "inline-block": "display:inline-block", "inline": "display:inline",
+    "flex": "display:flex", "inline-flex": "display:inline-flex", "table": "display:table",
+    "grid": "display:grid", "hidden": "display:none",
+    "flex-1": "flex:1 1 0%", "flex-auto": "flex:1 1 auto", "flex-none": "flex:none",
+    "flex-shrink-0": "flex-shrink:0", "shrink-0": "flex-shrink:0",
+    "flex-grow": "flex-grow:1", "grow": "flex-grow:1",
+    "border-collapse": "border-collapse:collapse",
+    "cursor-pointer": "cursor:pointer", "cursor-default": "cursor:default",
+    "list-inside": "list-style-position:inside",
+    "list-disc": "list-style-type:disc", "list-decimal": "list-style-type:decimal", "list-none": "list-style-type:none",
+    "flex-row": "flex-direction:row", "flex-col": "flex-direction:column",
+    "flex-wrap": "flex-wrap:wrap", "flex-nowrap": "flex-wrap:nowrap",
+    "items-start": "align-items:flex-start", "items-end": "align-items:flex-end",
+    "items-center": "align-items:center", "items-baseline": "align-items:baseline",
+    "items-stretch": "align-items:stretch",
+    "justify-start": "justify-content:flex-start", "justify-end": "justify-content:flex-end",
+    "justify-center": "justify-content:center", "justify-between": "justify-content:space-between",
+    "justify-around": "justify-content:space-around",
+    "self-start": "align-self:flex-start", "self-center": "align-self:center", "self-end": "align-self:flex-end",
+    "overflow-auto": "overflow:auto", "overflow-hidden": "overflow:hidden",
+    "overflow-x-auto": "overflow-x:auto", "overflow-y-auto": "overflow-y:auto",
+    "truncate": "overflow:hidden;text-overflow:ellipsis;white-space:nowrap",
+    "whitespace-nowrap": "white-space:nowrap", "whitespace-pre-wrap": "white-space:pre-wrap",
+    "break-words": "overflow-wrap:break-word",
+    "rounded-none": "border-radius:0px", "rounded-sm": "border-radius:0.125rem", "rounded": "border-radius:0.25rem",
+    "rounded-md": "border-radius:0.375rem", "rounded-lg": "border-radius:0.5rem", "rounded-xl": "border-radius:0.75rem",
+    "rounded-2xl": "border-radius:1rem", "rounded-full": "border-radius:9999px",
+    "border-0": "border-width:0px", "border": "border-width:1px", "border-2": "border-width:2px",
+    "border-4": "border-width:4px",
+    "text-left": "text-align:left", "text-center": "text-align:center", "text-right": "text-align:right",
+    "align-top": "vertical-align:top", "align-middle": "vertical-align:middle",
+    "font-sans": f"font-family:{FONT_SANS}", "font-mono": f"font-family:{FONT_MONO}",
+    "font-normal": "font-weight:400", "font-medium": "font-weight:500",
+    "font-semibold": "font-weight:600", "font-bold": "font-weight:700",
+    "uppercase": "text-transform:uppercase", "lowercase": "text-transform:lowercase",
+    "capitalize": "text-transform:capitalize", "normal-case": "text-transform:none",
+    "italic": "font-style:italic", "not-italic": "font-style:normal",
+    "tabular-nums": "font-variant-numeric:tabular-nums",
+    "leading-none": "line-height:1", "leading-tight": "line-height:1.25", "leading-snug": "line-height:1.375",
+    "leading-normal": "line-height:1.5", "leading-relaxed": "line-height:1.625", "leading-loose": "line-height:2",
+    "tracking-tight": "letter-spacing:-0.025em", "tracking-normal": "letter-spacing:0em",
+    "tracking-wide": "letter-spacing:0.025em", "tracking-wider": "letter-spacing:0.05em",
+    "tracking-widest": "letter-spacing:0.1em",
+    "underline": "text-decoration-line:underline", "line-through": "text-decoration-line:line-through",
+    "no-underline": "text-decoration-line:none",
+    "antialiased": "-webkit-font-smoothing:antialiased;-moz-osx-font-smoothing:grayscale",
+    "shadow-none": "box-shadow:0 0 #0000",
+    "shadow-sm": "box-shadow:0 1px 2px 0 rgb(0 0 0 / 0.05)",
+    "shadow": "box-shadow:0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)",
+    "shadow-md": "box-shadow:0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)",
+    "shadow-lg": "box-shadow:0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)",
+    "outline-none": "outline:2px solid transparent;outline-offset:2px",
+    "ring": "box-shadow:0 0 0 3px var(--tw-ring-color, rgb(59 130 246 / 0.5))",
+    "transition": "transition-property:color, background-color, border-color, text-decoration-color, fill, stroke, opacity, box-shadow, transform, filter;" + _TRANSITION,
+    "transition-all": "transition-property:all;" + _TRANSITION,
+    "transition-colors": "transition-property:color, background-color, border-color, text-decoration-color, fill, stroke;" + _TRANSITION,
+}
+
+_SPACING_PROPS = {
+    "m": ("margin",), "mx": ("margin-left", "margin-right"), "my": ("margin-top", "margin-bottom"),
+    "mt": ("margin-top",), "mr": ("margin-right",), "mb": ("margin-bottom",), "ml": ("margin-left",),
+    "p": ("padding",), "px": ("padding-left", "padding-right"), "py": ("padding-top", "padding-bottom"),
+    "pt": ("padding-top",), "pr": ("padding-right",), "pb": ("padding-bottom",), "pl": ("padding-left",),
+}
+_BORDER_SIDES = {"t": ("top",), "r": ("right",), "b": ("bottom",), "l": ("left",),
+                 "x": ("left", "right"), "y": ("top", "bottom")}
+
+
+def _space(value: str, allow_auto: bool = False) -> str | None:
+    """Tailwind's spacing scale: ``n`` → ``n/4 rem``, plus ``px``, fractions, ``full``."""
+    if value == "px":
+        return "1px"
+    if value == "0":
+        return "0px"
+    if allow_auto and value == "auto":
+        return "auto"
+    if re.fullmatch(r"\d+(\.5)?", value):
+        return f"{float(value) / 4:g}rem"
+    return None
+
+
+def _size(value: str) -> str | None:
+    if value == "full":
+        return "100%"
+    if value == "auto":
+        return "auto"
+    fraction = re.fullmatch(r"(\d+)/(\d+)", value)
+    if fraction and int(fraction.group(2)):
+        return f"{int(fraction.group(1)) / int(fraction.group(2)) * 100:g}%"
+    return _space(value)
+
+
+def _color(value: str) -> str | None:
+    """``blue-500``, ``blue-500/50``, ``white``… → a CSS colour."""
+    name, _, alpha = value.partition("/")
+    if name in _NAMED_COLORS:
+        color = _NAMED_COLORS[name]
+    else:
+        hue, _, shade = name.rpartition("-")
+        color = PALETTE.get(hue, {}).get(shade)
+    if color is None or (alpha and not alpha.isdigit()):
+        return None
+    if alpha and color.startswith("#"):
+        r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+        return f"rgb({r} {g} {b} / {int(alpha) / 100:g})"
+    return color
+
+
+def _declarations(utility: str) -> tuple[int, str, str] | None:
+    """``(order, selector suffix, declarations)`` for one utility, or None.
+
+    The suffix is appended to the class selector (``space-y-*`` styles the
+    children). ``order`` places the rule among the others.
+    """
+    if utility in _STATIC:
+        return (list(_STATIC).index(utility), "", _STATIC[utility])
+    base = len(_STATIC)
+    negative = utility.startswith("-")
+    name = utility[1:] if negative else utility
+
+    m = re.fullmatch(r"(m|mx|my|mt|mr|mb|ml|p|px|py|pt|pr|pb|pl)-(.+)", name)
+    if m:
+        value = _space(m.group(2), allow_auto=m.group(1).startswith("m"))
+        if value is None or (negative and not m.group(1).startswith("m")):
+            return None
+        value = f"-{value}" if negative and value not in ("0px", "auto") else value
+        props = _SPACING_PROPS[m.group(1)]
+        order = base + list(_SPACING_PROPS).index(m.group(1))
+        return (order, "", ";".join(f"{p}:{value}" for p in props))
+    base += len(_SPACING_PROPS)
+
+    m = re.fullmatch(r"(top|right|bottom|left)-(.+)", name)
+    if m and (value := _space(m.group(2), allow_auto=True)):
+        return (base, "", f"{m.group(1)}:{'-' if negative else ''}{value}")
+    if negative:
+        return None
+
+    m = re.fullmatch(r"z-(\d+)", name)
+    if m:
+        return (base + 1, "", f"z-index:{m.group(1)}")
+
+    m = re.fullmatch(r"space-(x|y)-(.+)", name)
+    if m and (value := _space(m.group(2))):
+        side = "left" if m.group(1) == "x" else "top"
+        return (base + 2, " > :not([hidden]) ~ :not([hidden])", f"margin-{side}:{value}")
+
+    m = re.fullmatch(r"(w|h|min-w|min-h)-(.+)", name)
+    if m:
+        prop = {"w": "width", "h": "height", "min-w": "min-width", "min-h": "min-height"}[m.group(1)]
+        value = "100vh" if m.group(2) == "screen" and prop.endswith("height") else _size(m.group(2))
+        if value:
+            return (base + 3 + list(("w", "h", "min-w", "min-h")).index(m.group(1)), "", f"{prop}:{value}")
+    m = re.fullmatch(r"max-w-(.+)", name)
+    if m and m.group(1) in _MAX_WIDTHS:
+        return (base + 7, "", f"max-width:{_MAX_WIDTHS[m.group(1)]}")
+
+    m = re.fullmatch(r"grid-cols-(\d+)", name)
+    if m:
+        return (base + 8, "", f"grid-template-columns:repeat({m.group(1)}, minmax(0, 1fr))")
+    m = re.fullmatch(r"col-span-(\d+|full)", name)
+    if m:
+        span = "1 / -1" if m.group(1) == "full" else f"span {m.group(1)} / span {m.group(1)}"
+        return (base + 9, "", f"grid-column:{span}")
+    m = re.fullmatch(r"gap(-x|-y)?-(.+)", name)
+    if m and (value := _space(m.group(2))):
+        prop = {None: "gap", "-x": "column-gap", "-y": "row-gap"}[m.group(1)]
+        return (base + 10, "", f"{prop}:{value}")
+
+    m = re.fullmatch(r"border-([trblxy])(?:-(0|2|4|8))?", name)
+    if m:
+        width = f"{m.group(2) or 1}px"
+        return (base + 11, "", ";".join(f"border-{s}-width:{width}" for s in _BORDER_SIDES[m.group(1)]))
+    m = re.fullmatch(r"border-(.+)", name)
+    if m and (value := _color(m.group(1))):
+        return (base + 12, "", f"border-color:{value}")
+    m = re.fullmatch(r"border-([trblxy])-(.+)", name)
+    if m and (value := _color(m.group(2))):
+        return (base + 13, "", ";".join(f"border-{s}-color:{value}" for s in _BORDER_SIDES[m.group(1)]))
+    m = re.fullmatch(r"bg-(.+)", name)
+    if m and (value := _color(m.group(1))):
+        return (base + 14, "", f"background-color:{value}")
+
+    m = re.fullmatch(r"text-(.+)", name)
+    if m and m.group(1) in _FONT_SIZES:
+        size, line_height = _FONT_SIZES[m.group(1)]
+        return (base + 15, "", f"font-size:{size};line-height:{line_height}")
+    m = re.fullmatch(r"text-\[(\d+(?:\.\d+)?(?:px|rem|em))\]", name)
+    if m:
+        return (base + 15, "", f"font-size:{m.group(1)}")
+    m = re.fullmatch(r"text-(.+)", name)
+    if m and (value := _color(m.group(1))):
+        return (base + 16, "", f"color:{value}")
+
+    m = re.fullmatch(r"opacity-(\d+)", name)
+    if m and int(m.group(1)) <= 100:
+        return (base + 17, "", f"opacity:{int(m.group(1)) / 100:g}")
+    m = re.fullmatch(r"ring-(\d)", name)
+    if m:
+        return (base + 18, "", f"box-shadow:0 0 0 {m.group(1)}px var(--tw-ring-color, rgb(59 130 246 / 0.5))")
+    m = re.fullmatch(r"ring-(.+)", name)
+    if m and (value := _color(m.group(1))):
+        return (base + 19, "", f"--tw-ring-color:{value}")
+    return None
+
+
+def _escape(cls: str) -> str:
+    return re.sub(r"([^a-zA-Z0-9_-])", r"\\\1", cls)
+
+
+def _rule(cls: str) -> tuple[tuple, str, str] | None:
+    """``(sort key, media query, rule)`` for one class, or None if it isn't a utility."""
+    *variants, utility = cls.split(":")
+    compiled = _declarations(utility)
+    if compiled is None:
+        return None
+    order, suffix, decls = compiled
+    screen, pseudo, group = None, "", False
+    for variant in variants:
+        if variant in _SCREENS and screen is None:
+            screen = variant
+        elif variant in _PSEUDO:
+            pseudo += _PSEUDO[variant]
+        elif variant == "group-hover":
+            group = True
+        else:
+            return None
+    selector = f".{_escape(cls)}{pseudo}{suffix}"
+    if group:
+        selector = f".group:hover {selector}"
+    screen_rank = list(_SCREENS).index(screen) + 1 if screen else 0
+    key = (screen_rank, bool(pseudo or group), order, cls)
+    media = f"@media (min-width: {_SCREENS[screen]}px)" if screen else None
+    return key, media, f"{selector}{{{decls}}}"
+
+
+def compile_css(classes) -> str:
+    """Preflight plus a rule for every utility in ``classes`` (others are skipped)."""
+    rules = sorted(filter(None, (_rule(c) for c in set(classes))))
+    out = [PREFLIGHT]
+    media_blocks: dict[str, list[str]] = {}
+    for _, media, rule in rules:
+        if media:
+            media_blocks.setdefault(media, []).append(rule)
+        else:
+            out.append(rule + "\n")
+    for media, block in media_blocks.items():
+        out.append(media + "{" + "".join(block) + "}\n")
+    return "".join(out)
+
+
+# ── Icons ───────────────────────────────────────────────────────────
+
+_ICON_SCRIPT = """/* Lucide icons (ISC License, https://lucide.dev) — generated by Software of You */
+(function () {
+  var icons = %s;
+  var aliases = %s;
+  function createIcons() {
+    var nodes = document.querySelectorAll("i[data-lucide]");
+    for (var i = 0; i < nodes.length; i++) {
+      var el = nodes[i], name = el.getAttribute("data-lucide");
+      var svg = document.createElementNS("http://www.w3.org/2000/svg", "svg");
+      var attrs = {width: 24, height: 24, viewBox: "0 0 24 24", fill: "none", stroke: "currentColor",
+                   "stroke-width": 2, "stroke-linecap": "round", "stroke-linejoin": "round"};
+      for (var key in attrs) svg.setAttribute(key, attrs[key]);
+      svg.setAttribute("class", ("lucide lucide-" + name + " " + (el.getAttribute("class") || "")).trim());
+      svg.innerHTML = icons[aliases[name] || name] || icons.circle;
+      el.parentNode.replaceChild(svg, el);
+    }
+  }
+  window.lucide = {createIcons: createIcons};
+})();
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _icon_set() -> dict:
+    return json.loads(ICONS_FILE.read_text())
+
+
+def icons_script(names) -> str:
+    """The icon script for ``names`` that exist in the vendored set (plus the
+    ``circle`` every unknown name falls back to)."""
+    data = _icon_set()
+    wanted = {data["aliases"].get(n, n) for n in names} | {"circle"}
+    icons = {n: body for n, body in sorted(data["icons"].items()) if n in wanted}
+    aliases = {a: n for a, n in sorted(data["aliases"].items()) if n in icons}
+    return _ICON_SCRIPT % (json.dumps(icons, separators=(",", ":")), json.dumps(aliases, separators=(",", ":")))
+
+
+# ── Bundles ─────────────────────────────────────────────────────────
+
+_TOKEN = re.compile(r"[A-Za-z0-9_\-:./\[\]]+")
+
+
+def _files(sources) -> list[Path]:
+    out = []
+    for source in map(Path, sources):
+        out.extend(sorted(source.rglob("*.html")) if source.is_dir() else [source])
+    return [f for f in out if f.exists()]
+
+
+# Tokens per source file, keyed by (path, size, mtime): the MCP server asks
+# for the bundle on every render, and only stats the files to answer.
+_scanned: dict[tuple, frozenset] = {}
+
+
+def _source_tokens(sources) -> frozenset:
+    tokens = set()
+    for path in _files(sources):
+        st = path.stat()
+        key = (str(path), st.st_size, st.st_mtime_ns)
+        if key not in _scanned:
+            _scanned[key] = frozenset(candidates(path.read_text()))
+        tokens |= _scanned[key]
+    return frozenset(tokens)
+
+
+def candidates(text: str) -> set[str]:
+    """Every token in ``text`` that could be a class or icon name."""
+    return set(_TOKEN.findall(text))
+
+
+@functools.lru_cache(maxsize=16)
+def _build(tokens: frozenset) -> tuple[tuple[str, str], tuple[str, str]]:
+    css = compile_css(tokens | set(SAFELIST))
+    js = icons_script(tokens)
+    return (
+        (f"app-{hashlib.sha256(css.encode('utf-8')).hexdigest()[:12]}.css", css),
+        (f"icons-{hashlib.sha256(js.encode('utf-8')).hexdigest()[:12]}.js", js),
+    )
+
+
+def bundle(sources=(), extra=()) -> dict:
+    """The asset files for pages built from the templates (plus ``sources``,
+    more files that emit page HTML, and ``extra``, page data such as
+    model-authored sections): ``{filename: contents}``."""
+    tokens = _source_tokens([*CONTENT_SOURCES, *sources])
+    tokens = tokens.union(*(candidates(e) for e in extra if e))
+    return dict(_build(tokens))
+
+
+def publish(out_dir, sources=(), extra=()) -> dict:
+    """Write the bundle into ``out_dir/assets/`` (files already there are
+    left alone — their names are their hashes). Returns the hrefs pages use,
+    relative to ``out_dir``: ``{"css", "icons"}``."""
+    files = bundle(sources, extra)
+    assets_dir = Path(out_dir) / "assets"
+    for name, contents in files.items():
+        path = assets_dir / name
+        if not path.exists():
+            assets_dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{name}.{os.getpid()}.tmp")
+            tmp.write_text(contents)
+            tmp.replace(path)
+    css, icons = files
+    return {"css": f"assets/{css}", "icons": f"assets/{icons}"}
@@ -0,0 +1,101 @@
+"""The tables the generated views read, and a cheap change signature for each.
+
+Shared by ``scripts/render.py`` (which skips module pages whose inputs are
+unchanged) and ``scripts/pipeline.py`` (which skips the whole views phase),
+so the two can't drift apart. Imports nothing beyond the standard library:
+the pipeline loads it even when the rest of the package can't be imported.
+"""
+
+import hashlib
+import json
+
+# Everything the dashboard and module views read, directly or through
+# v_contact_health, v_nudge_items and friends. The pipeline's own activity_log
+# rows are left out so logging a run doesn't invalidate the next one.
+VIEW_INPUT_TABLES = {
+    "contacts": "",
+    "emails": "",
+    "calendar_events": "",
+    "calendar_event_attendees": "",
+    "transcripts": "",
+    "transcript_participants": "",
+    "commitments": "",
+    "follow_ups": "",
+    "contact_interactions": "",
+    "slack_messages": "",
+    "projects": "",
+    "tasks": "",
+    "milestones": "",
+    "notes": "",
+    "standalone_notes": "",
+    "decisions": "",
+    "journal_entries": "",
+    "tags": "",
+    "entity_tags": "",
+    "entity_narratives": "",
+    "relationship_scores": "",
+    "activity_log": "WHERE entity_type != 'pipeline'",
+}
+
+# Derived tables the renderer reads once it has refreshed them. Refreshes
+# delete and reinsert rows under the same ids, with no updated_at, so count
+# and max rowid never move: these are signed by a hash of their contents.
+DERIVED_INPUT_TABLES = {
+    "contact_health": "",
+}
+
+# Tables the syncs and tools edit in place without an updated_at to bump —
+# Gmail read/label flips, Calendar reschedules and cancellations, follow-up
+# completions — so count and max rowid miss those edits. They're signed by a
+# hash of rowid plus the columns that change; the rest are write-once.
+EDITED_IN_PLACE_COLUMNS = {
+    "emails": "contact_id, account_id, labels, is_read, is_starred, synced_at",
+    "calendar_events": "title, location, start_time, end_time, all_day, status, "
+                       "attendees, contact_ids, project_id, synced_at",
+    "calendar_event_attendees": "contact_id, response_status, start_time",
+    "follow_ups": "due_date, reason, status, completed_at",
+    "contact_interactions": "contact_id, subject, summary, occurred_at",
+    "transcript_participants": "contact_id, is_user",
+    "slack_messages": "contact_id, content, synced_at",
+    "milestones": "name, target_date, completed_date, status",
+    "notes": "content",
+    "tags": "name, color, category",
+    "relationship_scores": "relationship_depth, trajectory, commitment_follow_through",
+}
+
+# Created by the plugin's own migrations (data/migrations/023), not the MCP
+# server's, so a server-only database may not have them yet.
+OPTIONAL_INPUT_TABLES = {"entity_narratives"}
+
+
+def table_signature(execute, table: str, where: str = "") -> list | None:
+    """Change signature for ``table``: row count, max rowid, latest updated_at
+    — or a content hash, for ``DERIVED_INPUT_TABLES`` (every column) and
+    ``EDITED_IN_PLACE_COLUMNS`` (rowid plus the columns that change).
+
+    ``execute(sql)`` runs a query and returns its rows. Inserts and deletes
+    move the first two, edits through the app bump updated_at where the table
+    has one. Raises ``ValueError`` for a table that doesn't exist (None for
+    a missing ``OPTIONAL_INPUT_TABLES`` one): a misspelt name would otherwise
+    sign as "never changes".
+    """
+    cols = {r[1] for r in execute(f"PRAGMA table_info({table})")}
+    if not cols:
+        if table in OPTIONAL_INPUT_TABLES:
+            return None
+        raise ValueError(f"view input table {table!r} does not exist")
+    if table in DERIVED_INPUT_TABLES:
+        return [_content_hash(execute(f"SELECT * FROM {table} {where} ORDER BY rowid"))]
+    if table in EDITED_IN_PLACE_COLUMNS:
+        return [_content_hash(execute(
+            f"SELECT rowid, {EDITED_IN_PLACE_COLUMNS[table]} FROM {table} {where} ORDER BY rowid"
+        ))]
+    stamp = "MAX(updated_at)" if "updated_at" in cols else "NULL"
+    return list(execute(f"SELECT COUNT(*), MAX(rowid), {stamp} FROM {table} {where}")[0])
+
+
+def _content_hash(rows) -> str:
+    digest = hashlib.sha256()
+    for row in rows:
+        digest.update(json.dumps(list(row), default=str).encode("utf-8"))
+    return digest.hexdigest()
@@ -7,6 +7,12 @@ monkeypatch the module-level constants to a per-test temp directory and run
 migrations there. Nothing in the suite touches real user data.
 """
 
+import json
+import re
+import threading
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 
 from software_of_you import db as db_module
@@ -28,9 +34,24 @@ def tmp_db_paths(tmp_path, monkeypatch):
     """Isolated, EMPTY db paths (no migrations run yet).
 
     Use for tests that exercise the migration runner / ledger directly and
-    need to control when migrations execute.
+    need to control when migrations execute. Pooled connections opened
+    against the temp db are closed on teardown.
+    """
+    yield _point_db_at(tmp_path, monkeypatch)
+    db_module.close_pool()
+
+
+@pytest.fixture(autouse=True)
+def no_background_sync(monkeypatch):
+    """Keep tools from starting background syncs unless a test opts in.
+
+    A tool call with stale data would otherwise spawn a refresh thread that
+    can outlive its test's temp database.
     """
-    return _point_db_at(tmp_path, monkeypatch)
+    from software_of_you import sync_daemon
+
+    monkeypatch.setattr(sync_daemon, "REFRESH_ON_READ", False)
+    monkeypatch.setattr(sync_daemon, "_last_attempt", {})
 
 
 @pytest.fixture
@@ -38,3 +59,67 @@ def soy_db(tmp_db_paths):
     """Isolated db with all migrations applied. Returns the db module."""
     db_module.init_db()
     return db_module
+
+
+@pytest.fixture
+def gmail_batch_server(monkeypatch):
+    """A local stand-in for Gmail's ``batch/gmail/v1`` multipart endpoint.
+
+    ``serve(handler)`` starts it and points ``google_sync.GMAIL_BATCH_URL`` at
+    it. ``handler(url, token)`` has the same shape as a fake ``_api_get``: it
+    receives each part's full URL and the batch's bearer token, and returns
+    the JSON body or raises — an ``HTTPError`` becomes that part's status,
+    anything else a 500.
+    """
+    from software_of_you import google_sync
+
+    servers = []
+
+    def serve(handler):
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                boundary = re.search(r"boundary=(\S+)", self.headers["Content-Type"]).group(1)
+                token = self.headers.get("Authorization", "").removeprefix("Bearer ")
+                body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+                out = []
+                for part in body.split(f"--{boundary}")[1:]:
+                    if part.startswith("--"):
+                        break
+                    part_headers, _, request = part.strip().partition("\r\n\r\n")
+                    content_id = re.search(r"Content-ID: <(\w+)>", part_headers).group(1)
+                    path = request.split()[1]
+                    try:
+                        status, data = 200, handler(f"https://gmail.googleapis.com{path}", token)
+                    except urllib.error.HTTPError as e:
+                        status, data = e.code, {"error": {"code": e.code}}
+                    except Exception as e:
+                        status, data = 500, {"error": {"code": 500, "message": str(e)}}
+                    out.append(
+                        f"--resp\r\nContent-Type: application/http\r\n"
+                        f"Content-ID: <response-{content_id}>\r\n\r\n"
+                        f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n\r\n"
+                        f"{json.dumps(data)}\r\n"
+                    )
+                payload = ("".join(out) + "--resp--\r\n").encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "multipart/mixed; boundary=resp")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+        servers.append(server)
+        monkeypatch.setattr(
+            google_sync, "GMAIL_BATCH_URL",
+            f"http://127.0.0.1:{server.server_address[1]}/batch/gmail/v1",
+        )
+        return server
+
+    yield serve
+    for server in servers:
+        server.shutdown()
+        server.server_close()
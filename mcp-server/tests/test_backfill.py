@@ -0,0 +1,141 @@
+"""Tests for the resumable history backfill.
+
+Guards:
+  1. a Gmail backfill interrupted mid-walk keeps the pages it stored and
+     resumes from its saved page token, without refetching earlier pages;
+     drafts aren't stored and a message deleted mid-page doesn't stop it;
+  2. Slack walks each channel backwards with ``latest`` until ``has_more`` is
+     false, and the status reports items, throughput and checkpoints;
+  3. the MCP action runs the backfill in the background and reports progress.
+"""
+
+import time
+import urllib.error
+
+from mcp.server.fastmcp import FastMCP
+
+from software_of_you import backfill, google_sync, slack_sync
+from software_of_you.tools import system
+
+
+def _gmail_fake(pages, requested, fail_once=(), drafts=(), gone=()):
+    """Fake ``_api_get``: ``pages`` maps a page token ("" for the first) to
+    ``(ids, next_token)``; tokens in ``fail_once`` raise on their first request.
+    Ids in ``drafts`` carry the DRAFT label, ids in ``gone`` answer 404."""
+    failing = set(fail_once)
+
+    def fake(url, token):
+        if url.endswith("/profile"):
+            return {"messagesTotal": sum(len(ids) for ids, _ in pages.values())}
+        if "/messages?" in url:
+            page = url.split("pageToken=")[1] if "pageToken=" in url else ""
+            requested.append(page)
+            if page in failing:
+                failing.discard(page)
+                raise urllib.error.URLError("connection reset")
+            ids, next_token = pages[page]
+            data = {"messages": [{"id": i} for i in ids]}
+            if next_token:
+                data["nextPageToken"] = next_token
+            return data
+        msg_id = url.split("/messages/")[1].split("?")[0]
+        if msg_id in gone:
+            raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+        labels = ["DRAFT"] if msg_id in drafts else []
+        return {"id": msg_id, "threadId": "t", "labelIds": labels, "snippet": "", "internalDate": "0",
+                "payload": {"headers": [{"name": "From", "value": f"X <{msg_id}@acme.com>"}]}}
+    return fake
+
+
+def test_gmail_backfill_resumes_from_checkpoint(soy_db, monkeypatch, gmail_batch_server):
+    monkeypatch.setattr(backfill, "PAUSE_SECS", 0)
+    monkeypatch.setattr(google_sync, "get_valid_token", lambda email=None: "tok")
+    pages = {"": (["a1", "a2"], "p1"), "p1": (["b1", "b2"], "p2"), "p2": (["c1"], None)}
+    requested = []
+    fake = _gmail_fake(pages, requested, fail_once={"p1"})
+    monkeypatch.setattr(google_sync, "_api_get", fake)
+    gmail_batch_server(fake)
+
+    first = backfill.run(["gmail"])
+    stream = first["streams"][0]
+    assert stream["done"] is False and "connection reset" in stream["error"]
+    assert stream["items"] == 2 and stream["total"] == 5
+    assert soy_db.execute("SELECT COUNT(*) AS n FROM emails")[0]["n"] == 2
+
+    requested.clear()
+    second = backfill.run(["gmail"])
+    assert requested == ["p1", "p2"]  # resumed; the first page wasn't walked again
+    assert second["state"] == "finished" and second["streams"][0]["done"] is True
+    assert second["streams"][0]["items"] == 5
+    assert soy_db.execute("SELECT COUNT(*) AS n FROM emails")[0]["n"] == 5
+
+    # A finished stream is skipped until its checkpoint is reset.
+    requested.clear()
+    backfill.run(["gmail"])
+    assert requested == []
+    backfill.reset(["gmail"])
+    backfill.run(["gmail"])
+    assert requested == ["", "p1", "p2"]
+
+
+def test_gmail_backfill_skips_drafts_and_deleted_messages(soy_db, monkeypatch, gmail_batch_server):
+    monkeypatch.setattr(backfill, "PAUSE_SECS", 0)
+    monkeypatch.setattr(google_sync, "get_valid_token", lambda email=None: "tok")
+    pages = {"": (["a1", "d1", "x1"], "p1"), "p1": (["b1"], None)}
+    fake = _gmail_fake(pages, [], drafts={"d1"}, gone={"x1"})
+    monkeypatch.setattr(google_sync, "_api_get", fake)
+    gmail_batch_server(fake)
+
+    result = backfill.run(["gmail"])
+    assert result["state"] == "finished" and result["streams"][0]["done"] is True
+    stored = {r["gmail_id"] for r in soy_db.execute("SELECT gmail_id FROM emails")}
+    assert stored == {"a1", "b1"}
+
+
+def test_slack_backfill_walks_backwards_with_latest(soy_db, monkeypatch):
+    monkeypatch.setattr(backfill, "PAUSE_SECS", 0)
+    monkeypatch.setattr(slack_sync, "get_bot_token", lambda: "tok")
+    soy_db.execute_write(
+        "INSERT INTO slack_channels (slack_channel_id, name, is_dm, is_monitored) VALUES ('C1', 'general', 0, 1)"
+    )
+    history = [f"17000000{n:02d}.000100" for n in range(5, 0, -1)]  # newest first
+    calls = []
+
+    def fake_api_get(method, token, params=None):
+        if method == "users.list":
+            return {"ok": True, "members": []}
+        calls.append(params.get("latest"))
+        older = [ts for ts in history if not params.get("latest") or float(ts) < float(params["latest"])]
+        page = older[:2]
+        return {"ok": True, "messages": [{"user": "U1", "ts": ts, "text": "hi"} for ts in page],
+                "has_more": len(older) > 2}
+
+    monkeypatch.setattr(slack_sync, "_api_get", fake_api_get)
+    result = backfill.run(["slack"])
+
+    assert calls == [None, history[1], history[3]]
+    assert result["state"] == "finished" and result["items"] == 5
+    assert result["streams"][0]["done"] is True and result["items_per_sec"] > 0
+    assert soy_db.execute("SELECT COUNT(*) AS n FROM slack_messages")[0]["n"] == 5
+    [checkpoint] = backfill.status()["checkpoints"]
+    assert (checkpoint["stream"], checkpoint["items"], checkpoint["done"]) == ("slack:C1", 5, True)
+
+
+def test_system_status_runs_backfill_in_background(soy_db, monkeypatch):
+    monkeypatch.setattr(backfill, "PAUSE_SECS", 0)
+    monkeypatch.setattr(slack_sync, "get_bot_token", lambda: None)
+    server = FastMCP("test")
+    system.register(server)
+    tool = server._tool_manager._tools["system_status"].fn
+
+    assert "Unknown source" in tool(action="backfill", sources="fax")["error"]
+    tool(action="backfill", sources="slack")
+    deadline = time.monotonic() + 5
+    while tool(action="backfill_status")["state"] not in ("finished", "stopped", "failed"):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    status = tool(action="backfill_status")
+    assert status["state"] == "finished"
+    assert status["errors"] == [{"source": "slack", "error": "Not connected to Slack."}]
+    assert tool(action="backfill_stop")["state"] == "idle"
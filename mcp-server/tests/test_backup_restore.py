@@ -157,11 +157,9 @@ def test_data_loss_branch_restores_via_init_db_path(soy_db, monkeypatch):
     soy_db.run_migrations(conn)
     conn.close()  # init_db's trailing close — must be a safe no-op post-restore
 
-    # Restore brought the original contacts back.
-    rows = soy_db.execute("SELECT name FROM contacts ORDER BY name")
-    assert [r["name"] for r in rows] == ["Dana", "Eve"]
-
     # No stale WAL/SHM left to replay over the restored file on next open.
+    # Checked before the read below: execute() draws a pooled connection that
+    # stays open by design, and a live WAL connection always maps a -shm.
     for suffix in ("-wal", "-shm"):
         sidecar = soy_db.DB_PATH.with_name(soy_db.DB_PATH.name + suffix)
         # If present at all, it must be empty (a fresh connection may recreate an
@@ -169,6 +167,10 @@ def test_data_loss_branch_restores_via_init_db_path(soy_db, monkeypatch):
         if sidecar.exists():
             assert sidecar.stat().st_size == 0
 
+    # Restore brought the original contacts back.
+    rows = soy_db.execute("SELECT name FROM contacts ORDER BY name")
+    assert [r["name"] for r in rows] == ["Dana", "Eve"]
+
     # A subsequent fresh connection sees a clean, intact DB.
     conn = soy_db.get_connection()
     try:
@@ -0,0 +1,143 @@
+"""Tests for incremental Calendar sync via events.list syncTokens.
+
+Guards:
+  1. the first run pages through a full listing and stores the final page's
+     nextSyncToken; later runs send only the token and apply just the delta;
+  2. cancelled items delete their event — or mark it cancelled when a
+     transcript still points at it;
+  3. a 410 Gone drops back to a full listing, which prunes events that
+     vanished while the token was stale — from that calendar only;
+  4. the full listing is a bounded window paged to the end, and is listed
+     again once half its horizon has passed.
+
+``_api_get`` is monkeypatched with a fake that answers by URL.
+"""
+
+import urllib.error
+from datetime import datetime, timedelta, timezone
+
+from software_of_you import google_sync
+
+SOON = (datetime.now(timezone.utc) + timedelta(days=1)).strftime("%Y-%m-%dT10:00:00Z")
+
+
+def _event(gid, start=SOON, **extra):
+    return {"id": gid, "summary": gid, "status": "confirmed",
+            "start": {"dateTime": start}, "end": {"dateTime": start}, **extra}
+
+
+class FakeCalendar:
+    def __init__(self, full_pages, sync_token="tok-1"):
+        self.full_pages = full_pages  # list of item lists
+        self.sync_token = sync_token
+        self.delta = None  # items to return for a syncToken request, or "gone"
+        self.urls = []
+
+    def __call__(self, url, token):
+        self.urls.append(url)
+        if "syncToken=" in url and self.delta is not None:
+            if self.delta == "gone":
+                raise urllib.error.HTTPError(url, 410, "Gone", {}, None)
+            return {"items": self.delta, "nextSyncToken": self.sync_token}
+        page = int(url.split("pageToken=")[1].split("&")[0]) if "pageToken=" in url else 0
+        data = {"items": self.full_pages[page]}
+        if page + 1 < len(self.full_pages):
+            data["nextPageToken"] = str(page + 1)
+        else:
+            data["nextSyncToken"] = self.sync_token
+        return data
+
+
+def _stored(soy_db):
+    rows = soy_db.execute("SELECT google_event_id, title, status FROM calendar_events ORDER BY google_event_id")
+    return {r["google_event_id"]: (r["title"], r["status"]) for r in rows}
+
+
+def _sync_token(soy_db):
+    rows = soy_db.execute("SELECT value FROM soy_meta WHERE key = 'calendar_sync_token:primary'")
+    return rows[0]["value"] if rows else None
+
+
+def test_full_listing_then_incremental_delta(soy_db, monkeypatch):
+    fake = FakeCalendar([[_event("a"), _event("b")], [_event("c")]])
+    monkeypatch.setattr(google_sync, "_api_get", fake)
+
+    first = google_sync.sync_calendar(token="t")
+    assert (first["mode"], first["synced"]) == ("full", 3)
+    assert _sync_token(soy_db) == "tok-1"
+    assert all("timeMax=" in u and "timeMin=" in u for u in fake.urls)
+
+    fake.urls.clear()
+    fake.sync_token = "tok-2"
+    fake.delta = [_event("a", summary="renamed"), {"id": "b", "status": "cancelled"}]
+    second = google_sync.sync_calendar(token="t")
+
+    assert (second["mode"], second["synced"], second["deleted"]) == ("incremental", 1, 1)
+    assert len(fake.urls) == 1 and "syncToken=tok-1" in fake.urls[0]
+    assert "timeMin" not in fake.urls[0]
+    assert _stored(soy_db) == {"a": ("renamed", "confirmed"), "c": ("c", "confirmed")}
+    assert _sync_token(soy_db) == "tok-2"
+
+
+def test_cancelled_event_with_transcript_is_kept_as_cancelled(soy_db, monkeypatch):
+    fake = FakeCalendar([[_event("a")]])
+    monkeypatch.setattr(google_sync, "_api_get", fake)
+    google_sync.sync_calendar(token="t")
+    event_id = soy_db.execute("SELECT id FROM calendar_events WHERE google_event_id = 'a'")[0]["id"]
+    soy_db.execute_write(
+        "INSERT INTO transcripts (title, raw_text, occurred_at, source_calendar_event_id) "
+        "VALUES ('Notes', 'x', datetime('now'), ?)",
+        (event_id,),
+    )
+
+    fake.delta = [{"id": "a", "status": "cancelled"}]
+    google_sync.sync_calendar(token="t")
+
+    assert _stored(soy_db) == {"a": ("a", "cancelled")}
+
+
+def test_expired_token_falls_back_to_full_listing_and_prunes(soy_db, monkeypatch):
+    fake = FakeCalendar([[_event("a"), _event("b")]])
+    monkeypatch.setattr(google_sync, "_api_get", fake)
+    google_sync.sync_calendar(token="t")
+
+    fake.delta = "gone"
+    fake.full_pages = [[_event("a")]]  # "b" was deleted while the token was stale
+    fake.sync_token = "tok-fresh"
+    result = google_sync.sync_calendar(token="t")
+
+    assert (result["mode"], result["synced"], result["deleted"]) == ("full", 1, 1)
+    assert set(_stored(soy_db)) == {"a"}
+    assert _sync_token(soy_db) == "tok-fresh"
+
+
+def test_full_resync_prunes_only_its_own_calendar(soy_db, monkeypatch):
+    monkeypatch.setattr(google_sync, "_api_get", FakeCalendar([[_event("work-1")]]))
+    google_sync.sync_calendar(token="t", calendar_id="work@example.com")
+    monkeypatch.setattr(google_sync, "_api_get", FakeCalendar([[_event("a")]]))
+    google_sync.sync_calendar(token="t")
+
+    fake = FakeCalendar([[]])  # every primary event deleted
+    fake.delta = "gone"
+    monkeypatch.setattr(google_sync, "_api_get", fake)
+    result = google_sync.sync_calendar(token="t")
+
+    assert result["deleted"] == 1
+    assert set(_stored(soy_db)) == {"work-1"}
+
+
+def test_long_listing_pages_to_the_end_and_relists_near_horizon(soy_db, monkeypatch):
+    fake = FakeCalendar([[_event(f"e{i}")] for i in range(60)])
+    monkeypatch.setattr(google_sync, "_api_get", fake)
+    assert google_sync.sync_calendar(token="t")["synced"] == 60
+    assert _sync_token(soy_db) == "tok-1"
+
+    fake.delta = []
+    assert google_sync.sync_calendar(token="t")["mode"] == "incremental"
+
+    # Half the horizon later, unchanged events past the old window need listing.
+    soy_db.execute_write(
+        "UPDATE soy_meta SET value = ? WHERE key = 'calendar_sync_horizon:primary'",
+        ((datetime.now(timezone.utc) + timedelta(days=100)).strftime("%Y-%m-%dT%H:%M:%SZ"),),
+    )
+    assert google_sync.sync_calendar(token="t")["mode"] == "full"
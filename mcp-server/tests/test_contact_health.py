@@ -0,0 +1,92 @@
+"""Tests for the materialized contact_health table and its shim (migration 025).
+
+The invariant under test: ``v_contact_health`` (the shim) always returns exactly
+what the 020 computation (``v_contact_health_live``) would — whether the row
+comes from the table, from the dirty-row fallback, or from the stale-sweep
+fallback — while the refresher moves rows back onto the materialized path.
+"""
+
+from software_of_you import contact_health
+from software_of_you.tools import contacts
+
+
+def _rows(soy_db, view):
+    return [dict(r) for r in soy_db.execute(f"SELECT * FROM {view} ORDER BY id")]
+
+
+def _assert_shim_matches_live(soy_db):
+    assert _rows(soy_db, "v_contact_health") == _rows(soy_db, "v_contact_health_live")
+
+
+def _dirty(soy_db):
+    return {r["contact_id"] for r in soy_db.execute("SELECT contact_id FROM contact_health_dirty")}
+
+
+def _add(name):
+    return contacts._add(name, "", "", "", "", "individual", "active", None)["result"]["contact_id"]
+
+
+def test_source_writes_mark_contacts_dirty_and_shim_stays_correct(soy_db):
+    ann, bob = _add("Ann"), _add("Bob")
+    contact_health.ensure_fresh()
+    assert _dirty(soy_db) == set()
+
+    soy_db.execute_write(
+        "INSERT INTO emails (gmail_id, thread_id, contact_id, direction, from_address, subject, received_at) "
+        "VALUES ('g1', 't1', ?, 'inbound', 'ann@acme.com', 'Hi', datetime('now', '-2 days'))",
+        (ann,),
+    )
+    soy_db.execute_write(
+        "INSERT INTO follow_ups (contact_id, due_date, reason, status) "
+        "VALUES (?, date('now', '-1 day'), 'Call back', 'pending')",
+        (bob,),
+    )
+    soy_db.execute_write(
+        "INSERT INTO relationship_scores (contact_id, score_date, relationship_depth, trajectory) "
+        "VALUES (?, date('now'), 'professional', 'strengthening')",
+        (ann,),
+    )
+    soy_db.execute_write(
+        "INSERT INTO calendar_events (google_event_id, title, start_time, end_time, status, contact_ids) "
+        "VALUES ('ev1', 'Sync', datetime('now', '+1 day'), datetime('now', '+1 day', '+30 minutes'), "
+        "'confirmed', ?)",
+        (f"[{bob}]",),
+    )
+    assert _dirty(soy_db) == {ann, bob}
+    _assert_shim_matches_live(soy_db)
+
+    assert contact_health.refresh_dirty() == 2
+    assert _dirty(soy_db) == set()
+    _assert_shim_matches_live(soy_db)
+    stored = soy_db.execute("SELECT emails_total, trajectory FROM contact_health WHERE id = ?", (ann,))[0]
+    assert stored["emails_total"] == 1 and stored["trajectory"] == "strengthening"
+
+
+def test_status_change_and_delete_leave_table(soy_db):
+    ann, bob = _add("Ann"), _add("Bob")
+    contact_health.ensure_fresh()
+
+    soy_db.execute_write("UPDATE contacts SET status = 'inactive' WHERE id = ?", (ann,))
+    soy_db.execute_write("DELETE FROM contacts WHERE id = ?", (bob,))
+    _assert_shim_matches_live(soy_db)
+    contact_health.refresh_dirty()
+    assert soy_db.execute("SELECT COUNT(*) AS n FROM contact_health")[0]["n"] == 0
+    _assert_shim_matches_live(soy_db)
+
+
+def test_stale_sweep_falls_back_to_live_then_ensure_fresh_sweeps(soy_db):
+    ann = _add("Ann")
+    contact_health.ensure_fresh()
+    soy_db.execute_write(
+        "UPDATE soy_meta SET value = datetime('now', '-2 hours') WHERE key = 'contact_health_swept_at'"
+    )
+    # A time-window change the triggers can't see: the interaction ages out of
+    # the 30-day window. Simulate by editing the table behind the shim's back.
+    soy_db.execute_write("UPDATE contact_health SET interactions_30d = 99 WHERE id = ?", (ann,))
+    _assert_shim_matches_live(soy_db)  # stale → served live, not the bogus 99
+
+    result = contact_health.ensure_fresh()
+    assert result["swept"] is True
+    assert soy_db.execute("SELECT interactions_30d FROM contact_health WHERE id = ?", (ann,))[0]["interactions_30d"] == 0
+    assert contact_health.ensure_fresh() == {"swept": False, "refreshed": 0}
+    _assert_shim_matches_live(soy_db)
@@ -0,0 +1,113 @@
+"""Tests for the per-thread connection pool behind ``db.execute*``.
+
+The execute helpers used to open, pragma, and close a fresh connection on
+every call. They now reuse one connection per thread. These guard:
+  1. a thread reuses its connection across reads and writes;
+  2. threads never share a connection, and the pool size is a hard cap
+     (overflow callers fall back to a one-shot connection, not an error);
+  3. a failed write never leaks an open transaction into the next call;
+  4. repointing DB_PATH or ``close_pool`` retires stale connections;
+  5. ``configure_pool(0)`` restores connect-per-call.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+
+def _conn_id(soy_db):
+    conn, pooled = soy_db._acquire()
+    soy_db._release(conn, pooled)
+    return id(conn), pooled
+
+
+def test_thread_reuses_one_connection(soy_db):
+    first, pooled = _conn_id(soy_db)
+    assert pooled
+    soy_db.execute("SELECT COUNT(*) FROM contacts")
+    soy_db.execute_write(
+        "INSERT INTO soy_meta (key, value) VALUES ('pool_test', '1')"
+    )
+    assert _conn_id(soy_db)[0] == first
+    assert soy_db.pool_stats()["open"] == 1
+
+
+def test_threads_get_distinct_connections_and_size_caps(soy_db, monkeypatch):
+    monkeypatch.setattr(soy_db, "POOL_SIZE", 2)
+    soy_db.close_pool()
+
+    hold = threading.Barrier(3)
+    seen = []
+
+    def worker():
+        conn, pooled = soy_db._acquire()
+        seen.append((id(conn), pooled))
+        hold.wait()  # keep every thread alive until all have acquired
+        soy_db._release(conn, pooled)
+        hold.wait()
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({cid for cid, _ in seen}) == 3
+    assert sorted(p for _, p in seen) == [False, True, True]
+    assert soy_db.pool_stats()["open"] <= 2
+
+
+def test_dead_thread_connections_are_reaped(soy_db, monkeypatch):
+    monkeypatch.setattr(soy_db, "POOL_SIZE", 1)
+    soy_db.close_pool()
+
+    t = threading.Thread(target=lambda: soy_db.execute("SELECT 1"))
+    t.start()
+    t.join()
+    assert soy_db.pool_stats()["open"] == 1
+
+    # The exited thread's slot is reclaimed instead of forcing a one-shot.
+    assert _conn_id(soy_db)[1] is True
+
+
+def test_failed_write_leaves_no_open_transaction(soy_db):
+    with pytest.raises(sqlite3.IntegrityError):
+        soy_db.execute_many([
+            ("INSERT INTO soy_meta (key, value) VALUES ('a', '1')", ()),
+            ("INSERT INTO contacts (name, type) VALUES ('x', 'not-a-type')", ()),
+        ])
+    conn, pooled = soy_db._acquire()
+    try:
+        assert pooled and not conn.in_transaction
+    finally:
+        soy_db._release(conn, pooled)
+    assert soy_db.execute("SELECT COUNT(*) AS n FROM soy_meta WHERE key = 'a'")[0]["n"] == 0
+
+
+def test_close_pool_and_path_change_retire_connections(soy_db, tmp_path, monkeypatch):
+    _conn_id(soy_db)
+    generation = soy_db.pool_stats()["generation"]
+    soy_db.close_pool()
+    assert soy_db.pool_stats() == {
+        "size": soy_db.POOL_SIZE,
+        "open": 0,
+        "generation": generation + 1,
+    }
+
+    # A repointed DB_PATH must never be served by the old file's connection.
+    _conn_id(soy_db)
+    other = tmp_path / "other.db"
+    monkeypatch.setattr(soy_db, "DB_PATH", other)
+    soy_db.execute_write("CREATE TABLE t (x)")
+    assert other.exists()
+    assert soy_db.pool_stats()["open"] == 1
+
+
+def test_pool_size_zero_is_connect_per_call(soy_db, monkeypatch):
+    monkeypatch.setattr(soy_db, "POOL_SIZE", soy_db.POOL_SIZE)
+    soy_db.configure_pool(0)
+    _, pooled = _conn_id(soy_db)
+    assert pooled is False
+    assert soy_db.execute("SELECT 1 AS one")[0]["one"] == 1
+    assert soy_db.pool_stats()["open"] == 0
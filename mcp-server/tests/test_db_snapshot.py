@@ -0,0 +1,82 @@
+"""Tests for ``db.snapshot`` / ``db.query_batch`` and the tools built on them.
+
+Guards:
+  1. a batch returns ``{name: rows}`` for bare-SQL and ``(sql, params)`` entries;
+  2. every read inside a snapshot — including plain ``execute()`` from helpers —
+     sees one database state, even when another connection commits mid-block;
+  3. writes inside a snapshot still commit (through the writer) and the
+     snapshot ends cleanly;
+  4. ``get_overview`` and the dashboard render still produce their output.
+"""
+
+import sqlite3
+
+from mcp.server.fastmcp import FastMCP
+
+from software_of_you.tools import contacts, overview, views
+
+
+def test_query_batch_returns_named_results(soy_db):
+    contacts._add("Ann", "ann@acme.com", "", "Acme", "", "individual", "active", None)
+    r = soy_db.query_batch({
+        "total": "SELECT COUNT(*) AS n FROM contacts",
+        "by_name": ("SELECT email FROM contacts WHERE name = ?", ("Ann",)),
+    })
+    assert r["total"][0]["n"] == 1
+    assert r["by_name"][0]["email"] == "ann@acme.com"
+
+
+def test_snapshot_is_isolated_from_concurrent_commits(soy_db):
+    contacts._add("Ann", "", "", "", "", "individual", "active", None)
+    other = sqlite3.connect(str(soy_db.DB_PATH))
+    try:
+        with soy_db.snapshot() as snap:
+            before = snap.execute("SELECT COUNT(*) AS n FROM contacts")[0]["n"]
+            other.execute(
+                "INSERT INTO contacts (name, type, status) VALUES ('Bob', 'individual', 'active')"
+            )
+            other.commit()
+            # Both the snapshot and a helper-style plain execute() agree.
+            assert snap.execute("SELECT COUNT(*) AS n FROM contacts")[0]["n"] == before
+            assert soy_db.execute("SELECT COUNT(*) AS n FROM contacts")[0]["n"] == before
+            with soy_db.snapshot() as inner:
+                assert inner is snap
+    finally:
+        other.close()
+
+    assert soy_db.execute("SELECT COUNT(*) AS n FROM contacts")[0]["n"] == before + 1
+
+
+def test_write_inside_snapshot_commits(soy_db, monkeypatch):
+    for writer_enabled in (True, False):
+        monkeypatch.setattr(soy_db, "WRITER_ENABLED", writer_enabled)
+        key = f"snap_{writer_enabled}"
+        with soy_db.snapshot():
+            soy_db.execute_write(
+                "INSERT INTO soy_meta (key, value) VALUES (?, '1')", (key,)
+            )
+        rows = soy_db.execute("SELECT value FROM soy_meta WHERE key = ?", (key,))
+        assert rows and rows[0]["value"] == "1"
+
+    conn, pooled = soy_db._acquire()
+    try:
+        assert not conn.in_transaction
+    finally:
+        soy_db._release(conn, pooled)
+
+
+def test_overview_and_dashboard_read_through_snapshot(soy_db, monkeypatch):
+    monkeypatch.setattr(overview, "_auto_sync", lambda service: None)
+    contacts._add("Ann", "", "", "Acme", "", "individual", "active", None)
+
+    server = FastMCP("test")
+    overview.register(server)
+    result = server._tool_manager._tools["get_overview"].fn()["result"]
+    assert result["contacts"]["total"] == 1
+    assert result["contacts"]["recent"][0]["name"] == "Ann"
+    assert result["activity"]
+
+    monkeypatch.setattr(views, "VIEWS_DIR", soy_db.VIEWS_DIR)
+    rendered = views._render_dashboard(open_after=False)
+    assert (soy_db.VIEWS_DIR / "dashboard.html").exists()
+    assert rendered["result"]["view_type"] == "dashboard"
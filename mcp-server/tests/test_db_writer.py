@@ -0,0 +1,130 @@
+"""Tests for the single-writer group-commit coordinator in ``db``.
+
+Every execute_write / execute_many / execute_lenient / insert_with_log call is
+a job for one writer thread; jobs that queue while a batch commits share the
+next transaction. These guard:
+  1. concurrent writes group-commit and each caller gets its own lastrowid;
+  2. a failing job rolls back only itself — batch-mates still commit;
+  3. a cross-process lock held past busy_timeout is retried, not surfaced;
+  4. ``SOY_DB_WRITER=0`` (``WRITER_ENABLED = False``) keeps the same results.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+
+def _block_writer(soy_db):
+    """Occupy the writer with a job that waits on the returned event."""
+    started, release = threading.Event(), threading.Event()
+
+    def job(conn):
+        started.set()
+        release.wait(5)
+        return None
+
+    t = threading.Thread(target=soy_db._writer.submit, args=(job,))
+    t.start()
+    assert started.wait(5)
+    return release, t
+
+
+def test_concurrent_writes_share_one_commit(soy_db):
+    before = soy_db.writer_stats()
+    release, blocker = _block_writer(soy_db)
+
+    ids = {}
+
+    def writer(i):
+        ids[i] = soy_db.execute_write(
+            "INSERT INTO contacts (name, type, status) VALUES (?, 'individual', 'active')",
+            (f"Person {i}",),
+        )
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(10)]
+    for t in threads:
+        t.start()
+    # Wait until all ten jobs are queued behind the blocker, then let it go.
+    while soy_db._writer._queue.qsize() < 10:
+        threading.Event().wait(0.005)
+    release.set()
+    blocker.join()
+    for t in threads:
+        t.join()
+
+    after = soy_db.writer_stats()
+    assert after["jobs"] - before["jobs"] == 11
+    assert after["batches"] - before["batches"] == 2  # blocker, then all ten
+
+    rows = soy_db.execute("SELECT id, name FROM contacts")
+    by_name = {r["name"]: r["id"] for r in rows}
+    assert {by_name[f"Person {i}"] for i in range(10)} == set(ids.values())
+    for i, rowid in ids.items():
+        assert by_name[f"Person {i}"] == rowid
+
+
+def test_failing_job_does_not_sink_batch(soy_db):
+    release, blocker = _block_writer(soy_db)
+    errors = []
+
+    def good():
+        soy_db.execute_many([
+            ("INSERT INTO soy_meta (key, value) VALUES ('good', '1')", ()),
+        ])
+
+    def bad():
+        try:
+            soy_db.execute_many([
+                ("INSERT INTO soy_meta (key, value) VALUES ('bad', '1')", ()),
+                ("INSERT INTO contacts (name, type) VALUES ('x', 'not-a-type')", ()),
+            ])
+        except sqlite3.IntegrityError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=bad), threading.Thread(target=good)]
+    for t in threads:
+        t.start()
+    while soy_db._writer._queue.qsize() < 2:
+        threading.Event().wait(0.005)
+    release.set()
+    blocker.join()
+    for t in threads:
+        t.join()
+
+    assert len(errors) == 1
+    keys = {r["key"] for r in soy_db.execute("SELECT key FROM soy_meta")}
+    assert "good" in keys
+    assert "bad" not in keys
+
+
+def test_busy_lock_is_retried_with_backoff(soy_db, monkeypatch):
+    monkeypatch.setattr(soy_db, "BUSY_TIMEOUT_SECS", 0.02)
+    monkeypatch.setattr(soy_db, "BUSY_BACKOFF_SECS", 0.02)
+    soy_db.close_pool()  # reopen the writer with the short busy timeout
+
+    # Another "process" holds the write lock for a while.
+    other = sqlite3.connect(str(soy_db.DB_PATH), check_same_thread=False)
+    other.execute("BEGIN IMMEDIATE")
+    threading.Timer(0.15, other.commit).start()
+
+    before = soy_db.writer_stats()["busy_retries"]
+    rowid = soy_db.execute_write(
+        "INSERT INTO soy_meta (key, value) VALUES ('after_lock', '1')"
+    )
+    other.close()
+
+    assert rowid
+    assert soy_db.writer_stats()["busy_retries"] > before
+
+
+def test_direct_mode_matches_writer(soy_db, monkeypatch):
+    monkeypatch.setattr(soy_db, "WRITER_ENABLED", False)
+    skipped = soy_db.execute_lenient([
+        ("INSERT INTO soy_meta (key, value) VALUES ('d1', '1')", ()),
+        ("INSERT INTO contacts (name, type) VALUES ('x', 'not-a-type')", ()),
+    ])
+    assert skipped == 1
+    with pytest.raises(sqlite3.IntegrityError):
+        soy_db.execute_write("INSERT INTO contacts (name, type) VALUES ('y', 'nope')")
+    assert soy_db.execute("SELECT value FROM soy_meta WHERE key = 'd1'")[0]["value"] == "1"
@@ -0,0 +1,126 @@
+"""Tests for the batch entity-page loader.
+
+Guards:
+  1. every section ``EntityPageData`` groups for a batch matches what the
+     entity page's per-contact queries return — same rows, same order, same
+     per-contact limits (including standalone notes' ``LIKE '%<id>%'``);
+  2. loading a batch costs one query per table, however many contacts it
+     holds.
+"""
+
+import json
+
+from software_of_you import entity_data
+from software_of_you.entity_data import EntityPageData
+
+# The entity page's original per-contact queries.
+_PER_CONTACT = {
+    "tags": "SELECT t.name, t.color FROM tags t JOIN entity_tags et ON et.tag_id = t.id WHERE et.entity_type = 'contact' AND et.entity_id = ?",
+    "notes": "SELECT content, created_at FROM notes WHERE entity_type = 'contact' AND entity_id = ? ORDER BY created_at DESC LIMIT 5",
+    "emails": "SELECT * FROM emails WHERE contact_id = ? ORDER BY received_at ASC",
+    "upcoming_events": """SELECT ce.* FROM calendar_event_attendees a
+        JOIN calendar_events ce ON ce.id = a.event_id
+        WHERE a.contact_id = ? AND a.start_time > datetime('now') AND ce.status != 'cancelled'
+        ORDER BY a.start_time ASC LIMIT 5""",
+    "projects": "SELECT * FROM projects WHERE client_id = ?",
+    "follow_ups": "SELECT * FROM follow_ups WHERE contact_id = ? AND status = 'pending' ORDER BY due_date ASC",
+    "transcripts": """SELECT t.id, t.title, t.summary, t.call_intelligence, t.occurred_at
+        FROM transcripts t JOIN transcript_participants tp ON tp.transcript_id = t.id
+        WHERE tp.contact_id = ? GROUP BY t.id ORDER BY t.occurred_at DESC LIMIT 10""",
+}
+
+
+def _seed(db, n):
+    """``n`` contacts at two companies, each with a few rows in every section."""
+    stmts = []
+    for k, name in enumerate(("vip", "lead", "partner"), start=1):
+        stmts.append(("INSERT INTO tags (id, name, color) VALUES (?, ?, 'blue')", (k, name)))
+    for cid in range(1, n + 1):
+        company = "Acme" if cid % 2 else "Globex"
+        stmts.append(("INSERT INTO contacts (id, name, email, company, role, status) VALUES (?, ?, ?, ?, 'Eng', 'active')",
+                      (cid, f"Person {cid}", f"p{cid}@x.com", company)))
+        stmts.append(("INSERT INTO entity_tags (entity_type, entity_id, tag_id) VALUES ('contact', ?, ?)", (cid, cid % 3 + 1)))
+        for k in range(7):
+            stmts.append(("INSERT INTO notes (entity_type, entity_id, content, created_at) VALUES ('contact', ?, ?, datetime('now', ?))",
+                          (cid, f"note {k}", f"-{k} hours")))
+            stmts.append(("INSERT INTO calendar_events (title, start_time, end_time, status, synced_at) VALUES (?, datetime('now', ?), datetime('now', ?), ?, datetime('now'))",
+                          (f"mtg {cid}-{k}", f"{k - 1} days", f"{k - 1} days", "cancelled" if k == 3 else "confirmed")))
+            stmts.append(("""INSERT INTO calendar_event_attendees (event_id, contact_id, email, start_time)
+                             SELECT id, ?, ?, start_time FROM calendar_events WHERE title = ?""",
+                          (cid, f"p{cid}@x.com", f"mtg {cid}-{k}")))
+        for k in range(3):
+            stmts.append(("INSERT INTO emails (contact_id, direction, from_address, subject, received_at, synced_at) VALUES (?, 'inbound', ?, ?, datetime('now', ?), datetime('now'))",
+                          (cid, f"p{cid}@x.com", f"email {k}", f"-{k} days")))
+            stmts.append(("INSERT INTO follow_ups (contact_id, due_date, reason, status) VALUES (?, date('now', ?), 'ping', ?)",
+                          (cid, f"{k} days", "completed" if k == 1 else "pending")))
+            stmts.append(("INSERT INTO relationship_scores (contact_id, score_date, relationship_depth) VALUES (?, date('now', ?), ?)",
+                          (cid, f"-{k} days", ("transactional", "professional", "trusted")[k])))
+        stmts.append(("INSERT INTO projects (id, name, client_id, status) VALUES (?, ?, ?, 'active')", (cid, f"proj {cid}", cid)))
+        for k in (2, 0, 1):
+            stmts.append(("INSERT INTO tasks (project_id, title, status, sort_order) VALUES (?, ?, 'todo', ?)", (cid, f"task {k}", k)))
+    for k in range(12):
+        stmts.append(("INSERT INTO transcripts (id, title, raw_text, occurred_at) VALUES (?, ?, 'x', datetime('now', ?))",
+                      (k + 1, f"call {k}", f"-{k} days")))
+        for cid in range(1, n + 1):
+            if (cid + k) % 2 or cid == 1:
+                stmts.append(("INSERT INTO transcript_participants (transcript_id, contact_id, speaker_label) VALUES (?, ?, 'A')", (k + 1, cid)))
+                stmts.append(("INSERT INTO transcript_participants (transcript_id, contact_id, speaker_label) VALUES (?, ?, 'B')", (k + 1, cid)))
+    for k in range(8):
+        stmts.append(("INSERT INTO standalone_notes (title, content, linked_contacts, pinned) VALUES (?, 'body', ?, ?)",
+                      (f"sn {k}", json.dumps([k + 1, 10 + k]), k % 2)))
+    db.execute_many(stmts)
+
+
+def _reference(db, cid):
+    """The page's sections as the per-contact queries saw them."""
+    ref = {name: db.rows_to_dicts(db.execute(sql, (cid,))) for name, sql in _PER_CONTACT.items()}
+    for p in ref["projects"]:
+        p["tasks"] = db.rows_to_dicts(db.execute(
+            "SELECT title, status FROM tasks WHERE project_id = ? ORDER BY sort_order", (p["id"],)))
+    rs = db.rows_to_dicts(db.execute(
+        "SELECT * FROM relationship_scores WHERE contact_id = ? ORDER BY score_date DESC LIMIT 1", (cid,)))
+    ref["relationship_score"] = rs[0] if rs else None
+    ref["standalone_notes"] = db.rows_to_dicts(db.execute(
+        "SELECT id, title, substr(content, 1, 150) as preview, tags, pinned FROM standalone_notes WHERE linked_contacts LIKE ? ORDER BY pinned DESC LIMIT 5",
+        (f"%{cid}%",)))
+    company = db.execute("SELECT company FROM contacts WHERE id = ?", (cid,))[0]["company"]
+    ref["company_team"] = db.rows_to_dicts(db.execute(
+        "SELECT name, role FROM contacts WHERE company = ? AND id != ? AND status = 'active'", (company, cid)))
+    return ref
+
+
+def test_batch_sections_match_per_contact_queries(soy_db):
+    _seed(soy_db, 12)
+    data = EntityPageData(range(1, 13), soy_db.get_installed_modules())
+
+    for cid in range(1, 13):
+        got, ref = data.sections(cid), _reference(soy_db, cid)
+        assert data.contact(cid)["name"] == f"Person {cid}"
+        assert sorted(got) == sorted(ref)
+        for name in ("tags", "company_team"):  # unordered in the page's queries too
+            got[name], ref[name] = (sorted(x[name], key=json.dumps) for x in (got, ref))
+        got["standalone_notes"] = sorted(got["standalone_notes"], key=lambda n: (-n["pinned"], n["id"]))
+        ref["standalone_notes"] = sorted(ref["standalone_notes"], key=lambda n: (-n["pinned"], n["id"]))
+        assert got == ref, cid
+
+    assert len(data.sections(1)["notes"]) == 5 and len(data.sections(1)["transcripts"]) == 10
+    assert len(data.sections(1)["standalone_notes"]) == 5  # every note: "11", "12", … contain "1"
+    assert data.contact(999) is None and data.sections(999)["emails"] == []
+
+
+def test_batch_query_count_does_not_grow_with_contacts(soy_db, monkeypatch):
+    _seed(soy_db, 20)
+    modules = soy_db.get_installed_modules()
+    calls = []
+    real_execute = entity_data.execute
+    monkeypatch.setattr(entity_data, "execute", lambda *a: calls.append(a) or real_execute(*a))
+
+    EntityPageData([1, 2], modules)
+    small = len(calls)
+    calls.clear()
+    EntityPageData(range(1, 21), modules)
+    assert len(calls) == small
+
+    calls.clear()
+    EntityPageData(range(1, 21), ["crm"])  # uninstalled modules' tables aren't read
+    assert len(calls) < small
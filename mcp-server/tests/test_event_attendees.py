@@ -0,0 +1,124 @@
+"""Tests for the calendar_event_attendees junction table (migration 026).
+
+Guards:
+  1. ids are matched exactly — contact 1 is not an attendee of an event with
+     contacts 11 and 21 (the old ``contact_ids LIKE`` bug);
+  2. the triggers follow event inserts, attendee changes, start_time moves and
+     deletes, and the migration backfills events that predate it;
+  3. ``sync_calendar`` populates it (email, response status, matched contact)
+     and the per-contact consumers read through it.
+"""
+
+from mcp.server.fastmcp import FastMCP
+
+from software_of_you import contact_health, google_sync
+from software_of_you.tools import calendar_tool, contacts
+
+
+def _add(name, email=""):
+    return contacts._add(name, email, "", "", "", "individual", "active", None)["result"]["contact_id"]
+
+
+def _attendees(soy_db, event_id):
+    rows = soy_db.execute(
+        "SELECT contact_id, email, response_status, start_time FROM calendar_event_attendees "
+        "WHERE event_id = ? ORDER BY contact_id",
+        (event_id,),
+    )
+    return [dict(r) for r in rows]
+
+
+def _insert_event(soy_db, gid, contact_ids, attendees=None, start="+1 day"):
+    return soy_db.execute_write(
+        "INSERT INTO calendar_events (google_event_id, title, start_time, end_time, status, attendees, contact_ids) "
+        "VALUES (?, 'Sync', datetime('now', ?), datetime('now', ?, '+30 minutes'), 'confirmed', ?, ?)",
+        (gid, start, start, attendees, contact_ids),
+    )
+
+
+def test_exact_contact_match_and_trigger_maintenance(soy_db):
+    ids = [_add(f"C{i}") for i in range(1, 22)]
+    one, eleven, twentyone = ids[0], ids[10], ids[20]
+    assert (one, eleven, twentyone) == (1, 11, 21)
+
+    ev = _insert_event(soy_db, "ev1", "[11, 21]")
+    _insert_event(soy_db, "ev2", "1, 2")  # comma-separated, as the /calendar command documents
+    assert [a["contact_id"] for a in _attendees(soy_db, ev)] == [11, 21]
+    contact_health.sweep()
+    nm = {r["id"]: r["next_meeting"] for r in soy_db.execute(
+        "SELECT id, next_meeting FROM v_contact_health WHERE id IN (1, 11)")}
+    assert nm[1] is not None and nm[11] is not None
+    # Only ev2 counts for contact 1, even though "1" is a substring of "[11, 21]".
+    assert soy_db.execute(
+        "SELECT COUNT(*) AS n FROM calendar_event_attendees WHERE contact_id = 1"
+    )[0]["n"] == 1
+
+    soy_db.execute_write("UPDATE calendar_events SET contact_ids = '[21]' WHERE id = ?", (ev,))
+    assert [a["contact_id"] for a in _attendees(soy_db, ev)] == [21]
+    assert 11 in {r["contact_id"] for r in soy_db.execute("SELECT contact_id FROM contact_health_dirty")}
+
+    soy_db.execute_write(
+        "UPDATE calendar_events SET start_time = datetime('now', '+3 days') WHERE id = ?", (ev,)
+    )
+    moved = soy_db.execute("SELECT start_time FROM calendar_events WHERE id = ?", (ev,))[0]["start_time"]
+    assert _attendees(soy_db, ev)[0]["start_time"] == moved
+
+    soy_db.execute_write("DELETE FROM calendar_events WHERE id = ?", (ev,))
+    assert _attendees(soy_db, ev) == []
+    contact_health.refresh_dirty()
+    assert soy_db.execute("SELECT next_meeting FROM contact_health WHERE id = 21")[0]["next_meeting"] is None
+
+
+def test_migration_backfills_existing_events(soy_db):
+    ann = _add("Ann", "ann@acme.com")
+    ev = _insert_event(
+        soy_db, "ev1", f"[{ann}]",
+        attendees='[{"email": "ann@acme.com", "name": "Ann", "status": "accepted"},'
+                  ' {"email": "guest@else.com", "name": "", "status": "needsAction"}]',
+    )
+    # Simulate a pre-026 database: drop the table, then re-run the migration.
+    conn = soy_db.get_connection()
+    try:
+        conn.executescript("DROP TABLE calendar_event_attendees;")
+        conn.executescript((soy_db.MIGRATIONS_DIR / "026_calendar_event_attendees.sql").read_text())
+    finally:
+        conn.close()
+
+    rows = _attendees(soy_db, ev)
+    assert [(r["contact_id"], r["email"], r["response_status"]) for r in rows] == [
+        (None, "guest@else.com", "needsAction"),
+        (ann, "ann@acme.com", "accepted"),
+    ]
+
+
+def test_sync_calendar_populates_attendees_for_consumers(soy_db, monkeypatch):
+    ann = _add("Ann", "ann@acme.com")
+    _add("Bob", "bob@acme.com")
+
+    def fake_api_get(url, token):
+        return {"items": [{
+            "id": "g1",
+            "summary": "Planning",
+            "start": {"dateTime": "2099-01-01T10:00:00Z"},
+            "end": {"dateTime": "2099-01-01T11:00:00Z"},
+            "attendees": [
+                {"email": "ann@acme.com", "responseStatus": "accepted"},
+                {"email": "stranger@else.com", "responseStatus": "declined"},
+            ],
+        }]}
+
+    monkeypatch.setattr(google_sync, "_api_get", fake_api_get)
+    assert google_sync.sync_calendar(token="t")["synced"] == 1
+    assert google_sync.sync_calendar(token="t")["synced"] == 1  # re-sync is a no-op
+
+    ev = soy_db.execute("SELECT id FROM calendar_events WHERE google_event_id = 'g1'")[0]["id"]
+    assert [(r["contact_id"], r["email"], r["response_status"]) for r in _attendees(soy_db, ev)] == [
+        (None, "stranger@else.com", "declined"),
+        (ann, "ann@acme.com", "accepted"),
+    ]
+
+    server = FastMCP("test")
+    calendar_tool.register(server)
+    tool = server._tool_manager._tools["calendar"].fn
+    assert [e["title"] for e in tool(action="with", contact_id=ann)["result"]] == ["Planning"]
+    assert tool(action="with", contact_name="Bob")["result"] == []
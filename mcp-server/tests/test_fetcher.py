@@ -0,0 +1,215 @@
+"""Tests for the shared fetch engine (``fetcher``).
+
+Guards:
+  1. 429 / 5xx are retried (honouring Retry-After) and other errors are not;
+     a 429's Retry-After holds off every request on that key, not just its own;
+  2. the per-host concurrency cap holds under ``fetch_all`` fan-out, and
+     results come back in input order with failures in their slots;
+  3. the token bucket paces requests to its rate once the burst is spent;
+  4. keep-alive connections are pooled and reused, and gzip bodies decoded;
+     a reused connection that drops mid-request is resent for a GET but
+     not for a POST.
+
+A local HTTP server stands in for the API; each test gets fresh host state.
+"""
+
+import gzip
+import threading
+import time
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from software_of_you import fetcher
+
+
+@pytest.fixture(autouse=True)
+def fresh_fetcher(monkeypatch):
+    monkeypatch.setattr(fetcher, "HOST_LIMITS", dict(fetcher.HOST_LIMITS))
+    monkeypatch.setattr(fetcher, "BACKOFF_BASE_SECS", 0.01)
+    fetcher.reset_stats()
+    yield
+    fetcher.reset_stats()
+
+
+@pytest.fixture
+def server():
+    """``serve(handler)`` → base URL; ``handler(path)`` returns (status, headers, body),
+    or None to drop the connection without answering.
+
+    Speaks HTTP/1.1, so connections stay open between requests. Each request's
+    client port is recorded in ``serve.ports``.
+    """
+    servers = []
+
+    def serve(handler):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                serve.ports.append(self.client_address[1])
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                reply = handler(self.path)
+                if reply is None:
+                    self.close_connection = True
+                    return
+                status, headers, body = reply
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_POST = do_GET
+
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True).start()
+        servers.append(httpd)
+        return f"http://127.0.0.1:{httpd.server_port}"
+
+    serve.ports = []
+    yield serve
+    fetcher.close_connections()
+    for httpd in servers:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_429_and_5xx_are_retried_but_404_is_not(server):
+    calls = []
+
+    def handler(path):
+        calls.append(path)
+        n = calls.count(path)
+        if path == "/throttled" and n == 1:
+            return 429, {"Retry-After": "0"}, b""
+        if path == "/flaky" and n < 3:
+            return 503, {}, b""
+        if path == "/missing":
+            return 404, {}, b""
+        return 200, {}, b'{"ok": true}'
+
+    base = server(handler)
+    assert fetcher.get_json(f"{base}/throttled") == {"ok": True}
+    assert fetcher.get_json(f"{base}/flaky") == {"ok": True}
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        fetcher.get_json(f"{base}/missing")
+    assert exc.value.code == 404
+    assert [calls.count(p) for p in ("/throttled", "/flaky", "/missing")] == [2, 3, 1]
+
+    host = fetcher.stats()["hosts"][base.removeprefix("http://")]
+    assert (host["requests"], host["retries"], host["throttled"]) == (6, 3, 1)
+
+
+def test_retries_give_up_after_max_retries(server, monkeypatch):
+    monkeypatch.setattr(fetcher, "MAX_RETRIES", 2)
+    calls = []
+    base = server(lambda path: calls.append(path) or (500, {}, b""))
+
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        fetcher.request(f"{base}/down")
+    assert exc.value.code == 500
+    assert len(calls) == 3
+
+
+def test_429_retry_after_pauses_the_whole_key(server):
+    arrivals = {}
+
+    def handler(path):
+        if path == "/first" and path not in arrivals:
+            arrivals[path] = None
+            return 429, {"Retry-After": "0.3"}, b""
+        arrivals[path] = time.monotonic()
+        return 200, {}, b"{}"
+
+    base = server(handler)
+    host = fetcher._host(fetcher._limits_key(base))
+    started = time.monotonic()
+    first = threading.Thread(target=fetcher.get_json, args=(f"{base}/first",))
+    first.start()
+    while not host.paused_until:
+        assert time.monotonic() - started < 2
+        time.sleep(0.005)
+    fetcher.get_json(f"{base}/second")  # never throttled itself, but waits too
+    first.join()
+
+    assert arrivals["/second"] - started >= 0.3
+    assert arrivals["/first"] - started >= 0.3
+
+
+def test_fetch_all_respects_host_concurrency_and_keeps_order(server):
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def handler(path):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        if path == "/item/3":
+            return 404, {}, b""
+        return 200, {}, f'{{"path": "{path}"}}'.encode()
+
+    base = server(handler)
+    fetcher.configure(base.removeprefix("http://"), concurrency=2, rate=1000, burst=1000)
+
+    results = fetcher.fetch_all(lambda i: fetcher.get_json(f"{base}/item/{i}"), range(8))
+
+    assert state["peak"] == 2
+    assert isinstance(results[3], urllib.error.HTTPError)
+    assert [r["path"] for i, r in enumerate(results) if i != 3] == [
+        f"/item/{i}" for i in range(8) if i != 3
+    ]
+
+
+def test_token_bucket_paces_after_burst():
+    bucket = fetcher.TokenBucket(rate=50, burst=2)
+    started = time.monotonic()
+    for _ in range(7):
+        bucket.acquire()
+    # Two ride the burst; the other five wait 1/50 s each.
+    assert time.monotonic() - started >= 0.09
+
+
+def test_connections_are_reused_and_gzip_is_decoded(server):
+    def handler(path):
+        return 200, {"Content-Encoding": "gzip"}, gzip.compress(b'{"path": "%s"}' % path.encode())
+
+    base = server(handler)
+    for i in range(3):
+        assert fetcher.get_json(f"{base}/n/{i}") == {"path": f"/n/{i}"}
+
+    assert len(set(server.ports)) == 1  # one handshake, three requests
+    assert fetcher.stats()["idle_connections"] == {base.removeprefix("http://"): 1}
+
+
+def test_dropped_reused_connection_resends_get_but_not_post(server):
+    calls = []
+
+    def handler(path):
+        calls.append(path)
+        if path.startswith("/drop") and calls.count(path) == 1:
+            return None  # read the request, then hang up like a stale socket
+        return 200, {}, b"{}"
+
+    base = server(handler)
+    fetcher.get_json(f"{base}/warm")
+    assert fetcher.get_json(f"{base}/drop-get") == {}
+    assert calls.count("/drop-get") == 2  # resent on a fresh connection
+
+    fetcher.get_json(f"{base}/warm")
+    with pytest.raises(urllib.error.URLError):
+        fetcher.request(f"{base}/drop-post", method="POST", data=b"x=1", retries=0)
+    assert calls.count("/drop-post") == 1
+
+
+def test_with_fields_appends_partial_response_mask():
+    assert fetcher.with_fields("https://x/a?format=full", "payload") == "https://x/a?format=full&fields=payload"
+    assert fetcher.with_fields("https://x/d", "title,body(content)") == "https://x/d?fields=title,body(content)"
@@ -0,0 +1,84 @@
+"""Tests for batched Gmail metadata fetches (``batch/gmail/v1``).
+
+Guards:
+  1. new messages are fetched ``GMAIL_BATCH_SIZE`` per multipart request, not
+     one request each;
+  2. per-part statuses are honoured: a 404 part (message deleted) is skipped
+     without failing the sync, and 401 parts share one token refresh and one
+     retry batch;
+  3. the response parser matches parts by Content-ID, not by position.
+"""
+
+import urllib.error
+
+from software_of_you import google_sync
+
+LIST_URL = f"{google_sync.GMAIL_API}/messages?maxResults=50&q=newer_than:7d"
+
+
+def _message(msg_id):
+    return {
+        "id": msg_id, "threadId": "t", "labelIds": [], "snippet": "", "internalDate": "0",
+        "payload": {"headers": [{"name": "From", "value": "P <p@example.com>"}]},
+    }
+
+
+def _mailbox(ids, missing=(), stale_token=None):
+    def fake(url, token):
+        if url.endswith("/profile"):
+            return {"historyId": "1"}
+        if url.startswith(LIST_URL):
+            page = int(url.split("pageToken=")[1]) if "pageToken=" in url else 0
+            data = {"messages": [{"id": i} for i in ids[page * 50:(page + 1) * 50]]}
+            if (page + 1) * 50 < len(ids):
+                data["nextPageToken"] = str(page + 1)
+            return data
+        if token == stale_token:
+            raise urllib.error.HTTPError(url, 401, "Unauthorized", {}, None)
+        msg_id = url.split("/messages/")[1].split("?")[0]
+        if msg_id in missing:
+            raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+        return _message(msg_id)
+    return fake
+
+
+def test_messages_are_fetched_in_batches(soy_db, monkeypatch, gmail_batch_server):
+    fake = _mailbox([f"m{i}" for i in range(120)], missing={"m7"})
+    monkeypatch.setattr(google_sync, "_api_get", fake)
+    gmail_batch_server(fake)
+    requests = []
+    original = google_sync._api_batch_get
+    monkeypatch.setattr(
+        google_sync, "_api_batch_get",
+        lambda urls, token: requests.append(len(urls)) or original(urls, token),
+    )
+
+    result = google_sync.sync_gmail(token="tok")
+
+    assert sorted(requests) == [20, 50, 50]  # chunks go out concurrently
+    assert (result["synced"], result["failed"]) == (119, 0)
+
+
+def test_401_parts_refresh_once_and_retry_together(soy_db, monkeypatch, gmail_batch_server):
+    fake = _mailbox(["a", "b"], stale_token="stale")
+    monkeypatch.setattr(google_sync, "_api_get", lambda url, token: fake(url, "ok"))
+    gmail_batch_server(fake)
+    refreshes = []
+    monkeypatch.setattr(google_sync, "_refresh_token", lambda email: refreshes.append(email) or "fresh")
+
+    result = google_sync.sync_gmail(token="stale")
+
+    assert refreshes == [None]
+    assert (result["synced"], result["failed"]) == (2, 0)
+
+
+def test_parser_matches_parts_by_content_id():
+    raw = (
+        b"--b\r\nContent-Type: application/http\r\nContent-ID: <response-item1>\r\n\r\n"
+        b"HTTP/1.1 404 Not Found\r\nContent-Type: application/json\r\n\r\n{\"error\": {}}\r\n"
+        b"--b\r\nContent-Type: application/http\r\nContent-ID: <response-item0>\r\n\r\n"
+        b"HTTP/1.1 200 OK\r\n\r\n{\"id\": \"x\"}\r\n"
+        b"--b--\r\n"
+    )
+    results = google_sync._parse_batch_response(raw, "multipart/mixed; boundary=b", 3)
+    assert results == [(200, {"id": "x"}), (404, {"error": {}}), (0, {})]
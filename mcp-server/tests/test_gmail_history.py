@@ -0,0 +1,182 @@
+"""Tests for Gmail incremental sync via history.list.
+
+Guards:
+  1. the first run does a paginated full scan (past the old 50-message cap)
+     and checkpoints the profile historyId read before the scan;
+  2. later runs ask history.list only — new messages are fetched, read/star
+     changes update stored rows, and the checkpoint advances;
+  3. an expired checkpoint (404) falls back to the full scan;
+  4. a partial failure leaves the checkpoint where it was — but a message
+     that's gone (404) or a draft isn't a failure, so neither stalls it.
+
+``_api_get`` is monkeypatched to serve a small fake mailbox by URL, and the
+local ``gmail_batch_server`` answers batched message fetches from the same fake.
+"""
+
+import urllib.error
+
+from software_of_you import google_sync
+
+LIST_URL = f"{google_sync.GMAIL_API}/messages?maxResults=50&q=newer_than:7d"
+
+
+def _message(msg_id, labels=()):
+    return {
+        "id": msg_id,
+        "threadId": f"t-{msg_id}",
+        "labelIds": list(labels),
+        "snippet": msg_id,
+        "internalDate": "0",
+        "payload": {"headers": [
+            {"name": "From", "value": "P <p@example.com>"},
+            {"name": "To", "value": "me@example.com"},
+            {"name": "Subject", "value": msg_id},
+        ]},
+    }
+
+
+class FakeGmail:
+    def __init__(self, pages, history=None, history_id="500"):
+        self.pages = pages  # list of id lists, one per messages.list page
+        self.history = history  # list of history.list pages, or "expired"
+        self.history_id = history_id
+        self.labels = {}
+        self.fail = set()
+        self.gone = set()
+        self.urls = []
+
+    def __call__(self, url, token):
+        self.urls.append(url)
+        if url.endswith("/profile"):
+            return {"emailAddress": "me@example.com", "historyId": self.history_id}
+        if url.startswith(LIST_URL):
+            page = int(url.split("pageToken=")[1]) if "pageToken=" in url else 0
+            data = {"messages": [{"id": i} for i in self.pages[page]]}
+            if page + 1 < len(self.pages):
+                data["nextPageToken"] = str(page + 1)
+            return data
+        if "/history?" in url:
+            if self.history == "expired":
+                raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+            page = int(url.split("pageToken=")[1]) if "pageToken=" in url else 0
+            return self.history[page]
+        msg_id = url.split("/messages/")[1].split("?")[0]
+        if msg_id in self.fail:
+            raise RuntimeError("boom")
+        if msg_id in self.gone:
+            raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+        return _message(msg_id, self.labels.get(msg_id, ()))
+
+    def fetched(self):
+        return [u.split("/messages/")[1].split("?")[0] for u in self.urls if "/messages/" in u]
+
+
+def _checkpoint(soy_db):
+    rows = soy_db.execute("SELECT value FROM soy_meta WHERE key = 'gmail_history_id'")
+    return rows[0]["value"] if rows else None
+
+
+def _email(soy_db, gmail_id):
+    return dict(soy_db.execute(
+        "SELECT is_read, is_starred, labels FROM emails WHERE gmail_id = ?", (gmail_id,)
+    )[0])
+
+
+def test_full_scan_paginates_and_checkpoints(soy_db, monkeypatch, gmail_batch_server):
+    fake = FakeGmail(pages=[[f"m{i}" for i in range(50)], ["m50", "m51"]], history_id="700")
+    monkeypatch.setattr(google_sync, "_api_get", fake)
+    gmail_batch_server(fake)
+
+    result = google_sync.sync_gmail(token="tok")
+
+    assert result["mode"] == "full"
+    assert result["synced"] == 52
+    assert _checkpoint(soy_db) == "700"
+    # The checkpoint is read before listing, so mail arriving mid-scan is replayed.
+    first_list = next(i for i, u in enumerate(fake.urls) if u.startswith(LIST_URL))
+    assert any(u.endswith("/profile") for u in fake.urls[:first_list])
+
+
+def test_incremental_run_fetches_only_the_delta(soy_db, monkeypatch, gmail_batch_server):
+    fake = FakeGmail(pages=[["a", "b"]], history_id="100")
+    fake.labels["a"] = ["UNREAD", "INBOX"]
+    monkeypatch.setattr(google_sync, "_api_get", fake)
+    gmail_batch_server(fake)
+    google_sync.sync_gmail(token="tok")
+    assert _email(soy_db, "a")["is_read"] == 0
+
+    fake.urls.clear()
+    fake.history = [
+        {"history": [
+            {"id": "101", "messagesAdded": [{"message": {"id": "c", "labelIds": ["INBOX"]}}]},
+            {"id": "102", "messagesAdded": [{"message": {"id": "junk", "labelIds": ["SPAM"]}}]},
+        ], "nextPageToken": "1", "historyId": "110"},
+        {"history": [
+            {"id": "103", "labelsRemoved": [{"message": {"id": "a", "labelIds": ["INBOX"]},
+                                             "labelIds": ["UNREAD"]}]},
+            {"id": "104", "labelsAdded": [{"message": {"id": "b"}, "labelIds": ["STARRED"]}]},
+        ], "historyId": "120"},
+    ]
+    result = google_sync.sync_gmail(token="tok")
+
+    assert result["mode"] == "incremental"
+    assert (result["synced"], result["updated"]) == (1, 2)
+    assert fake.fetched() == ["c"]
+    assert not any(u.startswith(LIST_URL) for u in fake.urls)
+    assert _email(soy_db, "a") == {"is_read": 1, "is_starred": 0, "labels": "INBOX"}
+    assert _email(soy_db, "b")["is_starred"] == 1
+    assert _checkpoint(soy_db) == "120"
+
+
+def test_expired_checkpoint_falls_back_to_full_scan(soy_db, monkeypatch, gmail_batch_server):
+    soy_db.execute_write(
+        "INSERT INTO soy_meta (key, value) VALUES ('gmail_history_id', '5')"
+    )
+    fake = FakeGmail(pages=[["a"]], history="expired", history_id="900")
+    monkeypatch.setattr(google_sync, "_api_get", fake)
+    gmail_batch_server(fake)
+
+    result = google_sync.sync_gmail(token="tok")
+
+    assert result["mode"] == "full"
+    assert result["synced"] == 1
+    assert _checkpoint(soy_db) == "900"
+
+
+def test_partial_failure_keeps_checkpoint(soy_db, monkeypatch, gmail_batch_server):
+    soy_db.execute_write(
+        "INSERT INTO soy_meta (key, value) VALUES ('gmail_history_id', '100')"
+    )
+    fake = FakeGmail(pages=[], history=[{"history": [
+        {"id": "101", "messagesAdded": [{"message": {"id": "ok"}}, {"message": {"id": "bad"}},
+                                        {"message": {"id": "deleted"}}]},
+    ], "historyId": "150"}])
+    fake.fail.add("bad")
+    fake.gone.add("deleted")
+    monkeypatch.setattr(google_sync, "_api_get", fake)
+    gmail_batch_server(fake)
+
+    result = google_sync.sync_gmail(token="tok")
+
+    assert (result["synced"], result["failed"]) == (1, 1)  # the 500 only
+    assert _checkpoint(soy_db) == "100"  # next run replays from 100 and retries "bad"
+
+
+def test_deleted_messages_and_drafts_dont_stall_checkpoint(soy_db, monkeypatch, gmail_batch_server):
+    soy_db.execute_write(
+        "INSERT INTO soy_meta (key, value) VALUES ('gmail_history_id', '100')"
+    )
+    fake = FakeGmail(pages=[], history=[{"history": [
+        {"id": "101", "messagesAdded": [{"message": {"id": "ok"}},
+                                        {"message": {"id": "autosave", "labelIds": ["DRAFT"]}},
+                                        {"message": {"id": "deleted"}}]},
+    ], "historyId": "150"}])
+    fake.gone.add("deleted")  # e.g. a draft autosave replaced before we fetched it
+    monkeypatch.setattr(google_sync, "_api_get", fake)
+    gmail_batch_server(fake)
+
+    result = google_sync.sync_gmail(token="tok")
+
+    assert (result["synced"], result["failed"]) == (1, 0)
+    assert "autosave" not in fake.fetched()
+    assert _checkpoint(soy_db) == "150"
@@ -0,0 +1,84 @@
+"""Tests for the FTS5 search index (migration 024) and the search tool on it.
+
+Guards:
+  1. migration 024 backfills rows that existed before it ran ('rebuild');
+  2. the triggers keep the index in step with INSERT / UPDATE / DELETE;
+  3. results are bm25-ranked (title/name hits before body hits) and carry a
+     highlighted snippet;
+  4. user punctuation can't break the MATCH syntax, a query with no terms
+     says so, prefixes still match, and module filtering/gating still applies.
+"""
+
+from mcp.server.fastmcp import FastMCP
+
+from software_of_you.tools import contacts, search_tool
+
+
+def _search_fn():
+    server = FastMCP("test")
+    search_tool.register(server)
+    return server._tool_manager._tools["search"].fn
+
+
+def _ids(soy_db, table, query):
+    rows = soy_db.execute(
+        f"SELECT rowid FROM {table} WHERE {table} MATCH ?",
+        (search_tool._match_expression(query),),
+    )
+    return {r["rowid"] for r in rows}
+
+
+def test_index_follows_insert_update_delete(soy_db):
+    cid = contacts._add("Sarah Chen", "sarah@acme.com", "", "Acme", "", "individual", "active", None)["result"]["contact_id"]
+    assert _ids(soy_db, "fts_contacts", "acme") == {cid}
+
+    soy_db.execute_write("UPDATE contacts SET company = 'Globex' WHERE id = ?", (cid,))
+    assert _ids(soy_db, "fts_contacts", "globex") == {cid}
+    # Old company still matches only via the email address, not the stale company.
+    assert _ids(soy_db, "fts_contacts", "acme") == {cid}
+    soy_db.execute_write("UPDATE contacts SET email = 'sarah@globex.com' WHERE id = ?", (cid,))
+    assert _ids(soy_db, "fts_contacts", "acme") == set()
+
+    soy_db.execute_write("DELETE FROM contacts WHERE id = ?", (cid,))
+    assert _ids(soy_db, "fts_contacts", "globex") == set()
+    integrity = soy_db.execute(
+        "INSERT INTO fts_contacts(fts_contacts, rank) VALUES ('integrity-check', 1)"
+    )
+    assert integrity == []
+
+
+def test_migration_backfills_existing_rows(soy_db):
+    soy_db.execute_write(
+        "INSERT INTO standalone_notes (title, content) VALUES ('Quarterly plan', 'budget review')"
+    )
+    # Simulate a pre-024 database: drop the index, then re-run the migration.
+    conn = soy_db.get_connection()
+    try:
+        conn.executescript("DROP TABLE fts_notes;")
+        conn.executescript((soy_db.MIGRATIONS_DIR / "024_search_index.sql").read_text())
+    finally:
+        conn.close()
+    assert len(_ids(soy_db, "fts_notes", "budget")) == 1
+
+
+def test_search_ranks_and_highlights(soy_db):
+    contacts._add("Dana", "", "", "", "", "individual", "active", "met at the Orbit launch")
+    contacts._add("Orbit Labs", "", "", "", "", "company", "active", None)
+
+    result = _search_fn()("orbit")
+    names = [c["name"] for c in result["result"]["contacts"]]
+    assert names == ["Orbit Labs", "Dana"]  # name hit outranks a notes hit
+    assert "**Orbit**" in result["result"]["contacts"][0]["highlight"]
+    assert result["total_matches"] == 2
+    assert "rank" not in result["result"]["contacts"][0]
+
+
+def test_search_handles_punctuation_prefix_and_module_filter(soy_db):
+    contacts._add("Pat O'Brien", "pat@initech.com", "", "Initech", "", "individual", "active", None)
+    search = _search_fn()
+
+    assert search('"O\'Brien" (*')["total_matches"] == 1
+    assert search("initec")["total_matches"] == 1
+    assert search("initech", module="notes")["result"] == {}
+    assert "No searchable terms" in search("!!!")["error"]
+    assert search("")["error"]
@@ -0,0 +1,198 @@
+"""Tests for incremental Slack sync.
+
+Guards:
+  1. history and users.list follow ``next_cursor`` across pages, so a busy
+     channel or big workspace isn't cut off at one page;
+  2. each channel's ``latest_synced_ts`` advances with the messages it covers
+     and the next run reads only after it — a quiet run is one history call
+     per channel;
+  3. channels are fetched concurrently, thread replies are ingested (and
+     active stored threads re-polled from their newest reply), and a failed
+     fetch only holds back its own channel;
+  4. stored threads are re-polled at most ``THREAD_POLL_MAX`` a run, in a
+     rotation that reaches every one of them, while new parents always are;
+     the rotation doesn't move past threads whose channel failed.
+"""
+
+import time
+
+from software_of_you import slack_sync
+
+
+def _fake_slack(history, calls):
+    """Fake ``_api_get`` serving ``history`` (newest first) two per page."""
+    def fake(method, token, params=None):
+        calls.append((method, dict(params or {})))
+        if method == "users.list":
+            if params.get("cursor") != "u2":
+                return {"ok": True, "members": [{"id": "U1", "profile": {"real_name": "Ann Lee"}}],
+                        "response_metadata": {"next_cursor": "u2"}}
+            return {"ok": True, "members": [{"id": "U2", "profile": {"real_name": "Bo Chen"}}]}
+        newer = [ts for ts in history if float(ts) > float(params["oldest"])]
+        start = int(params.get("cursor") or 0)
+        page = newer[start:start + 2]
+        data = {"ok": True, "messages": [{"user": "U2", "ts": ts, "text": "hi"} for ts in page]}
+        if start + 2 < len(newer):
+            data["response_metadata"] = {"next_cursor": str(start + 2)}
+        return data
+    return fake
+
+
+def test_history_pages_through_cursor_and_advances_high_water(soy_db, monkeypatch):
+    soy_db.execute_write(
+        "INSERT INTO slack_channels (slack_channel_id, name, is_dm, is_monitored) VALUES ('C1', 'general', 0, 1)"
+    )
+    history = ["9000000005.000100", "9000000004.000100", "9000000003.000100",
+               "9000000002.000100", "9000000001.000100"]
+    calls = []
+    monkeypatch.setattr(slack_sync, "_api_get", _fake_slack(history, calls))
+
+    assert slack_sync.sync_messages(token="tok")["synced"] == 5
+    assert [m for m, _ in calls].count("conversations.history") == 3
+    assert [m for m, _ in calls].count("users.list") == 2
+    senders = {r["sender_name"] for r in soy_db.execute("SELECT sender_name FROM slack_messages")}
+    assert senders == {"Bo Chen"}  # resolved from the second users.list page
+    mark = soy_db.execute("SELECT latest_synced_ts FROM slack_channels WHERE slack_channel_id = 'C1'")
+    assert mark[0]["latest_synced_ts"] == history[0]
+
+    # Nothing new: one history call, starting at the mark.
+    calls.clear()
+    assert slack_sync.sync_messages(token="tok")["synced"] == 0
+    history_calls = [p for m, p in calls if m == "conversations.history"]
+    assert [p["oldest"] for p in history_calls] == [history[0]]
+
+    # One new message: fetched alone, and the mark moves to it.
+    history.insert(0, "9000000006.000100")
+    calls.clear()
+    assert slack_sync.sync_messages(token="tok")["synced"] == 1
+    mark = soy_db.execute("SELECT latest_synced_ts FROM slack_channels WHERE slack_channel_id = 'C1'")
+    assert mark[0]["latest_synced_ts"] == "9000000006.000100"
+
+
+def test_channels_sync_concurrently_with_thread_replies(soy_db, monkeypatch):
+    for cid in ("C1", "C2", "C3", "C4"):
+        soy_db.execute_write(
+            "INSERT INTO slack_channels (slack_channel_id, name, is_dm, is_monitored) VALUES (?, ?, 0, 1)",
+            (cid, cid.lower()),
+        )
+    parent = "9000000001.000100"
+    thread = [parent, "9000000002.000100"]
+    replies_calls = []
+
+    def fake(method, token, params=None):
+        if method == "users.list":
+            return {"ok": True, "members": []}
+        channel = params["channel"]
+        if method == "conversations.replies":
+            replies_calls.append((channel, params["ts"], params.get("oldest")))
+            if channel == "C4":
+                raise RuntimeError("ratelimited")
+            newer = [ts for ts in thread if float(ts) > float(params.get("oldest") or 0)]
+            return {"ok": True, "messages": [{"user": "U1", "ts": ts, "thread_ts": parent, "text": "re"}
+                                             for ts in [parent, *newer]]}
+        time.sleep(0.2)
+        if float(params["oldest"]) >= float(parent):
+            return {"ok": True, "messages": []}
+        return {"ok": True, "messages": [{"user": "U1", "ts": parent, "thread_ts": parent,
+                                          "reply_count": 1, "text": "q"}]}
+
+    monkeypatch.setattr(slack_sync, "_api_get", fake)
+    started = time.monotonic()
+    result = slack_sync.sync_messages(token="tok")
+
+    assert time.monotonic() - started < 0.6  # four 0.2s histories, not 0.8s
+    assert (result["synced"], result["replies"], result["failed"]) == (6, 3, 1)
+    assert result["errors"][0]["channel"] == "c4"
+    rows = soy_db.execute("SELECT slack_message_id, thread_ts FROM slack_messages WHERE channel_id = 'C1'")
+    assert {r["slack_message_id"]: r["thread_ts"] for r in rows} == {f"C1_{ts}": parent for ts in thread}
+    c4 = soy_db.execute("SELECT latest_synced_ts FROM slack_channels WHERE slack_channel_id = 'C4'")
+    assert c4[0]["latest_synced_ts"] is None  # held back, retried next run
+
+    # Stored threads stay polled from their newest reply; new ones are picked up.
+    thread.append("9000000003.000100")
+    replies_calls.clear()
+    result = slack_sync.sync_messages(token="tok")
+    assert ("C1", parent, "9000000002.000100") in replies_calls
+    assert (result["replies"], result["failed"]) == (3, 1)  # one new reply in each of C1..C3
+
+
+def test_stored_thread_polls_are_capped_and_rotate(soy_db, monkeypatch):
+    soy_db.execute_write(
+        "INSERT INTO slack_channels (slack_channel_id, name, is_dm, is_monitored, latest_synced_ts) "
+        "VALUES ('C1', 'general', 0, 1, '9000000100.000100')"
+    )
+    stored = [f"90000000{n:02d}.000100" for n in range(1, 6)]
+    soy_db.execute_many([
+        ("INSERT INTO slack_messages (slack_message_id, channel_id, thread_ts, is_thread_parent, received_at) "
+         "VALUES (?, 'C1', ?, 1, datetime('now'))", (f"C1_{ts}", ts))
+        for ts in stored
+    ])
+    new_parent = "9000000101.000100"
+    polls = []
+
+    def fake(method, token, params=None):
+        if method == "users.list":
+            return {"ok": True, "members": []}
+        if method == "conversations.replies":
+            polls.append(params["ts"])
+            return {"ok": True, "messages": []}
+        if float(params["oldest"]) >= float(new_parent):
+            return {"ok": True, "messages": []}
+        return {"ok": True, "messages": [{"user": "U1", "ts": new_parent, "reply_count": 2, "text": "q"}]}
+
+    monkeypatch.setattr(slack_sync, "_api_get", fake)
+    monkeypatch.setattr(slack_sync, "THREAD_POLL_MAX", 2)
+
+    result = slack_sync.sync_messages(token="tok")
+    assert result["threads_checked"] == 3
+    assert sorted(polls) == [*stored[:2], new_parent]
+
+    seen = set(polls)
+    for _ in range(2):
+        polls.clear()
+        slack_sync.sync_messages(token="tok")
+        assert len(polls) == 2
+        seen.update(polls)
+    assert set(stored) <= seen  # five threads, two a run: all reached by the third
+
+
+def test_rotation_holds_at_threads_of_a_failed_channel(soy_db, monkeypatch):
+    for cid in ("C1", "C2"):
+        soy_db.execute_write(
+            "INSERT INTO slack_channels (slack_channel_id, name, is_dm, is_monitored, latest_synced_ts) "
+            "VALUES (?, ?, 0, 1, '9000000100.000100')",
+            (cid, cid.lower()),
+        )
+    soy_db.execute_many([
+        ("INSERT INTO slack_messages (slack_message_id, channel_id, thread_ts, is_thread_parent, received_at) "
+         "VALUES (?, ?, ?, 1, datetime('now'))", (f"{cid}_{ts}", cid, ts))
+        for cid in ("C1", "C2") for ts in ("9000000001.000100", "9000000002.000100")
+    ])
+    failing = {"C1"}
+    polls = []
+
+    def fake(method, token, params=None):
+        if method == "users.list":
+            return {"ok": True, "members": []}
+        if method == "conversations.replies":
+            polls.append((params["channel"], params["ts"]))
+            if params["channel"] in failing:
+                raise RuntimeError("ratelimited")
+            return {"ok": True, "messages": []}
+        return {"ok": True, "messages": []}
+
+    monkeypatch.setattr(slack_sync, "_api_get", fake)
+    monkeypatch.setattr(slack_sync, "THREAD_POLL_MAX", 2)
+
+    assert slack_sync.sync_messages(token="tok")["failed"] == 1
+    first = list(polls)
+    assert {c for c, _ in first} == {"C1"}
+
+    failing.clear()
+    polls.clear()
+    assert slack_sync.sync_messages(token="tok")["failed"] == 0
+    assert sorted(polls) == sorted(first)  # C1's threads again, not skipped for a rotation
+
+    polls.clear()
+    slack_sync.sync_messages(token="tok")
+    assert {c for c, _ in polls} == {"C2"}
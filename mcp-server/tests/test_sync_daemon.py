@@ -0,0 +1,182 @@
+"""Tests for the background sync daemon.
+
+Guards:
+  1. each service runs on its own jittered interval, a failing one backs off
+     exponentially (capped) and a clean run resets it, and an unconnected one
+     is "skipped" rather than failed; a run abandoned past its deadline isn't
+     started again until it has finished;
+  2. the first run after start-up is due ``interval`` after the service's last
+     clean sync in soy_meta, so restarts don't resync fresh data;
+  3. the schedule is persisted and ``system_status`` reports it;
+  4. tools only read local data and stamp ``_context.freshness``; stale data
+     starts one background refresh that concurrent tool calls share.
+"""
+
+import threading
+import time
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from software_of_you import sync_daemon
+from software_of_you.tools import calendar_tool, email_tool, system
+
+
+def _daemon(outcomes, intervals=None):
+    """A daemon whose jobs pop their next result from ``outcomes[name]``."""
+    calls = []
+
+    def job(name):
+        def run():
+            calls.append(name)
+            return outcomes[name].pop(0)
+        return run
+
+    daemon = sync_daemon.SyncDaemon(
+        jobs={name: job(name) for name in outcomes},
+        intervals=intervals or {name: 900 for name in outcomes},
+    )
+    return daemon, calls
+
+
+def test_intervals_jitter_and_backoff(soy_db, monkeypatch):
+    monkeypatch.setattr(sync_daemon.random, "uniform", lambda lo, hi: hi)  # +10% jitter
+    daemon, calls = _daemon({
+        "gmail": [{"synced": 3}, {"synced": 1}],
+        "slack": [{"error": "boom"}, {"error": "boom"}, {"synced": 2}],
+        "calendar": [{"error": "Not connected to Google."}],
+    })
+    gmail, slack, calendar = (next(s for s in daemon.services if s.name == n) for n in ("gmail", "slack", "calendar"))
+    start = max(s.next_run for s in daemon.services)
+
+    daemon.tick(now=start)
+    assert sorted(calls) == ["calendar", "gmail", "slack"]
+    assert gmail.next_run - gmail.last_run == pytest.approx(900 * 1.1)
+    assert slack.failures == 1 and slack.next_run - slack.last_run == pytest.approx(60 * 1.1)
+    assert (calendar.last_status, calendar.failures) == ("skipped", 0)
+    assert calendar.next_run - calendar.last_run == pytest.approx(900 * 1.1)
+
+    calls.clear()
+    daemon.tick(now=slack.next_run)  # only Slack is due
+    assert calls == ["slack"]
+    assert slack.failures == 2 and slack.next_run - slack.last_run == pytest.approx(120 * 1.1)
+    assert slack.last_error == "boom"
+
+    monkeypatch.setattr(sync_daemon, "BACKOFF_MAX_SECS", 100)
+    slack.failures = 10
+    slack.record("error", "boom", 0.1, now=0)
+    assert slack.next_run == pytest.approx(100 * 1.1)
+
+    daemon.tick(now=slack.next_run + 1_000_000)
+    assert slack.last_status == "ok" and slack.failures == 0
+
+
+def test_timed_out_service_waits_for_its_abandoned_run(soy_db, monkeypatch):
+    monkeypatch.setattr(sync_daemon.scheduler, "JOB_DEADLINE_SECS", 0.1)
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append("gmail")
+        release.wait(5)
+        return {"synced": 1}
+
+    daemon = sync_daemon.SyncDaemon(jobs={"gmail": slow}, intervals={"gmail": 900})
+    gmail = daemon.services[0]
+    daemon.tick(now=gmail.next_run)
+    assert gmail.last_status == "error" and "Timed out" in gmail.last_error
+
+    assert daemon.tick(now=gmail.next_run + 1) == {}  # first run still writing
+    assert calls == ["gmail"] and gmail.running
+
+    release.set()
+    deadline = time.monotonic() + 2
+    while gmail.running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    daemon.tick(now=gmail.next_run + 1)
+    assert calls == ["gmail", "gmail"]
+
+
+def test_first_run_is_due_an_interval_after_last_sync(soy_db):
+    soy_db.execute_write(
+        "INSERT INTO soy_meta (key, value, updated_at) VALUES ('gmail_last_synced', datetime('now', '-600 seconds'), datetime('now'))"
+    )
+    daemon, calls = _daemon({"gmail": [{"synced": 0}], "slack": [{"synced": 0}]})
+    gmail, slack = daemon.services
+
+    assert abs(gmail.next_run - (time.time() + 300)) < 5  # 900s interval, synced 600s ago
+    assert slack.next_run <= time.time() + sync_daemon.STARTUP_STAGGER_SECS  # never synced: right away
+
+    daemon.tick(now=time.time() + sync_daemon.STARTUP_STAGGER_SECS)
+    assert calls == ["slack"]
+
+
+def test_system_status_reports_the_schedule(soy_db):
+    server = FastMCP("test")
+    system.register(server)
+    tool = server._tool_manager._tools["system_status"].fn
+    assert tool()["result"]["sync_daemon"]["running"] is False
+
+    daemon, _ = _daemon({"gmail": [{"error": "quota"}]})
+    daemon.tick(now=daemon.services[0].next_run)
+
+    state = tool()["result"]["sync_daemon"]
+    assert state["running"] is True and state["embedded"] is True
+    gmail = state["services"]["gmail"]
+    assert (gmail["last_status"], gmail["last_error"], gmail["consecutive_failures"]) == ("error", "quota", 1)
+    assert gmail["next_run_at"] > gmail["last_run_at"]
+
+    daemon.save_state(stopped=True)
+    assert tool()["result"]["sync_daemon"]["running"] is False
+
+
+def test_tools_answer_at_once_and_share_one_refresh(soy_db, monkeypatch):
+    monkeypatch.setattr(sync_daemon, "REFRESH_ON_READ", True)
+    gate = threading.Event()
+    calls = []
+
+    def job(service):
+        def run():
+            calls.append(service)
+            assert gate.wait(5)
+            soy_db.execute_write(
+                "INSERT OR REPLACE INTO soy_meta (key, value, updated_at) VALUES (?, datetime('now'), datetime('now'))",
+                (sync_daemon.LAST_SYNCED_KEYS[service],),
+            )
+            return {"synced": 1}
+        return run
+
+    monkeypatch.setattr(sync_daemon, "default_jobs", lambda: {s: job(s) for s in ("gmail", "calendar")})
+    server = FastMCP("test")
+    email_tool.register(server)
+    calendar_tool.register(server)
+    tools = server._tool_manager._tools
+
+    answers = []
+    callers = [
+        threading.Thread(target=lambda: answers.append(tools["email"].fn(action="inbox")))
+        for _ in range(8)
+    ]
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join(5)
+    calendar = tools["calendar"].fn(action="today")
+
+    # Every call answered while the sync was still blocked, and they all shared it.
+    assert len(answers) == 8 and all(a["count"] == 0 for a in answers)
+    deadline = time.monotonic() + 5
+    while len(calls) < 2:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert sorted(calls) == ["calendar", "gmail"]
+    gmail = answers[-1]["_context"]["freshness"]["gmail"]
+    assert (gmail["stale"], gmail["refreshing"], gmail["last_synced_at"]) == (True, True, None)
+    assert calendar["_context"]["freshness"]["calendar"]["refreshing"] is True
+
+    gate.set()
+    for thread in list(sync_daemon._inflight.values()):
+        thread.join(5)
+    fresh = tools["email"].fn(action="inbox")["_context"]["freshness"]["gmail"]
+    assert (fresh["stale"], fresh["refreshing"]) == (False, False) and fresh["age_secs"] < 60
+    assert sorted(calls) == ["calendar", "gmail"]
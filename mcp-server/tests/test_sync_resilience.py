@@ -16,7 +16,10 @@ These tests exercise the core, network-free seams:
   single retry of that item.
 
 Full Google/Slack API mocking is avoided: only ``_api_get`` (the per-call HTTP
-seam) and ``_refresh_token`` are monkeypatched.
+seam) and ``_refresh_token`` are monkeypatched. Gmail message fetches go
+through the multipart batch endpoint, so those tests also start the local
+``gmail_batch_server`` fixture, which answers each batch part with the same
+fake ``_api_get``.
 """
 
 import urllib.error
@@ -51,7 +54,7 @@ def _last_synced(soy_db, key):
 # ── Gmail: partial-failure accounting + timestamp gating ─────────────────────
 
 
-def test_sync_gmail_partial_failure_does_not_advance_timestamp(soy_db, monkeypatch):
+def test_sync_gmail_partial_failure_does_not_advance_timestamp(soy_db, monkeypatch, gmail_batch_server):
     """Some per-message fetches fail → failed > 0 and the timestamp is NOT set."""
     # The list call returns three messages; the per-message metadata fetch
     # succeeds for msg "ok" and raises for the other two.
@@ -76,6 +79,7 @@ def test_sync_gmail_partial_failure_does_not_advance_timestamp(soy_db, monkeypat
         raise RuntimeError("boom")
 
     monkeypatch.setattr(google_sync, "_api_get", fake_api_get)
+    gmail_batch_server(fake_api_get)
     # No refresh available — even if a 401 path were hit, refresh returns None.
     monkeypatch.setattr(google_sync, "_refresh_token", lambda email: None)
 
@@ -87,7 +91,7 @@ def test_sync_gmail_partial_failure_does_not_advance_timestamp(soy_db, monkeypat
     assert _last_synced(soy_db, "gmail_last_synced") is None
 
 
-def test_sync_gmail_clean_run_advances_timestamp(soy_db, monkeypatch):
+def test_sync_gmail_clean_run_advances_timestamp(soy_db, monkeypatch, gmail_batch_server):
     """All per-message fetches succeed → failed == 0 and the timestamp IS set."""
     list_url = f"{google_sync.GMAIL_API}/messages?maxResults=50&q=newer_than:7d"
 
@@ -107,6 +111,7 @@ def test_sync_gmail_clean_run_advances_timestamp(soy_db, monkeypatch):
         }
 
     monkeypatch.setattr(google_sync, "_api_get", fake_api_get)
+    gmail_batch_server(fake_api_get)
 
     result = google_sync.sync_gmail(token="tok", account_email=None)
 
@@ -115,7 +120,7 @@ def test_sync_gmail_clean_run_advances_timestamp(soy_db, monkeypatch):
     assert _last_synced(soy_db, "gmail_last_synced") is not None
 
 
-def test_sync_gmail_401_triggers_refresh_and_retry(soy_db, monkeypatch):
+def test_sync_gmail_401_triggers_refresh_and_retry(soy_db, monkeypatch, gmail_batch_server):
     """A per-message 401 refreshes the token once and retries the item once."""
     list_url = f"{google_sync.GMAIL_API}/messages?maxResults=50&q=newer_than:7d"
     refresh_calls = {"n": 0}
@@ -126,6 +131,8 @@ def test_sync_gmail_401_triggers_refresh_and_retry(soy_db, monkeypatch):
     def fake_api_get(url, token):
         if "userinfo" in url:
             return {"email": "me@example.com"}
+        if url.endswith("/profile"):
+            return {"emailAddress": "me@example.com", "historyId": "100"}
         if url == list_url:
             return {"messages": [{"id": "x"}]}
         attempts["item"] += 1
@@ -148,6 +155,7 @@ def test_sync_gmail_401_triggers_refresh_and_retry(soy_db, monkeypatch):
         return "fresh"
 
     monkeypatch.setattr(google_sync, "_api_get", fake_api_get)
+    gmail_batch_server(fake_api_get)
     monkeypatch.setattr(google_sync, "_refresh_token", fake_refresh)
 
     result = google_sync.sync_gmail(token="stale", account_email=None)
@@ -159,7 +167,7 @@ def test_sync_gmail_401_triggers_refresh_and_retry(soy_db, monkeypatch):
     assert _last_synced(soy_db, "gmail_last_synced") is not None
 
 
-def test_sync_gmail_401_with_no_refresh_counts_as_failure(soy_db, monkeypatch):
+def test_sync_gmail_401_with_no_refresh_counts_as_failure(soy_db, monkeypatch, gmail_batch_server):
     """401 with no refreshable token → the item is dropped and counted failed."""
     list_url = f"{google_sync.GMAIL_API}/messages?maxResults=50&q=newer_than:7d"
 
@@ -169,6 +177,7 @@ def test_sync_gmail_401_with_no_refresh_counts_as_failure(soy_db, monkeypatch):
         raise _http_401(url)
 
     monkeypatch.setattr(google_sync, "_api_get", fake_api_get)
+    gmail_batch_server(fake_api_get)
     monkeypatch.setattr(google_sync, "_refresh_token", lambda email: None)
 
     result = google_sync.sync_gmail(token="stale", account_email=None)
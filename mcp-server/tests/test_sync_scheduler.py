@@ -0,0 +1,106 @@
+"""Tests for the parallel sync scheduler and ``sync_all_accounts`` on top of it.
+
+Guards:
+  1. jobs run concurrently up to ``max_parallel``; a raising job reports an
+     error without affecting the others;
+  2. a job past its deadline is reported as timed out and abandoned, and the
+     jobs queued behind it still run;
+  3. ``sync_all_accounts`` fans out account × service jobs, gives each job its
+     own account's token, and keeps the per-account / per-service result shape;
+  4. transcripts jobs start only after every gmail and calendar job is done,
+     and each account's run only picks up its own mailbox's Gemini emails
+     (the primary account also those stored before accounts existed).
+"""
+
+import threading
+import time
+
+from software_of_you import google_sync, scheduler
+from software_of_you.google_auth import register_account
+
+
+def test_jobs_run_in_parallel_and_errors_stay_local():
+    def job(n):
+        time.sleep(0.2)
+        if n == 2:
+            raise RuntimeError("boom")
+        return {"n": n}
+
+    started = time.monotonic()
+    results = scheduler.run_jobs(((n, lambda n=n: job(n)) for n in range(4)), max_parallel=4)
+
+    assert time.monotonic() - started < 0.6
+    assert results[0]["n"] == 0 and results[3]["n"] == 3
+    assert results[2]["error"] == "boom"
+
+
+def test_overrunning_job_times_out_without_blocking_the_queue():
+    release = threading.Event()
+    results = scheduler.run_jobs(
+        [("slow", lambda: release.wait(5) and {}), ("next", lambda: {"ok": True})],
+        max_parallel=1,
+        deadline_secs=0.2,
+    )
+    release.set()
+
+    assert results["slow"]["timed_out"] is True
+    assert results["next"]["ok"] is True
+
+
+def test_sync_all_accounts_fans_out_with_per_account_tokens(soy_db, monkeypatch):
+    for email in ("a@one.com", "b@two.com"):
+        register_account(email, None, f"{email}.json")
+    monkeypatch.setattr(google_sync, "get_valid_token", lambda email=None: f"tok-{email}")
+    calls = []
+
+    def fake(service):
+        def run(token=None, account_email=None):
+            calls.append((service, account_email, token))
+            time.sleep(0.2)
+            calls.append(("done", service, account_email))
+            return {"synced": 1}
+        return run
+
+    for service in google_sync.SYNC_SERVICES:
+        monkeypatch.setitem(google_sync._SERVICE_FNS, service, fake(service))
+
+    started = time.monotonic()
+    result = google_sync.sync_all_accounts()
+
+    assert time.monotonic() - started < 0.6  # two phases of 0.2s jobs, not 1.2s serially
+    assert list(result["results"]) == ["a@one.com", "b@two.com"]
+    assert set(result["results"]["b@two.com"]) == {"gmail", "calendar", "transcripts"}
+    starts = [c for c in calls if c[0] != "done"]
+    assert all(token == f"tok-{email}" for _, email, token in starts)
+    assert len(starts) == 6
+    first_transcripts = calls.index(next(c for c in calls if c[0] == "transcripts"))
+    assert sum(c[0] == "done" for c in calls[:first_transcripts]) == 4
+    stamped = soy_db.execute("SELECT COUNT(*) AS n FROM google_accounts WHERE last_synced_at IS NOT NULL")
+    assert stamped[0]["n"] == 2
+
+
+def test_transcripts_only_scan_their_own_accounts_emails(soy_db, monkeypatch):
+    for email in ("a@one.com", "b@two.com"):
+        register_account(email, None, f"{email}.json")
+    ids = {r["email"]: r["id"] for r in soy_db.execute("SELECT id, email FROM google_accounts")}
+    soy_db.execute_many([
+        ("INSERT INTO emails (gmail_id, direction, from_address, subject, account_id, received_at) VALUES (?, 'inbound', ?, 'Notes', ?, datetime('now'))",
+         (f"g-{email}", google_sync.GEMINI_SENDER, account_id))
+        for email, account_id in ids.items()
+    ])
+    fetched = []
+    monkeypatch.setattr(google_sync, "_get_all_with_refresh",
+                        lambda urls, token, account_email: (fetched.extend(urls) or [{}] * len(urls), token))
+
+    soy_db.execute_write(
+        "INSERT INTO emails (gmail_id, direction, from_address, subject, received_at) "
+        "VALUES ('g-legacy', 'inbound', ?, 'Notes', datetime('now'))",
+        (google_sync.GEMINI_SENDER,),
+    )
+
+    google_sync.sync_transcripts(token="t", account_email="a@one.com")  # primary
+    assert sorted(url.split("/messages/")[1].split("?")[0] for url in fetched) == ["g-a@one.com", "g-legacy"]
+
+    fetched.clear()
+    google_sync.sync_transcripts(token="t", account_email="b@two.com")
+    assert len(fetched) == 1 and "g-b@two.com" in fetched[0]
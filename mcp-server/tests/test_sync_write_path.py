@@ -0,0 +1,93 @@
+"""Tests for the set-based sync write path.
+
+Guards:
+  1. ``ContactIndex`` answers exactly like the SQL it replaces — exact email
+     match, unique case-insensitive name substring, ambiguous → None;
+  2. the number of reads a Gmail sync issues doesn't grow with the number of
+     messages (no per-message contact lookup or existence check);
+  3. Slack sync skips messages it already stored and resolves senders through
+     the index.
+"""
+
+from software_of_you import contact_index, google_sync, slack_sync
+from software_of_you.contact_index import ContactIndex
+from software_of_you.tools import contacts
+
+
+def _add(name, email=""):
+    return contacts._add(name, email, "", "", "", "individual", "active", None)["result"]["contact_id"]
+
+
+def test_index_matches_sql_semantics(soy_db):
+    ann = _add("Ann Lee", "ann@acme.com")
+    _add("Bob Stone")
+    _add("Bobby Tables")
+
+    index = ContactIndex()
+    assert index.by_email("ann@acme.com") == ann
+    assert index.by_email("ANN@acme.com") is None  # exact, like WHERE email = ?
+    assert index.by_name("ann") == ann
+    assert index.by_name("bob") is None  # ambiguous: two matches
+    assert index.match("nobody", "ann@acme.com") == ann
+
+
+def _count_reads(monkeypatch, *modules):
+    calls = []
+    for module in modules:
+        original = module.execute
+        monkeypatch.setattr(module, "execute", lambda *a, _o=original: calls.append(a[0]) or _o(*a))
+    return calls
+
+
+def _gmail_fake(ids):
+    def fake(url, token):
+        if url.endswith("/profile"):
+            return {"historyId": "1"}
+        if "/messages?" in url:
+            return {"messages": [{"id": i} for i in ids]}
+        msg_id = url.split("/messages/")[1].split("?")[0]
+        return {"id": msg_id, "threadId": "t", "labelIds": [], "snippet": "", "internalDate": "0",
+                "payload": {"headers": [{"name": "From", "value": f"X <{msg_id}@acme.com>"}]}}
+    return fake
+
+
+def test_gmail_reads_do_not_scale_with_messages(soy_db, monkeypatch, gmail_batch_server):
+    known = _add("Known", "m3@acme.com")
+    calls = _count_reads(monkeypatch, google_sync, contact_index)
+    reads = []
+    for ids in (["m1", "m2", "m3"], [f"n{i}" for i in range(40)]):
+        fake = _gmail_fake(ids)
+        monkeypatch.setattr(google_sync, "_api_get", fake)
+        gmail_batch_server(fake)
+        soy_db.execute_write("DELETE FROM soy_meta WHERE key = 'gmail_history_id'")
+        calls.clear()
+        google_sync.sync_gmail(token="tok")
+        reads.append(len(calls))
+
+    assert reads[0] == reads[1]
+    assert soy_db.execute("SELECT contact_id FROM emails WHERE gmail_id = 'm3'")[0]["contact_id"] == known
+
+
+def test_slack_skips_stored_messages_and_links_senders(soy_db, monkeypatch):
+    ann = _add("Ann Lee", "ann@acme.com")
+    soy_db.execute_write(
+        "INSERT INTO slack_channels (slack_channel_id, name, is_dm, is_monitored) VALUES ('C1', 'general', 0, 1)"
+    )
+
+    def fake_api_get(method, token, params=None):
+        if method == "users.list":
+            return {"ok": True, "members": [
+                {"id": "U1", "profile": {"real_name": "Ann Lee", "email": "ann@acme.com"}},
+                {"id": "U2", "profile": {"real_name": "Stranger"}},
+            ]}
+        return {"ok": True, "messages": [
+            {"user": "U1", "ts": "1700000000.000100", "text": "hi"},
+            {"user": "U2", "ts": "1700000001.000100", "text": "yo"},
+        ]}
+
+    monkeypatch.setattr(slack_sync, "_api_get", fake_api_get)
+    assert slack_sync.sync_messages(token="tok")["synced"] == 2
+    assert slack_sync.sync_messages(token="tok")["synced"] == 0  # already stored
+
+    linked = {r["sender_id"]: r["contact_id"] for r in soy_db.execute("SELECT sender_id, contact_id FROM slack_messages")}
+    assert linked == {"U1": ann, "U2": None}
@@ -0,0 +1,86 @@
+"""Tests for the shared, cached Jinja environment.
+
+Guards:
+  1. renders share one environment per process, and a new process (here, a
+     reset cache) loads compiled templates from the on-disk bytecode cache
+     instead of parsing them again;
+  2. editing a template rebuilds the environment under a new template hash,
+     so neither cache layer serves the old version;
+  3. ``precompile`` emits importable modules that render identically, and
+     prunes the caches of older template versions.
+"""
+
+import shutil
+
+import jinja2
+import pytest
+
+from software_of_you import templating
+from software_of_you.tools import views
+
+
+@pytest.fixture
+def templates(soy_db, tmp_path, monkeypatch):
+    """A private copy of the templates and a cold process-wide env."""
+    copy = tmp_path / "templates"
+    shutil.copytree(templating.TEMPLATES_DIR, copy)
+    monkeypatch.setattr(templating, "TEMPLATES_DIR", copy)
+    monkeypatch.setattr(templating, "_current", None)
+    monkeypatch.setattr(views, "VIEWS_DIR", soy_db.VIEWS_DIR)
+    return copy
+
+
+def _count_parses(monkeypatch):
+    parsed = []
+    real_parse = jinja2.Environment._parse
+    monkeypatch.setattr(jinja2.Environment, "_parse",
+                        lambda self, source, name, filename: parsed.append(name) or real_parse(self, source, name, filename))
+    return parsed
+
+
+def test_env_is_shared_and_bytecode_survives_restart(templates, soy_db, monkeypatch):
+    parsed = _count_parses(monkeypatch)
+    env = views._get_env()
+    assert views._get_env() is env
+    ctx = {**views._get_nav_context("contacts"), "page_title": "Hi", "sections": []}
+    html = env.get_template("pages/module_view.html").render(**ctx)
+    assert "pages/module_view.html" in parsed and "base.html" in parsed
+
+    cache_dir = soy_db.DATA_DIR / "template-cache" / "bytecode" / templating.template_hash()[:16]
+    assert any(cache_dir.iterdir())
+
+    # A new process: the env is rebuilt, the templates aren't re-parsed.
+    monkeypatch.setattr(templating, "_current", None)
+    parsed.clear()
+    again = views._get_env()
+    assert again is not env
+    assert again.get_template("pages/module_view.html").render(**ctx) == html
+    assert parsed == []
+
+
+def test_template_edit_rebuilds_env(templates, soy_db):
+    env = templating.get_env()
+    env.get_template("components/empty_state.html")
+    before = templating.template_hash()
+
+    (templates / "components" / "empty_state.html").write_text("edited {{ title }}")
+    fresh = templating.get_env()
+    assert fresh is not env and templating.template_hash() != before
+    assert fresh.get_template("components/empty_state.html").render(title="x") == "edited x"
+
+
+def test_precompile_loads_modules_and_prunes_stale(templates, soy_db, monkeypatch):
+    stale = soy_db.DATA_DIR / "template-cache" / "bytecode" / "0123456789abcdef"
+    stale.mkdir(parents=True)
+    ctx = {**views._get_nav_context("contacts"), "page_title": "Hi", "sections": []}
+    expected = templating.get_env().get_template("pages/module_view.html").render(**ctx)
+
+    result = templating.precompile()
+    assert result["templates"] == len(list(templates.rglob("*.html")))
+    assert not stale.exists()
+
+    parsed = _count_parses(monkeypatch)
+    env = templating.get_env()
+    assert isinstance(env.loader, jinja2.ChoiceLoader)
+    assert env.get_template("pages/module_view.html").render(**ctx) == expected
+    assert parsed == []
@@ -0,0 +1,76 @@
+"""Tests for the offline view assets.
+
+Guards:
+  1. the compiled CSS has rules for the utilities pages use — variants,
+     responsive prefixes, ``/alpha`` colours, the render-time safelist — and
+     nothing for tokens that aren't utilities;
+  2. only referenced icons ship, old Lucide names resolve through aliases;
+  3. ``publish`` writes content-hashed files once, and a rendered page links
+     them instead of any CDN.
+"""
+
+import json
+import re
+from pathlib import Path
+
+from software_of_you import view_assets
+from software_of_you.tools import views
+
+
+def test_compile_css_covers_used_utilities():
+    css = view_assets.compile_css([
+        "flex", "px-4", "-mt-1", "hover:bg-zinc-100", "lg:ml-60", "bg-blue-500/10",
+        "space-y-2", "group-hover:text-blue-600", "text-[11px]", "w-1/2", "not-a-class",
+    ])
+    assert ".flex{display:flex}" in css
+    assert ".px-4{padding-left:1rem;padding-right:1rem}" in css
+    assert ".-mt-1{margin-top:-0.25rem}" in css
+    assert r".hover\:bg-zinc-100:hover{background-color:#f4f4f5}" in css
+    assert r"@media (min-width: 1024px){.lg\:ml-60{margin-left:15rem}}" in css
+    assert r".bg-blue-500\/10{background-color:rgb(59 130 246 / 0.1)}" in css
+    assert ".space-y-2 > :not([hidden]) ~ :not([hidden]){margin-top:0.5rem}" in css
+    assert r".group:hover .group-hover\:text-blue-600{color:#2563eb}" in css
+    assert r".text-\[11px\]{font-size:11px}" in css
+    assert r".w-1\/2{width:50%}" in css
+    assert "not-a-class" not in css
+    # Later utilities win: ``hidden`` after ``flex``, ``px`` after ``p``.
+    assert css.index(".flex{") < view_assets.compile_css(["flex", "hidden"]).index(".hidden{")
+
+
+def test_icons_script_ships_only_referenced_icons():
+    js = view_assets.icons_script(["mail", "home", "no-such-icon"])
+    icons = json.loads(re.search(r"var icons = (\{.*\});", js).group(1))
+    assert set(icons) == {"mail", "house", "circle"}
+    assert '"home":"house"' in js
+
+
+def test_publish_writes_hashed_files_once(soy_db, tmp_path):
+    hrefs = view_assets.publish(tmp_path)
+    css = tmp_path / hrefs["css"]
+    assert re.fullmatch(r"assets/app-[0-9a-f]{12}\.css", hrefs["css"])
+    assert ".bg-emerald-50{" in css.read_text()  # safelisted: built as bg-{{ c }}-50
+    css.write_text("left alone")
+    assert view_assets.publish(tmp_path) == hrefs
+    assert css.read_text() == "left alone"
+
+    # Classes only a model-authored section uses get a bundle of their own.
+    other = view_assets.publish(tmp_path, extra=['{"html": "<b class=\\"tracking-widest\\">"}'])
+    assert other["css"] != hrefs["css"]
+    assert ".tracking-widest{" in (tmp_path / other["css"]).read_text()
+
+
+def test_rendered_view_links_local_assets(soy_db, monkeypatch):
+    monkeypatch.setattr(views, "VIEWS_DIR", soy_db.VIEWS_DIR)
+    result = views._render_module_view(json.dumps({
+        "page_title": "Offline", "sections": [{"type": "html", "title": "x", "icon": "rocket",
+                                               "html": '<p class="ring-2">hi</p>'}],
+    }), open_after=False)
+    html = Path(result["result"]["path"]).read_text()
+    assert "cdn.tailwindcss.com" not in html and "unpkg.com" not in html
+    assert "fonts.googleapis.com" not in html
+
+    hrefs = re.findall(r'(?:href|src)="(assets/[^"]+)"', html)
+    assert len(hrefs) == 2
+    css, js = (soy_db.VIEWS_DIR / h for h in hrefs)
+    assert ".ring-2{" in css.read_text()
+    assert '"rocket":' in js.read_text()
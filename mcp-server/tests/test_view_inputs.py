@@ -0,0 +1,106 @@
+"""Tests for the view input signatures shared by render.py and pipeline.py.
+
+Guards:
+  1. every listed input table exists, and an unknown name raises instead of
+     signing as "never changes";
+  2. logging an interaction moves both its own signature and, once the
+     materialized table is refreshed, contact_health's — whose refresh keeps
+     row count and max rowid the same;
+  3. in-place edits the syncs make (a Gmail read flag, a Calendar reschedule)
+     rebuild render.py's module pages and re-run pipeline.py's views phase.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from software_of_you import contact_health, db
+from software_of_you.view_inputs import DERIVED_INPUT_TABLES, VIEW_INPUT_TABLES, table_signature
+
+
+def test_every_input_table_exists(soy_db):
+    for table, where in {**VIEW_INPUT_TABLES, **DERIVED_INPUT_TABLES}.items():
+        table_signature(soy_db.execute, table, where)
+    with pytest.raises(ValueError, match="interactions"):
+        table_signature(soy_db.execute, "interactions")
+
+
+def test_refreshed_contact_health_changes_signature(soy_db):
+    soy_db.execute_write("INSERT INTO contacts (id, name, status) VALUES (1, 'Ada', 'active')")
+    contact_health.sweep()
+    before = {t: table_signature(soy_db.execute, t) for t in ("contact_interactions", "contact_health")}
+    rowids = soy_db.execute("SELECT COUNT(*), MAX(rowid) FROM contact_health")[0][:]
+
+    soy_db.execute_write(
+        "INSERT INTO contact_interactions (contact_id, type, direction, occurred_at) "
+        "VALUES (1, 'call', 'outbound', datetime('now'))"
+    )
+    assert contact_health.refresh_dirty() == 1
+    after = {t: table_signature(soy_db.execute, t) for t in ("contact_interactions", "contact_health")}
+
+    assert soy_db.execute("SELECT COUNT(*), MAX(rowid) FROM contact_health")[0][:] == rowids
+    assert after["contact_interactions"] != before["contact_interactions"]
+    assert after["contact_health"] != before["contact_health"]
+
+
+def _load_script(name):
+    path = Path(__file__).resolve().parents[2] / "scripts" / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(f"soy_script_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _seed_synced_rows(soy_db):
+    soy_db.execute_many([
+        ("INSERT INTO emails (id, gmail_id, direction, from_address, subject, is_read, received_at) "
+         "VALUES (1, 'g1', 'inbound', 'ann@x.com', 'Hello', 0, datetime('now'))", ()),
+        ("INSERT INTO calendar_events (id, google_event_id, title, start_time, end_time) "
+         "VALUES (1, 'ev1', 'Sync', datetime('now', '+1 day'), datetime('now', '+1 day', '+1 hour'))", ()),
+    ])
+
+
+def _edit_in_place(soy_db):
+    soy_db.execute_many([
+        ("UPDATE emails SET is_read = 1 WHERE id = 1", ()),
+        ("UPDATE calendar_events SET start_time = datetime('now', '+2 days') WHERE id = 1", ()),
+    ])
+
+
+def test_in_place_edits_rebuild_module_pages(soy_db, tmp_path, monkeypatch):
+    render = _load_script("render")
+    monkeypatch.setattr(render, "OUTPUT_DIR", tmp_path)
+    # The renderer also reads the plugin's own tables (slugs, narratives).
+    conn = soy_db.get_connection()
+    try:
+        for name in ("022_signals.sql", "023_entity_narratives.sql"):
+            conn.executescript((Path(render.PLUGIN_ROOT) / "data" / "migrations" / name).read_text())
+    finally:
+        conn.close()
+    _seed_synced_rows(soy_db)
+
+    assert not render.render_pages("modules").get("errors")
+    assert render.render_pages("modules")["skipped"] == len(render._MODULE_BUILDERS)
+
+    _edit_in_place(soy_db)
+    assert render.render_pages("modules")["skipped"] == 0
+
+
+def test_in_place_edits_rerun_the_views_phase(soy_db, monkeypatch):
+    pipeline = _load_script("pipeline")
+    monkeypatch.setattr(pipeline, "DB_PATH", db.DB_PATH)
+    _seed_synced_rows(soy_db)
+    conn = pipeline.get_db()
+    views = next(p for p in pipeline.PHASES if p.name == "view_generation")
+    ctx = pipeline.RunContext(conn, None, False, True, False)
+
+    run_id = pipeline.create_run(conn)
+    fp = pipeline.fingerprint(views.inputs(conn))
+    pipeline.update_phase(conn, pipeline.create_phase(conn, run_id, views.name), "completed", fingerprint=fp)
+    assert pipeline._skip_reason(ctx, views, pipeline.fingerprint(views.inputs(conn)), False)
+
+    # The sync only updated rows, so it reports nothing synced upstream.
+    _edit_in_place(soy_db)
+    assert pipeline._skip_reason(ctx, views, pipeline.fingerprint(views.inputs(conn)), False) is None
+    conn.close()
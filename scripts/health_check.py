@@ -45,7 +45,7 @@ REQUIRED_TABLES = [
     "communication_insights", "relationship_scores", "decisions", "journal_entries",
     "standalone_notes", "transcript_sources", "user_profile", "google_accounts",
     "pipeline_runs", "pipeline_phases", "health_checks",
-    "slack_channels", "slack_messages",
+    "slack_channels", "slack_messages", "contact_health",
 ]
 
 REQUIRED_VIEWS = [
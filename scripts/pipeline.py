@@ -4,10 +4,15 @@
 Runs data ingestion, analysis, and view generation as a fault-tolerant
 pipeline with parallel execution where possible.
 
-Phases:
-  1. Sync (parallel): Gmail, Calendar, Transcripts
+Phases (a DAG — see PHASES):
+  1. Sync (parallel, every account × service): Gmail, Calendar, Transcripts
   2. Analysis: Process new transcripts via Claude headless
-  3. Views: Regenerate dashboards via Claude headless
+  3. Views: Regenerate dashboards with the deterministic renderer
+
+A phase is skipped when its declared inputs are unchanged since its last
+successful run and nothing upstream changed this run; sync is skipped while
+its last sync is still fresh. Each skip and its reason is recorded in
+pipeline_phases, so a cron run on an idle day costs a few queries.
 
 Usage:
     # Data sync only (no Claude needed)
@@ -21,15 +26,31 @@ Usage:
 
     # Skip sync, just run analysis + views
     python3 scripts/pipeline.py --skip-sync --with-claude
+
+    # Run sync and rendering in child interpreters (the MCP venv's Python)
+    python3 scripts/pipeline.py --isolated
+
+    # Run every phase regardless of unchanged inputs / fresh sync
+    python3 scripts/pipeline.py --force
+
+Phases run in-process by default: ``software_of_you`` is imported once and
+sync and rendering share its DB connection pool, HTTP connection pool and
+fetch threads, so a phase costs its own work rather than an interpreter
+start-up, package import and fresh connections. ``--isolated`` keeps the old
+subprocess-per-phase behaviour, for when this interpreter can't import the
+package's dependencies (or to contain a misbehaving phase); the pipeline also
+falls back to it on its own if the in-process import fails.
 """
 
+import graphlib
+import hashlib
+import importlib
 import json
 import os
 import sqlite3
 import subprocess
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -45,6 +66,10 @@ DATA_DIR = Path(DATA_HOME) / "software-of-you"
 DB_PATH = DATA_DIR / "soy.db"
 LOG_DIR = DATA_DIR / "logs"
 
+# Stdlib-only, so importable even when the rest of the package isn't.
+sys.path.insert(0, str(MCP_SRC))
+from software_of_you import view_inputs  # noqa: E402
+
 
 # --- Database helpers ---
 
@@ -84,7 +109,7 @@ def _duration_since(start_str):
     return (now - start).total_seconds()
 
 
-def update_phase(conn, phase_id, status, result=None, error=None):
+def update_phase(conn, phase_id, status, result=None, error=None, fingerprint=None, skip_reason=None):
     now = _now()
     if status == "running":
         conn.execute(
@@ -97,12 +122,25 @@ def update_phase(conn, phase_id, status, result=None, error=None):
         ).fetchone()
         duration = _duration_since(row["started_at"]) if row else None
         conn.execute(
-            "UPDATE pipeline_phases SET status=?, completed_at=?, duration_seconds=?, result=?, error=? WHERE id=?",
-            (status, now, duration, json.dumps(result) if result else None, error, phase_id),
+            """UPDATE pipeline_phases SET status=?, completed_at=?, duration_seconds=?, result=?, error=?,
+                      input_fingerprint=?, skip_reason=? WHERE id=?""",
+            (status, now, duration, json.dumps(result) if result else None, error,
+             fingerprint, skip_reason, phase_id),
         )
     conn.commit()
 
 
+def last_fingerprint(conn, phase):
+    """``(run_id, fingerprint)`` of ``phase``'s last successful (or skipped) run."""
+    row = conn.execute(
+        """SELECT run_id, input_fingerprint FROM pipeline_phases
+           WHERE phase=? AND status IN ('completed', 'skipped') AND input_fingerprint IS NOT NULL
+           ORDER BY id DESC LIMIT 1""",
+        (phase,),
+    ).fetchone()
+    return (row["run_id"], row["input_fingerprint"]) if row else (None, None)
+
+
 def complete_run(conn, run_id, status, summary=None):
     now = _now()
     row = conn.execute(
@@ -116,35 +154,126 @@ def complete_run(conn, run_id, status, summary=None):
     conn.commit()
 
 
+# --- In-process package ---
+
+def load_in_process():
+    """Import the sync and render modules into this interpreter.
+
+    Returns ``(google_sync, render)``, or None when they can't be imported
+    here (e.g. jinja2 lives only in the MCP venv), so the caller falls back to
+    ``--isolated`` mode.
+    """
+    for path in (str(MCP_SRC), str(SCRIPT_DIR)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    try:
+        return importlib.import_module("software_of_you.google_sync"), importlib.import_module("render")
+    except ImportError as e:
+        print(f"  In-process import failed ({e}); using --isolated mode", file=sys.stderr)
+        return None
+
+
 # --- Phase runners ---
 
-def run_sync_phase(service):
-    """Run a single sync service via the MCP venv Python. Returns (service, result_dict)."""
+# Budget for the whole sync subprocess: the scheduler's per-job deadline
+# (jobs run in parallel, so one deadline covers them all) plus start-up slack.
+SYNC_TIMEOUT_SECS = float(os.environ.get("SOY_SYNC_JOB_DEADLINE", "120")) + 30
+
+
+def run_sync(services, modules=None):
+    """Sync ``services`` for every Google account.
+
+    ``sync_all_accounts``' scheduler fans the account × service jobs out in
+    parallel — in this process when ``modules`` (from ``load_in_process``) is
+    given, else in one MCP venv subprocess. Returns its result dict
+    (``{"results": {account: {service: result}}, ...}``) or ``{"error": ...}``.
+    """
+    if modules:
+        google_sync, _ = modules
+        try:
+            return google_sync.sync_all_accounts(services)
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
     try:
         env = {**os.environ, "PYTHONPATH": str(MCP_SRC)}
         result = subprocess.run(
             [
                 SYNC_PYTHON, "-c",
-                f"import json; from software_of_you.google_sync import sync_service; print(json.dumps(sync_service('{service}')))",
+                "import json, sys; from software_of_you.google_sync import sync_all_accounts; "
+                "print(json.dumps(sync_all_accounts(sys.argv[1:])))",
+                *services,
             ],
-            capture_output=True, text=True, timeout=120,
+            capture_output=True, text=True, timeout=SYNC_TIMEOUT_SECS,
             cwd=str(PROJECT_ROOT / "mcp-server"),
             env=env,
         )
         if result.returncode != 0:
-            return service, {"error": result.stderr.strip()[:500]}
+            return {"error": result.stderr.strip()[:500]}
         # Parse the last line of stdout as JSON (skip any debug output)
         lines = result.stdout.strip().splitlines()
         for line in reversed(lines):
             try:
-                return service, json.loads(line)
+                return json.loads(line)
             except json.JSONDecodeError:
                 continue
-        return service, {"error": "No JSON output", "stdout": result.stdout[:500]}
+        return {"error": "No JSON output", "stdout": result.stdout[:500]}
+    except subprocess.TimeoutExpired:
+        return {"error": f"Timeout after {SYNC_TIMEOUT_SECS:g}s"}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def service_result(sync_result, service):
+    """One service's slice of a ``sync_all_accounts`` result, across accounts."""
+    if sync_result.get("error") or sync_result.get("status") == "skipped":
+        return {"error": sync_result.get("error") or sync_result.get("reason", "skipped")}
+    per_account = {}
+    errors = []
+    synced = 0
+    for account, services in sync_result.get("results", {}).items():
+        res = services.get(service) or {"error": services.get("error", "not run")}
+        per_account[account] = res
+        if res.get("error"):
+            errors.append(f"{account}: {res['error']}")
+        synced += res.get("synced", res.get("imported", 0)) or 0
+    result = {"synced": synced, "accounts": per_account}
+    if errors:
+        result["error"] = "; ".join(errors)[:500]
+    return result
+
+
+def run_views(modules=None, force=False):
+    """Render every page whose inputs changed (all of them with ``force``),
+    in-process when ``modules`` is given. Returns render's summary."""
+    if modules:
+        _, render = modules
+        try:
+            render.ensure_contact_health_fresh()
+            result = render.render_pages("all", force=force)
+            if result.get("errors"):
+                # Same outcome as render.py's non-zero exit in isolated mode.
+                result["error"] = f"{len(result['errors'])} page(s) failed to render"
+            return result
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+    try:
+        render_py = str(PROJECT_ROOT / "scripts" / "render.py")
+        proc = subprocess.run(
+            [SYNC_PYTHON, render_py, "all", *(["--force"] if force else [])],
+            capture_output=True, text=True, timeout=120, cwd=str(PROJECT_ROOT),
+        )
+        try:
+            # render.py prints one (multi-line, indented) JSON summary object.
+            result = json.loads(proc.stdout.strip()) if proc.stdout.strip() else {}
+        except (json.JSONDecodeError, ValueError):
+            result = {"stdout": proc.stdout[:300]}
+        if proc.returncode != 0:
+            result["error"] = proc.stderr.strip()[:500] or "render.py returned non-zero"
+        return result
     except subprocess.TimeoutExpired:
-        return service, {"error": "Timeout after 120s"}
+        return {"error": "Timeout after 120s"}
     except Exception as e:
-        return service, {"error": str(e)}
+        return {"error": str(e)}
 
 
 def run_claude_phase(prompt, timeout=300):
@@ -171,116 +300,275 @@ def run_claude_phase(prompt, timeout=300):
         return {"error": str(e)}
 
 
-# --- Main pipeline ---
+# --- Phase inputs ---
+#
+# Each phase declares what it reads. Its inputs are fingerprinted before it
+# runs; a phase whose fingerprint matches its last successful run, and none of
+# whose upstream phases changed anything this run, is skipped — the reason is
+# recorded on its pipeline_phases row. Sync reads remote APIs, which can't be
+# fingerprinted locally, so it's skipped instead while its last sync is
+# fresher than SYNC_FRESH_SECS.
+
+SYNC_SERVICES = ("gmail", "calendar", "transcripts")
+SYNC_FRESH_SECS = float(os.environ.get("SOY_PIPELINE_SYNC_FRESH_SECS", "900"))
+_SYNC_META_KEYS = {
+    "gmail": "gmail_last_synced",
+    "calendar": "calendar_last_synced",
+    "transcripts": "transcripts_last_scanned",
+}
+
+# Everything the renderer reads is view_inputs.VIEW_INPUT_TABLES, the list
+# render.py's per-page check uses too. Its outputs (generated_views,
+# contact_health, slugs) aren't inputs. Signatures cover in-place edits as
+# well as new rows: a sync that only flips read flags or moves meetings
+# reports nothing synced, so the fingerprint alone has to catch it.
+VIEW_INPUT_FILES = [
+    SCRIPT_DIR / "render.py",
+    MCP_SRC / "software_of_you" / "templates",
+]
+
+
+def table_signature(conn, table, where=""):
+    """``view_inputs.table_signature`` over ``conn``; raises for a table that
+    doesn't exist."""
+    return view_inputs.table_signature(lambda sql: conn.execute(sql).fetchall(), table, where)
+
+
+def file_signature(path):
+    """(relative name, size, mtime) for ``path``, or for every file under it."""
+    path = Path(path)
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    return [
+        [str(p.relative_to(PROJECT_ROOT)), p.stat().st_size, p.stat().st_mtime_ns]
+        for p in files if p.exists()
+    ]
+
+
+def fingerprint(inputs):
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def sync_age_secs(conn, service):
+    """Seconds since ``service`` last synced cleanly, or None if it never has."""
+    row = conn.execute(
+        "SELECT (julianday('now') - julianday(value)) * 86400 AS age FROM soy_meta WHERE key=?",
+        (_SYNC_META_KEYS[service],),
+    ).fetchone()
+    return row["age"] if row and row["age"] is not None else None
+
+
+# --- Phase graph ---
+
+class Phase:
+    """One node of the pipeline DAG.
+
+    ``run(ctx)`` does the work and returns its result dict. ``inputs(conn)``
+    returns the phase's declared inputs (None: always run). ``precheck(ctx)``
+    may return a reason to skip before inputs are even considered.
+    ``changed(result)`` says whether the run changed anything downstream
+    phases read, which forces them to run even if their own fingerprint
+    matches.
+    """
+
+    def __init__(self, name, run, deps=(), inputs=None, outputs=(), precheck=None, changed=None):
+        self.name = name
+        self.run = run
+        self.deps = tuple(deps)
+        self.inputs = inputs
+        self.outputs = tuple(outputs)
+        self.precheck = precheck
+        self.changed = changed or (lambda result: True)
+
+
+class RunContext:
+    def __init__(self, conn, modules, with_claude, skip_sync, force):
+        self.conn = conn
+        self.modules = modules
+        self.with_claude = with_claude
+        self.skip_sync = skip_sync
+        self.force = force
+        self.sync_services = []
+        self.sync_result = None
+
+
+def _sync_precheck(service):
+    def precheck(ctx):
+        if ctx.skip_sync:
+            return "--skip-sync"
+        age = sync_age_secs(ctx.conn, service)
+        if not ctx.force and age is not None and age < SYNC_FRESH_SECS:
+            return f"synced {age:.0f}s ago (fresh for {SYNC_FRESH_SECS:g}s)"
+        return None
+    return precheck
 
-def run_pipeline(trigger="manual", with_claude=False, skip_sync=False):
-    """Execute the full pipeline. Returns summary dict."""
-    # Ensure migration has run
-    conn = get_db()
-    try:
-        conn.execute("SELECT 1 FROM pipeline_runs LIMIT 0")
-    except sqlite3.OperationalError:
-        # Table doesn't exist yet — run bootstrap
-        bootstrap = PROJECT_ROOT / "shared" / "bootstrap.sh"
-        subprocess.run(["bash", str(bootstrap)], capture_output=True)
-        conn.close()
-        conn = get_db()
 
-    run_id = create_run(conn, trigger)
-    results = {}
-    any_failed = False
+def _sync_run(service):
+    def run(ctx):
+        # Every sync phase that's due runs in one sync_all_accounts call, so
+        # accounts × services still fan out together.
+        if ctx.sync_result is None:
+            print(f"  Syncing: {', '.join(ctx.sync_services)} (parallel, all accounts)")
+            ctx.sync_result = run_sync(ctx.sync_services, ctx.modules)
+        return service_result(ctx.sync_result, service)
+    return run
 
-    print(f"Pipeline run #{run_id} started ({trigger})")
 
-    # ── Phase 1: Parallel data sync ──────────────────────────────────
-    if not skip_sync:
-        services = ["gmail", "calendar", "transcripts"]
-        phase_ids = {}
-        for svc in services:
-            pid = create_phase(conn, run_id, f"{svc}_sync")
-            phase_ids[svc] = pid
-            update_phase(conn, pid, "running")
+def _sync_changed(result):
+    return any(
+        (res.get(key) or 0) > 0
+        for res in result.get("accounts", {}).values()
+        for key in ("synced", "updated", "deleted", "imported")
+    )
 
-        print(f"  Syncing: {', '.join(services)} (parallel)")
 
-        with ThreadPoolExecutor(max_workers=3) as pool:
-            futures = {pool.submit(run_sync_phase, svc): svc for svc in services}
-            for future in as_completed(futures):
-                svc = futures[future]
-                try:
-                    _, result = future.result()
-                except Exception as e:
-                    result = {"error": str(e)}
+def _analysis_inputs(conn):
+    rows = conn.execute(
+        "SELECT id FROM transcripts WHERE processed_at IS NULL AND source='gemini' ORDER BY id"
+    ).fetchall()
+    return {"unprocessed": [r["id"] for r in rows]}
 
-                has_error = "error" in result and result["error"]
-                status = "failed" if has_error else "completed"
-                if has_error:
-                    any_failed = True
 
-                update_phase(conn, phase_ids[svc], status, result=result, error=result.get("error"))
-                results[f"{svc}_sync"] = result
+def _analysis_precheck(ctx):
+    if not ctx.with_claude:
+        return "no --with-claude flag"
+    if not _analysis_inputs(ctx.conn)["unprocessed"]:
+        return "no unanalyzed transcripts"
+    return None
 
-                icon = "x" if has_error else "ok"
-                detail = result.get("error", "") or f"synced={result.get('synced', result.get('imported', '?'))}"
-                print(f"    [{icon}] {svc}: {detail}")
-    else:
-        print("  Skipping sync (--skip-sync)")
-
-    # ── Phase 2: Transcript analysis ─────────────────────────────────
-    if with_claude:
-        phase_id = create_phase(conn, run_id, "transcript_analysis")
-        update_phase(conn, phase_id, "running")
-        print("  Analyzing new transcripts...")
-
-        prompt = (
-            "Check for unanalyzed transcripts: "
-            "SELECT id, title FROM transcripts WHERE processed_at IS NULL AND source='gemini'. "
-            "If any exist, analyze each one: extract commitments, coaching insights, and key metrics. "
-            "Mark each as processed. If none exist, just report 'No new transcripts to analyze.' "
-            "Be concise."
-        )
-        result = run_claude_phase(prompt, timeout=300)
-        has_error = result.get("error")
-        update_phase(conn, phase_id, "failed" if has_error else "completed", result=result, error=has_error)
-        results["transcript_analysis"] = result
-        if has_error:
-            any_failed = True
-        print(f"    [{'x' if has_error else 'ok'}] transcript analysis")
-    else:
-        phase_id = create_phase(conn, run_id, "transcript_analysis")
-        update_phase(conn, phase_id, "skipped", result={"reason": "no --with-claude flag"})
-        print("  Skipping transcript analysis (no --with-claude)")
 
-    # ── Phase 3: View regeneration (deterministic — no Claude needed) ─
+def _analysis_run(ctx):
+    print("  Analyzing new transcripts...")
+    prompt = (
+        "Check for unanalyzed transcripts: "
+        "SELECT id, title FROM transcripts WHERE processed_at IS NULL AND source='gemini'. "
+        "If any exist, analyze each one: extract commitments, coaching insights, and key metrics. "
+        "Mark each as processed. If none exist, just report 'No new transcripts to analyze.' "
+        "Be concise."
+    )
+    return run_claude_phase(prompt, timeout=300)
+
+
+def _views_inputs(conn):
+    return {
+        "tables": {t: table_signature(conn, t, where) for t, where in view_inputs.VIEW_INPUT_TABLES.items()},
+        "files": [file_signature(p) for p in VIEW_INPUT_FILES],
+        # Pages show relative dates ("3 days ago", today's meetings), so
+        # they're rebuilt at least once a day even when no data changed.
+        "date": datetime.now().date().isoformat(),
+    }
+
+
+def _views_run(ctx):
     # The renderer builds the whole site in ~1-2s from the computed views; it
     # runs regardless of --with-claude (structure never needs the model). Narrative
     # refresh for stale contacts is a separate, interactive concern (see build-all).
-    phase_id = create_phase(conn, run_id, "view_generation")
-    update_phase(conn, phase_id, "running")
     print("  Rendering views (deterministic)...")
+    return run_views(ctx.modules, ctx.force)
+
+
+PHASES = [
+    *(
+        Phase(f"{svc}_sync", _sync_run(svc), precheck=_sync_precheck(svc),
+              outputs=(svc,), changed=_sync_changed)
+        for svc in SYNC_SERVICES
+    ),
+    Phase("transcript_analysis", _analysis_run, deps=("transcripts_sync",),
+          inputs=_analysis_inputs, precheck=_analysis_precheck, outputs=("transcripts", "commitments")),
+    Phase("view_generation", _views_run,
+          deps=("gmail_sync", "calendar_sync", "transcripts_sync", "transcript_analysis"),
+          inputs=_views_inputs, outputs=("output/", "generated_views")),
+]
+
+
+def _describe(result):
+    if "synced" in result:
+        return f"synced={result['synced']}"
+    if "count" in result:
+        return f"{result['count']} pages"
+    return "done"
+
+
+def _skip_reason(ctx, phase, fp, upstream_changed):
+    """Why ``phase`` shouldn't run this time, or None to run it."""
+    if phase.precheck:
+        reason = phase.precheck(ctx)
+        if reason:
+            return reason
+    if ctx.force or fp is None or upstream_changed:
+        return None
+    last_run, last_fp = last_fingerprint(ctx.conn, phase.name)
+    if last_fp == fp:
+        return f"inputs unchanged since run #{last_run}"
+    return None
+
+
+# --- Main pipeline ---
+
+def run_pipeline(trigger="manual", with_claude=False, skip_sync=False, isolated=False, force=False):
+    """Execute the pipeline DAG, skipping phases whose inputs are unchanged. Returns summary dict."""
+    modules = None if isolated else load_in_process()
+
+    # Ensure migration has run
+    conn = get_db()
     try:
-        render_py = str(PROJECT_ROOT / "scripts" / "render.py")
-        proc = subprocess.run(
-            [SYNC_PYTHON, render_py, "all"],
-            capture_output=True, text=True, timeout=120, cwd=str(PROJECT_ROOT),
-        )
-        try:
-            # render.py prints one (multi-line, indented) JSON summary object.
-            result = json.loads(proc.stdout.strip()) if proc.stdout.strip() else {}
-        except (json.JSONDecodeError, ValueError):
-            result = {"stdout": proc.stdout[:300]}
-        if proc.returncode != 0:
-            result["error"] = proc.stderr.strip()[:500] or "render.py returned non-zero"
-    except subprocess.TimeoutExpired:
-        result = {"error": "Timeout after 120s"}
-    except Exception as e:
-        result = {"error": str(e)}
-    has_error = result.get("error")
-    update_phase(conn, phase_id, "failed" if has_error else "completed", result=result, error=has_error)
-    results["view_generation"] = result
-    if has_error:
-        any_failed = True
-    print(f"    [{'x' if has_error else 'ok'}] view generation ({result.get('count', '?')} pages)")
+        conn.execute("SELECT input_fingerprint FROM pipeline_phases LIMIT 0")
+    except sqlite3.OperationalError:
+        # Tables (or 028's columns) missing — migrate in-process, or via bootstrap
+        conn.close()
+        if modules:
+            importlib.import_module("software_of_you.db").init_db()
+        else:
+            bootstrap = PROJECT_ROOT / "shared" / "bootstrap.sh"
+            subprocess.run(["bash", str(bootstrap)], capture_output=True)
+        conn = get_db()
+
+    run_id = create_run(conn, trigger)
+    ctx = RunContext(conn, modules, with_claude, skip_sync, force)
+    results = {}
+    changed = set()
+    by_name = {p.name: p for p in PHASES}
+
+    print(f"Pipeline run #{run_id} started ({trigger}, {'in-process' if modules else 'isolated'})")
+
+    graph = graphlib.TopologicalSorter({p.name: p.deps for p in PHASES})
+    graph.prepare()
+    while graph.is_active():
+        ready = [by_name[name] for name in graph.get_ready()]
+
+        # Decide every ready phase first, so due sync phases share one call.
+        plan = []
+        for phase in ready:
+            fp = fingerprint(phase.inputs(conn)) if phase.inputs else None
+            upstream_changed = any(dep in changed for dep in phase.deps)
+            plan.append((phase, fp, _skip_reason(ctx, phase, fp, upstream_changed)))
+        ctx.sync_services = [
+            p.name.removesuffix("_sync") for p, _, reason in plan
+            if not reason and p.name.endswith("_sync")
+        ]
+
+        for phase, fp, reason in plan:
+            phase_id = create_phase(conn, run_id, phase.name)
+            if reason:
+                update_phase(conn, phase_id, "skipped", result={"reason": reason},
+                             fingerprint=fp, skip_reason=reason)
+                results[phase.name] = {"skipped": reason}
+                print(f"    [--] {phase.name}: skipped ({reason})")
+            else:
+                update_phase(conn, phase_id, "running")
+                try:
+                    result = phase.run(ctx)
+                except Exception as e:
+                    result = {"error": f"{type(e).__name__}: {e}"}
+                has_error = result.get("error")
+                update_phase(conn, phase_id, "failed" if has_error else "completed",
+                             result=result, error=has_error, fingerprint=fp)
+                results[phase.name] = result
+                # A failed sync may still have stored part of its data, so
+                # its counts (not its status) decide.
+                if phase.changed(result):
+                    changed.add(phase.name)
+                print(f"    [{'x' if has_error else 'ok'}] {phase.name}: {has_error or _describe(result)}")
+            graph.done(phase.name)
 
     # ── Finalize ─────────────────────────────────────────────────────
     # Determine overall status
@@ -324,11 +612,15 @@ if __name__ == "__main__":
     parser.add_argument("--trigger", default="manual", help="Trigger source (manual, cron, interactive)")
     parser.add_argument("--with-claude", action="store_true", help="Run Claude-powered phases (analysis, views)")
     parser.add_argument("--skip-sync", action="store_true", help="Skip data sync, run analysis/views only")
+    parser.add_argument("--isolated", action="store_true", help="Run sync and rendering in subprocesses")
+    parser.add_argument("--force", action="store_true", help="Run every phase even if its inputs are unchanged")
     args = parser.parse_args()
 
     result = run_pipeline(
         trigger=args.trigger,
         with_claude=args.with_claude,
         skip_sync=args.skip_sync,
+        isolated=args.isolated,
+        force=args.force,
     )
     print(json.dumps(result, indent=2))
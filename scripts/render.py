@@ -12,7 +12,12 @@ the only raw-HTML channels are the whitelisted ``type:'html'`` module_view
 sections, and every DB value spliced into them is ``markupsafe.escape``'d first.
 
 CLI:
-    python3 scripts/render.py [all|dashboard|entities|modules|stale-narratives]
+    python3 scripts/render.py [all|dashboard|entities|modules|stale-narratives] [--force] [--jobs N]
+
+Rendering is incremental: each generated_views row records the fingerprint of
+the inputs its page was built from, and only pages whose fingerprint moved
+are rebuilt (``--force`` rebuilds everything). See ``_RenderPlan``.
+``--jobs N`` builds them across N worker processes (``_build_parallel``).
 
 Ports the machinery of mcp-server/.../tools/views.py (dashboard + entity page
 logic, nav context, time helpers, slug whitelist) but writes to output/ instead
@@ -21,6 +26,8 @@ of views/, and sources entity narratives from the DB instead of a Claude arg.
 
 import hashlib
 import json
+import math
+import multiprocessing
 import re
 import sys
 import time
@@ -37,10 +44,18 @@ from markupsafe import escape, Markup  # noqa: E402  (ships with jinja2)
 
 from software_of_you.db import (  # noqa: E402
     execute, execute_many, execute_write, rows_to_dicts, get_installed_modules,
+    snapshot,
+)
+from software_of_you.contact_health import (  # noqa: E402
+    ensure_fresh as ensure_contact_health_fresh,
+)
+from software_of_you import templating, view_assets  # noqa: E402
+from software_of_you.view_inputs import (  # noqa: E402
+    DERIVED_INPUT_TABLES, VIEW_INPUT_TABLES, table_signature,
 )
+from software_of_you.entity_data import EntityPageData, digit_runs  # noqa: E402
 
 OUTPUT_DIR = PLUGIN_ROOT / "output"
-TEMPLATES_DIR = PLUGIN_ROOT / "mcp-server" / "src" / "software_of_you" / "templates"
 
 
 # =============================================================================
@@ -54,11 +69,13 @@ def _safe_slug(name: str, fallback: str = "view") -> str:
 
 
 def _get_env() -> jinja2.Environment:
-    """Jinja env with autoescape ON for HTML (see views.py audit note)."""
-    return jinja2.Environment(
-        loader=jinja2.FileSystemLoader(str(TEMPLATES_DIR)),
-        autoescape=jinja2.select_autoescape(["html"]),
-    )
+    """Jinja env with autoescape ON for HTML (see views.py audit note).
+
+    The process-wide ``templating`` env, so each template is compiled once
+    per process — or loaded from the on-disk cache a previous run (or
+    another worker) filled.
+    """
+    return templating.get_env()
 
 
 def _parse_dt(iso_str: str) -> datetime | None:
@@ -141,6 +158,29 @@ def _dash(v):
 def _get_nav_context(active_page: str = "dashboard", active_section: str = "",
                      active_entity_id: int = None, tip_text: str = None) -> dict:
     """Build sidebar navigation context for templates (ported from views.py)."""
+    nav = _batch_nav or _nav_data()
+    return {
+        "modules": nav["modules"],
+        "active_page": active_page,
+        "active_section": active_section,
+        "active_entity_id": active_entity_id,
+        "nav_counts": type("Counts", (), nav["counts"])(),
+        "contact_pages": nav["contact_pages"],
+        "project_pages": nav["project_pages"],
+        "tip_text": tip_text or "Use /help-soy to see all available commands.",
+        "generated_at": datetime.now().strftime("%B %d, %Y at %-I:%M %p"),
+        "assets": nav["assets"],
+    }
+
+
+# Set for the length of a ``_build_batch``: the sidebar reads the same counts
+# and entity links on every page, so a batch queries them once.
+_batch_nav: dict | None = None
+
+
+def _nav_data() -> dict:
+    """The sidebar's DB-backed parts (installed modules, badge counts, entity
+    links) plus the page assets, published to OUTPUT_DIR once per batch."""
     modules = get_installed_modules()
 
     counts = {}
@@ -189,32 +229,58 @@ def _get_nav_context(active_page: str = "dashboard", active_section: str = "",
     except Exception:
         pass
 
-    return {
-        "modules": modules,
-        "active_page": active_page,
-        "active_section": active_section,
-        "active_entity_id": active_entity_id,
-        "nav_counts": type("Counts", (), counts)(),
-        "contact_pages": contact_pages,
-        "project_pages": project_pages,
-        "tip_text": tip_text or "Use /help-soy to see all available commands.",
-        "generated_at": datetime.now().strftime("%B %d, %Y at %-I:%M %p"),
-    }
+    return {"modules": modules, "counts": counts,
+            "contact_pages": contact_pages, "project_pages": project_pages,
+            "assets": view_assets.publish(OUTPUT_DIR, sources=[Path(__file__)])}
 
 
-def _register(view_type, entity_type, entity_id, entity_name, filename):
+_REGISTER_SQL = """INSERT INTO generated_views (view_type, entity_type, entity_id, entity_name, filename, content_hash)
+   VALUES (?, ?, ?, ?, ?, ?)
+   ON CONFLICT(filename) DO UPDATE SET entity_name = excluded.entity_name,
+     content_hash = excluded.content_hash, updated_at = datetime('now')"""
+
+# Set in render worker processes: registrations are handed back to the parent,
+# which writes them in one transaction instead of N processes contending for
+# the write lock.
+_deferred_registrations: list | None = None
+
+
+def _register(view_type, entity_type, entity_id, entity_name, filename, content_hash=None):
     """Upsert a generated_views row keyed by unique filename."""
-    execute_many([(
-        """INSERT INTO generated_views (view_type, entity_type, entity_id, entity_name, filename)
-           VALUES (?, ?, ?, ?, ?)
-           ON CONFLICT(filename) DO UPDATE SET entity_name = excluded.entity_name, updated_at = datetime('now')""",
-        (view_type, entity_type, entity_id, entity_name, filename),
-    )])
+    params = (view_type, entity_type, entity_id, entity_name, filename, content_hash)
+    if _deferred_registrations is not None:
+        _deferred_registrations.append(params)
+        return
+    execute_many([(_REGISTER_SQL, params)])
 
 
-def _write(filename: str, html: str):
+# Pages re-rendered this run whose bytes matched the file already on disk.
+_identical: list[str] = []
+
+# Set for the length of a ``_build_batch``: the stored content hash of every
+# page in the batch, read in one query instead of one per ``_write``.
+_batch_hashes: dict[str, str] | None = None
+
+
+def _write(filename: str, html: str, stamp: str = "") -> str:
+    """Write ``html`` unless the file already holds the same page. Returns its content hash.
+
+    The hash ignores the "generated at" ``stamp``, so re-rendering a page with
+    nothing new in it leaves the file (and its mtime) alone.
+    """
+    content_hash = hashlib.sha256((html.replace(stamp, "") if stamp else html).encode("utf-8")).hexdigest()
+    path = OUTPUT_DIR / filename
+    if _batch_hashes is not None:
+        stored = _batch_hashes.get(filename)
+    else:
+        rows = execute("SELECT content_hash FROM generated_views WHERE filename = ?", (filename,))
+        stored = rows[0]["content_hash"] if rows else None
+    if stored == content_hash and path.exists():
+        _identical.append(filename)
+        return content_hash
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    (OUTPUT_DIR / filename).write_text(html)
+    path.write_text(html)
+    return content_hash
 
 
 # =============================================================================
@@ -278,148 +344,151 @@ def build_dashboard() -> str:
     modules = get_installed_modules()
     today = date.today()
 
-    ctx = _get_nav_context("dashboard")
-
-    stats = {"contacts": execute("SELECT COUNT(*) as n FROM contacts")[0]["n"]}
-    if "project-tracker" in modules:
-        stats["projects"] = execute("SELECT COUNT(*) as n FROM projects WHERE status IN ('active','planning')")[0]["n"]
-    if "gmail" in modules:
-        stats["unread"] = execute("SELECT COUNT(*) as n FROM emails WHERE is_read = 0")[0]["n"]
-    if "calendar" in modules:
-        stats["today_events"] = execute("SELECT COUNT(*) as n FROM calendar_events WHERE date(start_time) = date('now') AND status != 'cancelled'")[0]["n"]
+    # One read transaction for every query below (nav context and
+    # _contact_has_page included) — consistent numbers, one connection.
+    with snapshot() as snap:
+        ctx = _get_nav_context("dashboard")
 
-    ctx["stats"] = stats
-    ctx["today_formatted"] = today.strftime("%A, %B %d, %Y")
+        stats = {"contacts": snap.execute("SELECT COUNT(*) as n FROM contacts")[0]["n"]}
+        if "project-tracker" in modules:
+            stats["projects"] = snap.execute("SELECT COUNT(*) as n FROM projects WHERE status IN ('active','planning')")[0]["n"]
+        if "gmail" in modules:
+            stats["unread"] = snap.execute("SELECT COUNT(*) as n FROM emails WHERE is_read = 0")[0]["n"]
+        if "calendar" in modules:
+            stats["today_events"] = snap.execute("SELECT COUNT(*) as n FROM calendar_events WHERE date(start_time) = date('now') AND status != 'cancelled'")[0]["n"]
 
-    urgent = 0
-    try:
-        row = execute("""SELECT
-            (SELECT COUNT(*) FROM follow_ups WHERE status = 'pending' AND due_date < date('now'))
-            + (SELECT COUNT(*) FROM commitments WHERE status IN ('open','overdue') AND deadline_date < date('now'))
-            + (SELECT COUNT(*) FROM tasks t JOIN projects p ON p.id = t.project_id WHERE t.status NOT IN ('done') AND t.due_date < date('now'))
-            as urgent_count""")
-        urgent = row[0]["urgent_count"] if row else 0
-    except Exception:
-        pass
-    ctx["urgent_count"] = urgent
+        ctx["stats"] = stats
+        ctx["today_formatted"] = today.strftime("%A, %B %d, %Y")
 
-    if "calendar" in modules:
-        now = datetime.now()
-        today_events_raw = rows_to_dicts(execute(
-            "SELECT * FROM calendar_events WHERE date(start_time) = date('now') AND status != 'cancelled' ORDER BY start_time ASC"
-        ))
-        for e in today_events_raw:
-            e["start_formatted"] = _format_time(e["start_time"])
-            try:
-                start = datetime.fromisoformat(e["start_time"])
-                end = datetime.fromisoformat(e["end_time"])
-                mins = int((end - start).total_seconds() / 60)
-                e["duration"] = f"{mins}m" if mins < 60 else f"{mins // 60}h{mins % 60:02d}m"
-                e["is_past"] = end < now
-                e["is_next"] = not e["is_past"] and start > now
-            except (ValueError, TypeError):
-                e["duration"] = ""
-                e["is_past"] = False
-                e["is_next"] = False
-            e["context_line"] = e.get("location", "")
-
-        found_next = False
-        for e in today_events_raw:
-            if e["is_next"] and not found_next:
-                found_next = True
-            elif e["is_next"]:
-                e["is_next"] = False
-        ctx["today_events"] = today_events_raw
-
-        tomorrow_raw = rows_to_dicts(execute(
-            "SELECT * FROM calendar_events WHERE date(start_time) = date('now', '+1 day') AND status != 'cancelled' ORDER BY start_time ASC"
-        ))
-        for e in tomorrow_raw:
-            e["start_formatted"] = _format_time(e["start_time"])
-        ctx["tomorrow_events"] = tomorrow_raw
-
-    if "gmail" in modules:
-        ctx["unread_count"] = stats.get("unread", 0)
-
-        needs_resp = rows_to_dicts(execute(
-            """SELECT e.thread_id, e.subject, e.from_name, e.received_at, c.name as contact_name
-               FROM emails e LEFT JOIN contacts c ON e.contact_id = c.id
-               WHERE e.direction = 'inbound'
-                 AND e.thread_id NOT IN (SELECT thread_id FROM emails WHERE direction = 'outbound' AND received_at > e.received_at)
-                 AND e.received_at > datetime('now', '-7 days')
-               GROUP BY e.thread_id ORDER BY e.received_at DESC LIMIT 5"""
-        ))
-        for t in needs_resp:
-            t["received_at_relative"] = _relative_time(t["received_at"])
-        ctx["needs_response"] = needs_resp
-
-        recent = rows_to_dicts(execute(
-            """SELECT e.thread_id, e.subject, e.snippet, e.from_name, e.direction,
-                      e.received_at, e.is_read, e.is_starred, c.name as contact_name
-               FROM emails e LEFT JOIN contacts c ON e.contact_id = c.id
-               WHERE e.id IN (SELECT MAX(id) FROM emails GROUP BY thread_id)
-               ORDER BY e.received_at DESC LIMIT 8"""
-        ))
-        for t in recent:
-            t["received_at_relative"] = _relative_time(t["received_at"])
-        ctx["recent_threads"] = recent
+        urgent = 0
+        try:
+            row = snap.execute("""SELECT
+                (SELECT COUNT(*) FROM follow_ups WHERE status = 'pending' AND due_date < date('now'))
+                + (SELECT COUNT(*) FROM commitments WHERE status IN ('open','overdue') AND deadline_date < date('now'))
+                + (SELECT COUNT(*) FROM tasks t JOIN projects p ON p.id = t.project_id WHERE t.status NOT IN ('done') AND t.due_date < date('now'))
+                as urgent_count""")
+            urgent = row[0]["urgent_count"] if row else 0
+        except Exception:
+            pass
+        ctx["urgent_count"] = urgent
+
+        if "calendar" in modules:
+            now = datetime.now()
+            today_events_raw = rows_to_dicts(snap.execute(
+                "SELECT * FROM calendar_events WHERE date(start_time) = date('now') AND status != 'cancelled' ORDER BY start_time ASC"
+            ))
+            for e in today_events_raw:
+                e["start_formatted"] = _format_time(e["start_time"])
+                try:
+                    start = datetime.fromisoformat(e["start_time"])
+                    end = datetime.fromisoformat(e["end_time"])
+                    mins = int((end - start).total_seconds() / 60)
+                    e["duration"] = f"{mins}m" if mins < 60 else f"{mins // 60}h{mins % 60:02d}m"
+                    e["is_past"] = end < now
+                    e["is_next"] = not e["is_past"] and start > now
+                except (ValueError, TypeError):
+                    e["duration"] = ""
+                    e["is_past"] = False
+                    e["is_next"] = False
+                e["context_line"] = e.get("location", "")
+
+            found_next = False
+            for e in today_events_raw:
+                if e["is_next"] and not found_next:
+                    found_next = True
+                elif e["is_next"]:
+                    e["is_next"] = False
+            ctx["today_events"] = today_events_raw
+
+            tomorrow_raw = rows_to_dicts(snap.execute(
+                "SELECT * FROM calendar_events WHERE date(start_time) = date('now', '+1 day') AND status != 'cancelled' ORDER BY start_time ASC"
+            ))
+            for e in tomorrow_raw:
+                e["start_formatted"] = _format_time(e["start_time"])
+            ctx["tomorrow_events"] = tomorrow_raw
+
+        if "gmail" in modules:
+            ctx["unread_count"] = stats.get("unread", 0)
+
+            needs_resp = rows_to_dicts(snap.execute(
+                """SELECT e.thread_id, e.subject, e.from_name, e.received_at, c.name as contact_name
+                   FROM emails e LEFT JOIN contacts c ON e.contact_id = c.id
+                   WHERE e.direction = 'inbound'
+                     AND e.thread_id NOT IN (SELECT thread_id FROM emails WHERE direction = 'outbound' AND received_at > e.received_at)
+                     AND e.received_at > datetime('now', '-7 days')
+                   GROUP BY e.thread_id ORDER BY e.received_at DESC LIMIT 5"""
+            ))
+            for t in needs_resp:
+                t["received_at_relative"] = _relative_time(t["received_at"])
+            ctx["needs_response"] = needs_resp
+
+            recent = rows_to_dicts(snap.execute(
+                """SELECT e.thread_id, e.subject, e.snippet, e.from_name, e.direction,
+                          e.received_at, e.is_read, e.is_starred, c.name as contact_name
+                   FROM emails e LEFT JOIN contacts c ON e.contact_id = c.id
+                   WHERE e.id IN (SELECT MAX(id) FROM emails GROUP BY thread_id)
+                   ORDER BY e.received_at DESC LIMIT 8"""
+            ))
+            for t in recent:
+                t["received_at_relative"] = _relative_time(t["received_at"])
+            ctx["recent_threads"] = recent
+
+        if "project-tracker" in modules:
+            ctx["active_projects"] = rows_to_dicts(snap.execute(
+                """SELECT p.id, p.name, p.status, p.priority, c.name as client_name
+                   FROM projects p LEFT JOIN contacts c ON p.client_id = c.id
+                   WHERE p.status IN ('active', 'planning') ORDER BY p.priority DESC LIMIT 8"""
+            ))
+            task_rows = snap.execute("SELECT status, COUNT(*) as count FROM tasks GROUP BY status")
+            ctx["task_stats"] = {r["status"]: r["count"] for r in task_rows}
+            ctx["overdue_tasks"] = rows_to_dicts(snap.execute(
+                """SELECT t.title, t.due_date, p.name as project_name FROM tasks t
+                   JOIN projects p ON p.id = t.project_id
+                   WHERE t.due_date < date('now') AND t.status NOT IN ('done') LIMIT 5"""
+            ))
 
-    if "project-tracker" in modules:
-        ctx["active_projects"] = rows_to_dicts(execute(
-            """SELECT p.id, p.name, p.status, p.priority, c.name as client_name
-               FROM projects p LEFT JOIN contacts c ON p.client_id = c.id
-               WHERE p.status IN ('active', 'planning') ORDER BY p.priority DESC LIMIT 8"""
-        ))
-        task_rows = execute("SELECT status, COUNT(*) as count FROM tasks GROUP BY status")
-        ctx["task_stats"] = {r["status"]: r["count"] for r in task_rows}
-        ctx["overdue_tasks"] = rows_to_dicts(execute(
-            """SELECT t.title, t.due_date, p.name as project_name FROM tasks t
-               JOIN projects p ON p.id = t.project_id
-               WHERE t.due_date < date('now') AND t.status NOT IN ('done') LIMIT 5"""
+        contacts_raw = rows_to_dicts(snap.execute(
+            "SELECT id, name, company, role, email, updated_at FROM contacts WHERE status = 'active' ORDER BY updated_at DESC LIMIT 8"
         ))
-
-    contacts_raw = rows_to_dicts(execute(
-        "SELECT id, name, company, role, email, updated_at FROM contacts WHERE status = 'active' ORDER BY updated_at DESC LIMIT 8"
-    ))
-    for c in contacts_raw:
-        c["entity_page"] = _contact_has_page(c["id"])
-    ctx["recent_contacts"] = contacts_raw
-
-    if "crm" in modules:
-        fus = rows_to_dicts(execute(
-            """SELECT f.*, c.name as contact_name FROM follow_ups f
-               JOIN contacts c ON c.id = f.contact_id
-               WHERE f.status = 'pending' ORDER BY f.due_date ASC LIMIT 8"""
+        for c in contacts_raw:
+            c["entity_page"] = _contact_has_page(c["id"])
+        ctx["recent_contacts"] = contacts_raw
+
+        if "crm" in modules:
+            fus = rows_to_dicts(snap.execute(
+                """SELECT f.*, c.name as contact_name FROM follow_ups f
+                   JOIN contacts c ON c.id = f.contact_id
+                   WHERE f.status = 'pending' ORDER BY f.due_date ASC LIMIT 8"""
+            ))
+            today_str = today.isoformat()
+            for fu in fus:
+                fu["overdue"] = fu["due_date"] < today_str
+                fu["due_today"] = fu["due_date"] == today_str
+                fu["due_date_relative"] = _relative_time(fu["due_date"] + "T12:00:00")
+            ctx["follow_ups"] = fus
+
+        activity_raw = rows_to_dicts(snap.execute(
+            """SELECT al.*, CASE al.entity_type
+                   WHEN 'contact' THEN (SELECT name FROM contacts WHERE id = al.entity_id)
+                   WHEN 'project' THEN (SELECT name FROM projects WHERE id = al.entity_id)
+                   ELSE al.entity_type || ' #' || al.entity_id
+                 END as entity_name
+               FROM activity_log al ORDER BY al.created_at DESC LIMIT 15"""
         ))
-        today_str = today.isoformat()
-        for fu in fus:
-            fu["overdue"] = fu["due_date"] < today_str
-            fu["due_today"] = fu["due_date"] == today_str
-            fu["due_date_relative"] = _relative_time(fu["due_date"] + "T12:00:00")
-        ctx["follow_ups"] = fus
-
-    activity_raw = rows_to_dicts(execute(
-        """SELECT al.*, CASE al.entity_type
-               WHEN 'contact' THEN (SELECT name FROM contacts WHERE id = al.entity_id)
-               WHEN 'project' THEN (SELECT name FROM projects WHERE id = al.entity_id)
-               ELSE al.entity_type || ' #' || al.entity_id
-             END as entity_name
-           FROM activity_log al ORDER BY al.created_at DESC LIMIT 15"""
-    ))
-    icon_map = {"created": "plus", "updated": "edit-3", "interaction_logged": "message-circle",
-                "follow_up_created": "clock", "follow_up_completed": "check-circle",
-                "imported": "upload", "task_added": "plus-square", "task_updated": "check-square"}
-    for a in activity_raw:
-        a["icon"] = icon_map.get(a["action"], "activity")
-        a["created_at_relative"] = _relative_time(a["created_at"])
-    ctx["activity"] = activity_raw
+        icon_map = {"created": "plus", "updated": "edit-3", "interaction_logged": "message-circle",
+                    "follow_up_created": "clock", "follow_up_completed": "check-circle",
+                    "imported": "upload", "task_added": "plus-square", "task_updated": "check-square"}
+        for a in activity_raw:
+            a["icon"] = icon_map.get(a["action"], "activity")
+            a["created_at_relative"] = _relative_time(a["created_at"])
+        ctx["activity"] = activity_raw
 
     from software_of_you.db import DATA_DIR
     ctx["google_connected"] = (DATA_DIR / "google_token.json").exists() or (DATA_DIR / "tokens").is_dir()
 
     html = template.render(**ctx)
-    _write("dashboard.html", html)
-    _register("dashboard", None, None, "Dashboard", "dashboard.html")
+    content_hash = _write("dashboard.html", html, ctx["generated_at"])
+    _register("dashboard", None, None, "Dashboard", "dashboard.html", content_hash)
     return "dashboard.html"
 
 
@@ -427,79 +496,35 @@ def build_dashboard() -> str:
 # Builder: entity pages (ported from views._render_entity_page)
 # =============================================================================
 
-def build_entity_page(contact_id: int, slug: str) -> str:
-    rows = execute("SELECT * FROM contacts WHERE id = ?", (contact_id,))
-    if not rows:
+def build_entity_page(contact_id: int, slug: str, data: EntityPageData | None = None) -> str:
+    """Render one contact's page from ``data`` (a batch loaded by the caller),
+    or from a single-contact batch when rendering just this page."""
+    if data is None:
+        data = EntityPageData([contact_id], get_installed_modules(), narratives=True)
+    contact = data.contact(contact_id)
+    if contact is None:
         raise ValueError(f"No contact with id {contact_id}")
-    contact = rows_to_dicts(rows)[0]
-    modules = get_installed_modules()
 
     ctx = _get_nav_context("contacts", "people", active_entity_id=contact_id,
                            tip_text="Use /follow-up to set a reminder for this person.")
     ctx["contact"] = contact
+    ctx.update(data.sections(contact_id))
 
-    ctx["tags"] = rows_to_dicts(execute(
-        "SELECT t.name, t.color FROM tags t JOIN entity_tags et ON et.tag_id = t.id WHERE et.entity_type = 'contact' AND et.entity_id = ?",
-        (contact_id,),
-    ))
+    for e in ctx.get("emails", []):
+        e["received_at_formatted"] = _relative_time(e["received_at"])
 
-    ctx["notes"] = rows_to_dicts(execute(
-        "SELECT content, created_at FROM notes WHERE entity_type = 'contact' AND entity_id = ? ORDER BY created_at DESC LIMIT 5",
-        (contact_id,),
-    ))
+    for e in ctx.get("upcoming_events", []):
+        e["start_formatted"] = _format_time(e["start_time"]) + " · " + _relative_time(e["start_time"])
 
-    if "gmail" in modules:
-        emails_raw = rows_to_dicts(execute(
-            "SELECT * FROM emails WHERE contact_id = ? ORDER BY received_at ASC", (contact_id,),
-        ))
-        for e in emails_raw:
-            e["received_at_formatted"] = _relative_time(e["received_at"])
-        ctx["emails"] = emails_raw
-
-    if "calendar" in modules:
-        events_raw = rows_to_dicts(execute(
-            "SELECT * FROM calendar_events WHERE contact_ids LIKE ? AND status != 'cancelled' AND start_time > datetime('now') ORDER BY start_time ASC LIMIT 5",
-            (f"%{contact_id}%",),
-        ))
-        for e in events_raw:
-            e["start_formatted"] = _format_time(e["start_time"]) + " · " + _relative_time(e["start_time"])
-        ctx["upcoming_events"] = events_raw
-
-    if "project-tracker" in modules:
-        projects = rows_to_dicts(execute(
-            "SELECT * FROM projects WHERE client_id = ?", (contact_id,),
-        ))
-        for p in projects:
-            p["tasks"] = rows_to_dicts(execute(
-                "SELECT title, status FROM tasks WHERE project_id = ? ORDER BY sort_order", (p["id"],),
-            ))
-        ctx["projects"] = projects
-
-    if "crm" in modules:
-        fus = rows_to_dicts(execute(
-            "SELECT * FROM follow_ups WHERE contact_id = ? AND status = 'pending' ORDER BY due_date ASC",
-            (contact_id,),
-        ))
-        today_str = date.today().isoformat()
-        for fu in fus:
-            fu["overdue"] = fu["due_date"] < today_str
-        ctx["follow_ups"] = fus
-
-    if "conversation-intelligence" in modules:
-        transcripts = rows_to_dicts(execute(
-            """SELECT t.id, t.title, t.summary, t.call_intelligence, t.occurred_at
-               FROM transcripts t
-               JOIN transcript_participants tp ON tp.transcript_id = t.id
-               WHERE tp.contact_id = ?
-               GROUP BY t.id ORDER BY t.occurred_at DESC LIMIT 10""",
-            (contact_id,),
-        ))
-        ctx["transcripts"] = transcripts
+    today_str = date.today().isoformat()
+    for fu in ctx.get("follow_ups", []):
+        fu["overdue"] = fu["due_date"] < today_str
 
+    if "transcripts" in ctx:
         ci_agg = {"pain_points": [], "tech_stack": [], "key_concerns": []}
         seen_pp = set()
         seen_ts = set()
-        for t in transcripts:
+        for t in ctx["transcripts"]:
             if t.get("call_intelligence"):
                 try:
                     ci = json.loads(t["call_intelligence"]) if isinstance(t["call_intelligence"], str) else t["call_intelligence"]
@@ -518,38 +543,18 @@ def build_entity_page(contact_id: int, slug: str) -> str:
         if any(ci_agg.values()):
             ctx["call_intelligence"] = ci_agg
 
-        rs = rows_to_dicts(execute(
-            "SELECT * FROM relationship_scores WHERE contact_id = ? ORDER BY score_date DESC LIMIT 1",
-            (contact_id,),
-        ))
-        ctx["relationship_score"] = rs[0] if rs else None
-
-    if "notes" in modules:
-        sn = rows_to_dicts(execute(
-            "SELECT id, title, substr(content, 1, 150) as preview, tags, pinned FROM standalone_notes WHERE linked_contacts LIKE ? ORDER BY pinned DESC LIMIT 5",
-            (f"%{contact_id}%",),
-        ))
-        for n in sn:
-            if n.get("tags"):
-                try:
-                    n["tags"] = json.loads(n["tags"]) if isinstance(n["tags"], str) else n["tags"]
-                except (json.JSONDecodeError, TypeError):
-                    n["tags"] = []
-        ctx["standalone_notes"] = sn
-
-    if contact.get("company"):
-        team = rows_to_dicts(execute(
-            "SELECT name, role FROM contacts WHERE company = ? AND id != ? AND status = 'active'",
-            (contact["company"], contact_id),
-        ))
-        ctx["company_team"] = team
+    for n in ctx.get("standalone_notes", []):
+        if n.get("tags"):
+            try:
+                n["tags"] = json.loads(n["tags"]) if isinstance(n["tags"], str) else n["tags"]
+            except (json.JSONDecodeError, TypeError):
+                n["tags"] = []
 
     # Narrative sections sourced from the DB (not a Claude argument).
     ns = {}
     next_action = None
-    nar = execute("SELECT * FROM entity_narratives WHERE contact_id = ?", (contact_id,))
-    if nar:
-        r = dict(nar[0])
+    r = data.narrative(contact_id)
+    if r:
         if r.get("relationship_context"):
             ns["relationship_context"] = r["relationship_context"]
         if r.get("company_intel"):
@@ -578,8 +583,8 @@ def build_entity_page(contact_id: int, slug: str) -> str:
     template = env.get_template("pages/entity_page.html")
     html = template.render(**ctx)
     filename = f"contact-{slug}.html"
-    _write(filename, html)
-    _register("entity_page", "contact", contact_id, contact["name"], filename)
+    content_hash = _write(filename, html, ctx["generated_at"])
+    _register("entity_page", "contact", contact_id, contact["name"], filename, content_hash)
     return filename
 
 
@@ -604,8 +609,8 @@ def build_module_view(filename, page_title, active_page, active_section,
     env = _get_env()
     template = env.get_template("pages/module_view.html")
     html = template.render(**ctx)
-    _write(filename, html)
-    _register("module_view", "module", None, entity_name or page_title, filename)
+    content_hash = _write(filename, html, ctx["generated_at"])
+    _register("module_view", "module", None, entity_name or page_title, filename, content_hash)
     return filename
 
 
@@ -1263,25 +1268,173 @@ def stale_narratives() -> list[dict]:
 
 
 # =============================================================================
-# Orchestration
+# Incremental rendering: what each page was built from
 # =============================================================================
 
-def _run(built, errors, label, fn):
+# What the dashboard and module views read: the source tables (shared with
+# pipeline.py's views phase) plus contact_health, refreshed just before the
+# plan is made.
+_MODULE_INPUT_TABLES = {**VIEW_INPUT_TABLES, **DERIVED_INPUT_TABLES}
+
+# Per-contact versions of what an entity page reads: each query returns
+# (contact_id, signature...) with one row per contact. Inserts and deletes move
+# COUNT / MAX(rowid); edits move updated_at, synced_at or the listed columns.
+_ENTITY_INPUT_QUERIES = {
+    "contact": "SELECT id, name, updated_at, status FROM contacts",
+    "tags": """SELECT et.entity_id, group_concat(t.name || ':' || COALESCE(t.color, ''))
+               FROM entity_tags et JOIN tags t ON t.id = et.tag_id
+               WHERE et.entity_type = 'contact' GROUP BY et.entity_id""",
+    "notes": """SELECT entity_id, COUNT(*), MAX(rowid) FROM notes
+                WHERE entity_type = 'contact' GROUP BY entity_id""",
+    "emails": """SELECT contact_id, COUNT(*), MAX(rowid), MAX(synced_at), SUM(is_read), SUM(is_starred)
+                 FROM emails WHERE contact_id IS NOT NULL GROUP BY contact_id""",
+    "events": """SELECT a.contact_id, COUNT(*), MAX(a.rowid), MAX(ce.synced_at), MAX(a.start_time),
+                        SUM(ce.status = 'cancelled')
+                 FROM calendar_event_attendees a JOIN calendar_events ce ON ce.id = a.event_id
+                 WHERE a.contact_id IS NOT NULL GROUP BY a.contact_id""",
+    "projects": """SELECT p.client_id, COUNT(DISTINCT p.id), MAX(p.updated_at),
+                          COUNT(t.id), MAX(t.rowid), MAX(t.updated_at)
+                   FROM projects p LEFT JOIN tasks t ON t.project_id = p.id
+                   WHERE p.client_id IS NOT NULL GROUP BY p.client_id""",
+    "follow_ups": """SELECT contact_id, group_concat(id || ':' || status || ':' || due_date)
+                     FROM follow_ups GROUP BY contact_id""",
+    "transcripts": """SELECT tp.contact_id, COUNT(*), MAX(t.rowid), MAX(t.updated_at)
+                      FROM transcript_participants tp JOIN transcripts t ON t.id = tp.transcript_id
+                      WHERE tp.contact_id IS NOT NULL GROUP BY tp.contact_id""",
+    "relationship_scores": """SELECT contact_id, COUNT(*), MAX(rowid) FROM relationship_scores
+                              GROUP BY contact_id""",
+    "narrative": "SELECT contact_id, updated_at FROM entity_narratives",
+}
+
+
+def _input_fingerprint(inputs) -> str:
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _table_signature(table: str, where: str = ""):
+    """``view_inputs.table_signature`` over the pooled connection; raises for
+    a table that doesn't exist."""
+    return table_signature(execute, table, where)
+
+
+def _template_hash() -> str:
+    """Hash of every template plus this script and the asset bundle it links,
+    so a code change rebuilds all pages."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(templating.template_hash().encode("utf-8"))
+    digest.update(" ".join(view_assets.bundle(sources=[Path(__file__)])).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _nav_signature():
+    """The sidebar's entity links. Its count badges are deliberately left out:
+    they'd move with every synced email and rebuild every page, so an unchanged
+    entity page's badges refresh on its next rebuild (at least daily)."""
+    return [
+        list(r) for r in execute(
+            """SELECT entity_type, entity_id, entity_name, filename FROM generated_views
+               WHERE view_type = 'entity_page' ORDER BY filename"""
+        )
+    ]
+
+
+def _entity_versions() -> dict[int, dict]:
+    """``{contact_id: {input: signature}}`` for every contact, one query per input."""
+    versions: dict[int, dict] = {}
+    for name, sql in _ENTITY_INPUT_QUERIES.items():
+        try:
+            rows = execute(sql)
+        except Exception:
+            continue  # module not installed
+        for row in rows:
+            versions.setdefault(row[0], {})[name] = list(row)[1:]
+
+    # Company teammates are listed on the page.
     try:
-        result = fn()
-        if isinstance(result, list):
-            built.extend(result)
-        elif result:
-            built.append(result)
-    except Exception as e:
-        errors.append({"page": label, "error": f"{type(e).__name__}: {e}"})
+        teams = {
+            r["company"]: list(r)[1:] for r in execute(
+                """SELECT company, COUNT(*), MAX(rowid), MAX(updated_at) FROM contacts
+                   WHERE status = 'active' AND company IS NOT NULL AND company != ''
+                   GROUP BY company"""
+            )
+        }
+        for r in execute("SELECT id, company FROM contacts WHERE company IS NOT NULL AND company != ''"):
+            versions.setdefault(r["id"], {})["team"] = teams.get(r["company"])
+    except Exception:
+        pass
 
+    # Standalone notes link contacts by substring (linked_contacts LIKE '%<id>%').
+    try:
+        for r in execute(
+            """SELECT rowid, linked_contacts, updated_at, pinned FROM standalone_notes
+               WHERE linked_contacts IS NOT NULL AND linked_contacts != ''"""
+        ):
+            for cid in digit_runs(r["linked_contacts"]):
+                versions.setdefault(int(cid), {}).setdefault("standalone_notes", []).append(
+                    [r["rowid"], r["updated_at"], r["pinned"]]
+                )
+    except Exception:
+        pass
+    return versions
 
-def _build_entities(built, errors, contacts):
-    for c in contacts:
-        _run(built, errors, f"contact-{c['slug']}.html",
-             lambda c=c: build_entity_page(c["id"], c["slug"]))
 
+class _RenderPlan:
+    """Fingerprints for this run, and which pages' inputs moved since they were built.
+
+    An entity page's fingerprint covers that contact's own row versions; the
+    dashboard and module views share one over module-level table signatures.
+    Every page also folds in the template hash, installed modules, the
+    sidebar's entity links and today's date (pages show relative dates), and
+    the dashboard the hour (it marks today's past / next meetings).
+    """
+
+    def __init__(self, force: bool = False):
+        self.force = force
+        self.stored = {
+            r["filename"]: r["input_fingerprint"]
+            for r in execute("SELECT filename, input_fingerprint FROM generated_views")
+        }
+        now = datetime.now()
+        shared = {
+            "templates": _template_hash(),
+            "modules": get_installed_modules(),
+            "nav": _nav_signature(),
+            "date": now.date().isoformat(),
+        }
+        self._shared = shared
+        self._versions: dict[int, dict] | None = None
+        self.modules = _input_fingerprint({
+            **shared,
+            "tables": {t: _table_signature(t, where) for t, where in _MODULE_INPUT_TABLES.items()},
+        })
+        self.dashboard = _input_fingerprint([self.modules, now.strftime("%H")])
+        self.built: dict[str, str] = {}
+
+    def entity(self, contact_id: int) -> str:
+        if self._versions is None:
+            self._versions = _entity_versions()
+        return _input_fingerprint({**self._shared, "contact": self._versions.get(contact_id)})
+
+    def due(self, filename: str, fingerprint: str) -> bool:
+        """Whether ``filename`` needs rebuilding to match ``fingerprint``."""
+        return (
+            self.force
+            or self.stored.get(filename) != fingerprint
+            or not (OUTPUT_DIR / filename).exists()
+        )
+
+    def save(self) -> None:
+        """Record the fingerprints of the pages built this run."""
+        if self.built:
+            execute_many([
+                ("UPDATE generated_views SET input_fingerprint = ? WHERE filename = ?", (fp, filename))
+                for filename, fp in self.built.items()
+            ])
+
+
+# =============================================================================
+# Orchestration
+# =============================================================================
 
 _MODULE_BUILDERS = [
     ("contacts.html", build_contacts),
@@ -1296,15 +1449,120 @@ _MODULE_BUILDERS = [
 ]
 
 
-def _build_modules(built, errors):
-    for label, fn in _MODULE_BUILDERS:
-        _run(built, errors, label, fn)
+def _build_page(task, data: EntityPageData | None = None):
+    """Build one page: ``("entity", contact_id, slug)``, ``("dashboard",)`` or ``("module", filename)``."""
+    if task[0] == "entity":
+        return build_entity_page(task[1], task[2], data)
+    if task[0] == "dashboard":
+        return build_dashboard()
+    return dict(_MODULE_BUILDERS)[task[1]]()
+
+
+def _build_batch(batch) -> dict:
+    """Build ``[(filename, task)]`` in this process.
+
+    Returns ``{"pages": [{"page", "ms", "error"}], "identical", "registrations"}``
+    — plain data, so a worker process can hand it back to the parent.
+
+    Everything the batch's pages read per page — entity sections, the
+    sidebar, stored content hashes — is loaded up front in one query per
+    table, so the batch's query count doesn't grow with its size.
+    """
+    global _batch_nav, _batch_hashes
+    _identical.clear()
+    _batch_nav = _nav_data()
+    _batch_hashes = {
+        r["filename"]: r["content_hash"] for r in execute(
+            "SELECT filename, content_hash FROM generated_views WHERE filename IN (SELECT value FROM json_each(?))",
+            (json.dumps([label for label, _ in batch]),),
+        )
+    }
+    pages = []
+    try:
+        contact_ids = [task[1] for _, task in batch if task[0] == "entity"]
+        data = EntityPageData(contact_ids, _batch_nav["modules"], narratives=True) if contact_ids else None
+        for label, task in batch:
+            start = time.perf_counter()
+            try:
+                _build_page(task, data)
+                error = None
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            pages.append({"page": label, "ms": round((time.perf_counter() - start) * 1000, 1), "error": error})
+    finally:
+        _batch_nav = _batch_hashes = None
+    registrations = list(_deferred_registrations or [])
+    if _deferred_registrations is not None:
+        _deferred_registrations.clear()
+    return {"pages": pages, "identical": list(_identical), "registrations": registrations}
+
+
+def _init_worker(db_path: str, output_dir: str) -> None:
+    """Point a spawned worker at the parent's database and output directory."""
+    global OUTPUT_DIR, _deferred_registrations
+    from software_of_you import db
+    db.DB_PATH = Path(db_path)
+    db.DATA_DIR = db.DB_PATH.parent
+    OUTPUT_DIR = Path(output_dir)
+    _deferred_registrations = []
+
+
+def _build_parallel(pages, jobs: int) -> list[dict]:
+    """Build ``pages`` across ``jobs`` worker processes; returns each batch's result.
+
+    Workers are spawned, not forked, so none inherits the parent's SQLite
+    connections or writer thread: each opens its own read connection and
+    compiles the templates once. Pages go out in small batches so a few slow
+    ones don't leave the other workers idle, and the registrations the
+    workers hand back are written here in one transaction.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from software_of_you import db
+
+    size = max(1, math.ceil(len(pages) / (jobs * 4)))
+    batches = [pages[i:i + size] for i in range(0, len(pages), size)]
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=jobs, mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker, initargs=(str(db.DB_PATH), str(OUTPUT_DIR)),
+    ) as pool:
+        futures = [(batch, pool.submit(_build_batch, batch)) for batch in batches]
+        for batch, future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                results.append({"pages": [{"page": label, "ms": None, "error": error} for label, _ in batch],
+                                "identical": [], "registrations": []})
+    registrations = [params for r in results for params in r["registrations"]]
+    if registrations:
+        execute_many([(_REGISTER_SQL, params) for params in registrations])
+    return results
+
+
+def _due_pages(cmd, plan, contacts):
+    """``(pages to build as [(filename, task)], {filename: fingerprint}, skipped count)``."""
+    candidates = []
+    if cmd in ("entities", "all"):
+        candidates += [(f"contact-{c['slug']}.html", plan.entity(c["id"]), ("entity", c["id"], c["slug"]))
+                       for c in contacts]
+    if cmd in ("dashboard", "all"):
+        candidates.append(("dashboard.html", plan.dashboard, ("dashboard",)))
+    if cmd in ("modules", "all"):
+        candidates += [(label, plan.modules, ("module", label)) for label, _ in _MODULE_BUILDERS]
+    due = [(label, fp, task) for label, fp, task in candidates if plan.due(label, fp)]
+    return [(label, task) for label, _, task in due], {label: fp for label, fp, _ in due}, len(candidates) - len(due)
 
 
 def main(argv):
     cmd = argv[1] if len(argv) > 1 else "all"
     start = time.perf_counter()
 
+    # Entity pages, module views and stale-narratives all read v_contact_health;
+    # fold pending changes into the materialized table first (cheap no-op when
+    # nothing changed).
+    ensure_contact_health_fresh()
+
     if cmd == "stale-narratives":
         print(json.dumps(stale_narratives(), indent=2))
         return 0
@@ -1319,34 +1577,77 @@ def main(argv):
         print(json.dumps(result))
         return 0 if "error" not in result else 1
 
+    try:
+        jobs = int(_flag_value(argv[2:], "--jobs", "1"))
+    except ValueError:
+        print(json.dumps({"error": "--jobs takes a number of worker processes"}))
+        return 2
+    summary = render_pages(cmd, force="--force" in argv[2:], jobs=jobs)
+    if "built" not in summary:
+        print(json.dumps(summary))
+        return 2
+    summary["ms"] = round((time.perf_counter() - start) * 1000, 1)
+    print(json.dumps(summary, indent=2))
+    return 0 if not summary.get("errors") else 1
+
+
+def _flag_value(args, name, default):
+    """The value of ``name N`` / ``name=N`` in ``args``, else ``default``."""
+    for i, arg in enumerate(args):
+        if arg == name and i + 1 < len(args):
+            return args[i + 1]
+        if arg.startswith(name + "="):
+            return arg.split("=", 1)[1]
+    return default
+
+
+def render_pages(cmd: str = "all", force: bool = False, jobs: int = 1) -> dict:
+    """Build the pages for ``cmd`` (all|dashboard|entities|modules).
+
+    Only pages whose input fingerprint moved are rebuilt (``force`` rebuilds
+    them all), and a rebuilt page whose bytes didn't change isn't rewritten.
+    With ``jobs`` > 1 the pages are built across that many worker processes.
+    Returns the summary ``main`` prints — ``{"built", "count", "skipped",
+    "identical", "timings", "ms"}`` plus ``"errors"`` if any page failed — or
+    ``{"error"}`` for an unknown command. ``built`` lists the files written;
+    ``skipped`` counts pages with unchanged inputs, ``identical`` pages
+    re-rendered to the same bytes, and ``timings`` maps each page built to
+    its render time in ms. Importable, so the pipeline can render
+    in-process. Callers refresh contact health first (``main`` does).
+    """
+    start = time.perf_counter()
+    if cmd not in ("all", "dashboard", "entities", "modules"):
+        return {"error": f"Unknown command: {cmd}. "
+                         "Use: all|dashboard|entities|modules|stale-narratives"}
+
     # Every render path needs stable slugs + pre-registered entity rows so that
     # sidebars are complete and contact links resolve on a single pass.
     contacts = backfill_slugs()
     preregister_entities(contacts)
 
-    built, errors = [], []
-
-    if cmd == "dashboard":
-        _run(built, errors, "dashboard.html", build_dashboard)
-    elif cmd == "entities":
-        _build_entities(built, errors, contacts)
-    elif cmd == "modules":
-        _build_modules(built, errors)
-    elif cmd == "all":
-        _build_entities(built, errors, contacts)
-        _run(built, errors, "dashboard.html", build_dashboard)
-        _build_modules(built, errors)
-    else:
-        print(json.dumps({"error": f"Unknown command: {cmd}. "
-                          "Use: all|dashboard|entities|modules|stale-narratives"}))
-        return 2
+    plan = _RenderPlan(force)
+    pages, fingerprints, skipped = _due_pages(cmd, plan, contacts)
+    jobs = max(1, min(jobs, len(pages)))
+    results = _build_parallel(pages, jobs) if jobs > 1 else [_build_batch(pages)]
+
+    identical = {f for r in results for f in r["identical"]}
+    built, errors, timings = [], [], {}
+    for page in (p for r in results for p in r["pages"]):
+        if page["error"]:
+            errors.append({"page": page["page"], "error": page["error"]})
+            continue
+        plan.built[page["page"]] = fingerprints[page["page"]]
+        timings[page["page"]] = page["ms"]
+        if page["page"] not in identical:
+            built.append(page["page"])
+    plan.save()
 
     elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
-    summary = {"built": built, "count": len(built), "ms": elapsed_ms}
+    summary = {"built": built, "count": len(built), "skipped": skipped,
+               "identical": len(identical), "jobs": jobs, "timings": timings, "ms": elapsed_ms}
     if errors:
         summary["errors"] = errors
-    print(json.dumps(summary, indent=2))
-    return 0 if not errors else 1
+    return summary
 
 
 if __name__ == "__main__":
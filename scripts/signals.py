@@ -34,6 +34,7 @@ import sqlite3
 import sys
 from pathlib import Path
 
+PLUGIN_ROOT = Path(__file__).resolve().parent.parent
 DATA_HOME = os.environ.get("XDG_DATA_HOME", str(Path.home() / ".local" / "share"))
 DB_PATH = Path(DATA_HOME) / "software-of-you" / "soy.db"
 
@@ -43,6 +44,20 @@ W_URGENCY, W_IMPORTANCE, W_NOVELTY = 0.5, 0.3, 0.2
 TIER_URGENCY = {"urgent": 0.85, "soon": 0.55, "awareness": 0.30}
 
 
+def _refresh_contact_health():
+    """Bring the materialized contact_health up to date before detecting.
+
+    v_contact_health falls back to a slow live recompute for stale rows; the
+    refresher lives in the MCP package, so this is skipped if that can't load.
+    """
+    sys.path.insert(0, str(PLUGIN_ROOT / "mcp-server" / "src"))
+    try:
+        from software_of_you.contact_health import ensure_fresh
+    except ImportError:
+        return
+    ensure_fresh()
+
+
 def get_db():
     conn = sqlite3.connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
@@ -390,6 +405,8 @@ def main():
         print(json.dumps({"error": f"DB not found at {DB_PATH}"}))
         sys.exit(0)
 
+    if args.cmd == "detect":
+        _refresh_contact_health()
     conn = get_db()
     try:
         if args.cmd == "detect":
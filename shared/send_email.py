@@ -3,7 +3,8 @@
 
 Used by the morning-brief loop to push the daily brief to the user's own inbox.
 Pure stdlib: reuses the existing OAuth in shared/google_auth.py (the gmail.send
-scope is already provisioned) and posts the raw message with urllib. No new
+scope is already provisioned) and posts the raw message through the server's
+pooled HTTP client (mcp-server/src/software_of_you/fetcher.py). No new
 credentials, no external packages, no venv required.
 
 Usage:
@@ -22,13 +23,15 @@ import json
 import os
 import sys
 import urllib.error
-import urllib.request
 from email.mime.text import MIMEText
 from email.utils import formataddr
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from google_auth import get_valid_token, list_accounts  # noqa: E402
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mcp-server", "src"))
+from software_of_you import fetcher  # noqa: E402
+
 GMAIL_SEND_URL = "https://gmail.googleapis.com/gmail/v1/users/me/messages/send"
 
 
@@ -62,15 +65,17 @@ def send(subject, body, to=None, account=None, html=False):
     msg["Subject"] = subject
     raw = base64.urlsafe_b64encode(msg.as_bytes()).decode("ascii")
 
-    req = urllib.request.Request(
-        GMAIL_SEND_URL,
-        data=json.dumps({"raw": raw}).encode("utf-8"),
-        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
-        method="POST",
-    )
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            payload = json.loads(resp.read().decode("utf-8"))
+        # retries=0: a send that failed mid-flight may still have gone out.
+        _, _, resp_body = fetcher.request(
+            GMAIL_SEND_URL,
+            method="POST",
+            data=json.dumps({"raw": raw}).encode("utf-8"),
+            headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+            timeout=30,
+            retries=0,
+        )
+        payload = json.loads(resp_body.decode("utf-8"))
         return {"status": "sent", "id": payload.get("id"), "to": recipient}
     except urllib.error.HTTPError as e:
         return {"status": "error", "reason": f"HTTP {e.code}: {e.read().decode('utf-8')[:300]}"}
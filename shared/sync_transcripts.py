@@ -21,7 +21,6 @@ import subprocess
 import sys
 import urllib.error
 import urllib.parse
-import urllib.request
 from datetime import datetime, timedelta
 
 PLUGIN_ROOT = os.environ.get(
@@ -30,9 +29,15 @@ PLUGIN_ROOT = os.environ.get(
 )
 DB_PATH = os.path.join(PLUGIN_ROOT, "data", "soy.db")
 
+sys.path.insert(0, os.path.join(PLUGIN_ROOT, "mcp-server", "src"))
+from software_of_you import fetcher  # noqa: E402  (needs sys.path first)
+
 GMAIL_API = "https://gmail.googleapis.com/gmail/v1/users/me"
 DOCS_API = "https://docs.googleapis.com/v1/documents"
 
+# Partial-response mask: only the title and paragraph text runs.
+DOC_FIELDS = "title,body(content(paragraph(elements(textRun(content)))))"
+
 GEMINI_SENDER = "gemini-notes@google.com"
 DOC_LINK_RE = re.compile(r"https://docs\.google\.com/document/d/([a-zA-Z0-9_-]+)")
 
@@ -71,10 +76,8 @@ def _get_active_accounts():
 
 
 def _api_get(url, token):
-    """Authenticated GET request to a Google API."""
-    req = urllib.request.Request(url, headers={"Authorization": f"Bearer {token}"})
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        return json.loads(resp.read().decode())
+    """Authenticated GET request to a Google API, via the shared fetch engine."""
+    return fetcher.get_json(url, headers={"Authorization": f"Bearer {token}"})
 
 
 def _get_db():
@@ -201,7 +204,7 @@ def _scan_with_token(token, conn):
         try:
             # Fetch full email body to extract the Google Doc link
             msg = _api_get(
-                f"{GMAIL_API}/messages/{gmail_id}?format=full",
+                fetcher.with_fields(f"{GMAIL_API}/messages/{gmail_id}?format=full", "payload"),
                 token,
             )
 
@@ -221,7 +224,7 @@ def _scan_with_token(token, conn):
 
             # Fetch the Google Doc content
             try:
-                doc = _api_get(f"{DOCS_API}/{doc_id}", token)
+                doc = _api_get(fetcher.with_fields(f"{DOCS_API}/{doc_id}", DOC_FIELDS), token)
             except urllib.error.HTTPError as e:
                 if e.code == 403:
                     # Return early with needs_reauth signal